@@ -5,6 +5,7 @@ import { Checkbox } from '@/components/ui/Checkbox';
 import { Button } from '@/components/ui/Button';
 import { SectionTitle } from '@/components/ui/SectionTitle';
 import CommonShell from '@/components/common/CommonShell';
+import { fetchAllDataRows } from '@/lib/datagatherList';
 import { 
   Database, 
   Filter, 
@@ -104,21 +105,16 @@ export default function DataManagementPage() {
       const gatewayUrl = process.env.NEXT_PUBLIC_GATEWAY_URL || 'http://localhost:8080';
       
       // input_data, output_data, 분류 데이터를 병렬로 로드
-      const [inputResponse, outputResponse, fuelResponse, utilityResponse, wasteResponse, processProductResponse] = await Promise.all([
-        fetch(`${gatewayUrl}/api/datagather/input-data`),
-        fetch(`${gatewayUrl}/api/datagather/output-data`),
+      // input/output은 키셋 페이지네이션 목록이므로 next_cursor를 따라 전체를 받음 (HTTP 오류는 throw)
+      const [inputData, outputData, fuelResponse, utilityResponse, wasteResponse, processProductResponse] = await Promise.all([
+        fetchAllDataRows(`${gatewayUrl}/api/datagather/input-data`),
+        fetchAllDataRows(`${gatewayUrl}/api/datagather/output-data`),
         fetch(`${gatewayUrl}/api/datagather/classified-data/연료`),
         fetch(`${gatewayUrl}/api/datagather/classified-data/유틸리티`),
         fetch(`${gatewayUrl}/api/datagather/classified-data/폐기물`),
         fetch(`${gatewayUrl}/api/datagather/classified-data/공정 생산품`)
       ]);
 
-      if (!inputResponse.ok || !outputResponse.ok) {
-        throw new Error('데이터 로드 실패');
-      }
-
-      const inputData = await inputResponse.json();
-      const outputData = await outputResponse.json();
       const fuelData = await fuelResponse.json();
       const utilityData = await utilityResponse.json();
       const wasteData = await wasteResponse.json();
@@ -2,6 +2,7 @@
 
 import { useState, useEffect } from 'react';
 import CommonShell from '@/components/common/CommonShell';
+import { fetchAllDataRows } from '@/lib/datagatherList';
 import { Button } from '@/components/ui/Button';
 import { 
   Trash2, 
@@ -120,33 +121,18 @@ export default function DataDeletePage() {
     try {
       const gatewayUrl = process.env.NEXT_PUBLIC_GATEWAY_URL || 'http://localhost:8080';
       
-      // 모든 데이터를 병렬로 로드
-      const [inputResponse, outputResponse, transportResponse, processResponse] = await Promise.all([
-        fetch(`${gatewayUrl}/api/datagather/input-data`),
-        fetch(`${gatewayUrl}/api/datagather/output-data`),
-        fetch(`${gatewayUrl}/api/datagather/transport-data`),
-        fetch(`${gatewayUrl}/api/datagather/process-data`)
+      // 모든 데이터를 병렬로 로드 (키셋 페이지네이션 목록이므로 next_cursor를 따라 전체를 받음)
+      const [inputResult, outputResult, transportResult, processResult] = await Promise.all([
+        fetchAllDataRows(`${gatewayUrl}/api/datagather/input-data`),
+        fetchAllDataRows(`${gatewayUrl}/api/datagather/output-data`),
+        fetchAllDataRows(`${gatewayUrl}/api/datagather/transport-data`),
+        fetchAllDataRows(`${gatewayUrl}/api/datagather/process-data`)
       ]);
 
-      if (inputResponse.ok) {
-        const inputResult = await inputResponse.json();
-        setInputData(inputResult.success ? inputResult.data : []);
-      }
-
-      if (outputResponse.ok) {
-        const outputResult = await outputResponse.json();
-        setOutputData(outputResult.success ? outputResult.data : []);
-      }
-
-      if (transportResponse.ok) {
-        const transportResult = await transportResponse.json();
-        setTransportData(transportResult.success ? transportResult.data : []);
-      }
-
-      if (processResponse.ok) {
-        const processResult = await processResponse.json();
-        setProcessData(processResult.success ? processResult.data : []);
-      }
+      setInputData(inputResult.success ? inputResult.data : []);
+      setOutputData(outputResult.success ? outputResult.data : []);
+      setTransportData(transportResult.success ? transportResult.data : []);
+      setProcessData(processResult.success ? processResult.data : []);
 
     } catch (err) {
       setError(err instanceof Error ? err.message : '데이터 로드 중 오류가 발생했습니다.');
@@ -4,7 +4,7 @@ import { useState, useEffect, useMemo, Suspense } from 'react';
 import { useRouter, useSearchParams } from 'next/navigation';
 import CommonShell from '@/components/common/CommonShell';
 import LcaTabsNav from '@/components/atomic/molecules/LcaTabsNav';
-import { LcaTabKey, ManageSegment } from '@/lib';
+import { LcaTabKey, ManageSegment, fetchAllDataRows } from '@/lib';
 import { Button } from '@/components/ui/Button';
 import { 
   Database, 
@@ -308,69 +308,35 @@ function LcaPageContent() {
       
       if (activeTab === 'base') {
         // input_data 테이블 데이터 로드
-        const response = await fetch(`${gatewayUrl}/api/datagather/input-data`);
-        if (response.ok) {
-          const data = await response.json();
-          const inputDataArray = data.success ? data.data : [];
-          setInputData(inputDataArray);
-          console.log('투입물명 값들:', inputDataArray.map((row: any) => row.투입물명));
-        } else {
-          throw new Error(`input_data 데이터 로드 실패: ${response.statusText}`);
-        }
+        const data = await fetchAllDataRows(`${gatewayUrl}/api/datagather/input-data`);
+        const inputDataArray = data.success ? data.data : [];
+        setInputData(inputDataArray);
+        console.log('투입물명 값들:', inputDataArray.map((row: any) => row.투입물명));
       } else if (activeTab === 'actual') {
         // input_data 테이블 데이터 로드 (투입물)
-        const response = await fetch(`${gatewayUrl}/api/datagather/input-data`);
-        if (response.ok) {
-          const data = await response.json();
-          const inputDataArray = data.success ? data.data : [];
-          setInputData(inputDataArray);
-        } else {
-          throw new Error(`input_data 데이터 로드 실패: ${response.statusText}`);
-        }
+        const data = await fetchAllDataRows(`${gatewayUrl}/api/datagather/input-data`);
+        setInputData(data.success ? data.data : []);
       } else if (activeTab === 'output') {
         // output_data 테이블 데이터 로드
-        const response = await fetch(`${gatewayUrl}/api/datagather/output-data`);
-        if (response.ok) {
-          const data = await response.json();
-          const outputDataArray = data.success ? data.data : [];
-          setOutputData(outputDataArray);
-        } else {
-          throw new Error(`output_data 데이터 로드 실패: ${response.statusText}`);
-        }
+        const data = await fetchAllDataRows(`${gatewayUrl}/api/datagather/output-data`);
+        setOutputData(data.success ? data.data : []);
       } else if (activeTab === 'transport') {
         // transport_data 테이블 데이터 로드
         console.log('운송 데이터 로드 시작...');
-        const response = await fetch(`${gatewayUrl}/api/datagather/transport-data`);
-        console.log('운송 데이터 응답 상태:', response.status, response.statusText);
+        const data = await fetchAllDataRows(`${gatewayUrl}/api/datagather/transport-data`);
         
-        if (response.ok) {
-          const data = await response.json();
-          console.log('운송 데이터 응답:', data);
-          
-          if (data.success) {
-            const transportDataArray = data.data || [];
-            console.log('운송 데이터 배열:', transportDataArray);
-            console.log('운송 데이터 개수:', transportDataArray.length);
-            setTransportData(transportDataArray);
-          } else {
-            console.error('운송 데이터 응답 실패:', data.message, data.error);
-            throw new Error(`운송 데이터 응답 실패: ${data.message || '알 수 없는 오류'}`);
-          }
+        if (data.success) {
+          const transportDataArray = data.data || [];
+          console.log('운송 데이터 개수:', transportDataArray.length);
+          setTransportData(transportDataArray);
         } else {
-          const errorText = await response.text();
-          console.error('운송 데이터 HTTP 오류:', response.status, errorText);
-          throw new Error(`transport_data 데이터 로드 실패: ${response.status} ${response.statusText}`);
+          console.error('운송 데이터 응답 실패:', data.message, data.error);
+          throw new Error(`운송 데이터 응답 실패: ${data.message || '알 수 없는 오류'}`);
         }
       } else if (activeTab === 'process') {
         // process_data 테이블 데이터 로드
-        const response = await fetch(`${gatewayUrl}/api/datagather/process-data`);
-        if (response.ok) {
-          const data = await response.json();
-          const processDataArray = data.success ? data.data : [];
-          setProcessData(processDataArray);
-        } else {
-          throw new Error(`process_data 데이터 로드 실패: ${response.statusText}`);
-        }
+        const data = await fetchAllDataRows(`${gatewayUrl}/api/datagather/process-data`);
+        setProcessData(data.success ? data.data : []);
       } else if (activeTab === 'manage') {
         // 데이터 관리 탭 - 세그먼트별 데이터 로드
         if (activeSegment === 'mat') {
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import axiosClient from '@/lib/axiosClient';
+import { collectDataListPages } from '@/lib/datagatherList';
 
 interface InputData {
   id: number;
@@ -21,7 +22,7 @@ interface InputData {
 
 interface InputDataResponse {
   success: boolean;
-  message: string;
+  message?: string;
   data: InputData[];
   count: number;
 }
@@ -52,8 +53,11 @@ export const useInputData = () => {
     setError(null);
 
     try {
-      const response = await axiosClient.get('/api/datagather/input-data');
-      const result: InputDataResponse = response.data;
+      // 키셋 페이지네이션 목록이므로 next_cursor를 따라 전체를 받음
+      const result: InputDataResponse = await collectDataListPages<InputData>(async (params) => {
+        const response = await axiosClient.get('/api/datagather/input-data', { params });
+        return response.data;
+      });
 
       if (result.success) {
         // 투입물명이 빈 값인 경우 더미 데이터로 대체
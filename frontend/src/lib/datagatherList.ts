@@ -0,0 +1,64 @@
+// ============================================================================
+// 📄 DataGather 목록 조회 - next_cursor 페이지 따라가기
+// ============================================================================
+
+// 한 번에 요청할 페이지 크기 (서버 최대값 LIST_MAX_LIMIT 이하)
+export const DATA_LIST_PAGE_SIZE = 1000;
+
+export interface DataListPage<T = any> {
+  success: boolean;
+  message?: string;
+  error?: string;
+  data: T[];
+  count: number;
+  has_more?: boolean;
+  next_cursor?: string | null;
+}
+
+export type DataListPageFetcher<T = any> = (params: { limit: number; cursor?: string }) => Promise<DataListPage<T>>;
+
+/**
+ * next_cursor가 없을 때까지 페이지를 이어 받아 하나의 응답으로 합칩니다.
+ * 실패한 페이지(success: false)를 만나면 그 응답을 그대로 반환합니다.
+ */
+export async function collectDataListPages<T = any>(
+  fetchPage: DataListPageFetcher<T>,
+  pageSize: number = DATA_LIST_PAGE_SIZE
+): Promise<DataListPage<T>> {
+  const rows: T[] = [];
+  let cursor: string | undefined;
+  let last: DataListPage<T>;
+
+  do {
+    last = await fetchPage({ limit: pageSize, cursor });
+    if (!last.success) {
+      return last;
+    }
+    rows.push(...(last.data || []));
+    cursor = last.has_more && last.next_cursor ? last.next_cursor : undefined;
+  } while (cursor);
+
+  return { ...last, data: rows, count: rows.length, has_more: false, next_cursor: null };
+}
+
+/**
+ * fetch로 DataGather 목록 엔드포인트의 모든 페이지를 조회합니다.
+ * HTTP 오류는 Error로 던집니다.
+ */
+export async function fetchAllDataRows<T = any>(
+  url: string,
+  pageSize: number = DATA_LIST_PAGE_SIZE
+): Promise<DataListPage<T>> {
+  return collectDataListPages<T>(async ({ limit, cursor }) => {
+    const params = new URLSearchParams({ limit: String(limit) });
+    if (cursor) {
+      params.set('cursor', cursor);
+    }
+    const separator = url.includes('?') ? '&' : '?';
+    const response = await fetch(`${url}${separator}${params.toString()}`);
+    if (!response.ok) {
+      throw new Error(`${url} 조회 실패: ${response.status} ${response.statusText}`);
+    }
+    return response.json();
+  }, pageSize);
+}
@@ -13,3 +13,4 @@ export * from './axiosClient';
 export * from './analytics';
 export * from './addressConverter';
 export * from './actions';
+export * from './datagatherList';
@@ -0,0 +1,75 @@
+# ============================================================================
+# ⏱️ 순수 ASGI 접근 로그 미들웨어 (처리 시간 헤더 + 라우트 매칭 로그)
+# ============================================================================
+
+"""
+요청 처리 시간 측정, X-Process-Time 헤더, 라우트 매칭/접근 로그를 처리하는 순수 ASGI 미들웨어
+
+기존 @app.middleware("http") 두 겹(add_process_time_header, log_matched_route)은
+BaseHTTPMiddleware 라서 요청마다 태스크/메모리 스트림을 추가로 만들고 StreamingResponse 를
+한 번 더 감싸 중계했습니다. 이 미들웨어는 send 만 감싸서
+- http.response.start 에 X-Process-Time 헤더를 붙이고 (응답 시작까지 걸린 시간)
+- 마지막 바디 청크가 나간 뒤 전체 시간/상태/매칭된 라우트를 접근 로그로 남깁니다.
+
+로그는 gateway_logger 큐에 넣기만 하고 출력은 리스너 스레드가 하므로 응답 전송을 기다리게 하지 않습니다.
+샘플링 비율은 GATEWAY_ACCESS_LOG_SAMPLE_RATE (5xx 는 항상 기록)를 따릅니다.
+"""
+
+import time
+from typing import Any, Dict
+
+from .utility.logger import gateway_logger
+
+
+class AccessLogMiddleware:
+    """처리 시간 헤더 + 샘플링된 구조화 접근 로그 (순수 ASGI)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        state: Dict[str, Any] = {"status": 500, "logged": False}
+
+        def log_access():
+            if state["logged"]:
+                return
+            state["logged"] = True
+            status = state["status"]
+            if not gateway_logger.should_sample(status):
+                return
+            # 라우터가 같은 scope 에 매칭된 라우트를 기록함
+            route = scope.get("route")
+            gateway_logger.log_access({
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path", None),
+                "status": status,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                "client_ip": scope["client"][0] if scope.get("client") else None
+            })
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", str(time.perf_counter() - started).encode("latin-1")))
+                message = {**message, "headers": headers}
+                await send(message)
+                return
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                log_access()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 예외 또는 클라이언트 연결 종료로 마지막 청크가 나가지 않은 경우도 기록
+            log_access()
+
+
+__all__ = ["AccessLogMiddleware"]
@@ -0,0 +1,198 @@
+# ============================================================================
+# 🌐 업스트림 공용 HTTP 클라이언트 레지스트리
+# ============================================================================
+
+"""
+업스트림 서비스별로 하나씩 유지하는 httpx.AsyncClient 레지스트리
+
+요청마다 httpx.AsyncClient를 새로 만들면 매번 TCP/TLS 핸드셰이크가 발생하므로,
+lifespan에서 업스트림별 클라이언트를 만들어 keep-alive 연결을 재사용합니다.
+요청/응답 바디는 메모리에 모으지 않고 StreamingResponse로 그대로 흘려보냅니다.
+
+환경변수:
+- GATEWAY_HTTP_MAX_CONNECTIONS: 업스트림당 최대 연결 수 (기본 100)
+- GATEWAY_HTTP_MAX_KEEPALIVE: 업스트림당 유지할 keep-alive 연결 수 (기본 20)
+- GATEWAY_HTTP_KEEPALIVE_EXPIRY: 유휴 keep-alive 연결 유지 시간 초 (기본 30)
+- GATEWAY_HTTP2: HTTP/2 사용 여부 (기본 true, h2 패키지가 설치된 경우에만 적용)
+"""
+
+import os
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+from fastapi import Request
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+from .utility.logger import gateway_logger
+
+try:
+    import h2  # noqa: F401  (httpx[http2] 설치 여부 확인용)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# 프록시 구간마다 다시 정해지는 hop-by-hop 헤더 (RFC 7230 6.1)
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailer", "transfer-encoding", "upgrade"
+}
+
+DEFAULT_TIMEOUT = httpx.Timeout(connect=15.0, read=60.0, write=60.0, pool=30.0)
+
+TimeoutTypes = Union[float, httpx.Timeout]
+
+
+class UpstreamClientRegistry:
+    """업스트림 base URL별 장기 유지 httpx.AsyncClient 레지스트리 (lifespan에서 open/close)"""
+
+    def __init__(self):
+        self.max_connections = int(os.getenv("GATEWAY_HTTP_MAX_CONNECTIONS", "100"))
+        self.max_keepalive = int(os.getenv("GATEWAY_HTTP_MAX_KEEPALIVE", "20"))
+        self.keepalive_expiry = float(os.getenv("GATEWAY_HTTP_KEEPALIVE_EXPIRY", "30"))
+        self.http2 = HTTP2_AVAILABLE and os.getenv("GATEWAY_HTTP2", "true").lower() == "true"
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _key(base_url: str) -> str:
+        return base_url.strip().rstrip("/")
+
+    def _create_client(self, base_url: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            http2=self.http2,
+            follow_redirects=False
+        )
+
+    async def open(self, base_urls: Iterable[str]):
+        """설정된 업스트림 클라이언트를 미리 생성"""
+        for base_url in base_urls:
+            if base_url:
+                await self.get_client(base_url)
+        gateway_logger.log_info(
+            f"✅ 업스트림 HTTP 클라이언트 준비 완료: {len(self._clients)}개 "
+            f"(max_connections={self.max_connections}, keepalive={self.max_keepalive}, http2={self.http2})"
+        )
+
+    async def get_client(self, base_url: str) -> httpx.AsyncClient:
+        """업스트림 클라이언트 반환 (없으면 생성)"""
+        key = self._key(base_url)
+        client = self._clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+
+        async with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = self._create_client(key)
+                self._clients[key] = client
+            return client
+
+    async def close(self):
+        """모든 업스트림 클라이언트 종료"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                gateway_logger.log_warning(f"업스트림 HTTP 클라이언트 종료 실패: {str(e)}")
+        gateway_logger.log_info("✅ 업스트림 HTTP 클라이언트 종료 완료")
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            "upstreams": sorted(self._clients.keys()),
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive,
+            "keepalive_expiry": self.keepalive_expiry,
+            "http2": self.http2
+        }
+
+
+# 게이트웨이 전역 레지스트리 인스턴스
+http_clients = UpstreamClientRegistry()
+
+
+def filter_response_headers(headers: httpx.Headers) -> List[Tuple[str, str]]:
+    """업스트림 응답 헤더에서 hop-by-hop 헤더 제거 (Set-Cookie 등 중복 헤더 유지)"""
+    return [
+        (name, value) for name, value in headers.multi_items()
+        if name.lower() not in HOP_BY_HOP_HEADERS
+    ]
+
+
+def request_body_stream(request: Request):
+    """요청 바디를 메모리에 모으지 않고 업스트림으로 흘려보낼 스트림 (바디가 없으면 None)"""
+    if not request.headers.get("content-length") and not request.headers.get("transfer-encoding"):
+        return None
+    return request.stream()
+
+
+def forward_request_headers(request: Request) -> Dict[str, str]:
+    """클라이언트 요청 헤더에서 host/hop-by-hop 헤더 제거 (content-length는 스트리밍 전송을 위해 유지)"""
+    return {
+        name: value for name, value in request.headers.items()
+        if name.lower() != "host" and name.lower() not in HOP_BY_HOP_HEADERS
+    }
+
+
+async def send_upstream(
+    base_url: str,
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    content=None,
+    timeout: TimeoutTypes = DEFAULT_TIMEOUT
+) -> httpx.Response:
+    """공용 클라이언트로 요청을 보내고 응답 바디는 읽지 않은 상태(stream)로 반환"""
+    client = await http_clients.get_client(base_url)
+    upstream_request = client.build_request(method, url, headers=headers, content=content, timeout=timeout)
+    return await client.send(upstream_request, stream=True)
+
+
+def streaming_response(upstream_response: httpx.Response) -> StreamingResponse:
+    """업스트림 응답을 그대로 흘려보내는 StreamingResponse (전송 완료 후 연결 반환)"""
+    response = StreamingResponse(
+        upstream_response.aiter_raw(),
+        status_code=upstream_response.status_code,
+        background=BackgroundTask(upstream_response.aclose)
+    )
+    response.raw_headers.extend(
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in filter_response_headers(upstream_response.headers)
+    )
+    return response
+
+
+async def stream_upstream(
+    base_url: str,
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    content=None,
+    timeout: TimeoutTypes = DEFAULT_TIMEOUT
+) -> StreamingResponse:
+    """업스트림 요청 후 응답을 StreamingResponse로 반환"""
+    upstream_response = await send_upstream(base_url, method, url, headers=headers, content=content, timeout=timeout)
+    return streaming_response(upstream_response)
+
+
+__all__ = [
+    "HOP_BY_HOP_HEADERS",
+    "HTTP2_AVAILABLE",
+    "UpstreamClientRegistry",
+    "http_clients",
+    "filter_response_headers",
+    "forward_request_headers",
+    "request_body_stream",
+    "send_upstream",
+    "streaming_response",
+    "stream_upstream"
+]
@@ -0,0 +1,545 @@
+# ============================================================================
+# 🗃️ 게이트웨이 응답 캐시 (기준정보 GET, ETag + stale-while-revalidate)
+# ============================================================================
+
+"""
+화이트리스트에 등록한 CBAM 기준정보 GET 응답을 게이트웨이에서 캐시하는 모듈
+
+제품/원료 입력 폼은 렌더링마다 원료·연료 마스터, HS-CN 매핑, 사업장/제품 이름 목록을
+조회하고, 이 요청은 모두 cbam 서비스와 Postgres 까지 내려갔습니다. 데이터는 거의 바뀌지 않으므로
+업스트림 경로(재작성 후, 예: /matdir/material-master) 접두사별 TTL 로 200 응답을 보관합니다.
+
+- 신선(age < TTL): 캐시 응답 (X-Cache: HIT)
+- TTL 이후 GATEWAY_CACHE_STALE_SECONDS 이내: 오래된 응답을 바로 주고 백그라운드에서 갱신 (X-Cache: STALE)
+- 그 외/없음: 업스트림 조회 후 저장 (X-Cache: MISS, 같은 키의 동시 조회는 한 번만 보냄)
+- ETag 는 업스트림 값이 없으면 바디 해시로 만들고, If-None-Match 가 같으면 바디 없이 304
+- 요청의 Cache-Control: no-cache 는 캐시를 건너뛰고 업스트림에서 다시 받아 저장
+
+무효화: 게이트웨이를 지나는 쓰기(POST/PUT/PATCH/DELETE)의 업스트림 경로 첫 구간(/matdir, /mapping, ...)과
+같은 그룹의 버전 카운터를 올립니다. 항목은 저장 당시 버전과 현재 버전이 다르면 버려집니다.
+(게이트웨이를 거치지 않은 쓰기는 TTL 이 지나야 반영됩니다.)
+
+메모리 LRU 가 1차 캐시이고, GATEWAY_CACHE_BACKEND=redis 면 Redis 를 공유 2차 캐시/버전 저장소로 씁니다
+(redis 패키지 또는 주소가 없거나 연결에 실패하면 메모리만 사용).
+화이트리스트 경로는 사용자와 무관한 응답이어야 합니다 (Set-Cookie, Cache-Control: private/no-store 응답은 저장하지 않음).
+
+환경변수:
+- GATEWAY_CACHE_ENABLED: 캐시 사용 여부 (기본 false)
+- GATEWAY_CACHE_ROUTES: "업스트림경로접두사=TTL초[@그룹]" 쉼표 목록 (기본 DEFAULT_CACHE_ROUTES)
+- GATEWAY_CACHE_STALE_SECONDS: TTL 이후 오래된 응답을 주며 갱신할 시간 초 (기본 60)
+- GATEWAY_CACHE_MAX_ENTRIES: 메모리 캐시 최대 항목 수 (기본 1024)
+- GATEWAY_CACHE_MAX_BODY_BYTES: 저장할 최대 응답 크기 (기본 1 MiB, 넘으면 그대로 스트리밍)
+- GATEWAY_CACHE_BACKEND: memory | redis (기본 memory)
+- GATEWAY_CACHE_REDIS_URL: Redis 주소 (기본 REDIS_URL)
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import httpx
+from fastapi import Request
+from starlette.background import BackgroundTask
+from starlette.responses import Response, StreamingResponse
+
+from .http_client import filter_response_headers
+from .route_table import RouteMatch
+from .utility.logger import gateway_logger
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis 패키지가 없으면 메모리 백엔드만 사용
+    aioredis = None
+
+REDIS_KEY_PREFIX = "gateway:cache"
+
+# 업스트림(cbam) 경로 기준 기본 화이트리스트 (그룹을 생략하면 경로 첫 구간)
+# cbam 매핑 라우터는 /mapping 에 마운트되므로 CN 코드 조회(/mapping/cncode/lookup/...)도 /mapping/ 에 포함
+DEFAULT_CACHE_ROUTES = (
+    "/matdir/material-master=3600,"
+    "/fueldir/fuel-master=3600,"
+    "/mapping/=600,"
+    "/install/names=60,"
+    "/product/names=60"
+)
+
+# 게이트웨이 캐시가 직접 처리하는 조건부 요청 헤더 (업스트림에는 전달하지 않음)
+CONDITIONAL_REQUEST_HEADERS = frozenset({"if-none-match", "if-modified-since", "if-match", "if-unmodified-since"})
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# 저장하지 않는 응답 헤더 (길이는 응답 생성 시 다시 계산)
+_UNSTORED_HEADERS = frozenset({"content-length", "etag", "age", "x-cache", "x-process-time"})
+
+UpstreamFetch = Callable[[], Awaitable[httpx.Response]]
+
+
+def _path_group(path: str) -> str:
+    """경로 첫 구간 (/mapping/search/hs/72 -> mapping)"""
+    return path.lstrip("/").split("/", 1)[0]
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """업스트림 경로 접두사 하나의 캐시 규칙"""
+    prefix: str
+    ttl: float
+    group: str
+
+
+@dataclass
+class CachedResponse:
+    """캐시 항목 (stored_at 은 Redis 로 공유하므로 wall clock)"""
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    etag: str
+    stored_at: float
+    ttl: float
+    group: str = ""
+    version: int = 0
+
+    def age(self, now: float) -> float:
+        return max(0.0, now - self.stored_at)
+
+    def to_payload(self) -> bytes:
+        meta = {
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "etag": self.etag,
+            "stored_at": self.stored_at,
+            "ttl": self.ttl
+        }
+        return json.dumps(meta, separators=(",", ":")).encode("utf-8") + b"\n" + self.body
+
+    @classmethod
+    def from_payload(cls, payload: bytes, group: str, version: int) -> "CachedResponse":
+        meta, body = payload.split(b"\n", 1)
+        data = json.loads(meta)
+        return cls(
+            status_code=data["status_code"],
+            headers=[tuple(header) for header in data["headers"]],
+            body=body,
+            etag=data["etag"],
+            stored_at=data["stored_at"],
+            ttl=data["ttl"],
+            group=group,
+            version=version
+        )
+
+
+def parse_cache_routes(spec: str) -> List[CacheRule]:
+    """'접두사=TTL[@그룹]' 목록 파싱 (긴 접두사 우선)"""
+    rules = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            prefix, setting = item.rsplit("=", 1)
+            ttl, _, group = setting.partition("@")
+            prefix = "/" + prefix.strip().lstrip("/")
+            rules.append(CacheRule(prefix, float(ttl), group.strip() or _path_group(prefix)))
+        except ValueError:
+            gateway_logger.log_warning(f"GATEWAY_CACHE_ROUTES 항목을 무시합니다: {item}")
+    return sorted(rules, key=lambda rule: len(rule.prefix), reverse=True)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 약한 비교 (RFC 7232 3.2)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
+
+
+def _is_storable(upstream_response: httpx.Response) -> bool:
+    if upstream_response.status_code != 200 or "set-cookie" in upstream_response.headers:
+        return False
+    cache_control = upstream_response.headers.get("cache-control", "").lower()
+    return "no-store" not in cache_control and "private" not in cache_control
+
+
+class GatewayResponseCache:
+    """화이트리스트 GET 응답 캐시 (메모리 LRU + 선택적 Redis)"""
+
+    def __init__(self):
+        self.enabled = os.getenv("GATEWAY_CACHE_ENABLED", "false").lower() == "true"
+        self.rules = parse_cache_routes(os.getenv("GATEWAY_CACHE_ROUTES", DEFAULT_CACHE_ROUTES))
+        self.groups: Set[str] = {rule.group for rule in self.rules}
+        self.stale_seconds = float(os.getenv("GATEWAY_CACHE_STALE_SECONDS", "60"))
+        self.max_entries = int(os.getenv("GATEWAY_CACHE_MAX_ENTRIES", "1024"))
+        self.max_body_bytes = int(os.getenv("GATEWAY_CACHE_MAX_BODY_BYTES", str(1024 * 1024)))
+        self.backend = os.getenv("GATEWAY_CACHE_BACKEND", "memory").lower()
+        self.redis_url = os.getenv("GATEWAY_CACHE_REDIS_URL", os.getenv("REDIS_URL", ""))
+
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._redis = None
+        self._redis_lock = asyncio.Lock()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.stores = 0
+        self.uncacheable = 0
+        self.refreshes = 0
+        self.evictions = 0
+        self.purges = 0
+        self.errors = 0
+
+    # ============================================================================
+    # 🔌 Redis 연결
+    # ============================================================================
+
+    async def _get_redis(self):
+        """Redis 클라이언트 반환 (설정/패키지가 없거나 연결 실패 시 메모리 백엔드로 전환)"""
+        if self.backend != "redis":
+            return None
+        if self._redis is not None:
+            return self._redis
+
+        async with self._redis_lock:
+            if self._redis is not None:
+                return self._redis
+            if aioredis is None or not self.redis_url:
+                gateway_logger.log_warning("redis 패키지 또는 GATEWAY_CACHE_REDIS_URL이 없어 메모리 응답 캐시를 사용합니다.")
+                self.backend = "memory"
+                return None
+            try:
+                client = aioredis.from_url(self.redis_url)
+                await client.ping()
+                self._redis = client
+                gateway_logger.log_info("✅ 게이트웨이 응답 캐시 Redis 연결 성공")
+            except Exception as e:
+                gateway_logger.log_warning(f"게이트웨이 응답 캐시 Redis 연결 실패, 메모리 캐시 사용: {str(e)}")
+                self.backend = "memory"
+            return self._redis
+
+    async def close(self):
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    # ============================================================================
+    # 🔢 규칙/버전
+    # ============================================================================
+
+    def rule_for(self, upstream_path: str) -> Optional[CacheRule]:
+        """업스트림 경로에 해당하는 캐시 규칙 (없으면 None)"""
+        for rule in self.rules:
+            if upstream_path.startswith(rule.prefix):
+                return rule
+        return None
+
+    def is_cacheable(self, request: Request, match: RouteMatch) -> bool:
+        return self.enabled and request.method == "GET" and self.rule_for(match.upstream_path) is not None
+
+    async def _version(self, group: str) -> int:
+        redis = await self._get_redis()
+        if redis is None:
+            return self._versions.get(group, 0)
+        return int(await redis.get(f"{REDIS_KEY_PREFIX}:version:{group}") or 0)
+
+    async def purge_for_write(self, request: Request, match: RouteMatch):
+        """쓰기 요청의 업스트림 경로 그룹 버전 증가 (해당 그룹 항목 전체 무효화)"""
+        if not self.enabled or request.method in SAFE_METHODS:
+            return
+        group = _path_group(match.upstream_path)
+        if group not in self.groups:
+            return
+        self.purges += 1
+
+        self._versions[group] = self._versions.get(group, 0) + 1
+        for key in [key for key, entry in self._entries.items() if entry.group == group]:
+            del self._entries[key]
+        try:
+            redis = await self._get_redis()
+            if redis is not None:
+                await redis.incr(f"{REDIS_KEY_PREFIX}:version:{group}")
+        except Exception as e:
+            self.errors += 1
+            gateway_logger.log_warning(f"게이트웨이 응답 캐시 무효화 실패: {str(e)}")
+
+    # ============================================================================
+    # 📦 조회/저장
+    # ============================================================================
+
+    @staticmethod
+    def _key(request: Request, match: RouteMatch) -> str:
+        # 업스트림이 Accept-Encoding 에 따라 압축할 수 있으므로 키에 포함
+        key = f"{match.target_url(request.url.query)}|{request.headers.get('accept-encoding', '')}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _redis_key(self, key: str, group: str, version: int) -> str:
+        return f"{REDIS_KEY_PREFIX}:{group}:{version}:{key}"
+
+    async def _get(self, key: str, group: str, version: int) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.version == version and entry.age(time.time()) < entry.ttl + self.stale_seconds:
+                self._entries.move_to_end(key)
+                return entry
+            del self._entries[key]
+
+        redis = await self._get_redis()
+        if redis is None:
+            return None
+        payload = await redis.get(self._redis_key(key, group, version))
+        if not payload:
+            return None
+        entry = CachedResponse.from_payload(payload, group, version)
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: CachedResponse):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def _set(self, key: str, entry: CachedResponse):
+        self._remember(key, entry)
+        self.stores += 1
+        redis = await self._get_redis()
+        if redis is not None:
+            await redis.set(
+                self._redis_key(key, entry.group, entry.version),
+                entry.to_payload(),
+                ex=max(1, int(entry.ttl + self.stale_seconds))
+            )
+
+    # ============================================================================
+    # 🌐 업스트림 조회
+    # ============================================================================
+
+    async def _read_upstream(
+        self, upstream_response: httpx.Response, rule: CacheRule, version: int
+    ) -> Tuple[Optional[CachedResponse], List[bytes], Optional[AsyncIterator[bytes]]]:
+        """응답 바디를 최대 크기까지 읽음 -> (저장할 항목, 읽은 청크, 남은 바디 이터레이터)"""
+        chunks: List[bytes] = []
+        if not _is_storable(upstream_response):
+            return None, chunks, None
+
+        size = 0
+        iterator = upstream_response.aiter_raw()
+        async for chunk in iterator:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                return None, chunks, iterator
+
+        body = b"".join(chunks)
+        headers = [
+            (name, value) for name, value in filter_response_headers(upstream_response.headers)
+            if name.lower() not in _UNSTORED_HEADERS
+        ]
+        etag = upstream_response.headers.get("etag") or f'"{hashlib.sha1(body).hexdigest()}"'
+        entry = CachedResponse(
+            status_code=upstream_response.status_code,
+            headers=headers,
+            body=body,
+            etag=etag,
+            stored_at=time.time(),
+            ttl=rule.ttl,
+            group=rule.group,
+            version=version
+        )
+        return entry, chunks, None
+
+    async def _fill(self, key: str, rule: CacheRule, version: int, fetch: UpstreamFetch):
+        """업스트림 조회 후 저장 -> (항목, 항목이 없을 때 그대로 돌려줄 업스트림 응답과 읽은 청크)"""
+        upstream_response = await fetch()
+        try:
+            entry, chunks, iterator = await self._read_upstream(upstream_response, rule, version)
+        except BaseException:
+            await upstream_response.aclose()
+            raise
+
+        if entry is None:
+            self.uncacheable += 1
+            return None, (upstream_response, chunks, iterator)
+
+        await upstream_response.aclose()
+        try:
+            await self._set(key, entry)
+        except Exception as e:
+            self.errors += 1
+            gateway_logger.log_warning(f"게이트웨이 응답 캐시 저장 실패: {str(e)}")
+        return entry, None
+
+    async def _fill_once(self, key: str, rule: CacheRule, version: int, fetch: UpstreamFetch):
+        """같은 키의 동시 조회는 먼저 시작한 조회 결과를 기다림 (저장 불가 응답이면 각자 조회)"""
+        pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                entry = await asyncio.shield(pending)
+            except Exception:
+                entry = None
+            if entry is not None:
+                return entry, None
+            return await self._fill(key, rule, version, fetch)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            entry, passthrough = await self._fill(key, rule, version, fetch)
+            future.set_result(entry)
+            return entry, passthrough
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없어도 예외가 기록되지 않은 채 남지 않도록 조회
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _refresh(self, key: str, rule: CacheRule, version: int, fetch: UpstreamFetch):
+        """오래된 항목 백그라운드 갱신 (키마다 하나만)"""
+        if key in self._inflight:
+            return
+
+        async def run():
+            try:
+                entry, passthrough = await self._fill_once(key, rule, version, fetch)
+                if passthrough is not None:
+                    await passthrough[0].aclose()
+                self.refreshes += 1
+            except Exception as e:
+                self.errors += 1
+                gateway_logger.log_warning(f"게이트웨이 응답 캐시 갱신 실패: {str(e)}")
+
+        task = asyncio.create_task(run())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    # ============================================================================
+    # 🚦 요청 처리
+    # ============================================================================
+
+    async def serve(self, request: Request, match: RouteMatch, fetch: UpstreamFetch) -> Response:
+        """캐시 응답 또는 업스트림 조회 (is_cacheable 이 True 인 요청만)"""
+        rule = self.rule_for(match.upstream_path)
+        key = self._key(request, match)
+        revalidate = "no-cache" in request.headers.get("cache-control", "").lower()
+
+        try:
+            version = await self._version(rule.group)
+            entry = None if revalidate else await self._get(key, rule.group, version)
+        except Exception as e:
+            self.errors += 1
+            gateway_logger.log_warning(f"게이트웨이 응답 캐시 조회 실패: {str(e)}")
+            return streaming_passthrough(await fetch())
+
+        if entry is not None:
+            age = entry.age(time.time())
+            if age < entry.ttl:
+                self.hits += 1
+                return self._respond(request, entry, "HIT", age)
+            self.stale_hits += 1
+            self._refresh(key, rule, version, fetch)
+            return self._respond(request, entry, "STALE", age)
+
+        self.misses += 1
+        entry, passthrough = await self._fill_once(key, rule, version, fetch)
+        if entry is None:
+            return streaming_passthrough(*passthrough)
+        return self._respond(request, entry, "MISS", 0.0)
+
+    def _respond(self, request: Request, entry: CachedResponse, cache_status: str, age: float) -> Response:
+        extra = [
+            (b"etag", entry.etag.encode("latin-1")),
+            (b"age", str(int(age)).encode("latin-1")),
+            (b"x-cache", cache_status.encode("latin-1"))
+        ]
+        if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+            self.not_modified += 1
+            response = Response(status_code=304)
+            response.raw_headers.extend(extra)
+            return response
+
+        response = Response(content=entry.body, status_code=entry.status_code)
+        response.raw_headers.extend(
+            (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in entry.headers
+        )
+        response.raw_headers.extend(extra)
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "backend": self.backend,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "stale_seconds": self.stale_seconds,
+            "routes": {rule.prefix: {"ttl": rule.ttl, "group": rule.group} for rule in self.rules},
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "stores": self.stores,
+            "uncacheable": self.uncacheable,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+            "purges": self.purges,
+            "errors": self.errors
+        }
+
+
+def streaming_passthrough(
+    upstream_response: httpx.Response,
+    chunks: Iterable[bytes] = (),
+    iterator: Optional[AsyncIterator[bytes]] = None
+) -> StreamingResponse:
+    """저장하지 않는 업스트림 응답을 이미 읽은 청크부터 이어서 스트리밍"""
+
+    async def body():
+        for chunk in chunks:
+            yield chunk
+        async for chunk in iterator or upstream_response.aiter_raw():
+            yield chunk
+
+    response = StreamingResponse(
+        body(),
+        status_code=upstream_response.status_code,
+        background=BackgroundTask(upstream_response.aclose)
+    )
+    response.raw_headers.extend(
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in filter_response_headers(upstream_response.headers)
+    )
+    return response
+
+
+# 게이트웨이 전역 캐시 인스턴스
+response_cache = GatewayResponseCache()
+
+
+__all__ = [
+    "CONDITIONAL_REQUEST_HEADERS",
+    "DEFAULT_CACHE_ROUTES",
+    "CacheRule",
+    "CachedResponse",
+    "GatewayResponseCache",
+    "parse_cache_routes",
+    "response_cache"
+]
@@ -0,0 +1,199 @@
+# ============================================================================
+# 🧭 컴파일된 프록시 라우팅 테이블 (경로 접두사 radix trie)
+# ============================================================================
+
+"""
+경로 접두사 -> (업스트림, 경로 재작성 규칙) 라우팅 테이블
+
+기존에는 ProxyController.get_target_service 가 요청마다 service_map 접두사를 길이순으로
+정렬해 startswith 로 하나씩 비교했고, main.py 는 서비스마다 거의 같은 catch-all
+@app.api_route(/api/v1/cbam/{path}, /cbam/{path}, /auth/{path}, ...)를 선언해
+Starlette 가 순서대로 정규식을 검사했습니다.
+
+시작 시 설정으로 RouteRule 목록을 만들어 압축 radix trie 에 넣고, 요청 경로를 한 번 훑어
+가장 긴 접두사 규칙을 찾습니다 (경로 길이에 비례, 규칙 수와 무관). ProxyRoute 는 이 테이블을
+쓰는 단일 ASGI 라우트로, 일치하는 규칙이 없으면 다음 라우트로 넘어갑니다.
+
+경로 재작성: upstream_path = target_prefix + (경로에서 prefix 를 뗀 나머지)
+- append_slash_for 에 있는 나머지(예: CBAM 기본 리소스 "install")는 끝에 "/" 를 붙임
+- 업스트림 쿼리 문자열은 핸들러가 그대로 붙임
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from fastapi import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import BaseRoute, Match, NoMatchFound
+
+# 규칙 처리 방식
+KIND_FORWARD = "forward"        # 그대로 전달 (헬스/검증 없음)
+KIND_CONTROLLER = "controller"  # ProxyController (서킷 브레이커 + 요청 검증)
+
+PROXY_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"})
+
+
+@dataclass(frozen=True)
+class RouteRule:
+    """경로 접두사 하나의 라우팅 규칙"""
+    prefix: str
+    upstream: str
+    target_prefix: Optional[str] = None
+    kind: str = KIND_CONTROLLER
+    service: str = ""
+    append_slash_for: FrozenSet[str] = field(default_factory=frozenset)
+
+    def rewrite(self, path: str) -> str:
+        remainder = path[len(self.prefix):]
+        target_prefix = self.prefix if self.target_prefix is None else self.target_prefix
+        if remainder.lstrip("/") in self.append_slash_for:
+            remainder += "/"
+        return f"{target_prefix}{remainder}"
+
+
+@dataclass(frozen=True)
+class RouteMatch:
+    """경로 조회 결과"""
+    rule: RouteRule
+    path: str
+    upstream_path: str
+
+    @property
+    def upstream(self) -> str:
+        return self.rule.upstream
+
+    def target_url(self, query: str = "") -> str:
+        url = f"{self.rule.upstream.rstrip('/')}{self.upstream_path}"
+        return f"{url}?{query}" if query else url
+
+
+class _RadixNode:
+    """압축 radix trie 노드 (자식은 간선 첫 글자로 찾음)"""
+
+    __slots__ = ("children", "rule")
+
+    def __init__(self):
+        self.children: Dict[str, Tuple[str, "_RadixNode"]] = {}
+        self.rule: Optional[RouteRule] = None
+
+
+class RouteTable:
+    """접두사 radix trie 라우팅 테이블 (가장 긴 접두사 일치)"""
+
+    def __init__(self, rules: Iterable[RouteRule] = ()):
+        self._root = _RadixNode()
+        self.rules: List[RouteRule] = []
+        for rule in rules:
+            self.add(rule)
+
+    def add(self, rule: RouteRule):
+        """규칙 추가 (같은 접두사는 먼저 추가한 규칙 유지)"""
+        node = self._root
+        key = rule.prefix
+        while key:
+            edge = node.children.get(key[0])
+            if edge is None:
+                child = _RadixNode()
+                node.children[key[0]] = (key, child)
+                node = child
+                key = ""
+                break
+            label, child = edge
+            common = 0
+            limit = min(len(label), len(key))
+            while common < limit and label[common] == key[common]:
+                common += 1
+            if common < len(label):
+                # 간선 분할
+                middle = _RadixNode()
+                middle.children[label[common]] = (label[common:], child)
+                node.children[key[0]] = (label[:common], middle)
+                child = middle
+            node = child
+            key = key[common:]
+        if node.rule is None:
+            node.rule = rule
+            self.rules.append(rule)
+
+    def lookup(self, path: str) -> Optional[RouteRule]:
+        """경로의 가장 긴 접두사 규칙"""
+        node = self._root
+        best = node.rule
+        position = 0
+        while position < len(path):
+            edge = node.children.get(path[position])
+            if edge is None:
+                break
+            label, child = edge
+            if not path.startswith(label, position):
+                break
+            position += len(label)
+            node = child
+            if node.rule is not None:
+                best = node.rule
+        return best
+
+    def match(self, path: str) -> Optional[RouteMatch]:
+        rule = self.lookup(path)
+        if rule is None:
+            return None
+        return RouteMatch(rule=rule, path=path, upstream_path=rule.rewrite(path))
+
+    def describe(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "prefix": rule.prefix,
+                "upstream": rule.upstream,
+                "target_prefix": rule.prefix if rule.target_prefix is None else rule.target_prefix,
+                "kind": rule.kind,
+                "service": rule.service
+            }
+            for rule in sorted(self.rules, key=lambda r: r.prefix)
+        ]
+
+
+ProxyEndpoint = Callable[[Request, RouteMatch], Awaitable[Any]]
+
+
+class ProxyRoute(BaseRoute):
+    """RouteTable 을 쓰는 단일 ASGI 프록시 라우트 (규칙이 없으면 Match.NONE 으로 다음 라우트에 양보)"""
+
+    def __init__(self, table: RouteTable, endpoint: ProxyEndpoint, name: str = "compiled_proxy"):
+        self.table = table
+        self.endpoint = endpoint
+        self.name = name
+        self.path = "/{prefix}*"
+        self.methods = set(PROXY_METHODS)
+
+    def matches(self, scope) -> Tuple[Match, Dict[str, Any]]:
+        if scope["type"] != "http":
+            return Match.NONE, {}
+        route_match = self.table.match(scope["path"])
+        if route_match is None:
+            return Match.NONE, {}
+        if scope["method"] not in self.methods:
+            return Match.PARTIAL, {"route": self}
+        return Match.FULL, {"route": self, "route_match": route_match}
+
+    def url_path_for(self, name: str, /, **path_params: Any):
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope, receive, send):
+        if scope["method"] not in self.methods:
+            response = PlainTextResponse("Method Not Allowed", status_code=405, headers={"Allow": ", ".join(sorted(self.methods))})
+            await response(scope, receive, send)
+            return
+        request = Request(scope, receive, send)
+        response = await self.endpoint(request, scope["route_match"])
+        await response(scope, receive, send)
+
+
+__all__ = [
+    "KIND_FORWARD",
+    "KIND_CONTROLLER",
+    "PROXY_METHODS",
+    "RouteRule",
+    "RouteMatch",
+    "RouteTable",
+    "ProxyRoute"
+]
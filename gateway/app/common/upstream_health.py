@@ -0,0 +1,274 @@
+# ============================================================================
+# 🩺 업스트림 헬스 모니터 + 서킷 브레이커
+# ============================================================================
+
+"""
+업스트림 서비스 상태를 백그라운드에서 주기적으로 확인하고 업스트림별 서킷 브레이커를 유지하는 모듈
+
+기존 ProxyController.proxy_request 는 프록시 요청마다 업스트림 /health 를 먼저 호출해
+업스트림 요청 수가 두 배가 되고 요청마다 왕복 시간이 한 번 더 붙었습니다.
+lifespan 에서 시작한 모니터가 간격마다 모든 업스트림을 동시에 확인해 상태를 캐시하고,
+요청 경로에서는 업스트림별 브레이커 상태만 dict 조회로 확인합니다 (O(1)).
+
+브레이커 상태:
+- closed: 요청 허용. 연속 실패가 GATEWAY_BREAKER_FAILURE_THRESHOLD 에 도달하거나 헬스체크가 실패하면 open
+- open: 요청 즉시 503. GATEWAY_BREAKER_RESET_TIMEOUT 이 지나면 half_open
+- half_open: 시험 요청 하나만 허용. 성공하면 closed, 실패하면 다시 open (헬스체크 성공도 closed 로 복구)
+
+/status 도 다시 확인하지 않고 같은 캐시 상태를 읽습니다.
+
+환경변수:
+- GATEWAY_HEALTH_INTERVAL: 헬스체크 간격 초 (기본 10)
+- GATEWAY_HEALTH_TIMEOUT: 헬스체크 요청 타임아웃 초 (기본 5)
+- GATEWAY_HEALTH_PATH: 업스트림 헬스체크 경로 (기본 /health)
+- GATEWAY_BREAKER_FAILURE_THRESHOLD: 브레이커를 여는 연속 요청 실패 수 (기본 5)
+- GATEWAY_BREAKER_RESET_TIMEOUT: open 상태 유지 시간 초 (기본 30)
+"""
+
+import os
+import time
+import asyncio
+from typing import Any, Dict, Iterable, Optional
+
+from .http_client import http_clients
+from .utility.logger import gateway_logger
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+HEALTH_INTERVAL = float(os.getenv("GATEWAY_HEALTH_INTERVAL", "10"))
+HEALTH_TIMEOUT = float(os.getenv("GATEWAY_HEALTH_TIMEOUT", "5"))
+HEALTH_PATH = "/" + os.getenv("GATEWAY_HEALTH_PATH", "/health").lstrip("/")
+BREAKER_FAILURE_THRESHOLD = max(1, int(os.getenv("GATEWAY_BREAKER_FAILURE_THRESHOLD", "5")))
+BREAKER_RESET_TIMEOUT = float(os.getenv("GATEWAY_BREAKER_RESET_TIMEOUT", "30"))
+
+
+def _key(base_url: str) -> str:
+    return base_url.strip().rstrip("/")
+
+
+class CircuitBreaker:
+    """업스트림 하나의 서킷 브레이커 (요청 경로에서는 allow_request 만 호출)"""
+
+    __slots__ = (
+        "state", "consecutive_failures", "opened_at", "trial_started_at",
+        "failure_threshold", "reset_timeout", "rejected", "opened_count"
+    )
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trial_started_at: Optional[float] = None
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.rejected = 0
+        self.opened_count = 0
+
+    def allow_request(self) -> bool:
+        if self.state == STATE_CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == STATE_OPEN:
+            if now - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self.state = STATE_HALF_OPEN
+            self.trial_started_at = None
+        # half_open: 시험 요청 하나만 통과 (결과가 기록되지 않은 채 reset_timeout 이 지나면 다시 시험)
+        if self.trial_started_at is None or now - self.trial_started_at >= self.reset_timeout:
+            self.trial_started_at = now
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        if self.state != STATE_CLOSED:
+            gateway_logger.log_info("✅ 서킷 브레이커 closed (업스트림 복구)")
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.trial_started_at = None
+
+    def record_failure(self, trip: bool = False):
+        """실패 기록 (trip=True 면 임계값과 관계없이 바로 open)"""
+        self.consecutive_failures += 1
+        if trip or self.state == STATE_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self):
+        if self.state != STATE_OPEN:
+            self.opened_count += 1
+        self.state = STATE_OPEN
+        self.opened_at = time.monotonic()
+        self.trial_started_at = None
+
+    def retry_after(self) -> int:
+        """open 상태가 끝날 때까지 남은 초 (Retry-After 헤더용)"""
+        if self.state != STATE_OPEN:
+            return 0
+        return max(1, int(self.reset_timeout - (time.monotonic() - self.opened_at)) + 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened_count": self.opened_count,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after()
+        }
+
+
+class UpstreamHealthMonitor:
+    """업스트림별 캐시된 헬스 상태와 서킷 브레이커 (lifespan 에서 start/stop)"""
+
+    def __init__(self):
+        self.interval = HEALTH_INTERVAL
+        self.timeout = HEALTH_TIMEOUT
+        self.health_path = HEALTH_PATH
+        self._health: Dict[str, Dict[str, Any]] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.rounds = 0
+
+    def _breaker(self, base_url: str) -> CircuitBreaker:
+        key = _key(base_url)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            self._breakers[key] = breaker
+        return breaker
+
+    # ============================================================================
+    # 🔄 백그라운드 헬스체크
+    # ============================================================================
+
+    async def start(self, base_urls: Iterable[str]):
+        """업스트림 등록 후 헬스체크 태스크 시작 (첫 확인은 즉시 실행)"""
+        for base_url in base_urls:
+            if base_url:
+                key = _key(base_url)
+                self._breaker(key)
+                self._health.setdefault(key, {"healthy": None, "checked_at": None, "latency_ms": None, "error": None})
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        gateway_logger.log_info(
+            f"✅ 업스트림 헬스 모니터 시작: {len(self._health)}개 "
+            f"(interval={self.interval}s, timeout={self.timeout}s, path={self.health_path})"
+        )
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        gateway_logger.log_info("✅ 업스트림 헬스 모니터 종료")
+
+    async def _run(self):
+        while True:
+            try:
+                await self.check_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                gateway_logger.log_warning(f"업스트림 헬스체크 라운드 실패: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    async def check_all(self):
+        """등록된 모든 업스트림을 동시에 확인"""
+        await asyncio.gather(*(self._probe(key) for key in list(self._health)))
+        self.rounds += 1
+
+    async def _probe(self, key: str):
+        started = time.monotonic()
+        error = None
+        try:
+            client = await http_clients.get_client(key)
+            response = await client.get(f"{key}{self.health_path}", timeout=self.timeout)
+            healthy = response.status_code == 200
+            if not healthy:
+                error = f"HTTP {response.status_code}"
+        except Exception as e:
+            healthy = False
+            error = str(e) or type(e).__name__
+
+        previous = self._health.get(key, {}).get("healthy")
+        self._health[key] = {
+            "healthy": healthy,
+            "checked_at": time.time(),
+            "latency_ms": round((time.monotonic() - started) * 1000, 1),
+            "error": error
+        }
+        breaker = self._breaker(key)
+        if healthy:
+            breaker.record_success()
+        else:
+            breaker.record_failure(trip=True)
+        if healthy != previous:
+            if healthy:
+                gateway_logger.log_info(f"✅ 업스트림 정상: {key}")
+            else:
+                gateway_logger.log_warning(f"Health check failed for {key}: {error}")
+
+    # ============================================================================
+    # 🚦 요청 경로 (O(1))
+    # ============================================================================
+
+    def allow_request(self, base_url: str) -> bool:
+        """브레이커가 요청을 허용하는지 (등록되지 않은 업스트림은 항상 허용)"""
+        breaker = self._breakers.get(_key(base_url))
+        return breaker is None or breaker.allow_request()
+
+    def retry_after(self, base_url: str) -> int:
+        breaker = self._breakers.get(_key(base_url))
+        return breaker.retry_after() if breaker else 0
+
+    def record_success(self, base_url: str):
+        breaker = self._breakers.get(_key(base_url))
+        if breaker is not None:
+            breaker.record_success()
+
+    def record_failure(self, base_url: str):
+        breaker = self._breakers.get(_key(base_url))
+        if breaker is not None:
+            breaker.record_failure()
+
+    # ============================================================================
+    # 📊 상태 조회
+    # ============================================================================
+
+    def get_status(self, base_url: str) -> Dict[str, Any]:
+        """캐시된 헬스 상태 + 브레이커 상태 (아직 확인 전이면 healthy=None)"""
+        key = _key(base_url)
+        health = self._health.get(key) or {"healthy": None, "checked_at": None, "latency_ms": None, "error": None}
+        breaker = self._breakers.get(key)
+        return {**health, "circuit": breaker.to_dict() if breaker else None}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval": self.interval,
+            "timeout": self.timeout,
+            "rounds": self.rounds,
+            "failure_threshold": BREAKER_FAILURE_THRESHOLD,
+            "reset_timeout": BREAKER_RESET_TIMEOUT,
+            "upstreams": {key: self.get_status(key) for key in sorted(self._health)}
+        }
+
+
+# 게이트웨이 전역 모니터 인스턴스
+upstream_health = UpstreamHealthMonitor()
+
+
+__all__ = [
+    "STATE_CLOSED",
+    "STATE_OPEN",
+    "STATE_HALF_OPEN",
+    "CircuitBreaker",
+    "UpstreamHealthMonitor",
+    "upstream_health"
+]
@@ -1,10 +1,32 @@
+"""
+게이트웨이 로거
+
+모든 로그 레코드는 QueueHandler 로 메모리 큐에 넣기만 하고, 별도 스레드의 QueueListener 가
+포맷팅과 콘솔 출력을 처리합니다. 요청 로그의 바디 JSON 파싱/민감정보 마스킹/직렬화도
+메시지를 문자열로 만들 때(리스너 스레드) 수행하므로 요청 처리 경로에서는 큐 삽입만 일어납니다.
+
+환경변수:
+- GATEWAY_LOG_QUEUE_SIZE: 로그 큐 최대 레코드 수 (기본 10000, 가득 차면 버리고 dropped 로 집계)
+- GATEWAY_ACCESS_LOG_SAMPLE_RATE: 접근 로그 샘플링 비율 0~1 (기본 1.0, 5xx 응답은 항상 기록)
+- GATEWAY_LOG_BODY_MAX_BYTES: 요청 바디를 파싱/마스킹할 최대 크기 (기본 4096, 초과 시 크기만 기록)
+"""
+
+import os
+import queue
+import random
+import atexit
 import logging
+import logging.handlers
 import json
 from typing import Any, Dict, Optional
 from fastapi import Request, Response
 import time
 import urllib.parse
 
+LOG_QUEUE_SIZE = int(os.getenv("GATEWAY_LOG_QUEUE_SIZE", "10000"))
+ACCESS_LOG_SAMPLE_RATE = min(1.0, max(0.0, float(os.getenv("GATEWAY_ACCESS_LOG_SAMPLE_RATE", "1.0"))))
+LOG_BODY_MAX_BYTES = int(os.getenv("GATEWAY_LOG_BODY_MAX_BYTES", "4096"))
+
 # 민감정보 마스킹을 위한 키 목록
 SENSITIVE_KEYS = {
     'password', 'token', 'authorization', 'secret', 'key', 'api_key',
@@ -30,58 +52,129 @@ class SensitiveDataFilter:
         else:
             return data
 
+class _LazyJson:
+    """리스너 스레드에서 문자열로 바뀔 때 JSON 직렬화하는 로그 메시지"""
+    
+    __slots__ = ("prefix", "data")
+    
+    def __init__(self, prefix: str, data: Dict[str, Any]):
+        self.prefix = prefix
+        self.data = data
+    
+    def __str__(self) -> str:
+        return f"{self.prefix}: {json.dumps(self.data, ensure_ascii=False, default=str)}"
+
+
+class _RequestLogMessage(_LazyJson):
+    """요청 바디 파싱/마스킹을 문자열 변환 시점까지 미루는 요청 로그 메시지"""
+    
+    __slots__ = ("body",)
+    
+    def __init__(self, data: Dict[str, Any], body: Optional[bytes]):
+        super().__init__("REQUEST", data)
+        self.body = body
+    
+    def __str__(self) -> str:
+        body = self.body
+        if not body:
+            body_data = None
+        elif len(body) > LOG_BODY_MAX_BYTES:
+            body_data = f"***BODY_TOO_LARGE ({len(body)} bytes)***"
+        else:
+            try:
+                body_data = SensitiveDataFilter.mask_sensitive_data(json.loads(body))
+            except Exception:
+                body_data = "***BINARY_OR_INVALID_JSON***"
+        
+        # 쿼리 파라미터 URL 디코딩
+        decoded_query_params = {}
+        for key, value in self.data["query_params"].items():
+            try:
+                decoded_query_params[urllib.parse.unquote(key)] = urllib.parse.unquote(value)
+            except Exception:
+                decoded_query_params[key] = value
+        
+        self.data = {**self.data, "decoded_query_params": decoded_query_params, "body": body_data}
+        return super().__str__()
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 레코드를 버리는 QueueHandler"""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스의 리스너가 처리하므로 포맷팅(메시지 생성)은 리스너 스레드로 미룸
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
 class GatewayLogger:
-    """게이트웨이 로깅 클래스"""
+    """게이트웨이 로깅 클래스 (큐 기반 비동기 출력)"""
     
     def __init__(self, name: str = "gateway"):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.sample_rate = ACCESS_LOG_SAMPLE_RATE
+        self.sampled_out = 0
+        
+        # 콘솔 핸들러는 리스너 스레드에서만 실행
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        handler.setFormatter(formatter)
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._queue_handler = _DroppingQueueHandler(self._queue)
+        self._listener = logging.handlers.QueueListener(self._queue, handler, respect_handler_level=True)
         
-        # 콘솔 핸들러 설정
         if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+            self.logger.addHandler(self._queue_handler)
+        self._listener.start()
+        self._running = True
+        atexit.register(self.stop)
+    
+    def stop(self):
+        """큐에 남은 로그를 모두 출력하고 리스너 종료"""
+        if self._running:
+            self._running = False
+            self._listener.stop()
+    
+    def should_sample(self, status_code: int = 200) -> bool:
+        """접근 로그 샘플링 (5xx 는 항상 기록)"""
+        if status_code >= 500 or self.sample_rate >= 1.0:
+            return True
+        if random.random() < self.sample_rate:
+            return True
+        self.sampled_out += 1
+        return False
     
     def log_request(self, request: Request, body: Optional[bytes] = None):
-        """요청 로깅"""
-        # 쿼리 파라미터 로깅 (URL 디코딩 포함)
-        query_params = dict(request.query_params)
-        decoded_query_params = {}
-        for key, value in query_params.items():
-            try:
-                decoded_key = urllib.parse.unquote(key)
-                decoded_value = urllib.parse.unquote(value)
-                decoded_query_params[decoded_key] = decoded_value
-            except:
-                decoded_query_params[key] = value
-        
-        # 요청 바디 로깅 (민감정보 마스킹)
-        body_data = None
-        if body:
-            try:
-                body_data = json.loads(body)
-                body_data = SensitiveDataFilter.mask_sensitive_data(body_data)
-            except:
-                body_data = "***BINARY_OR_INVALID_JSON***"
-        
+        """요청 로깅 (바디 파싱/마스킹은 리스너 스레드에서 수행)"""
+        if not self.should_sample():
+            return
         log_data = {
             "method": request.method,
             "path": str(request.url.path),
-            "query_params": query_params,
-            "decoded_query_params": decoded_query_params,
-            "body": body_data,
+            "query_params": dict(request.query_params),
             "client_ip": request.client.host if request.client else None,
             "user_agent": request.headers.get("user-agent")
         }
-        
-        self.logger.info(f"REQUEST: {json.dumps(log_data, ensure_ascii=False)}")
+        self.logger.info(_RequestLogMessage(log_data, body))
     
     def log_response(self, method: str, path: str, status_code: int, response_time: float):
         """응답 로깅"""
+        if not self.should_sample(status_code):
+            return
         log_data = {
             "method": method,
             "path": path,
@@ -89,7 +182,11 @@ class GatewayLogger:
             "response_time_ms": round(response_time * 1000, 2)
         }
         
-        self.logger.info(f"RESPONSE: {json.dumps(log_data, ensure_ascii=False)}")
+        self.logger.info(_LazyJson("RESPONSE", log_data))
+    
+    def log_access(self, log_data: Dict[str, Any]):
+        """접근 로그 (ASGI 미들웨어에서 응답 완료 후 호출, 샘플링은 호출 측에서 결정)"""
+        self.logger.info(_LazyJson("ACCESS", log_data))
     
     def log_error(self, message: str, error: Optional[Exception] = None):
         """에러 로깅"""
@@ -105,6 +202,16 @@ class GatewayLogger:
     def log_warning(self, message: str):
         """경고 로깅"""
         self.logger.warning(message)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queue_size": self._queue.qsize(),
+            "queue_capacity": LOG_QUEUE_SIZE,
+            "dropped": self._queue_handler.dropped,
+            "access_log_sample_rate": self.sample_rate,
+            "sampled_out": self.sampled_out,
+            "body_max_bytes": LOG_BODY_MAX_BYTES
+        }
 
 # 전역 로거 인스턴스
 gateway_logger = GatewayLogger()
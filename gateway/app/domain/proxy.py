@@ -2,9 +2,34 @@ import os
 import json
 import time
 import httpx
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from fastapi import Request, Response, HTTPException
 from ..common.utility.logger import gateway_logger
+from ..common.http_client import request_body_stream, send_upstream, streaming_response
+from ..common.upstream_health import upstream_health
+from ..common.route_table import KIND_CONTROLLER, RouteMatch, RouteRule, RouteTable
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# 요청 바디 검증 모드
+# - selective (기본): 검증 규칙이 있는 경로(POST)만 바디를 읽고 파싱, 나머지는 파싱 없이 그대로 스트리밍
+# - all: 기존 방식, 모든 POST/PUT/PATCH JSON 바디를 파싱 (GATEWAY_VALIDATION_MAX_BYTES 이하만)
+VALIDATION_MODE_SELECTIVE = "selective"
+VALIDATION_MODE_ALL = "all"
+VALIDATION_MODE = os.getenv("GATEWAY_VALIDATION_MODE", VALIDATION_MODE_SELECTIVE).lower()
+# 검증을 위해 파싱할 최대 바디 크기 (검증 규칙이 있는 경로에서 초과하면 413)
+VALIDATION_MAX_BYTES = int(os.getenv("GATEWAY_VALIDATION_MAX_BYTES", str(1024 * 1024)))
+
+# 끝에 "/" 를 붙여 전달하는 CBAM 서비스 기본 리소스 경로 (/api/v1/cbam/install → /install/)
+CBAM_RESOURCES = frozenset({
+    "install", "product", "process", "edge", "mapping", "calculation", "matdir", "fueldir", "productprocess"
+})
 
 class ProxyController:
     """프록시 컨트롤러 - DDD의 Application Layer 역할"""
@@ -45,11 +70,15 @@ class ProxyController:
             
             # AI 어시스턴트 도메인
             "/chatbot": self._clean_service_url(os.getenv("CHATBOT_SERVICE_URL", "http://localhost:8084")),
-            
-            # AI 처리 엔드포인트
-            "/api/datagather/ai-process": self._clean_service_url(os.getenv("DATAGATHER_SERVICE_URL", "http://localhost:8083")),
         }
         
+        # 접두사 라우팅 테이블 (시작 시 한 번 컴파일, 요청마다 경로 길이만큼만 탐색)
+        self.route_table = RouteTable(self._build_route_rules())
+        
+        # 경로별 요청 바디 검증기
+        self.validators = self._build_validators()
+        self.validation_mode = VALIDATION_MODE if VALIDATION_MODE in (VALIDATION_MODE_SELECTIVE, VALIDATION_MODE_ALL) else VALIDATION_MODE_SELECTIVE
+        
         # 서비스 맵 로깅
         gateway_logger.log_info("=== SERVICE MAP AFTER CLEANING ===")
         for prefix, url in self.service_map.items():
@@ -98,57 +127,61 @@ class ProxyController:
         
         return cleaned_url
     
+    def _build_route_rules(self) -> List[RouteRule]:
+        """service_map 을 경로 재작성 규칙으로 변환"""
+        rules = []
+        for prefix, service_url in self.service_map.items():
+            if prefix == "/chatbot":
+                # /chatbot/chat → /api/v1/chatbot/chat
+                rules.append(RouteRule(prefix, service_url, "/api/v1/chatbot", KIND_CONTROLLER, "chatbot"))
+            elif prefix in ("/api/v1/cbam", "/cbam"):
+                # CBAM 서비스 라우터 구조: /install/, /product/, ... (하위 경로는 그대로)
+                rules.append(RouteRule(prefix, service_url, "", KIND_CONTROLLER, "cbam", CBAM_RESOURCES))
+            else:
+                rules.append(RouteRule(prefix, service_url, None, KIND_CONTROLLER, self._get_domain_context(prefix)))
+        return rules
+    
     def get_target_service(self, path: str) -> Optional[str]:
         """경로에 따른 타겟 서비스 URL 반환 - DDD 도메인 기반 라우팅"""
-        gateway_logger.log_info(f"=== TARGET SERVICE LOOKUP ===")
-        gateway_logger.log_info(f"Looking for service for path: '{path}'")
-        gateway_logger.log_info(f"Available prefixes: {list(self.service_map.keys())}")
-        
-        # 더 구체적인 경로부터 매칭 (긴 경로 우선)
-        sorted_prefixes = sorted(self.service_map.keys(), key=len, reverse=True)
-        gateway_logger.log_info(f"Sorted prefixes (longest first): {sorted_prefixes}")
-        
-        for prefix in sorted_prefixes:
-            gateway_logger.log_info(f"Checking prefix: '{prefix}' against path: '{path}'")
-            gateway_logger.log_info(f"path.startswith('{prefix}'): {path.startswith(prefix)}")
-            if path.startswith(prefix):
-                service_url = self.service_map[prefix]
-                gateway_logger.log_info(f"✓ MATCH FOUND: '{prefix}' → '{service_url}'")
-                if not service_url:
-                    gateway_logger.log_warning(f"Service URL not configured for prefix: {prefix}")
-                    gateway_logger.log_info("=== END TARGET SERVICE LOOKUP (NO URL) ===")
-                    return None
-                gateway_logger.log_info("=== END TARGET SERVICE LOOKUP (SUCCESS) ===")
-                return service_url
-            else:
-                gateway_logger.log_info(f"✗ No match: '{prefix}' does not match '{path}'")
-        
-        gateway_logger.log_warning(f"No matching service found for path: '{path}'")
-        gateway_logger.log_info("=== END TARGET SERVICE LOOKUP (NO MATCH) ===")
-        return None
+        match = self.route_table.match(path)
+        if match is None:
+            gateway_logger.log_warning(f"No matching service found for path: '{path}'")
+            return None
+        if not match.upstream:
+            gateway_logger.log_warning(f"Service URL not configured for prefix: {match.rule.prefix}")
+            return None
+        return match.upstream
+    
+    def _build_validators(self) -> Dict[str, Callable[[dict], bool]]:
+        """POST 경로별 도메인 규칙 검증기 (경로 완전 일치)"""
+        return {
+            # 기업 회원가입 도메인 규칙
+            "/auth/register/company": self._validate_company_registration,
+            # 사용자 회원가입 도메인 규칙
+            "/auth/register/user": self._validate_user_registration,
+            # 로그인 도메인 규칙
+            "/auth/login": self._validate_login,
+            # 스트림 이벤트 도메인 규칙
+            "/stream/events": lambda data: self._validate_stream_event("/stream/events", data),
+            "/stream/snapshots": lambda data: self._validate_stream_event("/stream/snapshots", data),
+            "/stream/metadata": lambda data: self._validate_stream_event("/stream/metadata", data),
+            "/stream/deactivate": lambda data: self._validate_stream_event("/stream/deactivate", data),
+        }
+    
+    def has_validator(self, path: str, method: str) -> bool:
+        """바디를 파싱해 검증해야 하는 요청인지 (CBAM/LCI 규칙은 항상 통과라 제외)"""
+        return method == "POST" and path in self.validators
     
     def validate_request_data(self, path: str, method: str, data: dict) -> bool:
         """요청 데이터 검증 - DDD 도메인 규칙 적용"""
         try:
             if method == "POST":
-                # 기업 회원가입 도메인 규칙
-                if path == "/auth/register/company":
-                    return self._validate_company_registration(data)
-                
-                # 사용자 회원가입 도메인 규칙
-                elif path == "/auth/register/user":
-                    return self._validate_user_registration(data)
-                
-                # 로그인 도메인 규칙
-                elif path == "/auth/login":
-                    return self._validate_login(data)
-                
-                # 스트림 이벤트 도메인 규칙
-                elif path.startswith("/stream/"):
-                    return self._validate_stream_event(path, data)
+                validator = self.validators.get(path)
+                if validator is not None:
+                    return validator(data)
                 
                 # CBAM 도메인 규칙
-                elif path.startswith("/cbam/"):
+                if path.startswith("/cbam/"):
                     return self._validate_cbam_data(path, data)
                 
                 # LCI 도메인 규칙
@@ -158,7 +191,7 @@ class ProxyController:
             return True
             
         except Exception as e:
-            gateway_logger.error(f"Validation error: {str(e)}")
+            gateway_logger.log_error(f"Validation error: {str(e)}")
             return False
     
     def _validate_company_registration(self, data: dict) -> bool:
@@ -171,31 +204,31 @@ class ProxyController:
         
         for field in required_fields:
             if not data.get(field):
-                gateway_logger.warning(f"Missing required field: {field}")
+                gateway_logger.log_warning(f"Missing required field: {field}")
                 return False
         
         # 도메인 규칙 검증
         username = data.get("username", "")
         if len(username) < 3:
-            gateway_logger.warning("Username too short (minimum 3 characters)")
+            gateway_logger.log_warning("Username too short (minimum 3 characters)")
             return False
         
         # 사업자번호 형식 검증 (숫자만)
         biz_no = data.get("biz_no", "")
         if not biz_no.isdigit():
-            gateway_logger.warning("Invalid business number format")
+            gateway_logger.log_warning("Invalid business number format")
             return False
         
         # 담당자 연락처 형식 검증
         manager_phone = data.get("manager_phone", "")
         if not manager_phone.replace("-", "").replace(" ", "").isdigit():
-            gateway_logger.warning("Invalid phone number format")
+            gateway_logger.log_warning("Invalid phone number format")
             return False
         
         # 비밀번호 길이 검증
         password = data.get("password", "")
         if len(password) < 8:
-            gateway_logger.warning("Password too short (minimum 8 characters)")
+            gateway_logger.log_warning("Password too short (minimum 8 characters)")
             return False
         
         return True
@@ -205,25 +238,25 @@ class ProxyController:
         required_fields = ["username", "password", "full_name", "company_id"]
         for field in required_fields:
             if not data.get(field):
-                gateway_logger.warning(f"Missing required field: {field}")
+                gateway_logger.log_warning(f"Missing required field: {field}")
                 return False
         
         # 도메인 규칙 검증
         username = data.get("username", "")
         if len(username) < 3:
-            gateway_logger.warning("Username too short (minimum 3 characters)")
+            gateway_logger.log_warning("Username too short (minimum 3 characters)")
             return False
         
         password = data.get("password", "")
         if len(password) < 8:
-            gateway_logger.warning("Password too short (minimum 8 characters)")
+            gateway_logger.log_warning("Password too short (minimum 8 characters)")
             return False
         
         # company_id 숫자 검증
         try:
             int(data.get("company_id", ""))
         except (ValueError, TypeError):
-            gateway_logger.warning("Invalid company ID format")
+            gateway_logger.log_warning("Invalid company ID format")
             return False
         
         return True
@@ -231,12 +264,12 @@ class ProxyController:
     def _validate_login(self, data: dict) -> bool:
         """로그인 도메인 규칙 검증"""
         if not data.get("username") or not data.get("password"):
-            gateway_logger.warning("Missing username or password")
+            gateway_logger.log_warning("Missing username or password")
             return False
         
         username = data.get("username", "")
         if len(username) < 3:
-            gateway_logger.warning("Username too short")
+            gateway_logger.log_warning("Username too short")
             return False
         
         return True
@@ -256,7 +289,7 @@ class ProxyController:
         
         for field in required_fields:
             if not data.get(field):
-                gateway_logger.warning(f"Missing required field for stream: {field}")
+                gateway_logger.log_warning(f"Missing required field for stream: {field}")
                 return False
         
         return True
@@ -288,8 +321,9 @@ class ProxyController:
         headers.pop("origin", None)
         headers.pop("referer", None)
         
-        # Content-Length 헤더 제거 (새로운 바디로 재계산됨)
-        headers.pop("content-length", None)
+        # hop-by-hop 헤더 제거 (Content-Length는 원본 바디를 그대로 스트리밍하므로 유지)
+        for header in ("connection", "keep-alive", "transfer-encoding", "te", "trailer", "upgrade"):
+            headers.pop(header, None)
         
         return headers
     
@@ -312,12 +346,14 @@ class ProxyController:
         else:
             return "unknown"
     
-    async def proxy_request(self, request: Request) -> Response:
-        """프록시 요청 처리 - DDD 도메인 서비스 라우팅"""
+    async def proxy_request(self, request: Request, match: Optional[RouteMatch] = None) -> Response:
+        """프록시 요청 처리 - DDD 도메인 서비스 라우팅 (match 가 없으면 라우팅 테이블에서 조회)"""
         try:
             path = request.url.path
             method = request.method
-            target_service = self.get_target_service(path)
+            if match is None:
+                match = self.route_table.match(path)
+            target_service = match.upstream if match else None
             
             # 챗봇 서비스 디버깅 로깅 추가
             if path.startswith("/chatbot"):
@@ -326,7 +362,6 @@ class ProxyController:
                 gateway_logger.log_info(f"Method: {method}")
                 gateway_logger.log_info(f"Target service URL: {target_service}")
                 gateway_logger.log_info(f"Service map for /chatbot: {self.service_map.get('/chatbot')}")
-                gateway_logger.log_info(f"All service prefixes: {list(self.service_map.keys())}")
                 gateway_logger.log_info(f"=== END DEBUG ===")
             
             if not target_service:
@@ -337,31 +372,23 @@ class ProxyController:
                     detail=f"Service not available for path: {path}. Please check service configuration."
                 )
             
-            # 서비스 연결 상태 확인 (챗봇 서비스는 헬스체크 건너뛰기)
+            # 서비스 연결 상태 확인 - 백그라운드 헬스 모니터가 유지하는 서킷 브레이커 조회 (챗봇 서비스는 건너뛰기)
             if not path.startswith("/chatbot"):
-                if not await self._check_service_health(target_service):
-                    gateway_logger.log_error(f"Service {target_service} is not responding")
+                if not upstream_health.allow_request(target_service):
+                    gateway_logger.log_error(f"Service {target_service} is not responding (circuit open)")
                     raise HTTPException(
                         status_code=503,
-                        detail=f"Service {target_service} is not available. Please try again later."
+                        detail=f"Service {target_service} is not available. Please try again later.",
+                        headers={"Retry-After": str(upstream_health.retry_after(target_service))}
                     )
             else:
                 gateway_logger.log_info(f"챗봇 서비스 헬스체크 건너뛰기: {path}")
             
-            # 요청 데이터 검증
-            if method in ["POST", "PUT", "PATCH"]:
-                try:
-                    body = await request.body()
-                    if body:
-                        data = json.loads(body)
-                        if not self.validate_request_data(path, method, data):
-                            raise HTTPException(status_code=400, detail="Invalid request data")
-                except json.JSONDecodeError:
-                    gateway_logger.log_warning("Invalid JSON in request body")
-                    raise HTTPException(status_code=400, detail="Invalid JSON format")
+            # 요청 데이터 검증 (검증 대상이 아니면 바디를 읽지 않고 그대로 스트리밍)
+            body = await self._read_body_for_validation(request, path, method)
             
-            # 프록시 요청 실행
-            return await self._execute_proxy_request(request, target_service, path)
+            # 프록시 요청 실행 (검증에서 읽은 바디는 그대로 재사용)
+            return await self._execute_proxy_request(request, match, body)
             
         except HTTPException:
             raise
@@ -369,179 +396,104 @@ class ProxyController:
             gateway_logger.log_error(f"Unexpected error in proxy_request: {str(e)}")
             raise HTTPException(status_code=500, detail="Internal gateway error")
 
-    async def _check_service_health(self, service_url: str) -> bool:
-        """서비스 헬스체크 - DDD 도메인 서비스 상태 확인"""
+    async def _read_body_for_validation(self, request: Request, path: str, method: str) -> Optional[bytes]:
+        """검증이 필요한 요청만 바디를 읽어 검증 -> 읽은 바디 (읽지 않았으면 None)"""
+        if method not in ("POST", "PUT", "PATCH"):
+            return None
+        validated_route = self.has_validator(path, method)
+        if not validated_route and self.validation_mode != VALIDATION_MODE_ALL:
+            return None
+        
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > VALIDATION_MAX_BYTES:
+            if validated_route:
+                raise HTTPException(status_code=413, detail="Request body too large")
+            # all 모드에서도 큰 바디는 파싱하지 않고 스트리밍
+            return None
+        
+        body = await request.body()
+        if not body:
+            return body
+        if len(body) > VALIDATION_MAX_BYTES:
+            if validated_route:
+                raise HTTPException(status_code=413, detail="Request body too large")
+            return body
+        
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{service_url}/health")
-                return response.status_code == 200
-        except Exception as e:
-            gateway_logger.log_warning(f"Health check failed for {service_url}: {str(e)}")
-            return False
+            data = _json_loads(body)
+        except ValueError:
+            gateway_logger.log_warning("Invalid JSON in request body")
+            raise HTTPException(status_code=400, detail="Invalid JSON format")
+        if not self.validate_request_data(path, method, data):
+            raise HTTPException(status_code=400, detail="Invalid request data")
+        return body
     
-    async def _execute_proxy_request(self, request: Request, target_service: str, path: str) -> Response:
+    async def _execute_proxy_request(self, request: Request, match: RouteMatch, body: Optional[bytes] = None) -> Response:
         """실제 프록시 요청 실행 - DDD 도메인 서비스 통신"""
         start_time = time.time()
         method = request.method
+        path = match.path
+        target_service = match.upstream
         
-        gateway_logger.log_info(f"=== EXECUTE PROXY REQUEST ===")
-        gateway_logger.log_info(f"Method: {method}")
-        gateway_logger.log_info(f"Path: {path}")
-        gateway_logger.log_info(f"Target service: {target_service}")
-        
-        # 타겟 URL 구성
-        # 챗봇 서비스의 경우 특별한 경로 매핑
-        gateway_logger.log_info(f"=== PATH MAPPING DEBUG ===")
-        gateway_logger.log_info(f"Original path: '{path}'")
-        gateway_logger.log_info(f"Target service: '{target_service}'")
-        
-        if path.startswith("/chatbot"):
-            gateway_logger.log_info(f"✓ Path '{path}' starts with '/chatbot'")
-            if path == "/chatbot/chat":
-                target_url = f"{target_service}/api/v1/chatbot/chat"  # 올바른 경로로 수정
-                gateway_logger.log_info(f"CHATBOT CHAT: {path} → {target_url}")
-            elif path == "/chatbot/health":
-                target_url = f"{target_service}/api/v1/chatbot/health"  # 올바른 경로로 수정
-                gateway_logger.log_info(f"CHATBOT HEALTH: {path} → {target_url}")
-            else:
-                # /chatbot으로 시작하는 다른 경로들도 /api/v1/chatbot으로 매핑
-                target_url = f"{target_service}/api/v1{path}"
-                gateway_logger.log_info(f"CHATBOT OTHER: {path} → {target_url}")
-        elif path.startswith("/api/v1/cbam"):
-            gateway_logger.log_info(f"✓ Path '{path}' starts with '/api/v1/cbam'")
-            # CBAM 서비스의 실제 라우터 구조에 맞게 경로 매핑 및 정규화
-            cbam_path = path.replace("/api/v1/cbam", "")
-            
-            # CBAM 서비스의 실제 라우터 구조에 맞게 경로 정규화
-            # CBAM 서비스: /install/, /product/, /process/, /edge/, /mapping/, /calculation/, /matdir/, /fueldir/, /productprocess/
-            
-            # 기본 경로들 (슬래시 추가)
-            if cbam_path in ["/install", "/product", "/process", "/edge", "/mapping", "/calculation", "/matdir", "/fueldir", "/productprocess"]:
-                normalized_path = cbam_path + "/"
-            # 하위 경로들 (동적 ID 포함)
-            elif cbam_path.startswith(("/install/", "/product/", "/process/", "/edge/", "/mapping/", "/calculation/", "/matdir/", "/fueldir/", "/productprocess/")):
-                # 하위 경로는 그대로 전달 (예: /install/1, /product/names 등)
-                normalized_path = cbam_path
-            else:
-                # 기타 경로는 그대로
-                normalized_path = cbam_path
-            
-            target_url = f"{target_service}{normalized_path}"
-            gateway_logger.log_info(f"CBAM API: {path} → {target_url}")
-        elif path.startswith("/cbam"):
-            gateway_logger.log_info(f"✓ Path '{path}' starts with '/cbam'")
-            # 레거시 경로도 CBAM 서비스의 실제 라우터 구조에 맞게 매핑 및 정규화
-            cbam_path = path.replace("/cbam", "")
-            
-            # CBAM 서비스의 실제 라우터 구조에 맞게 경로 정규화
-            # CBAM 서비스: /install/, /product/, /process/, /edge/, /mapping/, /calculation/, /matdir/, /fueldir/, /productprocess/
-            
-            # 기본 경로들 (슬래시 추가)
-            if cbam_path in ["/install", "/product", "/process", "/edge", "/mapping", "/calculation", "/matdir", "/fueldir", "/productprocess"]:
-                normalized_path = cbam_path + "/"
-            # 하위 경로들 (동적 ID 포함)
-            elif cbam_path.startswith(("/install/", "/product/", "/process/", "/edge/", "/mapping/", "/calculation/", "/matdir/", "/fueldir/", "/productprocess/")):
-                # 하위 경로는 그대로 전달 (예: /install/1, /product/names 등)
-                normalized_path = cbam_path
-            else:
-                # 기타 경로는 그대로
-                normalized_path = cbam_path
-            
-            target_url = f"{target_service}{normalized_path}"
-            gateway_logger.log_info(f"CBAM Legacy: {path} → {target_url}")
-        else:
-            gateway_logger.log_info(f"✗ Path '{path}' does NOT start with '/chatbot' or '/cbam'")
-            target_url = f"{target_service}{path}"
-            
-        if request.url.query:
-            target_url += f"?{request.url.query}"
-        
-        gateway_logger.log_info(f"Final target URL: {target_url}")
-        gateway_logger.log_info("=== END PATH MAPPING DEBUG ===")
+        # 타겟 URL 구성 (챗봇/CBAM 경로 매핑은 라우팅 규칙의 재작성으로 처리)
+        target_url = match.target_url(request.url.query)
         
-        # 프리픽스 매칭 로깅
-        matched_prefix = None
-        for prefix in sorted(self.service_map.keys(), key=len, reverse=True):
-            if path.startswith(prefix):
-                matched_prefix = prefix
-                break
-        
-        # 상세 로깅
-        gateway_logger.log_info(f"Matched prefix: {matched_prefix} → upstream: {target_service}")
+        gateway_logger.log_info(f"=== EXECUTE PROXY REQUEST ===")
+        gateway_logger.log_info(f"Matched prefix: {match.rule.prefix} → upstream: {target_service}")
         gateway_logger.log_info(f"Proxying {method} {path} to: {target_url}")
         
         # 헤더 준비
         headers = self.prepare_headers(request)
         gateway_logger.log_info(f"Request headers: {dict(headers)}")
         
-        # 요청 바디 읽기
-        body = await request.body()
-        gateway_logger.log_info(f"Request body length: {len(body)} bytes")
-        if body:
-            try:
-                body_text = body.decode('utf-8')
-                gateway_logger.log_info(f"Request body content: {body_text[:200]}...")
-            except:
-                gateway_logger.log_info("Request body is binary or cannot be decoded")
+        # 검증 단계에서 읽은 바디는 그대로 전달하고, 나머지는 버퍼링하지 않고 스트림으로 전달
+        content = body if body else request_body_stream(request)
+        gateway_logger.log_info(f"Request body length: {request.headers.get('content-length', 'stream')} bytes")
         
         try:
-            # httpx.AsyncClient로 프록시 요청 실행
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                gateway_logger.log_info(f"=== GATEWAY TO CHATBOT REQUEST ===")
-                gateway_logger.log_info(f"Making request to: {target_url}")
-                gateway_logger.log_info(f"Request method: {method}")
-                gateway_logger.log_info(f"Request headers: {dict(headers)}")
-                gateway_logger.log_info(f"Request body length: {len(body)} bytes")
-                if body:
-                    try:
-                        body_text = body.decode('utf-8')
-                        gateway_logger.log_info(f"Request body content: {body_text}")
-                    except:
-                        gateway_logger.log_info("Request body is binary or cannot be decoded")
-                gateway_logger.log_info(f"Timeout settings: {self.timeout}")
-                gateway_logger.log_info("=== END GATEWAY TO CHATBOT REQUEST ===")
-                
-                response = await client.request(
-                    method=method,
-                    url=target_url,
-                    headers=headers,
-                    content=body,
-                    follow_redirects=False
-                )
-                
-                # 응답 로깅
-                response_time = time.time() - start_time
-                gateway_logger.log_info(f"=== CHATBOT RESPONSE DEBUG ===")
-                gateway_logger.log_info(f"Response status: {response.status_code}")
-                gateway_logger.log_info(f"Response headers: {dict(response.headers)}")
-                gateway_logger.log_info(f"Response time: {response_time:.3f}s")
-                
-                # 응답 본문 로깅
-                try:
-                    response_body = response.text
-                    gateway_logger.log_info(f"Response body: {response_body}")
-                    gateway_logger.log_info(f"Response body length: {len(response_body)} bytes")
-                except Exception as e:
-                    gateway_logger.log_info(f"Response body logging failed: {str(e)}")
-                
-                gateway_logger.log_info("=== END CHATBOT RESPONSE DEBUG ===")
-                
-                gateway_logger.log_info(f"RESPONSE: {method} {path} → status: {response.status_code}, time: {response_time:.3f}s")
-                gateway_logger.log_response(method, path, response.status_code, response_time)
-                
-                # 응답 반환
-                return Response(
-                    content=response.content,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.headers.get("content-type")
-                )
+            # 업스트림 공용 클라이언트로 프록시 요청 실행 (keep-alive 연결 재사용)
+            gateway_logger.log_info(f"=== GATEWAY TO UPSTREAM REQUEST ===")
+            gateway_logger.log_info(f"Making request to: {target_url}")
+            gateway_logger.log_info(f"Request method: {method}")
+            gateway_logger.log_info(f"Timeout settings: {self.timeout}")
+            gateway_logger.log_info("=== END GATEWAY TO UPSTREAM REQUEST ===")
+            
+            upstream_response = await send_upstream(
+                target_service,
+                method,
+                target_url,
+                headers=headers,
+                content=content,
+                timeout=self.timeout
+            )
+            
+            # 게이트웨이 오류 계열 응답은 업스트림 장애로 보고 브레이커에 기록
+            if upstream_response.status_code in (502, 503, 504):
+                upstream_health.record_failure(target_service)
+            else:
+                upstream_health.record_success(target_service)
+            
+            # 응답 로깅 (본문은 스트리밍하므로 헤더/상태만 기록)
+            response_time = time.time() - start_time
+            gateway_logger.log_info(f"=== UPSTREAM RESPONSE DEBUG ===")
+            gateway_logger.log_info(f"Response status: {upstream_response.status_code}")
+            gateway_logger.log_info(f"Response headers: {dict(upstream_response.headers)}")
+            gateway_logger.log_info(f"Response time: {response_time:.3f}s")
+            gateway_logger.log_info("=== END UPSTREAM RESPONSE DEBUG ===")
+            
+            gateway_logger.log_info(f"RESPONSE: {method} {path} → status: {upstream_response.status_code}, time: {response_time:.3f}s")
+            gateway_logger.log_response(method, path, upstream_response.status_code, response_time)
+            
+            # 응답 반환 (본문을 메모리에 모으지 않고 스트리밍)
+            return streaming_response(upstream_response)
                 
         except httpx.TimeoutException:
+            upstream_health.record_failure(target_service)
             gateway_logger.log_error(f"Timeout error for {method} {path} to {target_url}")
             raise HTTPException(status_code=504, detail="Gateway timeout")
             
         except httpx.ConnectError as e:
+            upstream_health.record_failure(target_service)
             gateway_logger.log_error(f"Connection error for {method} {path} to {target_url}: {str(e)}")
             raise HTTPException(status_code=502, detail="Service connection failed")
             
@@ -573,7 +525,7 @@ class ProxyController:
         }
     
     async def get_service_status(self) -> Dict[str, Any]:
-        """서비스 상태 정보 반환 - DDD 도메인별 상태"""
+        """서비스 상태 정보 반환 - DDD 도메인별 상태 (헬스 모니터 캐시 기준)"""
         status_info = {
             "gateway": {
                 "name": self.gateway_name,
@@ -606,26 +558,27 @@ class ProxyController:
                     "message": "Service URL not configured"
                 }
             else:
-                # 서비스 헬스체크 수행
-                is_healthy = await self._check_service_health(service_url)
+                # 백그라운드 헬스 모니터의 캐시된 상태 사용 (다시 확인하지 않음)
+                health = upstream_health.get_status(service_url)
+                is_healthy = health["healthy"]
+                if is_healthy is None:
+                    status, message = "unknown", "Health check pending"
+                elif is_healthy:
+                    status, message = "healthy", "Service responding"
+                else:
+                    status, message = "unhealthy", "Service not responding"
                 status_info["domains"][domain_name] = {
-                    "status": "healthy" if is_healthy else "unhealthy",
+                    "status": status,
                     "url": service_url,
-                    "message": "Service responding" if is_healthy else "Service not responding"
+                    "message": message,
+                    "checked_at": health["checked_at"],
+                    "latency_ms": health["latency_ms"],
+                    "error": health["error"],
+                    "circuit": health["circuit"]
                 }
         
         return status_info
     
-    async def _check_service_health(self, service_url: str) -> bool:
-        """서비스 헬스체크 수행"""
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{service_url.rstrip('/')}/health")
-                return response.status_code == 200
-        except Exception as e:
-            gateway_logger.log_warning(f"Health check failed for {service_url}: {str(e)}")
-            return False
-    
     def get_routing_info(self) -> Dict[str, Any]:
         """라우팅 정보 반환 - DDD 도메인 구조 기반"""
         return {
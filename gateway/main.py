@@ -1,13 +1,25 @@
 import os
 from fastapi import FastAPI, Request, Response, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from contextlib import asynccontextmanager
 import time
 import httpx
 
-from app.domain.proxy import ProxyController
+from app.domain.proxy import ProxyController, CBAM_RESOURCES
 from app.common.utility.logger import gateway_logger
+from app.common.http_client import (
+    http_clients,
+    forward_request_headers,
+    request_body_stream,
+    send_upstream,
+    streaming_response
+)
+from app.common.upstream_health import upstream_health
+from app.common.access_log import AccessLogMiddleware
+from app.common.route_table import KIND_FORWARD, ProxyRoute, RouteMatch, RouteRule, RouteTable
+from app.common.response_cache import CONDITIONAL_REQUEST_HEADERS, response_cache
 
 # 환경변수에서 설정 가져오기 (기본값 포함)
 GATEWAY_NAME = os.getenv("GATEWAY_NAME", "greensteel-gateway")
@@ -35,7 +47,13 @@ CBAM_SERVICE_URL = os.getenv("CBAM_SERVICE_URL", "").strip()
 allowed_origins = [origin.strip() for origin in ALLOWED_ORIGINS.split(",") if origin.strip()]
 
 async def _forward(target_service_url: str, target_path: str, request: Request) -> Response:
-    """요청을 타겟 서비스로 전달하는 헬퍼 함수"""
+    """요청을 타겟 서비스로 전달하는 헬퍼 함수 (공용 클라이언트 + 요청/응답 스트리밍)"""
+    upstream_response = await _send_forward(target_service_url, target_path, request)
+    # 응답 바디는 버퍼링하지 않고 그대로 스트리밍
+    return streaming_response(upstream_response)
+
+async def _send_forward(target_service_url: str, target_path: str, request: Request, drop_headers=frozenset()) -> httpx.Response:
+    """요청을 타겟 서비스로 보내고 바디를 읽지 않은 업스트림 응답 반환 (drop_headers: 전달하지 않을 요청 헤더)"""
     # 서비스 URL이 설정되어 있는지 확인
     if not target_service_url:
         raise HTTPException(status_code=503, detail="Target service not configured")
@@ -48,46 +66,30 @@ async def _forward(target_service_url: str, target_path: str, request: Request)
         
         gateway_logger.log_info(f"Forwarding request: {request.method} {request.url.path} → {target_url}")
         
-        # 요청 헤더 준비 (host 제거)
-        headers = dict(request.headers)
-        headers.pop("host", None)
+        # 요청 헤더 준비 (host, hop-by-hop 제거)
+        headers = forward_request_headers(request)
+        for name in drop_headers:
+            headers.pop(name, None)
         headers["X-Forwarded-By"] = GATEWAY_NAME
         
-        # 요청 바디 읽기
-        body = await request.body()
+        # DELETE 요청이 아닌 경우에만 body를 스트림으로 전달
+        content = None
+        if request.method != "DELETE":
+            content = request_body_stream(request)
+        else:
+            headers.pop("content-length", None)
         
-        # httpx로 프록시 요청 실행
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # DELETE 요청이 아닌 경우에만 content 전달
-            request_kwargs = {
-                "method": request.method,
-                "url": target_url,
-                "headers": headers,
-                "follow_redirects": False
-            }
-            
-            # DELETE 요청이 아닌 경우에만 body 전달
-            if request.method != "DELETE" and body:
-                request_kwargs["content"] = body
-            
-            response = await client.request(**request_kwargs)
-            
-            gateway_logger.log_info(f"Forward response: {response.status_code}")
-            
-            # hop-by-hop 헤더 제거
-            for h in ["content-length", "transfer-encoding", "connection"]:
-                try:
-                    response.headers.pop(h, None)
-                except Exception:
-                    pass
-            
-            # 응답 반환
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type")
-            )
+        upstream_response = await send_upstream(
+            target_service_url,
+            request.method,
+            target_url,
+            headers=headers,
+            content=content,
+            timeout=30.0
+        )
+        
+        gateway_logger.log_info(f"Forward response: {upstream_response.status_code}")
+        return upstream_response
             
     except httpx.TimeoutException:
         gateway_logger.log_error(f"Forward timeout: {target_url}")
@@ -99,6 +101,17 @@ async def _forward(target_service_url: str, target_path: str, request: Request)
         gateway_logger.log_error(f"Forward error: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal gateway error")
 
+def _body_forward_headers(request: Request) -> dict:
+    """바디를 그대로 전달하는 DataGather 프록시용 헤더 (스트리밍 전송을 위해 Content-Length 유지)"""
+    headers = {
+        "Content-Type": request.headers.get("content-type", "application/json"),
+        "X-Forwarded-By": GATEWAY_NAME
+    }
+    content_length = request.headers.get("content-length")
+    if content_length:
+        headers["Content-Length"] = content_length
+    return headers
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리 - DDD Architecture"""
@@ -112,9 +125,20 @@ async def lifespan(app: FastAPI):
     proxy_controller = ProxyController()
     gateway_logger.log_info(f"Proxy Controller Service Map: {proxy_controller.service_map}")
     
+    # 업스트림별 공용 HTTP 클라이언트 생성 (keep-alive 연결 재사용)
+    await http_clients.open(set(proxy_controller.service_map.values()) | {CHATBOT_SERVICE_URL, CBAM_SERVICE_URL})
+    
+    # 업스트림 헬스 모니터 시작 (요청마다 헬스체크하지 않고 캐시된 상태/서킷 브레이커 사용)
+    await upstream_health.start(set(proxy_controller.service_map.values()))
+    
     yield
     # 종료 시
+    await upstream_health.stop()
+    await response_cache.close()
+    await http_clients.close()
     gateway_logger.log_info(f"Gateway {GATEWAY_NAME} shutting down...")
+    # 큐에 남은 로그 출력
+    gateway_logger.stop()
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -145,33 +169,18 @@ app.add_middleware(
 # 프록시 컨트롤러 인스턴스
 proxy_controller = ProxyController()
 
-# 요청 시간 측정 미들웨어
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
-
-# 라우트 매칭 로거 미들웨어
-@app.middleware("http")
-async def log_matched_route(request: Request, call_next):
-    response = await call_next(request)
-    try:
-        route = request.scope.get("route")
-        route_path = getattr(route, "path", "(no route)")
-        route_methods = list(getattr(route, "methods", []))
-        gateway_logger.log_info(f"ROUTE_MATCH method={request.method} path={request.url.path} -> {route_path} {route_methods} status={response.status_code}")
-    except Exception:
-        pass
-    return response
+# 요청 시간 측정 + 라우트 매칭 접근 로그 (순수 ASGI 미들웨어, 로그는 큐로 비동기 출력)
+app.add_middleware(AccessLogMiddleware)
 
 # 헬스체크 엔드포인트
 @app.get("/health")
 async def health_check():
     """게이트웨이 헬스체크 - DDD 도메인 서비스 상태"""
-    return proxy_controller.health_check()
+    return {
+        **proxy_controller.health_check(),
+        "logging": gateway_logger.get_stats(),
+        "response_cache": response_cache.get_stats()
+    }
 
 # ============================================================================
 # 🛣️ 라우팅 정보 엔드포인트
@@ -180,7 +189,7 @@ async def health_check():
 @app.get("/routing")
 async def routing_info():
     """라우팅 규칙 및 설정 정보 - DDD 도메인 구조 기반"""
-    return proxy_controller.get_routing_info()
+    return {**proxy_controller.get_routing_info(), "route_table": gateway_route_table.describe()}
 
 @app.get("/status")
 async def service_status():
@@ -267,8 +276,8 @@ async def ping_chatbot():
         return {"error": "CHATBOT_SERVICE_URL not configured"}
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(f"{CHATBOT_SERVICE_URL.rstrip('/')}/health")
+        client = await http_clients.get_client(CHATBOT_SERVICE_URL)
+        resp = await client.get(f"{CHATBOT_SERVICE_URL.rstrip('/')}/health", timeout=10.0)
         return {"status": resp.status_code, "body": resp.text[:300]}
     except Exception as e:
         return {"error": f"Failed to ping chatbot: {str(e)}"}
@@ -280,8 +289,8 @@ async def ping_cbam():
         return {"error": "CBAM_SERVICE_URL not configured"}
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(f"{CBAM_SERVICE_URL.rstrip('/')}/health")
+        client = await http_clients.get_client(CBAM_SERVICE_URL)
+        resp = await client.get(f"{CBAM_SERVICE_URL.rstrip('/')}/health", timeout=10.0)
         return {"status": resp.status_code, "body": resp.text[:300]}
     except Exception as e:
         return {"error": f"Failed to ping CBAM: {str(e)}"}
@@ -358,126 +367,53 @@ async def chatbot_chat_get_info():
 async def proxy_chatbot_health(request: Request):
     return await _forward(CHATBOT_SERVICE_URL, "/api/v1/chatbot/health", request)
 
-@app.api_route("/chatbot/{path:path}", methods=["GET","POST","PUT","DELETE","PATCH","HEAD","OPTIONS"])
-async def proxy_chatbot_general(request: Request, path: str):
-    return await _forward(CHATBOT_SERVICE_URL, f"/api/v1/chatbot/{path}", request)
-
 # ============================================================================
-# 🏭 CBAM 서비스 프록시 라우트 (새로운 CBAM 서비스용)
+# 🧭 컴파일된 프록시 라우트 (서비스별 catch-all 대신 접두사 radix trie 하나)
 # ============================================================================
 
-@app.api_route("/api/v1/cbam/{path:path}", methods=["GET","POST","PUT","DELETE","PATCH","HEAD","OPTIONS"])
-async def proxy_cbam_service(request: Request, path: str):
-    """CBAM 서비스로 요청을 프록시 - 새로운 CBAM 서비스 구조"""
-    if not CBAM_SERVICE_URL:
-        raise HTTPException(status_code=503, detail="CBAM service not configured")
-    
-    # 새로운 CBAM 서비스의 실제 엔드포인트로 전달 (greensteel-new_cbam 구조 적용)
-    # 프론트엔드: /api/v1/cbam/install → CBAM 서비스: /install/
-    # 프론트엔드: /api/v1/cbam/product → CBAM 서비스: /product/
-    # 프론트엔드: /api/v1/cbam/process → CBAM 서비스: /process/
-    # 프론트엔드: /api/v1/cbam/mapping → CBAM 서비스: /mapping
-    # 프론트엔드: /api/v1/cbam/calculation → CBAM 서비스: /calculation
-    # 프론트엔드: /api/v1/cbam/matdir → CBAM 서비스: /matdir
-    # 프론트엔드: /api/v1/cbam/fueldir → CBAM 서비스: /fueldir
-    # 프론트엔드: /api/v1/cbam/edge → CBAM 서비스: /edge/
-    # 프론트엔드: /api/v1/cbam/productprocess → CBAM 서비스: /productprocess
-    
-    # CBAM 서비스의 실제 라우터 구조에 맞게 경로 매핑
-    # CBAM 서비스: /install/, /product/, /process/, /edge/, /mapping/, /calculation/, /matdir/, /fueldir/, /productprocess/
-    
-    # 기본 경로들 (슬래시 추가)
-    if path in ["install", "product", "process", "edge", "mapping", "calculation", "matdir", "fueldir", "productprocess"]:
-        target_path = f"/{path}/"
-    # 하위 경로들 (동적 ID 포함)
-    elif path.startswith(("install/", "product/", "process/", "edge/", "mapping/", "calculation/", "matdir/", "fueldir/", "productprocess/")):
-        # 하위 경로는 그대로 전달 (예: /install/1, /product/names 등)
-        target_path = f"/{path}"
-    else:
-        # 기타 경로는 그대로
-        target_path = f"/{path}"
-    
-    gateway_logger.log_info(f"CBAM proxy: {request.method} /api/v1/cbam/{path} → {CBAM_SERVICE_URL}{target_path}")
-    return await _forward(CBAM_SERVICE_URL, target_path, request)
-
-@app.api_route("/cbam/{path:path}", methods=["GET","POST","PUT","DELETE","PATCH","HEAD","OPTIONS"])
-async def proxy_cbam_service_legacy(request: Request, path: str):
-    """CBAM 서비스로 요청을 프록시 (레거시 경로 지원)"""
-    if not CBAM_SERVICE_URL:
-        raise HTTPException(status_code=503, detail="CBAM service not configured")
-    
-    # CBAM 서비스의 실제 라우터 구조에 맞게 경로 매핑
-    # CBAM 서비스: /install/, /product/, /process/, /edge/, /mapping/, /calculation/, /matdir/, /fueldir/, /productprocess/
-    
-    # 기본 경로들 (슬래시 추가)
-    if path in ["install", "product", "process", "edge", "mapping", "calculation", "matdir", "fueldir", "productprocess"]:
-        target_path = f"/{path}/"
-    # 하위 경로들 (동적 ID 포함)
-    elif path.startswith(("install/", "product/", "process/", "edge/", "mapping/", "calculation/", "matdir/", "fueldir/", "productprocess/")):
-        # 하위 경로는 그대로 전달 (예: /install/1, /product/names 등)
-        target_path = f"/{path}"
-    else:
-        # 기타 경로는 그대로
-        target_path = f"/{path}"
-    
-    gateway_logger.log_info(f"CBAM legacy proxy: {request.method} /cbam/{path} → {CBAM_SERVICE_URL}{target_path}")
-    return await _forward(CBAM_SERVICE_URL, target_path, request)
-
-# ============================================================================
-# 🔐 Auth 서비스 프록시 라우트
-# ============================================================================
-
-@app.api_route("/api/auth/{path:path}", methods=["GET","POST","PUT","DELETE","PATCH","HEAD","OPTIONS"])
-async def proxy_auth_service(request: Request, path: str):
-    """Auth 서비스로 요청을 프록시"""
-    auth_service_url = os.getenv("AUTH_SERVICE_URL", "http://localhost:8081")
-    
-    # Auth 서비스의 실제 엔드포인트로 전달
-    target_path = f"/api/auth/{path}"
-    
-    gateway_logger.log_info(f"Auth proxy: {request.method} /api/auth/{path} → {auth_service_url}{target_path}")
-    return await _forward(auth_service_url, target_path, request)
-
-@app.api_route("/auth/{path:path}", methods=["GET","POST","PUT","DELETE","PATCH","HEAD","OPTIONS"])
-async def proxy_auth_service_legacy(request: Request, path: str):
-    """Auth 서비스로 요청을 프록시 (레거시 경로 지원)"""
-    auth_service_url = os.getenv("AUTH_SERVICE_URL", "http://localhost:8081")
-    
-    # Auth 서비스의 실제 엔드포인트로 전달
-    target_path = f"/auth/{path}"
-    
-    gateway_logger.log_info(f"Auth legacy proxy: {request.method} /auth/{path} → {auth_service_url}{target_path}")
-    return await _forward(auth_service_url, target_path, request)
-
-# ============================================================================
-# 🌱 LCA 서비스 프록시 라우트 (제거됨 - 더 이상 사용하지 않음)
-# ============================================================================
-
-# ============================================================================
-# 📊 DataGather 서비스 프록시 라우트
-# ============================================================================
-
-@app.api_route("/api/datagather/{path:path}", methods=["GET","POST","PUT","DELETE","PATCH","HEAD","OPTIONS"])
-async def proxy_datagather_service(request: Request, path: str):
-    """DataGather 서비스로 요청을 프록시"""
-    datagather_service_url = os.getenv("DATAGATHER_SERVICE_URL", "http://localhost:8085")
-    
-    # DataGather 서비스의 실제 엔드포인트로 전달
-    target_path = f"/api/datagather/{path}"
-    
-    gateway_logger.log_info(f"DataGather proxy: {request.method} /api/datagather/{path} → {datagather_service_url}{target_path}")
-    return await _forward(datagather_service_url, target_path, request)
+AUTH_SERVICE_URL = os.getenv("AUTH_SERVICE_URL", "http://localhost:8081")
+DATAGATHER_SERVICE_URL = os.getenv("DATAGATHER_SERVICE_URL", "http://localhost:8085")
+
+# 그대로 전달하는 규칙 (헬스체크/요청 검증 없이 _forward, 30초 타임아웃)
+# "/" 로 끝나는 접두사라 같은 서비스의 ProxyController 규칙(/auth, /cbam, ...)보다 길어 먼저 적용됨
+# - 챗봇: /chatbot/{path} → /api/v1/chatbot/{path}
+# - CBAM: /api/v1/cbam/install → /install/, /cbam/product/names → /product/names
+# - Auth / DataGather: 경로 그대로
+FORWARD_ROUTE_RULES = [
+    RouteRule("/chatbot/", CHATBOT_SERVICE_URL, "/api/v1/chatbot/", KIND_FORWARD, "Chatbot"),
+    RouteRule("/api/v1/cbam/", CBAM_SERVICE_URL, "/", KIND_FORWARD, "CBAM", CBAM_RESOURCES),
+    RouteRule("/cbam/", CBAM_SERVICE_URL, "/", KIND_FORWARD, "CBAM", CBAM_RESOURCES),
+    RouteRule("/api/auth/", AUTH_SERVICE_URL, None, KIND_FORWARD, "Auth"),
+    RouteRule("/auth/", AUTH_SERVICE_URL, None, KIND_FORWARD, "Auth"),
+    RouteRule("/api/datagather/", DATAGATHER_SERVICE_URL, None, KIND_FORWARD, "DataGather"),
+    RouteRule("/datagather/", DATAGATHER_SERVICE_URL, None, KIND_FORWARD, "DataGather"),
+]
+
+# 나머지 service_map 접두사는 ProxyController (서킷 브레이커 + 요청 검증)
+gateway_route_table = RouteTable(FORWARD_ROUTE_RULES + proxy_controller.route_table.rules)
+
+async def _dispatch_proxy_route(request: Request, match: RouteMatch) -> Response:
+    """라우팅 테이블 일치 규칙에 따라 업스트림으로 전달"""
+    if match.rule.kind != KIND_FORWARD:
+        return await proxy_controller.proxy_request(request, match)
+    if not match.upstream:
+        raise HTTPException(status_code=503, detail=f"{match.rule.service} service not configured")
+    gateway_logger.log_info(f"{match.rule.service} proxy: {request.method} {match.path} → {match.upstream}{match.upstream_path}")
+    # 화이트리스트 기준정보 GET 은 게이트웨이 응답 캐시 (GATEWAY_CACHE_ENABLED=true 일 때만)
+    if response_cache.is_cacheable(request, match):
+        return await response_cache.serve(
+            request,
+            match,
+            lambda: _send_forward(match.upstream, match.upstream_path, request, CONDITIONAL_REQUEST_HEADERS)
+        )
+    try:
+        return await _forward(match.upstream, match.upstream_path, request)
+    finally:
+        # 쓰기는 실패/타임아웃이어도 반영됐을 수 있으므로 같은 그룹 캐시 무효화
+        await response_cache.purge_for_write(request, match)
 
-@app.api_route("/datagather/{path:path}", methods=["GET","POST","PUT","DELETE","PATCH","HEAD","OPTIONS"])
-async def proxy_datagather_service_legacy(request: Request, path: str):
-    """DataGather 서비스로 요청을 프록시 (레거시 경로 지원)"""
-    datagather_service_url = os.getenv("DATAGATHER_SERVICE_URL", "http://localhost:8085")
-    
-    # DataGather 서비스의 실제 엔드포인트로 전달
-    target_path = f"/datagather/{path}"
-    
-    gateway_logger.log_info(f"DataGather legacy proxy: {request.method} /datagather/{path} → {datagather_service_url}{target_path}")
-    return await _forward(datagather_service_url, target_path, request)
+# 위에 선언한 개별 라우트 다음, 아래의 데이터 업로드 라우트보다 먼저 검사되도록 이 위치에 등록
+app.router.routes.append(ProxyRoute(gateway_route_table, _dispatch_proxy_route))
 
 @app.get("/cbam/health")
 async def cbam_health_check():
@@ -492,28 +428,28 @@ async def cbam_health_check():
     
     try:
         # 새로운 CBAM 서비스 헬스체크 요청
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"{CBAM_SERVICE_URL}/health")
-            if response.status_code == 200:
-                return {
-                    "status": "healthy",
-                    "service": "CBAM",
-                    "upstream": CBAM_SERVICE_URL,
-                    "architecture": "DDD (Domain-Driven Design)",
-                    "domains": [
-                        "install", "product", "process", "mapping", 
-                        "calculation", "matdir", "fueldir", "edge", "productprocess"
-                    ],
-                    "timestamp": time.time()
-                }
-            else:
-                return {
-                    "status": "unhealthy",
-                    "service": "CBAM",
-                    "upstream": CBAM_SERVICE_URL,
-                    "status_code": response.status_code,
-                    "timestamp": time.time()
-                }
+        client = await http_clients.get_client(CBAM_SERVICE_URL)
+        response = await client.get(f"{CBAM_SERVICE_URL}/health", timeout=10.0)
+        if response.status_code == 200:
+            return {
+                "status": "healthy",
+                "service": "CBAM",
+                "upstream": CBAM_SERVICE_URL,
+                "architecture": "DDD (Domain-Driven Design)",
+                "domains": [
+                    "install", "product", "process", "mapping", 
+                    "calculation", "matdir", "fueldir", "edge", "productprocess"
+                ],
+                "timestamp": time.time()
+            }
+        else:
+            return {
+                "status": "unhealthy",
+                "service": "CBAM",
+                "upstream": CBAM_SERVICE_URL,
+                "status_code": response.status_code,
+                "timestamp": time.time()
+            }
     except Exception as e:
         return {
             "status": "unhealthy",
@@ -536,26 +472,26 @@ async def cbam_database_status():
     
     try:
         # CBAM 서비스 데이터베이스 상태 확인 요청
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(f"{CBAM_SERVICE_URL}/db/status")
-            if response.status_code == 200:
-                db_data = response.json()
-                return {
-                    "status": "success",
-                    "service": "CBAM",
-                    "upstream": CBAM_SERVICE_URL,
-                    "database_status": db_data,
-                    "timestamp": time.time()
-                }
-            else:
-                return {
-                    "status": "error",
-                    "service": "CBAM",
-                    "upstream": CBAM_SERVICE_URL,
-                    "status_code": response.status_code,
-                    "message": "Failed to get database status",
-                    "timestamp": time.time()
-                }
+        client = await http_clients.get_client(CBAM_SERVICE_URL)
+        response = await client.get(f"{CBAM_SERVICE_URL}/db/status", timeout=15.0)
+        if response.status_code == 200:
+            db_data = response.json()
+            return {
+                "status": "success",
+                "service": "CBAM",
+                "upstream": CBAM_SERVICE_URL,
+                "database_status": db_data,
+                "timestamp": time.time()
+            }
+        else:
+            return {
+                "status": "error",
+                "service": "CBAM",
+                "upstream": CBAM_SERVICE_URL,
+                "status_code": response.status_code,
+                "message": "Failed to get database status",
+                "timestamp": time.time()
+            }
     except Exception as e:
         return {
             "status": "error",
@@ -577,27 +513,28 @@ async def process_data_to_datagather(data: dict):
         
         # DataGather 서비스로 JSON 데이터 전송 (환경변수 사용)
         datagather_service_url = os.getenv("DATAGATHER_SERVICE_URL", "http://localhost:8085")
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{datagather_service_url.rstrip('/')}/process-data",
-                json=data
-            )
+        client = await http_clients.get_client(datagather_service_url)
+        response = await client.post(
+            f"{datagather_service_url.rstrip('/')}/process-data",
+            json=data,
+            timeout=30.0
+        )
             
-            if response.status_code == 200:
-                response_data = response.json()
-                gateway_logger.log_info(f"datagather_service로 데이터 전송 성공: {data.get('filename', 'unknown')}")
+        if response.status_code == 200:
+            response_data = response.json()
+            gateway_logger.log_info(f"datagather_service로 데이터 전송 성공: {data.get('filename', 'unknown')}")
                 
-                return {
-                    "message": "게이트웨이를 통해 datagather_service로 전송 성공",
-                    "status": "success",
-                    "data": response_data
-                }
-            else:
-                gateway_logger.log_error(f"datagather_service 응답 오류: {response.status_code}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"datagather_service 오류: {response.text}"
-                )
+            return {
+                "message": "게이트웨이를 통해 datagather_service로 전송 성공",
+                "status": "success",
+                "data": response_data
+            }
+        else:
+            gateway_logger.log_error(f"datagather_service 응답 오류: {response.status_code}")
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"datagather_service 오류: {response.text}"
+            )
                 
     except httpx.TimeoutException:
         gateway_logger.log_error("datagather_service 연결 시간 초과")
@@ -618,33 +555,34 @@ async def ai_process_data(data: dict):
         
         # datagather_service로 AI 처리 요청 전송 (환경변수 사용)
         datagather_service_url = os.getenv("DATAGATHER_SERVICE_URL", "http://localhost:8085")
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{datagather_service_url.rstrip('/')}/ai-process",
-                json=data
-            )
+        client = await http_clients.get_client(datagather_service_url)
+        response = await client.post(
+            f"{datagather_service_url.rstrip('/')}/ai-process",
+            json=data,
+            timeout=60.0
+        )
             
-            if response.status_code == 200:
-                response_data = response.json()
-                gateway_logger.log_info(f"AI 모델 처리 성공: {data.get('filename', 'unknown')}")
+        if response.status_code == 200:
+            response_data = response.json()
+            gateway_logger.log_info(f"AI 모델 처리 성공: {data.get('filename', 'unknown')}")
                 
-                return {
-                    "message": "AI 모델을 통해 투입물명이 성공적으로 수정되었습니다",
-                    "status": "ai_processed",
-                    "filename": data.get('filename', 'unknown'),
-                    "original_count": data.get('rows_count', 0),
-                    "processed_count": len(response_data.get('data', [])),
-                    "ai_available": True,
-                    "data": response_data.get('data', []),
-                    "columns": response_data.get('columns', []),
-                    "timestamp": response_data.get('timestamp', time.time())
-                }
-            else:
-                gateway_logger.log_error(f"AI 모델 처리 오류: {response.status_code}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"AI 모델 처리 오류: {response.text}"
-                )
+            return {
+                "message": "AI 모델을 통해 투입물명이 성공적으로 수정되었습니다",
+                "status": "ai_processed",
+                "filename": data.get('filename', 'unknown'),
+                "original_count": data.get('rows_count', 0),
+                "processed_count": len(response_data.get('data', [])),
+                "ai_available": True,
+                "data": response_data.get('data', []),
+                "columns": response_data.get('columns', []),
+                "timestamp": response_data.get('timestamp', time.time())
+            }
+        else:
+            gateway_logger.log_error(f"AI 모델 처리 오류: {response.status_code}")
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"AI 모델 처리 오류: {response.text}"
+            )
                 
     except httpx.TimeoutException:
         gateway_logger.log_error("AI 모델 처리 시간 초과")
@@ -665,30 +603,31 @@ async def api_ai_process_data(data: dict):
         
         # datagather_service로 AI 처리 요청 전송
         datagather_service_url = os.getenv("DATAGATHER_SERVICE_URL", "http://localhost:8085")
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{datagather_service_url.rstrip('/')}/ai-process",
-                json=data
-            )
+        client = await http_clients.get_client(datagather_service_url)
+        response = await client.post(
+            f"{datagather_service_url.rstrip('/')}/ai-process",
+            json=data,
+            timeout=60.0
+        )
             
-            if response.status_code == 200:
-                response_data = response.json()
-                gateway_logger.log_info(f"API AI 모델 처리 성공: {data.get('filename', 'unknown')}")
+        if response.status_code == 200:
+            response_data = response.json()
+            gateway_logger.log_info(f"API AI 모델 처리 성공: {data.get('filename', 'unknown')}")
                 
-                return {
-                    "success": True,
-                    "message": "AI 처리가 완료되었습니다",
-                    "processed_data": response_data.get('data', []),
-                    "columns": response_data.get('columns', []),
-                    "total_rows": len(data.get('data', [])),
-                    "processed_rows": len(response_data.get('data', []))
-                }
-            else:
-                gateway_logger.log_error(f"API AI 모델 처리 오류: {response.status_code}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"AI 모델 처리 오류: {response.text}"
-                )
+            return {
+                "success": True,
+                "message": "AI 처리가 완료되었습니다",
+                "processed_data": response_data.get('data', []),
+                "columns": response_data.get('columns', []),
+                "total_rows": len(data.get('data', [])),
+                "processed_rows": len(response_data.get('data', []))
+            }
+        else:
+            gateway_logger.log_error(f"API AI 모델 처리 오류: {response.status_code}")
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"AI 모델 처리 오류: {response.text}"
+            )
                 
     except httpx.TimeoutException:
         gateway_logger.log_error("API AI 모델 처리 시간 초과")
@@ -712,27 +651,28 @@ async def process_feedback(feedback_data: dict):
         
         # DataGather 서비스로 피드백 전송 (환경변수 사용)
         datagather_service_url = os.getenv("DATAGATHER_SERVICE_URL", "http://localhost:8085")
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{datagather_service_url.rstrip('/')}/feedback",
-                json=feedback_data
-            )
+        client = await http_clients.get_client(datagather_service_url)
+        response = await client.post(
+            f"{datagather_service_url.rstrip('/')}/feedback",
+            json=feedback_data,
+            timeout=30.0
+        )
             
-            if response.status_code == 200:
-                response_data = response.json()
-                gateway_logger.log_info(f"피드백 처리 성공: {response_data}")
+        if response.status_code == 200:
+            response_data = response.json()
+            gateway_logger.log_info(f"피드백 처리 성공: {response_data}")
                 
-                return {
-                    "message": "피드백이 성공적으로 처리되었습니다",
-                    "status": "success",
-                    "data": response_data
-                }
-            else:
-                gateway_logger.log_error(f"피드백 처리 오류: {response.status_code}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"피드백 처리 오류: {response.text}"
-                )
+            return {
+                "message": "피드백이 성공적으로 처리되었습니다",
+                "status": "success",
+                "data": response_data
+            }
+        else:
+            gateway_logger.log_error(f"피드백 처리 오류: {response.status_code}")
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"피드백 처리 오류: {response.text}"
+            )
                 
     except httpx.TimeoutException:
         gateway_logger.log_error("피드백 처리 시간 초과")
@@ -755,27 +695,28 @@ async def upload_input_data(data: dict):
         
         # DataGather 서비스로 Input 데이터 전송 (환경변수 사용)
         datagather_service_url = os.getenv("DATAGATHER_SERVICE_URL", "http://localhost:8085")
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{datagather_service_url.rstrip('/')}/save-input-data",
-                json=data
-            )
+        client = await http_clients.get_client(datagather_service_url)
+        response = await client.post(
+            f"{datagather_service_url.rstrip('/')}/save-input-data",
+            json=data,
+            timeout=30.0
+        )
             
-            if response.status_code == 200:
-                response_data = response.json()
-                gateway_logger.log_info(f"Input 데이터 업로드 성공: {data.get('filename', 'unknown')}")
+        if response.status_code == 200:
+            response_data = response.json()
+            gateway_logger.log_info(f"Input 데이터 업로드 성공: {data.get('filename', 'unknown')}")
                 
-                return {
-                    "message": "Input 데이터가 성공적으로 업로드되었습니다",
-                    "status": "success",
-                    "data": response_data
-                }
-            else:
-                gateway_logger.log_error(f"Input 데이터 업로드 오류: {response.status_code}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Input 데이터 업로드 오류: {response.text}"
-                )
+            return {
+                "message": "Input 데이터가 성공적으로 업로드되었습니다",
+                "status": "success",
+                "data": response_data
+            }
+        else:
+            gateway_logger.log_error(f"Input 데이터 업로드 오류: {response.status_code}")
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Input 데이터 업로드 오류: {response.text}"
+            )
                 
     except httpx.TimeoutException:
         gateway_logger.log_error("Input 데이터 업로드 시간 초과")
@@ -796,27 +737,28 @@ async def upload_output_data(data: dict):
         
         # DataGather 서비스로 Output 데이터 전송 (환경변수 사용)
         datagather_service_url = os.getenv("DATAGATHER_SERVICE_URL", "http://localhost:8085")
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{datagather_service_url.rstrip('/')}/save-output-data",
-                json=data
-            )
+        client = await http_clients.get_client(datagather_service_url)
+        response = await client.post(
+            f"{datagather_service_url.rstrip('/')}/save-output-data",
+            json=data,
+            timeout=30.0
+        )
             
-            if response.status_code == 200:
-                response_data = response.json()
-                gateway_logger.log_info(f"Output 데이터 업로드 성공: {data.get('filename', 'unknown')}")
+        if response.status_code == 200:
+            response_data = response.json()
+            gateway_logger.log_info(f"Output 데이터 업로드 성공: {data.get('filename', 'unknown')}")
                 
-                return {
-                    "message": "Output 데이터가 성공적으로 업로드되었습니다",
-                    "status": "success",
-                    "data": response_data
-                }
-            else:
-                gateway_logger.log_error(f"Output 데이터 업로드 오류: {response.status_code}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Output 데이터 업로드 오류: {response.text}"
-                )
+            return {
+                "message": "Output 데이터가 성공적으로 업로드되었습니다",
+                "status": "success",
+                "data": response_data
+            }
+        else:
+            gateway_logger.log_error(f"Output 데이터 업로드 오류: {response.status_code}")
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Output 데이터 업로드 오류: {response.text}"
+            )
                 
     except httpx.TimeoutException:
         gateway_logger.log_error("Output 데이터 업로드 시간 초과")
@@ -842,23 +784,16 @@ async def save_processed_data_proxy(request: Request):
             raise HTTPException(status_code=503, detail="DATAGATHER_SERVICE_URL 환경변수가 설정되지 않았습니다")
         gateway_logger.log_info(f"DB 저장 요청을 DataGather 서비스로 프록시: {datagather_service_url}")
         target_url = f"{datagather_service_url.rstrip('/')}/save-processed-data"
-        body = await request.body()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                url=target_url,
-                content=body,
-                headers={
-                    "Content-Type": request.headers.get("content-type", "application/json"),
-                    "X-Forwarded-By": GATEWAY_NAME
-                }
-            )
-            gateway_logger.log_info(f"DataGather 서비스 DB 저장 응답: {response.status_code}")
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type")
-            )
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "POST",
+            target_url,
+            headers=_body_forward_headers(request),
+            content=request_body_stream(request),
+            timeout=60.0
+        )
+        gateway_logger.log_info(f"DataGather 서비스 DB 저장 응답: {upstream_response.status_code}")
+        return streaming_response(upstream_response)
     except httpx.TimeoutException:
         gateway_logger.log_error("DataGather 서비스 DB 저장 연결 시간 초과")
         raise HTTPException(status_code=504, detail="DataGather 서비스 DB 저장 연결 시간 초과")
@@ -881,24 +816,17 @@ async def classify_data_proxy(request: Request):
         gateway_logger.log_info(f"데이터 분류 요청을 DataGather 서비스로 프록시: {datagather_service_url}")
         target_url = f"{datagather_service_url.rstrip('/')}/classify-data"
         
-        body = await request.body()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                url=target_url,
-                content=body,
-                headers={
-                    "Content-Type": request.headers.get("content-type", "application/json"),
-                    "X-Forwarded-By": GATEWAY_NAME
-                }
-            )
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "POST",
+            target_url,
+            headers=_body_forward_headers(request),
+            content=request_body_stream(request),
+            timeout=60.0
+        )
             
-            gateway_logger.log_info(f"DataGather 서비스 데이터 분류 응답: {response.status_code}")
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type")
-            )
+        gateway_logger.log_info(f"DataGather 서비스 데이터 분류 응답: {upstream_response.status_code}")
+        return streaming_response(upstream_response)
             
     except httpx.TimeoutException:
         gateway_logger.log_error("DataGather 서비스 데이터 분류 연결 시간 초과")
@@ -922,31 +850,18 @@ async def delete_classification_proxy(request: Request):
         gateway_logger.log_info(f"데이터 분류 삭제 요청을 DataGather 서비스로 프록시: {datagather_service_url}")
         target_url = f"{datagather_service_url.rstrip('/')}/delete-classification"
         
-        body = await request.body()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # httpx의 delete 메서드는 본문을 지원하지 않으므로 request 메서드 사용
-            request_kwargs = {
-                "method": "DELETE",
-                "url": target_url,
-                "headers": {
-                    "Content-Type": request.headers.get("content-type", "application/json"),
-                    "X-Forwarded-By": GATEWAY_NAME
-                }
-            }
-            
-            # body가 있는 경우 content 파라미터로 전달
-            if body:
-                request_kwargs["content"] = body
-            
-            response = await client.request(**request_kwargs)
+        # httpx의 delete 메서드는 본문을 지원하지 않으므로 build_request 기반 send_upstream 사용
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "DELETE",
+            target_url,
+            headers=_body_forward_headers(request),
+            content=request_body_stream(request),
+            timeout=60.0
+        )
             
-            gateway_logger.log_info(f"DataGather 서비스 데이터 분류 삭제 응답: {response.status_code}")
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type")
-            )
+        gateway_logger.log_info(f"DataGather 서비스 데이터 분류 삭제 응답: {upstream_response.status_code}")
+        return streaming_response(upstream_response)
             
     except httpx.TimeoutException:
         gateway_logger.log_error("DataGather 서비스 데이터 분류 삭제 연결 시간 초과")
@@ -967,23 +882,16 @@ async def save_transport_data_proxy(request: Request):
             raise HTTPException(status_code=503, detail="DATAGATHER_SERVICE_URL 환경변수가 설정되지 않았습니다")
         gateway_logger.log_info(f"운송 데이터 저장 요청을 DataGather 서비스로 프록시: {datagather_service_url}")
         target_url = f"{datagather_service_url.rstrip('/')}/save-transport-data"
-        body = await request.body()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                url=target_url,
-                content=body,
-                headers={
-                    "Content-Type": request.headers.get("content-type", "application/json"),
-                    "X-Forwarded-By": GATEWAY_NAME
-                }
-            )
-            gateway_logger.log_info(f"DataGather 서비스 운송 데이터 저장 응답: {response.status_code}")
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type")
-            )
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "POST",
+            target_url,
+            headers=_body_forward_headers(request),
+            content=request_body_stream(request),
+            timeout=60.0
+        )
+        gateway_logger.log_info(f"DataGather 서비스 운송 데이터 저장 응답: {upstream_response.status_code}")
+        return streaming_response(upstream_response)
     except httpx.TimeoutException:
         gateway_logger.log_error("DataGather 서비스 운송 데이터 저장 연결 시간 초과")
         raise HTTPException(status_code=504, detail="DataGather 서비스 운송 데이터 저장 연결 시간 초과")
@@ -1000,23 +908,16 @@ async def save_process_data_proxy(request: Request):
             raise HTTPException(status_code=503, detail="DATAGATHER_SERVICE_URL 환경변수가 설정되지 않았습니다")
         gateway_logger.log_info(f"공정 데이터 저장 요청을 DataGather 서비스로 프록시: {datagather_service_url}")
         target_url = f"{datagather_service_url.rstrip('/')}/save-process-data"
-        body = await request.body()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                url=target_url,
-                content=body,
-                headers={
-                    "Content-Type": request.headers.get("content-type", "application/json"),
-                    "X-Forwarded-By": GATEWAY_NAME
-                }
-            )
-            gateway_logger.log_info(f"DataGather 서비스 공정 데이터 저장 응답: {response.status_code}")
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type")
-            )
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "POST",
+            target_url,
+            headers=_body_forward_headers(request),
+            content=request_body_stream(request),
+            timeout=60.0
+        )
+        gateway_logger.log_info(f"DataGather 서비스 공정 데이터 저장 응답: {upstream_response.status_code}")
+        return streaming_response(upstream_response)
     except httpx.TimeoutException:
         gateway_logger.log_error("DataGather 서비스 공정 데이터 저장 연결 시간 초과")
         raise HTTPException(status_code=504, detail="DataGather 서비스 공정 데이터 저장 연결 시간 초과")
@@ -1033,23 +934,16 @@ async def save_output_data_proxy(request: Request):
             raise HTTPException(status_code=503, detail="DATAGATHER_SERVICE_URL 환경변수가 설정되지 않았습니다")
         gateway_logger.log_info(f"산출물 데이터 저장 요청을 DataGather 서비스로 프록시: {datagather_service_url}")
         target_url = f"{datagather_service_url.rstrip('/')}/save-output-data"
-        body = await request.body()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                url=target_url,
-                content=body,
-                headers={
-                    "Content-Type": request.headers.get("content-type", "application/json"),
-                    "X-Forwarded-By": GATEWAY_NAME
-                }
-            )
-            gateway_logger.log_info(f"DataGather 서비스 산출물 데이터 저장 응답: {response.status_code}")
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type")
-            )
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "POST",
+            target_url,
+            headers=_body_forward_headers(request),
+            content=request_body_stream(request),
+            timeout=60.0
+        )
+        gateway_logger.log_info(f"DataGather 서비스 산출물 데이터 저장 응답: {upstream_response.status_code}")
+        return streaming_response(upstream_response)
     except httpx.TimeoutException:
         gateway_logger.log_error("DataGather 서비스 산출물 데이터 저장 연결 시간 초과")
         raise HTTPException(status_code=504, detail="DataGather 서비스 산출물 데이터 저장 연결 시간 초과")
@@ -1073,24 +967,17 @@ async def save_input_data_proxy(request: Request):
         gateway_logger.log_info(f"save-input-data 요청을 DataGather 서비스로 프록시: {datagather_service_url}")
         target_url = f"{datagather_service_url.rstrip('/')}/save-input-data"
         
-        body = await request.body()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                url=target_url,
-                content=body,
-                headers={
-                    "Content-Type": request.headers.get("content-type", "application/json"),
-                    "X-Forwarded-By": GATEWAY_NAME
-                }
-            )
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "POST",
+            target_url,
+            headers=_body_forward_headers(request),
+            content=request_body_stream(request),
+            timeout=60.0
+        )
             
-            gateway_logger.log_info(f"DataGather 서비스 save-input-data 응답: {response.status_code}")
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.headers.get("content-type")
-            )
+        gateway_logger.log_info(f"DataGather 서비스 save-input-data 응답: {upstream_response.status_code}")
+        return streaming_response(upstream_response)
             
     except httpx.TimeoutException:
         gateway_logger.log_error("DataGather 서비스 save-input-data 연결 시간 초과")
@@ -1109,43 +996,47 @@ async def save_input_data_proxy(request: Request):
 # ============================================================================
 @app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"])
 async def proxy_route(request: Request, path: str):
-    """모든 경로에 대한 프록시 라우팅 - DDD 도메인 서비스 라우팅"""
+    """라우팅 테이블에 일치하는 접두사가 없는 경로 (일치하면 위의 ProxyRoute 가 먼저 처리)"""
     # 루트 경로는 헬스체크로 리다이렉트
     if path == "" or path == "/":
         return {"message": "Gateway is running", "health_check": "/health"}
     
-    # 프록시 요청 처리
-    try:
-        return await proxy_controller.proxy_request(request)
-    except Exception as e:
-        from fastapi.responses import JSONResponse
-        return JSONResponse(
-            status_code=404,
-            content={
-                "message": "Proxy route not found",
-                "path": path,
-                "supported_methods": ["GET","POST","PUT","DELETE","PATCH","HEAD","OPTIONS"]
-            }
-        )
+    return JSONResponse(
+        status_code=404,
+        content={
+            "message": "Proxy route not found",
+            "path": path,
+            "supported_methods": ["GET","POST","PUT","DELETE","PATCH","HEAD","OPTIONS"]
+        }
+    )
 
-# 예외 처리
+# 예외 처리 (핸들러는 dict가 아니라 Response를 반환해야 함)
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc):
     """404 에러 처리"""
     gateway_logger.log_warning(f"404 Not Found: {request.url.path}")
-    return {"error": "Not Found", "path": request.url.path}
+    return JSONResponse(
+        status_code=404,
+        content={"error": "Not Found", "path": request.url.path, "detail": getattr(exc, "detail", "Not Found")}
+    )
 
 @app.exception_handler(400)
 async def bad_request_handler(request: Request, exc):
     """400 에러 처리"""
     gateway_logger.log_warning(f"400 Bad Request: {request.url.path}")
-    return {"error": "Bad Request", "detail": str(exc.detail) if hasattr(exc, 'detail') else "Invalid request"}
+    return JSONResponse(
+        status_code=400,
+        content={"error": "Bad Request", "detail": str(exc.detail) if hasattr(exc, 'detail') else "Invalid request"}
+    )
 
 @app.exception_handler(500)
 async def internal_error_handler(request: Request, exc):
-    """500 에러 처리"""
+    """500 에러 처리 (HTTPException(500)과 처리되지 않은 예외 모두)"""
     gateway_logger.log_error(f"Internal Server Error: {request.url.path}")
-    return {"error": "Internal Server Error"}
+    return JSONResponse(
+        status_code=500,
+        content={"error": "Internal Server Error", "detail": getattr(exc, "detail", "Internal Server Error")}
+    )
 
 # 데이터 조회 엔드포인트들
 @app.get("/api/datagather/input-data")
@@ -1156,23 +1047,23 @@ async def get_input_data_proxy():
         if not datagather_service_url:
             raise HTTPException(status_code=503, detail="DATAGATHER_SERVICE_URL 환경변수가 설정되지 않았습니다")
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{datagather_service_url.rstrip('/')}/api/datagather/input-data"
-            )
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "GET",
+            f"{datagather_service_url.rstrip('/')}/api/datagather/input-data",
+            timeout=30.0
+        )
             
-            if response.status_code == 200:
-                return Response(
-                    content=response.content,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.headers.get("content-type")
-                )
-            else:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"투입물 데이터 조회 오류: {response.text}"
-                )
+        if upstream_response.status_code == 200:
+            return streaming_response(upstream_response)
+        else:
+            # 오류 응답만 읽어서 메시지로 전달
+            error_body = await upstream_response.aread()
+            await upstream_response.aclose()
+            raise HTTPException(
+                status_code=upstream_response.status_code,
+                detail=f"투입물 데이터 조회 오류: {error_body.decode('utf-8', errors='replace')}"
+            )
                 
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="DataGather 서비스 연결 시간 초과")
@@ -1189,23 +1080,23 @@ async def get_output_data_proxy():
         if not datagather_service_url:
             raise HTTPException(status_code=503, detail="DATAGATHER_SERVICE_URL 환경변수가 설정되지 않았습니다")
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{datagather_service_url.rstrip('/')}/api/datagather/output-data"
-            )
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "GET",
+            f"{datagather_service_url.rstrip('/')}/api/datagather/output-data",
+            timeout=30.0
+        )
             
-            if response.status_code == 200:
-                return Response(
-                    content=response.content,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.headers.get("content-type")
-                )
-            else:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"산출물 데이터 조회 오류: {response.text}"
-                )
+        if upstream_response.status_code == 200:
+            return streaming_response(upstream_response)
+        else:
+            # 오류 응답만 읽어서 메시지로 전달
+            error_body = await upstream_response.aread()
+            await upstream_response.aclose()
+            raise HTTPException(
+                status_code=upstream_response.status_code,
+                detail=f"산출물 데이터 조회 오류: {error_body.decode('utf-8', errors='replace')}"
+            )
                 
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="DataGather 서비스 연결 시간 초과")
@@ -1222,23 +1113,23 @@ async def get_transport_data_proxy():
         if not datagather_service_url:
             raise HTTPException(status_code=503, detail="DATAGATHER_SERVICE_URL 환경변수가 설정되지 않았습니다")
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{datagather_service_url.rstrip('/')}/api/datagather/transport-data"
-            )
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "GET",
+            f"{datagather_service_url.rstrip('/')}/api/datagather/transport-data",
+            timeout=30.0
+        )
             
-            if response.status_code == 200:
-                return Response(
-                    content=response.content,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.headers.get("content-type")
-                )
-            else:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"운송 데이터 조회 오류: {response.text}"
-                )
+        if upstream_response.status_code == 200:
+            return streaming_response(upstream_response)
+        else:
+            # 오류 응답만 읽어서 메시지로 전달
+            error_body = await upstream_response.aread()
+            await upstream_response.aclose()
+            raise HTTPException(
+                status_code=upstream_response.status_code,
+                detail=f"운송 데이터 조회 오류: {error_body.decode('utf-8', errors='replace')}"
+            )
                 
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="DataGather 서비스 연결 시간 초과")
@@ -1255,23 +1146,23 @@ async def get_process_data_proxy():
         if not datagather_service_url:
             raise HTTPException(status_code=503, detail="DATAGATHER_SERVICE_URL 환경변수가 설정되지 않았습니다")
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{datagather_service_url.rstrip('/')}/api/datagather/process-data"
-            )
+        upstream_response = await send_upstream(
+            datagather_service_url,
+            "GET",
+            f"{datagather_service_url.rstrip('/')}/api/datagather/process-data",
+            timeout=30.0
+        )
             
-            if response.status_code == 200:
-                return Response(
-                    content=response.content,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.headers.get("content-type")
-                )
-            else:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"공정 데이터 조회 오류: {response.text}"
-                )
+        if upstream_response.status_code == 200:
+            return streaming_response(upstream_response)
+        else:
+            # 오류 응답만 읽어서 메시지로 전달
+            error_body = await upstream_response.aread()
+            await upstream_response.aclose()
+            raise HTTPException(
+                status_code=upstream_response.status_code,
+                detail=f"공정 데이터 조회 오류: {error_body.decode('utf-8', errors='replace')}"
+            )
                 
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="DataGather 서비스 연결 시간 초과")
@@ -0,0 +1,220 @@
+# ============================================================================
+# 🗃️ 게이트웨이 응답 캐시 테스트
+# ============================================================================
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+
+from app.common.response_cache import GatewayResponseCache, _etag_matches, parse_cache_routes
+from app.common.route_table import RouteRule, RouteTable
+
+ROUTES = RouteTable([RouteRule("/api/v1/cbam/", "http://cbam", "/")])
+
+
+class _FakeUpstream:
+    """httpx.Response 대신 쓰는 업스트림 응답 (aiter_raw / aclose 만 사용)"""
+
+    def __init__(self, body: bytes, status_code: int = 200, headers=None):
+        self.status_code = status_code
+        self.headers = httpx.Headers(headers or {"content-type": "application/json"})
+        self._body = body
+        self.closed = False
+
+    async def aiter_raw(self):
+        for start in range(0, len(self._body), 4):
+            yield self._body[start:start + 4]
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _Upstream:
+    """호출 횟수를 세는 업스트림 조회 함수"""
+
+    def __init__(self, body: bytes = b'{"data":[1,2,3]}', **kwargs):
+        self.body = body
+        self.kwargs = kwargs
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return _FakeUpstream(self.body, **self.kwargs)
+
+
+def _request(path: str, method: str = "GET", query: str = "", **headers):
+    request = SimpleNamespace(method=method, headers=headers, url=SimpleNamespace(query=query))
+    return request, ROUTES.match(path)
+
+
+def _cache(**settings) -> GatewayResponseCache:
+    cache = GatewayResponseCache()
+    cache.enabled = True
+    cache.backend = "memory"
+    for name, value in settings.items():
+        setattr(cache, name, value)
+    return cache
+
+
+def _header(response, name: str):
+    for key, value in response.raw_headers:
+        if key.decode("latin-1") == name:
+            return value.decode("latin-1")
+    return None
+
+
+def test_parse_cache_routes():
+    rules = parse_cache_routes("/mapping/=600, product/names=60@product, /matdir/material-master=3600,broken,=")
+
+    # 긴 접두사 우선, 그룹 생략 시 경로 첫 구간
+    assert [(rule.prefix, rule.ttl, rule.group) for rule in rules] == [
+        ("/matdir/material-master", 3600.0, "matdir"),
+        ("/product/names", 60.0, "product"),
+        ("/mapping/", 600.0, "mapping"),
+    ]
+
+
+def test_etag_matches_weak_comparison():
+    assert _etag_matches('"abc"', '"abc"')
+    assert _etag_matches('W/"abc"', '"abc"')
+    assert _etag_matches('"x", W/"abc"', 'W/"abc"')
+    assert _etag_matches("*", '"abc"')
+    assert not _etag_matches('"abd"', '"abc"')
+    assert not _etag_matches(None, '"abc"')
+
+
+def test_is_cacheable_only_whitelisted_gets():
+    cache = _cache()
+
+    assert cache.is_cacheable(*_request("/api/v1/cbam/matdir/material-master"))
+    assert cache.is_cacheable(*_request("/api/v1/cbam/mapping/search/hs/72"))
+    assert not cache.is_cacheable(*_request("/api/v1/cbam/install"))
+    assert not cache.is_cacheable(*_request("/api/v1/cbam/mapping/", method="POST"))
+
+    cache.enabled = False
+    assert not cache.is_cacheable(*_request("/api/v1/cbam/matdir/material-master"))
+
+
+def test_miss_hit_and_not_modified():
+    async def scenario():
+        cache = _cache()
+        upstream = _Upstream()
+        request, match = _request("/api/v1/cbam/matdir/material-master")
+
+        first = await cache.serve(request, match, upstream)
+        second = await cache.serve(request, match, upstream)
+        etag = _header(second, "etag")
+
+        conditional, _ = _request("/api/v1/cbam/matdir/material-master", **{"if-none-match": etag})
+        third = await cache.serve(conditional, match, upstream)
+        return cache, upstream, first, second, third
+
+    cache, upstream, first, second, third = asyncio.run(scenario())
+
+    assert upstream.calls == 1
+    assert (_header(first, "x-cache"), _header(second, "x-cache")) == ("MISS", "HIT")
+    assert second.body == b'{"data":[1,2,3]}'
+    assert _header(second, "content-type") == "application/json"
+    assert third.status_code == 304 and _header(third, "x-cache") == "HIT"
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["hits"], stats["not_modified"], stats["stores"]) == (1, 2, 1, 1)
+
+
+def test_query_string_is_part_of_key():
+    async def scenario():
+        cache = _cache()
+        upstream = _Upstream()
+        for query in ("q=1", "q=2", "q=1"):
+            request, match = _request("/api/v1/cbam/mapping/search", query=query)
+            await cache.serve(request, match, upstream)
+        return upstream
+
+    assert asyncio.run(scenario()).calls == 2
+
+
+def test_write_purges_group():
+    async def scenario():
+        cache = _cache()
+        upstream = _Upstream()
+        material = _request("/api/v1/cbam/matdir/material-master")
+        mapping = _request("/api/v1/cbam/mapping/search/hs/72")
+        await cache.serve(*material, upstream)
+        await cache.serve(*mapping, upstream)
+
+        await cache.purge_for_write(*_request("/api/v1/cbam/matdir/3", method="PUT"))
+        # 캐시 대상이 아닌 그룹의 쓰기는 무시
+        await cache.purge_for_write(*_request("/api/v1/cbam/edge", method="POST"))
+
+        after_material = await cache.serve(*material, upstream)
+        after_mapping = await cache.serve(*mapping, upstream)
+        return cache, upstream, after_material, after_mapping
+
+    cache, upstream, after_material, after_mapping = asyncio.run(scenario())
+
+    assert upstream.calls == 3
+    assert _header(after_material, "x-cache") == "MISS"
+    assert _header(after_mapping, "x-cache") == "HIT"
+    assert cache.get_stats()["purges"] == 1
+
+
+def test_stale_entry_served_and_refreshed_in_background():
+    async def scenario():
+        cache = _cache(stale_seconds=60)
+        upstream = _Upstream()
+        request, match = _request("/api/v1/cbam/product/names")
+        await cache.serve(request, match, upstream)
+
+        for entry in cache._entries.values():
+            entry.stored_at -= entry.ttl + 1
+        upstream.body = b'{"data":["new"]}'
+        stale = await cache.serve(request, match, upstream)
+        await asyncio.gather(*cache._refresh_tasks)
+        fresh = await cache.serve(request, match, upstream)
+        return cache, upstream, stale, fresh
+
+    cache, upstream, stale, fresh = asyncio.run(scenario())
+
+    assert _header(stale, "x-cache") == "STALE"
+    assert stale.body == b'{"data":[1,2,3]}'
+    assert _header(fresh, "x-cache") == "HIT"
+    assert fresh.body == b'{"data":["new"]}'
+    assert upstream.calls == 2
+    assert cache.get_stats()["refreshes"] == 1
+
+
+def test_concurrent_misses_fetch_once():
+    async def scenario():
+        cache = _cache()
+        upstream = _Upstream()
+        responses = await asyncio.gather(*(
+            cache.serve(*_request("/api/v1/cbam/fueldir/fuel-master"), upstream) for _ in range(5)
+        ))
+        return upstream, responses
+
+    upstream, responses = asyncio.run(scenario())
+
+    assert upstream.calls == 1
+    assert all(response.body == b'{"data":[1,2,3]}' for response in responses)
+
+
+def test_unstorable_and_oversized_responses_are_not_cached():
+    async def scenario():
+        cache = _cache(max_body_bytes=8)
+        request, match = _request("/api/v1/cbam/install/names")
+        with_cookie = _Upstream(headers={"set-cookie": "session=1"})
+        await cache.serve(request, match, with_cookie)
+        await cache.serve(request, match, with_cookie)
+
+        large = _Upstream(body=b"x" * 32)
+        await cache.serve(*_request("/api/v1/cbam/product/names"), large)
+        await cache.serve(*_request("/api/v1/cbam/product/names"), large)
+        return cache, with_cookie, large
+
+    cache, with_cookie, large = asyncio.run(scenario())
+
+    assert with_cookie.calls == 2
+    assert large.calls == 2
+    assert cache.get_stats()["uncacheable"] == 4
+    assert cache.get_stats()["entries"] == 0
@@ -0,0 +1,97 @@
+# ============================================================================
+# 🧭 프록시 라우팅 테이블 테스트
+# ============================================================================
+
+import random
+
+from starlette.routing import Match
+
+from app.common.route_table import KIND_CONTROLLER, KIND_FORWARD, ProxyRoute, RouteRule, RouteTable
+
+CBAM_RESOURCES = frozenset({"install", "product", "process"})
+
+RULES = [
+    RouteRule("/chatbot/", "http://chatbot", "/api/v1/chatbot/", KIND_FORWARD, "Chatbot"),
+    RouteRule("/api/v1/cbam/", "http://cbam", "/", KIND_FORWARD, "CBAM", CBAM_RESOURCES),
+    RouteRule("/cbam/", "http://cbam", "/", KIND_FORWARD, "CBAM", CBAM_RESOURCES),
+    RouteRule("/auth/", "http://auth", None, KIND_FORWARD, "Auth"),
+    RouteRule("/api/datagather/", "http://datagather", None, KIND_FORWARD, "DataGather"),
+    RouteRule("/chatbot", "http://chatbot", "/api/v1/chatbot", KIND_CONTROLLER, "chatbot"),
+    RouteRule("/api/v1/cbam", "http://cbam", "", KIND_CONTROLLER, "cbam", CBAM_RESOURCES),
+    RouteRule("/cbam", "http://cbam", "", KIND_CONTROLLER, "cbam", CBAM_RESOURCES),
+    RouteRule("/auth", "http://auth", None, KIND_CONTROLLER, "auth"),
+    RouteRule("/api/v1", "http://api", None, KIND_CONTROLLER, "api"),
+]
+
+
+def _linear_lookup(rules, path):
+    """기존 방식: 접두사를 길이순으로 정렬해 startswith 비교"""
+    for rule in sorted(rules, key=lambda r: len(r.prefix), reverse=True):
+        if path.startswith(rule.prefix):
+            return rule
+    return None
+
+
+def test_longest_prefix_wins():
+    table = RouteTable(RULES)
+
+    assert table.lookup("/cbam/install").kind == KIND_FORWARD
+    assert table.lookup("/cbam").kind == KIND_CONTROLLER
+    assert table.lookup("/api/v1/cbam/product/names").prefix == "/api/v1/cbam/"
+    assert table.lookup("/api/v1/other").prefix == "/api/v1"
+    assert table.lookup("/api/datagather/input-data").service == "DataGather"
+    assert table.lookup("/api/data") is None
+    assert table.lookup("/unknown") is None
+    assert table.lookup("") is None
+
+
+def test_upstream_path_rewrite():
+    table = RouteTable(RULES)
+
+    # 기본 리소스 경로에는 "/" 를 붙임
+    assert table.match("/api/v1/cbam/install").upstream_path == "/install/"
+    assert table.match("/cbam/install/3").upstream_path == "/install/3"
+    assert table.match("/cbam/product/names").upstream_path == "/product/names"
+    assert table.match("/cbam").upstream_path == ""
+    assert table.match("/chatbot/chat").upstream_path == "/api/v1/chatbot/chat"
+    # target_prefix 가 None 이면 경로 그대로
+    assert table.match("/auth/login").upstream_path == "/auth/login"
+
+    match = table.match("/api/datagather/input-data")
+    assert match.target_url() == "http://datagather/api/datagather/input-data"
+    assert match.target_url("limit=10&cursor=abc") == "http://datagather/api/datagather/input-data?limit=10&cursor=abc"
+
+
+def test_duplicate_prefix_keeps_first_rule():
+    first = RouteRule("/auth", "http://first")
+    table = RouteTable([first, RouteRule("/auth", "http://second")])
+
+    assert table.lookup("/auth/me") is first
+    assert table.rules == [first]
+    assert [entry["prefix"] for entry in RouteTable(RULES).describe()] == sorted(rule.prefix for rule in RULES)
+
+
+def test_lookup_matches_linear_scan():
+    rng = random.Random(7)
+    alphabet = "/abc"
+    rules = [RouteRule("/" + "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6))), "http://u") for _ in range(60)]
+    table = RouteTable(rules)
+    unique_rules = list({rule.prefix: rule for rule in reversed(rules)}.values())
+
+    for _ in range(2000):
+        path = "/" + "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+        expected = _linear_lookup(unique_rules, path)
+        actual = table.lookup(path)
+        assert (actual.prefix if actual else None) == (expected.prefix if expected else None), path
+
+
+def test_proxy_route_matches():
+    route = ProxyRoute(RouteTable(RULES), endpoint=None)
+
+    match, child_scope = route.matches({"type": "http", "path": "/auth/login", "method": "POST"})
+    assert match == Match.FULL
+    assert child_scope["route_match"].rule.service == "Auth"
+
+    assert route.matches({"type": "http", "path": "/auth/login", "method": "TRACE"})[0] == Match.PARTIAL
+    assert route.matches({"type": "http", "path": "/health", "method": "GET"})[0] == Match.NONE
+    assert route.matches({"type": "websocket", "path": "/auth/ws"})[0] == Match.NONE
@@ -0,0 +1,150 @@
+# ============================================================================
+# 🩺 업스트림 서킷 브레이커 테스트
+# ============================================================================
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.common import upstream_health as module
+from app.common.upstream_health import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    UpstreamHealthMonitor,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(module, "time", SimpleNamespace(monotonic=clock, time=time.time))
+    return clock
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED and breaker.allow_request()
+
+    # 성공하면 연속 실패 수 초기화
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request()
+    assert breaker.retry_after() == 31
+    clock.now += 10
+    assert breaker.retry_after() == 21
+    assert breaker.to_dict()["rejected"] == 1
+    assert breaker.opened_count == 1
+
+
+def test_trip_opens_immediately(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+    breaker.record_failure(trip=True)
+    assert breaker.state == STATE_OPEN
+
+
+def test_half_open_trial_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock.now += 29.9
+    assert not breaker.allow_request()
+
+    clock.now += 0.1
+    # reset_timeout 이후 시험 요청 하나만 통과
+    assert breaker.allow_request()
+    assert breaker.state == STATE_HALF_OPEN
+    assert not breaker.allow_request()
+    assert breaker.retry_after() == 0
+
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request() and breaker.allow_request()
+
+
+def test_half_open_trial_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    breaker.record_failure(trip=True)
+
+    clock.now += 30
+    assert breaker.allow_request()
+    # half_open 에서는 임계값과 관계없이 실패 한 번에 다시 open
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert breaker.opened_count == 2
+    assert not breaker.allow_request()
+
+    clock.now += 30
+    assert breaker.allow_request()
+
+
+def test_half_open_retries_when_trial_result_never_recorded(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock.now += 30
+    assert breaker.allow_request()
+    clock.now += 29
+    assert not breaker.allow_request()
+    clock.now += 1
+    assert breaker.allow_request()
+    assert breaker.state == STATE_HALF_OPEN
+
+
+class _FakeClient:
+    def __init__(self, status_codes):
+        self.status_codes = status_codes
+
+    async def get(self, url, timeout=None):
+        status = self.status_codes[url.rsplit("/", 1)[0]]
+        if isinstance(status, Exception):
+            raise status
+        return SimpleNamespace(status_code=status)
+
+
+def test_monitor_health_check_updates_breakers(monkeypatch):
+    status_codes = {"http://cbam": 200, "http://auth": 503, "http://chatbot": ConnectionError("refused")}
+
+    async def get_client(key):
+        return _FakeClient(status_codes)
+
+    monkeypatch.setattr(module.http_clients, "get_client", get_client)
+    monitor = UpstreamHealthMonitor()
+    for key in status_codes:
+        monitor._breaker(key)
+        monitor._health[key] = {"healthy": None, "checked_at": None, "latency_ms": None, "error": None}
+
+    asyncio.run(monitor.check_all())
+
+    assert monitor.allow_request("http://cbam/")
+    assert not monitor.allow_request("http://auth")
+    assert monitor.get_status("http://auth")["error"] == "HTTP 503"
+    assert monitor.get_status("http://chatbot")["circuit"]["state"] == STATE_OPEN
+    # 등록되지 않은 업스트림은 항상 허용
+    assert monitor.allow_request("http://unknown")
+    assert monitor.get_status("http://unknown")["circuit"] is None
+
+    # 헬스체크 성공이면 open 상태에서도 바로 closed
+    status_codes["http://auth"] = 200
+    asyncio.run(monitor.check_all())
+    assert monitor.get_status("http://auth")["circuit"]["state"] == STATE_CLOSED
+    assert monitor.get_stats()["rounds"] == 2
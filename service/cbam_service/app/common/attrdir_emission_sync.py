@@ -0,0 +1,262 @@
+# ============================================================================
+# 🔁 공정 직접귀속배출량 집계 동기화 (process_attrdir_emission)
+# ============================================================================
+
+"""
+matdir / fueldir 쓰기를 process_attrdir_emission 합계에 증분 반영하는 모듈
+
+기존에는 calculate_process_attrdir_emission 을 명시적으로 호출할 때만 matdir/fueldir 를
+SUM 해서 합계를 덮어썼기 때문에, 호출 전까지 합계가 실제 데이터와 어긋났습니다.
+trigger 모드에서는 matdir/fueldir 에 문장 단위(FOR EACH STATEMENT) 트리거를 설치해
+INSERT/UPDATE/DELETE 된 행의 배출량 차이(delta)를 공정별로 묶어 합계에 더합니다.
+
+- 변경 행은 전이 테이블(REFERENCING NEW/OLD TABLE)로 받아 공정별로 한 번만 갱신
+  (일괄 업서트 1만 행도 트리거 실행은 문장당 한 번)
+- total_matdir_emission / total_fueldir_emission 과 attrdir_em 에 같은 delta 를 더하므로
+  배출량 전파로 attrdir_em 이 조정된 공정도 값이 덮어써지지 않음
+- 설치 시 같은 트랜잭션에서 전체 합계를 한 번 재집계(기준값)한 뒤 증분 유지
+- 공정 삭제(ON DELETE CASCADE) 중에는 합계 행을 새로 만들지 않음
+
+환경변수:
+- ATTRDIR_EMISSION_SYNC_MODE: trigger (기본, DB 트리거로 증분 유지) | recompute (기존 방식, 트리거 제거)
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SYNC_MODE_TRIGGER = "trigger"
+SYNC_MODE_RECOMPUTE = "recompute"
+ATTRDIR_EMISSION_SYNC_MODE = os.getenv("ATTRDIR_EMISSION_SYNC_MODE", SYNC_MODE_TRIGGER).lower()
+
+
+@dataclass(frozen=True)
+class _SourceTable:
+    """합계에 반영되는 배출량 테이블"""
+    table: str
+    emission_column: str
+    total_column: str
+    other_total_column: str
+
+
+_SOURCE_TABLES = (
+    _SourceTable("matdir", "matdir_em", "total_matdir_emission", "total_fueldir_emission"),
+    _SourceTable("fueldir", "fueldir_em", "total_fueldir_emission", "total_matdir_emission"),
+)
+
+
+def _function_name(spec: _SourceTable) -> str:
+    return f"fn_{spec.table}_attrdir_emission_sync"
+
+
+def _trigger_name(spec: _SourceTable, operation: str) -> str:
+    return f"trg_{spec.table}_attrdir_emission_{operation.lower()}"
+
+
+def _delta_statement(spec: _SourceTable, source: str) -> str:
+    """전이 테이블 행을 공정별 delta 로 묶어 합계에 더하는 문장"""
+    total_column = spec.total_column
+    other_column = spec.other_total_column
+    return f"""
+        INSERT INTO process_attrdir_emission
+            (process_id, {total_column}, {other_column}, attrdir_em, calculation_date)
+        SELECT d.process_id, d.delta, 0, d.delta, NOW()
+        FROM (
+            SELECT process_id, SUM(em) AS delta
+            FROM ({source}) AS changed(process_id, em)
+            GROUP BY process_id
+        ) d
+        WHERE EXISTS (SELECT 1 FROM process p WHERE p.id = d.process_id)
+        ON CONFLICT (process_id) DO UPDATE SET
+            {total_column} = COALESCE(process_attrdir_emission.{total_column}, 0) + EXCLUDED.{total_column},
+            attrdir_em = COALESCE(process_attrdir_emission.attrdir_em, 0) + EXCLUDED.{total_column},
+            calculation_date = NOW(),
+            updated_at = NOW();
+    """
+
+
+def _function_sql(spec: _SourceTable) -> str:
+    """테이블별 문장 단위 트리거 함수 (작업 종류에 따라 전이 테이블 선택)"""
+    column = spec.emission_column
+    inserted = f"SELECT process_id, COALESCE({column}, 0) FROM new_rows"
+    deleted = f"SELECT process_id, -COALESCE({column}, 0) FROM old_rows"
+    return f"""
+        CREATE OR REPLACE FUNCTION {_function_name(spec)}() RETURNS trigger
+        LANGUAGE plpgsql AS $fn$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {_delta_statement(spec, inserted)}
+            ELSIF TG_OP = 'UPDATE' THEN
+                {_delta_statement(spec, f"{inserted} UNION ALL {deleted}")}
+            ELSIF TG_OP = 'DELETE' THEN
+                {_delta_statement(spec, deleted)}
+            END IF;
+            RETURN NULL;
+        END;
+        $fn$;
+    """
+
+
+def _trigger_sql(spec: _SourceTable) -> List[str]:
+    """INSERT/UPDATE/DELETE 문장 단위 트리거 (전이 테이블은 트리거당 한 이벤트만 허용)"""
+    function = _function_name(spec)
+    referencing = {
+        "INSERT": "REFERENCING NEW TABLE AS new_rows",
+        "UPDATE": "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+        "DELETE": "REFERENCING OLD TABLE AS old_rows",
+    }
+    statements = []
+    for operation, clause in referencing.items():
+        trigger = _trigger_name(spec, operation)
+        statements.append(f"DROP TRIGGER IF EXISTS {trigger} ON {spec.table}")
+        statements.append(f"""
+            CREATE TRIGGER {trigger}
+            AFTER {operation} ON {spec.table}
+            {clause}
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+        """)
+    return statements
+
+
+async def _existing_tables(conn, names: Iterable[str]) -> List[str]:
+    rows = await conn.fetch("""
+        SELECT table_name FROM information_schema.tables
+        WHERE table_schema = current_schema() AND table_name = ANY($1::text[])
+    """, list(names))
+    return [row['table_name'] for row in rows]
+
+
+async def refresh_process_attrdir_emissions(conn, process_ids: Optional[List[int]] = None) -> int:
+    """process_attrdir_emission 을 matdir/fueldir 합계로 재집계 (process_ids=None 이면 전체 공정)"""
+    if process_ids is not None and not process_ids:
+        return 0
+    rows = await conn.fetch("""
+        WITH target AS (
+            SELECT p.id FROM process p
+            WHERE $1::int[] IS NULL OR p.id = ANY($1::int[])
+        ),
+        mat AS (
+            SELECT process_id, SUM(matdir_em) AS total
+            FROM matdir WHERE $1::int[] IS NULL OR process_id = ANY($1::int[])
+            GROUP BY process_id
+        ),
+        fuel AS (
+            SELECT process_id, SUM(fueldir_em) AS total
+            FROM fueldir WHERE $1::int[] IS NULL OR process_id = ANY($1::int[])
+            GROUP BY process_id
+        )
+        INSERT INTO process_attrdir_emission
+            (process_id, total_matdir_emission, total_fueldir_emission, attrdir_em, calculation_date)
+        SELECT target.id,
+               COALESCE(mat.total, 0),
+               COALESCE(fuel.total, 0),
+               COALESCE(mat.total, 0) + COALESCE(fuel.total, 0),
+               NOW()
+        FROM target
+        LEFT JOIN mat ON mat.process_id = target.id
+        LEFT JOIN fuel ON fuel.process_id = target.id
+        ON CONFLICT (process_id) DO UPDATE SET
+            total_matdir_emission = EXCLUDED.total_matdir_emission,
+            total_fueldir_emission = EXCLUDED.total_fueldir_emission,
+            attrdir_em = EXCLUDED.attrdir_em,
+            calculation_date = NOW(),
+            updated_at = NOW()
+        RETURNING process_id
+    """, process_ids)
+    return len(rows)
+
+
+# 여러 워커가 동시에 설치하지 않도록 직렬화하는 advisory lock 키
+_INSTALL_LOCK_KEY = 0x41545452  # 'ATTR'
+
+
+async def _installed_trigger_count(conn) -> int:
+    names = [_trigger_name(spec, operation) for spec in _SOURCE_TABLES for operation in ("INSERT", "UPDATE", "DELETE")]
+    return await conn.fetchval("""
+        SELECT COUNT(*) FROM pg_trigger WHERE NOT tgisinternal AND tgname = ANY($1::text[])
+    """, names)
+
+
+class AttrdirEmissionSync:
+    """집계 트리거 설치 상태와 설치/제거 작업"""
+
+    def __init__(self, mode: str = ATTRDIR_EMISSION_SYNC_MODE):
+        if mode not in (SYNC_MODE_TRIGGER, SYNC_MODE_RECOMPUTE):
+            logger.warning(f"⚠️ 알 수 없는 ATTRDIR_EMISSION_SYNC_MODE={mode}, {SYNC_MODE_TRIGGER} 사용")
+            mode = SYNC_MODE_TRIGGER
+        self.mode = mode
+        self.triggers_active = False
+        self.backfilled_processes = 0
+
+    async def ensure_installed(self, pool):
+        """트리거가 없으면 설치 (process/matdir/fueldir/process_attrdir_emission 테이블이 모두 있어야 함)"""
+        if self.triggers_active or pool is None:
+            return self.triggers_active
+        async with pool.acquire() as conn:
+            return await self.install(conn)
+
+    async def install(self, conn) -> bool:
+        """트리거 설치 + 전체 재집계 (recompute 모드면 트리거 제거)"""
+        if self.mode == SYNC_MODE_RECOMPUTE:
+            await self.uninstall(conn)
+            return False
+
+        required = ["process", "process_attrdir_emission"] + [spec.table for spec in _SOURCE_TABLES]
+        missing = set(required) - set(await _existing_tables(conn, required))
+        if missing:
+            logger.info(f"ℹ️ 집계 트리거 설치 대기 (테이블 없음: {', '.join(sorted(missing))})")
+            return False
+
+        async with conn.transaction():
+            await conn.execute("SELECT pg_advisory_xact_lock($1)", _INSTALL_LOCK_KEY)
+            # 함수 본문은 배포마다 최신으로 교체
+            for spec in _SOURCE_TABLES:
+                await conn.execute(_function_sql(spec))
+            if await _installed_trigger_count(conn) < len(_SOURCE_TABLES) * 3:
+                # 트리거 생성이 대상 테이블 쓰기를 막는 동안 기준값을 재집계해 누락된 delta 가 없도록 함
+                for spec in _SOURCE_TABLES:
+                    for statement in _trigger_sql(spec):
+                        await conn.execute(statement)
+                self.backfilled_processes = await refresh_process_attrdir_emissions(conn)
+                logger.info(f"✅ 공정 직접귀속배출량 집계 트리거 설치 (재집계 공정 {self.backfilled_processes}개)")
+            else:
+                logger.info("✅ 공정 직접귀속배출량 집계 트리거 확인 완료")
+
+        self.triggers_active = True
+        return True
+
+    async def uninstall(self, conn):
+        """집계 트리거와 함수 제거"""
+        existing = await _existing_tables(conn, [spec.table for spec in _SOURCE_TABLES])
+        async with conn.transaction():
+            await conn.execute("SELECT pg_advisory_xact_lock($1)", _INSTALL_LOCK_KEY)
+            for spec in _SOURCE_TABLES:
+                if spec.table in existing:
+                    for operation in ("INSERT", "UPDATE", "DELETE"):
+                        await conn.execute(f"DROP TRIGGER IF EXISTS {_trigger_name(spec, operation)} ON {spec.table}")
+                await conn.execute(f"DROP FUNCTION IF EXISTS {_function_name(spec)}()")
+        self.triggers_active = False
+        logger.info("ℹ️ 공정 직접귀속배출량 집계 트리거 제거 (recompute 모드)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "triggers_active": self.triggers_active,
+            "backfilled_processes": self.backfilled_processes,
+        }
+
+
+# 애플리케이션 전역 인스턴스
+attrdir_emission_sync = AttrdirEmissionSync()
+
+
+__all__ = [
+    "SYNC_MODE_TRIGGER",
+    "SYNC_MODE_RECOMPUTE",
+    "AttrdirEmissionSync",
+    "attrdir_emission_sync",
+    "refresh_process_attrdir_emissions",
+]
@@ -0,0 +1,203 @@
+# ============================================================================
+# 🗄️ 공용 asyncpg 연결 풀 레지스트리
+# ============================================================================
+
+"""
+서비스 전체가 공유하는 asyncpg 연결 풀
+
+각 Repository가 개별적으로 asyncpg.create_pool()을 만들면 워커당 최대
+(도메인 수 × max_size)개의 Postgres 연결이 열리므로, FastAPI lifespan에서
+풀을 하나만 만들고 모든 Repository가 도메인별 DomainPool로 빌려 씁니다.
+
+환경변수:
+- DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE: 풀 크기 (기본 1 / 10)
+- DB_POOL_COMMAND_TIMEOUT: 쿼리 타임아웃 초 (기본 30)
+- DB_POOL_MAX_INACTIVE_LIFETIME: 유휴 연결 유지 시간 초 (기본 300)
+- DB_STATEMENT_CACHE_SIZE: 연결당 prepared statement 캐시 크기 (기본 100, PgBouncer 사용 시 0)
+- DB_POOL_TAG_APPLICATION_NAME: 도메인별 application_name 태깅 여부 (기본 true)
+
+asyncpg 는 연결을 풀에 반환할 때 RESET ALL 을 실행해 application_name 을 접속 시 값으로
+돌려놓습니다. TaggedConnection 은 마지막으로 적용한 태그를 기억하고 반환 시 reset 쿼리
+끝에 같은 태그를 다시 적용하므로(추가 왕복 없음), acquire 때는 도메인이 바뀐 연결에만
+set_config 를 보냅니다.
+"""
+
+import os
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+BASE_APPLICATION_NAME = "cbam-service"
+
+
+class TaggedConnection(asyncpg.Connection):
+    """마지막으로 적용한 application_name 태그를 기억하는 연결 (풀 반환 후에도 태그 유지)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._application_tag: Optional[str] = None
+
+    @property
+    def application_tag(self) -> Optional[str]:
+        return self._application_tag
+
+    def set_application_tag(self, application_name: str):
+        self._application_tag = application_name
+
+    def get_reset_query(self) -> str:
+        """기본 reset 쿼리(RESET ALL 포함) 뒤에 현재 태그를 다시 적용"""
+        reset_query = super().get_reset_query()
+        if self._application_tag and reset_query:
+            literal = self._application_tag.replace("'", "''")
+            reset_query += f"\nSELECT set_config('application_name', '{literal}', false);"
+        return reset_query
+
+
+class DomainPool:
+    """도메인별 풀 핸들 (공용 풀에서 연결을 빌리고 application_name을 태깅)"""
+
+    def __init__(self, registry: "DatabasePoolRegistry", domain: str):
+        self._registry = registry
+        self.domain = domain
+        self.application_name = f"{BASE_APPLICATION_NAME}-{domain}"
+        self.acquire_count = 0
+
+    @asynccontextmanager
+    async def acquire(self, timeout: Optional[float] = None):
+        """공용 풀에서 연결을 빌려 도메인 application_name으로 태깅"""
+        pool = self._registry.pool
+        if pool is None:
+            raise Exception("데이터베이스 연결 풀이 초기화되지 않았습니다.")
+
+        self._registry.waiters += 1
+        try:
+            conn = await pool.acquire(timeout=timeout)
+        finally:
+            self._registry.waiters -= 1
+
+        try:
+            self.acquire_count += 1
+            if self._registry.tag_application_name:
+                await self._registry.tag_connection(conn, self.application_name)
+            yield conn
+        finally:
+            await pool.release(conn)
+
+
+class DatabasePoolRegistry:
+    """서비스 전역 asyncpg 풀 레지스트리 (lifespan에서 open/close)"""
+
+    def __init__(self):
+        self.pool: Optional[asyncpg.Pool] = None
+        self.database_url = os.getenv("DATABASE_URL")
+        self.min_size = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+        self.max_size = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+        self.command_timeout = float(os.getenv("DB_POOL_COMMAND_TIMEOUT", "30"))
+        self.max_inactive_lifetime = float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", "300"))
+        self.statement_cache_size = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+        self.tag_application_name = os.getenv("DB_POOL_TAG_APPLICATION_NAME", "true").lower() == "true"
+        self.tag_updates = 0
+        self.tag_skips = 0
+        self.waiters = 0
+        self._domains: Dict[str, DomainPool] = {}
+        self._lock = asyncio.Lock()
+
+    async def open(self) -> Optional[asyncpg.Pool]:
+        """공용 풀 생성 (이미 생성되었으면 그대로 반환)"""
+        if self.pool is not None:
+            return self.pool
+
+        async with self._lock:
+            if self.pool is not None:
+                return self.pool
+
+            if not self.database_url:
+                logger.warning("DATABASE_URL이 없어 공용 연결 풀 생성을 건너뜁니다.")
+                return None
+
+            self.pool = await asyncpg.create_pool(
+                self.database_url,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                command_timeout=self.command_timeout,
+                max_inactive_connection_lifetime=self.max_inactive_lifetime,
+                statement_cache_size=self.statement_cache_size,
+                connection_class=TaggedConnection,
+                server_settings={
+                    'application_name': BASE_APPLICATION_NAME
+                }
+            )
+            logger.info(f"✅ 공용 데이터베이스 연결 풀 생성 성공 (min={self.min_size}, max={self.max_size})")
+            return self.pool
+
+    async def close(self):
+        """공용 풀 종료"""
+        if self.pool is None:
+            return
+        await self.pool.close()
+        self.pool = None
+        logger.info("✅ 공용 데이터베이스 연결 풀 종료 완료")
+
+    async def get_pool(self, domain: str) -> Optional[DomainPool]:
+        """도메인별 풀 핸들 반환 (공용 풀이 없으면 생성)"""
+        if await self.open() is None:
+            return None
+        if domain not in self._domains:
+            self._domains[domain] = DomainPool(self, domain)
+        return self._domains[domain]
+
+    async def tag_connection(self, conn, application_name: str):
+        """연결의 application_name 설정 (이 연결에 이미 같은 태그가 적용되어 있으면 생략)"""
+        if conn.application_tag == application_name:
+            self.tag_skips += 1
+            return
+        await conn.execute("SELECT set_config('application_name', $1, false)", application_name)
+        conn.set_application_tag(application_name)
+        self.tag_updates += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태 (acquired/idle/waiters) 조회"""
+        if self.pool is None:
+            return {"status": "uninitialized"}
+
+        size = self.pool.get_size()
+        idle = self.pool.get_idle_size()
+        return {
+            "status": "healthy",
+            "min_size": self.pool.get_min_size(),
+            "max_size": self.pool.get_max_size(),
+            "size": size,
+            "acquired": size - idle,
+            "idle": idle,
+            "waiters": self.waiters,
+            "statement_cache_size": self.statement_cache_size,
+            "application_name_tag_updates": self.tag_updates,
+            "application_name_tag_skips": self.tag_skips,
+            "domains": {
+                domain: {"application_name": handle.application_name, "acquire_count": handle.acquire_count}
+                for domain, handle in self._domains.items()
+            }
+        }
+
+
+# 서비스 전역 레지스트리 인스턴스
+pool_registry = DatabasePoolRegistry()
+
+
+async def get_domain_pool(domain: str) -> Optional[DomainPool]:
+    """Repository에서 사용할 도메인별 풀 핸들 반환"""
+    return await pool_registry.get_pool(domain)
+
+
+__all__ = [
+    "TaggedConnection",
+    "DatabasePoolRegistry",
+    "DomainPool",
+    "pool_registry",
+    "get_domain_pool"
+]
@@ -0,0 +1,180 @@
+# ============================================================================
+# 🔌 서비스 의존성 주입 (애플리케이션 수명 싱글톤)
+# ============================================================================
+
+"""
+도메인 서비스 싱글톤 컨테이너 및 FastAPI 의존성 함수
+
+서비스/Repository는 애플리케이션 수명 동안 한 번만 생성되고 공용 연결 풀을
+공유합니다. 컨트롤러는 Depends(get_xxx_service)로 요청마다 같은 인스턴스를
+주입받으며, lifespan에서 warm_up()으로 테이블 확인을 미리 끝내고
+shutdown()으로 연결 풀을 정리합니다.
+
+도메인 패키지 __init__이 컨트롤러를 임포트하므로 순환 참조를 피하기 위해
+서비스 클래스는 팩토리 함수 안에서 지연 임포트합니다.
+"""
+
+import logging
+from typing import Any, Callable, Dict
+
+from app.common.database_pool import pool_registry
+from app.common.report_cache import report_cache
+
+logger = logging.getLogger(__name__)
+
+
+def _create_install_service():
+    from app.domain.install.install_service import InstallService
+    return InstallService()
+
+
+def _create_product_service():
+    from app.domain.product.product_service import ProductService
+    return ProductService()
+
+
+def _create_process_service():
+    from app.domain.process.process_service import ProcessService
+    return ProcessService()
+
+
+def _create_product_process_service():
+    from app.domain.productprocess.productprocess_service import ProductProcessService
+    return ProductProcessService()
+
+
+def _create_calculation_service():
+    from app.domain.calculation.calculation_service import CalculationService
+    return CalculationService()
+
+
+def _create_mapping_service():
+    from app.domain.mapping.mapping_service import HSCNMappingService
+    return HSCNMappingService(None)  # Repository에서 공용 연결 풀 사용
+
+
+def _create_edge_service():
+    from app.domain.edge.edge_service import EdgeService
+    return EdgeService(None)  # Repository에서 공용 연결 풀 사용
+
+
+def _create_matdir_service():
+    from app.domain.matdir.matdir_service import MatDirService
+    return MatDirService()
+
+
+def _create_fueldir_service():
+    from app.domain.fueldir.fueldir_service import FuelDirService
+    return FuelDirService()
+
+
+def _create_report_service():
+    from app.domain.report.report_service import ReportService
+    return ReportService()
+
+
+class ServiceContainer:
+    """도메인 서비스 싱글톤 컨테이너"""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        self._factories[name] = factory
+
+    def get(self, name: str) -> Any:
+        """서비스 인스턴스 반환 (최초 호출 시 한 번만 생성)"""
+        instance = self._instances.get(name)
+        if instance is None:
+            instance = self._factories[name]()
+            self._instances[name] = instance
+            logger.info(f"✅ {name} 서비스 싱글톤 인스턴스 생성")
+        return instance
+
+    async def warm_up(self):
+        """모든 서비스를 생성하고 Repository 초기화(테이블 확인)를 미리 실행"""
+        for name in self._factories:
+            try:
+                await self.get(name).initialize()
+            except Exception as e:
+                logger.warning(f"⚠️ {name} 서비스 워밍업 실패 (최초 요청 시 재시도): {e}")
+        logger.info(f"✅ 서비스 워밍업 완료: {len(self._factories)}개 도메인")
+
+    async def shutdown(self):
+        """싱글톤 정리, 보고서 캐시 연결 및 공용 연결 풀 종료"""
+        self._instances.clear()
+        await report_cache.close()
+        await pool_registry.close()
+
+
+container = ServiceContainer()
+container.register("install", _create_install_service)
+container.register("product", _create_product_service)
+container.register("process", _create_process_service)
+container.register("productprocess", _create_product_process_service)
+container.register("calculation", _create_calculation_service)
+container.register("mapping", _create_mapping_service)
+container.register("edge", _create_edge_service)
+container.register("matdir", _create_matdir_service)
+container.register("fueldir", _create_fueldir_service)
+container.register("report", _create_report_service)
+
+# ============================================================================
+# 🎯 FastAPI 의존성 함수 (Depends)
+# ============================================================================
+
+def get_install_service():
+    return container.get("install")
+
+
+def get_product_service():
+    return container.get("product")
+
+
+def get_process_service():
+    return container.get("process")
+
+
+def get_product_process_service():
+    return container.get("productprocess")
+
+
+def get_calculation_service():
+    return container.get("calculation")
+
+
+def get_mapping_service():
+    return container.get("mapping")
+
+
+def get_edge_service():
+    return container.get("edge")
+
+
+def get_matdir_service():
+    return container.get("matdir")
+
+
+def get_fueldir_service():
+    return container.get("fueldir")
+
+
+def get_report_service():
+    return container.get("report")
+
+
+__all__ = [
+    "ServiceContainer",
+    "container",
+    "get_install_service",
+    "get_product_service",
+    "get_process_service",
+    "get_product_process_service",
+    "get_calculation_service",
+    "get_mapping_service",
+    "get_edge_service",
+    "get_matdir_service",
+    "get_fueldir_service",
+    "get_report_service"
+]
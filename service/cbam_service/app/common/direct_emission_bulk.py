@@ -0,0 +1,248 @@
+# ============================================================================
+# 📦 직접배출량 일괄 업서트 (MatDir/FuelDir 공용)
+# ============================================================================
+
+"""
+matdir / fueldir 행 수천 건을 집합 단위로 저장하는 일괄 업서트
+
+기존 /fueldir/bulk 는 항목마다 create_fueldir 를 호출해 (커넥션 획득 + 중복 SELECT +
+INSERT/UPDATE) 를 반복했습니다. 일괄 업서트는 검증/배출량 계산을 파이썬에서 끝낸 뒤
+컬럼별 배열을 unnest() 로 펼쳐 INSERT ... ON CONFLICT DO UPDATE 한 문장으로 저장하고,
+영향받은 공정의 process_attrdir_emission 만 집합 단위로 다시 집계합니다
+(집계 트리거가 설치된 경우 트리거가 합계를 유지하므로 재집계 생략).
+
+- 행 검증 실패(음수, 컬럼 자릿수 초과 등)와 존재하지 않는 공정은 행 번호와 함께 errors 로 보고
+- 같은 배치 안의 (process_id, 이름) 중복은 마지막 행이 적용 (ON CONFLICT 는 한 행을 두 번 갱신할 수 없음)
+- 전체 저장/집계/보고서 캐시 무효화는 하나의 트랜잭션에서 수행
+
+환경변수:
+- DIRECT_EMISSION_BULK_BATCH_SIZE: 한 문장으로 업서트할 최대 행 수 (기본 10000)
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.common.attrdir_emission_sync import attrdir_emission_sync, refresh_process_attrdir_emissions
+from app.common.emission_batch import exact_emission
+from app.common.report_cache import report_cache
+
+logger = logging.getLogger(__name__)
+
+BULK_BATCH_SIZE = max(1, int(os.getenv("DIRECT_EMISSION_BULK_BATCH_SIZE", "10000")))
+
+DEFAULT_OXYFACTOR = Decimal('1.0000')
+
+
+@dataclass(frozen=True)
+class DirectEmissionTable:
+    """직접배출량 테이블 컬럼 정의"""
+    table: str
+    name_column: str
+    factor_column: str
+    amount_column: str
+    oxyfactor_column: str
+    emission_column: str
+
+
+MATDIR_TABLE = DirectEmissionTable("matdir", "mat_name", "mat_factor", "mat_amount", "oxyfactor", "matdir_em")
+FUELDIR_TABLE = DirectEmissionTable("fueldir", "fuel_name", "fuel_factor", "fuel_amount", "fuel_oxyfactor", "fueldir_em")
+
+# NUMERIC(precision, scale) 컬럼이 담을 수 있는 정수부 한계
+_NAME_MAX_LENGTH = 255
+_FACTOR_LIMIT = Decimal(10) ** (10 - 6)
+_AMOUNT_LIMIT = Decimal(10) ** (15 - 6)
+_OXYFACTOR_LIMIT = Decimal(10) ** (5 - 4)
+_EMISSION_LIMIT = Decimal(10) ** (15 - 6)
+
+
+@dataclass
+class DirectEmissionBulkRow:
+    """일괄 업서트 입력 행 (index는 요청 내 위치)"""
+    index: int
+    process_id: int
+    name: str
+    factor: Optional[Decimal]
+    amount: Decimal
+    oxyfactor: Optional[Decimal] = DEFAULT_OXYFACTOR
+
+
+def _check_value(label: str, value: Optional[Decimal], limit: Decimal) -> Optional[str]:
+    """NUMERIC 컬럼에 저장 가능한 값인지 확인 -> 오류 메시지"""
+    if value is None:
+        return f"{label} 값이 없습니다."
+    if not value.is_finite():
+        return f"{label} 값이 유효한 숫자가 아닙니다: {value}"
+    if value < 0:
+        return f"{label} 값은 0 이상이어야 합니다: {value}"
+    if value >= limit:
+        return f"{label} 값이 허용 범위를 초과했습니다: {value} (< {limit})"
+    return None
+
+
+def prepare_bulk_rows(
+    spec: DirectEmissionTable,
+    rows: List[DirectEmissionBulkRow]
+) -> Tuple[Dict[Tuple[int, str], Tuple[DirectEmissionBulkRow, Decimal]], Dict[Tuple[int, str], List[int]], List[Dict[str, Any]]]:
+    """행 검증 + 배출량 계산 + (공정, 이름) 중복 제거 -> (업서트 행, 키별 요청 행 번호, 오류)"""
+    prepared: Dict[Tuple[int, str], Tuple[DirectEmissionBulkRow, Decimal]] = {}
+    indexes: Dict[Tuple[int, str], List[int]] = {}
+    errors: List[Dict[str, Any]] = []
+
+    for row in rows:
+        name = row.name or ""
+        oxyfactor = row.oxyfactor if row.oxyfactor is not None else DEFAULT_OXYFACTOR
+        error = None
+        if not name.strip() or len(name) > _NAME_MAX_LENGTH:
+            error = f"{spec.name_column} 은(는) 1~{_NAME_MAX_LENGTH}자여야 합니다."
+        if error is None:
+            error = (
+                _check_value(spec.factor_column, row.factor, _FACTOR_LIMIT)
+                or _check_value(spec.amount_column, row.amount, _AMOUNT_LIMIT)
+                or _check_value(spec.oxyfactor_column, oxyfactor, _OXYFACTOR_LIMIT)
+            )
+        emission = None
+        if error is None:
+            emission = exact_emission(row.amount, row.factor, oxyfactor)
+            if emission >= _EMISSION_LIMIT:
+                error = f"{spec.emission_column} 값이 허용 범위를 초과했습니다: {emission}"
+        if error is not None:
+            errors.append({"row": row.index, "process_id": row.process_id, "name": row.name, "error": error})
+            continue
+
+        key = (row.process_id, name)
+        prepared[key] = (
+            DirectEmissionBulkRow(row.index, row.process_id, name, row.factor, row.amount, oxyfactor),
+            emission
+        )
+        indexes.setdefault(key, []).append(row.index)
+
+    return prepared, indexes, errors
+
+
+def _upsert_sql(spec: DirectEmissionTable) -> str:
+    """unnest() 배열 업서트 문장 (존재하지 않는 공정의 행은 건너뛰고 errors 로 보고)"""
+    return f"""
+        INSERT INTO {spec.table} (
+            process_id, {spec.name_column}, {spec.factor_column},
+            {spec.amount_column}, {spec.oxyfactor_column}, {spec.emission_column}
+        )
+        SELECT t.process_id, t.name, t.factor, t.amount, t.oxyfactor, t.emission
+        FROM unnest($1::int[], $2::text[], $3::numeric[], $4::numeric[], $5::numeric[], $6::numeric[])
+            AS t(process_id, name, factor, amount, oxyfactor, emission)
+        WHERE EXISTS (SELECT 1 FROM process p WHERE p.id = t.process_id)
+        ON CONFLICT (process_id, {spec.name_column}) DO UPDATE SET
+            {spec.factor_column} = EXCLUDED.{spec.factor_column},
+            {spec.amount_column} = EXCLUDED.{spec.amount_column},
+            {spec.oxyfactor_column} = EXCLUDED.{spec.oxyfactor_column},
+            {spec.emission_column} = EXCLUDED.{spec.emission_column},
+            updated_at = NOW()
+        RETURNING *, (xmax = 0) AS inserted
+    """
+
+
+async def bulk_upsert_direct_emissions(
+    pool,
+    spec: DirectEmissionTable,
+    rows: List[DirectEmissionBulkRow],
+    include_results: bool = True
+) -> Dict[str, Any]:
+    """검증된 행을 배치 단위 unnest 업서트 -> 공정 합계 재집계 -> 보고서 캐시 무효화"""
+    prepared, indexes, errors = prepare_bulk_rows(spec, rows)
+    items = list(prepared.items())
+
+    results: List[Dict[str, Any]] = []
+    saved_keys = set()
+    inserted_count = 0
+    updated_count = 0
+    statement_count = 0
+    refreshed_count = 0
+
+    if items:
+        sql = _upsert_sql(spec)
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                for start in range(0, len(items), BULK_BATCH_SIZE):
+                    chunk = items[start:start + BULK_BATCH_SIZE]
+                    records = await conn.fetch(
+                        sql,
+                        [row.process_id for _, (row, _) in chunk],
+                        [row.name for _, (row, _) in chunk],
+                        [row.factor for _, (row, _) in chunk],
+                        [row.amount for _, (row, _) in chunk],
+                        [row.oxyfactor for _, (row, _) in chunk],
+                        [emission for _, (_, emission) in chunk]
+                    )
+                    statement_count += 1
+                    for record in records:
+                        saved_keys.add((record['process_id'], record[spec.name_column]))
+                        if record['inserted']:
+                            inserted_count += 1
+                        else:
+                            updated_count += 1
+                        if include_results:
+                            result = dict(record)
+                            result.pop('inserted')
+                            results.append(result)
+
+                affected_process_ids = sorted({process_id for process_id, _ in saved_keys})
+                if affected_process_ids and not attrdir_emission_sync.triggers_active:
+                    # 공정 합계 테이블이 아직 없을 수 있으므로 세이브포인트 안에서 재집계
+                    try:
+                        async with conn.transaction():
+                            refreshed_count = await refresh_process_attrdir_emissions(conn, affected_process_ids)
+                    except Exception as e:
+                        logger.warning(f"⚠️ {spec.table} 일괄 저장 후 공정 직접귀속배출량 재집계 실패: {e}")
+                install_ids = await report_cache.installs_for_nodes(
+                    conn, process_ids=affected_process_ids
+                ) if affected_process_ids else set()
+
+        # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+        await report_cache.invalidate_resolved(install_ids)
+    else:
+        affected_process_ids = []
+
+    # 존재하지 않는 공정을 가리킨 행 보고
+    for key, (row, _) in items:
+        if key in saved_keys:
+            continue
+        for index in indexes[key]:
+            errors.append({
+                "row": index,
+                "process_id": row.process_id,
+                "name": row.name,
+                "error": f"공정 ID {row.process_id}를 찾을 수 없습니다."
+            })
+    errors.sort(key=lambda error: error["row"])
+
+    success_count = sum(len(indexes[key]) for key in saved_keys)
+    logger.info(
+        f"📦 {spec.table} 일괄 업서트: {success_count}/{len(rows)}행 "
+        f"(생성 {inserted_count}, 수정 {updated_count}, 오류 {len(errors)}, 문장 {statement_count})"
+    )
+    return {
+        "success_count": success_count,
+        "total_count": len(rows),
+        "inserted_count": inserted_count,
+        "updated_count": updated_count,
+        "deduplicated_count": success_count - len(saved_keys),
+        "failed_count": len(errors),
+        "errors": errors,
+        "affected_process_ids": affected_process_ids,
+        "refreshed_process_count": refreshed_count,
+        "statement_count": statement_count,
+        "results": results if include_results else None
+    }
+
+
+__all__ = [
+    "BULK_BATCH_SIZE",
+    "DirectEmissionTable",
+    "DirectEmissionBulkRow",
+    "MATDIR_TABLE",
+    "FUELDIR_TABLE",
+    "prepare_bulk_rows",
+    "bulk_upsert_direct_emissions"
+]
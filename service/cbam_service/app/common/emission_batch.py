@@ -0,0 +1,245 @@
+# ============================================================================
+# 🧮 배출량 일괄 계산 (MatDir/FuelDir 공용)
+# ============================================================================
+
+"""
+(공정, 원료/연료명, 투입량) 수천 건을 한 번에 계산하는 배출량 계산기
+
+단건 계산(calculate_matdir_emission / calculate_fueldir_emission)은 행마다
+Decimal 곱셈을 하고, 배출계수가 없으면 행마다 마스터 테이블을 조회했습니다.
+일괄 계산은 배출계수를 서비스에서 한 번의 쿼리로 모아 온 뒤 NumPy 배열로
+amount × factor × oxyfactor 를 한 번에 계산하고 공정별 합계를 냅니다.
+
+계산 모드:
+- fixed (기본): float64로 곱한 뒤 배출량을 소수점 6자리 정수(int64, 1e-6 tCO2e 단위)로
+  반올림해 합산 -> 공정 합계가 행 배출량 합과 정확히 일치
+- float: float64 그대로 곱하고 합산 (가장 빠름, 합계에 부동소수점 오차 가능)
+- decimal: 행마다 Decimal로 정확히 계산 (기준값, 가장 느림)
+
+verify=true 이면 Decimal 기준값을 함께 계산해 행/공정 합계 불일치 건수를 보고합니다.
+배출량은 DB 컬럼(NUMERIC(15,6))과 같이 소수점 6자리 ROUND_HALF_UP 으로 맞춥니다.
+"""
+
+import time
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+MODE_FIXED = "fixed"
+MODE_FLOAT = "float"
+MODE_DECIMAL = "decimal"
+CALCULATION_MODES = (MODE_FIXED, MODE_FLOAT, MODE_DECIMAL)
+
+# 배출량 소수점 자릿수 (matdir_em / fueldir_em NUMERIC(15,6))
+EMISSION_SCALE = 6
+_QUANTUM = Decimal(1).scaleb(-EMISSION_SCALE)
+_FIXED_FACTOR = 10 ** EMISSION_SCALE
+
+# float 모드에서 불일치로 보는 차이 (반올림 단위의 절반)
+_FLOAT_TOLERANCE = 0.5 / _FIXED_FACTOR
+
+# 불일치 상세를 응답에 포함할 최대 개수
+MAX_REPORTED_MISMATCHES = 20
+
+FACTOR_SOURCE_REQUEST = "request"
+FACTOR_SOURCE_MASTER = "master"
+
+
+@dataclass
+class EmissionBatchRow:
+    """일괄 계산 입력 행 (factor가 None이면 마스터 배출계수 사용)"""
+    index: int
+    process_id: int
+    name: str
+    amount: Decimal
+    factor: Optional[Decimal] = None
+    oxyfactor: Decimal = Decimal('1.0000')
+
+
+def exact_emission(amount: Decimal, factor: Decimal, oxyfactor: Decimal) -> Decimal:
+    """Decimal 정확 계산 (소수점 6자리 ROUND_HALF_UP)"""
+    return (amount * factor * oxyfactor).quantize(_QUANTUM, rounding=ROUND_HALF_UP)
+
+
+def names_needing_factor(rows: List[EmissionBatchRow]) -> List[str]:
+    """마스터 배출계수를 조회해야 하는 서로 다른 이름 목록"""
+    return list(dict.fromkeys(row.name for row in rows if row.factor is None))
+
+
+def calculate_emission_batch(
+    rows: List[EmissionBatchRow],
+    master_factors: Dict[str, Decimal],
+    mode: str = MODE_FIXED,
+    verify: bool = False,
+    include_items: bool = True
+) -> Dict[str, Any]:
+    """배출량 일괄 계산 -> {items, process_totals, errors, summary}"""
+    if mode not in CALCULATION_MODES:
+        raise ValueError(f"지원하지 않는 계산 모드입니다: {mode} ({', '.join(CALCULATION_MODES)})")
+    started = time.perf_counter()
+
+    # 1. 배출계수 확정 (요청값 우선, 없으면 마스터)
+    valid: List[EmissionBatchRow] = []
+    factors: List[Decimal] = []
+    sources: List[str] = []
+    errors: List[Dict[str, Any]] = []
+    for row in rows:
+        if row.factor is not None:
+            factor, source = row.factor, FACTOR_SOURCE_REQUEST
+        else:
+            factor, source = master_factors.get(row.name), FACTOR_SOURCE_MASTER
+        if factor is None:
+            errors.append({"row": row.index, "name": row.name, "error": f"'{row.name}'의 배출계수를 찾을 수 없습니다."})
+            continue
+        valid.append(row)
+        factors.append(factor)
+        sources.append(source)
+
+    process_ids = np.fromiter((row.process_id for row in valid), dtype=np.int64, count=len(valid))
+    unique_processes, process_index = np.unique(process_ids, return_inverse=True)
+    counts = np.bincount(process_index, minlength=len(unique_processes))
+
+    # 2. 배출량 계산
+    exact: Optional[List[Decimal]] = None
+    if mode == MODE_DECIMAL or verify:
+        exact = [
+            exact_emission(row.amount, factor, row.oxyfactor)
+            for row, factor in zip(valid, factors)
+        ]
+
+    if mode == MODE_DECIMAL:
+        emissions: List[Any] = exact
+        totals: List[Any] = [Decimal(0)] * len(unique_processes)
+        for position, emission in zip(process_index.tolist(), exact):
+            totals[position] += emission
+        emission_values = [float(emission) for emission in exact]
+        total_values = [float(total) for total in totals]
+        grand_total = float(sum(totals, Decimal(0)))
+    else:
+        amounts = np.fromiter((float(row.amount) for row in valid), dtype=np.float64, count=len(valid))
+        factor_array = np.fromiter((float(factor) for factor in factors), dtype=np.float64, count=len(valid))
+        oxyfactors = np.fromiter((float(row.oxyfactor) for row in valid), dtype=np.float64, count=len(valid))
+        products = amounts * factor_array * oxyfactors
+
+        if mode == MODE_FIXED:
+            # 0에서 먼 쪽으로 반올림 (Decimal ROUND_HALF_UP / PostgreSQL numeric 반올림과 동일)
+            micro = (np.sign(products) * np.floor(np.abs(products) * _FIXED_FACTOR + 0.5)).astype(np.int64)
+            micro_totals = np.zeros(len(unique_processes), dtype=np.int64)
+            np.add.at(micro_totals, process_index, micro)
+            emissions = micro.tolist()
+            totals = micro_totals.tolist()
+            emission_values = (micro / _FIXED_FACTOR).tolist()
+            total_values = [total / _FIXED_FACTOR for total in totals]
+            grand_total = sum(totals) / _FIXED_FACTOR
+        else:
+            emissions = products.tolist()
+            totals = np.bincount(process_index, weights=products, minlength=len(unique_processes)).tolist()
+            emission_values = emissions
+            total_values = totals
+            grand_total = float(products.sum())
+
+    # 3. Decimal 기준값과 비교
+    verification = None
+    if verify:
+        verification = _verify(mode, valid, exact, emissions, process_index, len(unique_processes), totals)
+
+    items = None
+    if include_items:
+        items = [
+            {
+                "row": row.index,
+                "process_id": row.process_id,
+                "name": row.name,
+                "amount": float(row.amount),
+                "factor": float(factor),
+                "factor_source": source,
+                "oxyfactor": float(row.oxyfactor),
+                "emission": emission
+            }
+            for row, factor, source, emission in zip(valid, factors, sources, emission_values)
+        ]
+
+    process_totals = [
+        {"process_id": process_id, "total_emission": total, "item_count": count}
+        for process_id, total, count in zip(unique_processes.tolist(), total_values, counts.tolist())
+    ]
+
+    return {
+        "items": items,
+        "process_totals": process_totals,
+        "errors": errors,
+        "verification": verification,
+        "summary": {
+            "mode": mode,
+            "total_items": len(rows),
+            "calculated_count": len(valid),
+            "failed_count": len(errors),
+            "process_count": len(process_totals),
+            "total_emission": grand_total,
+            "master_factor_count": len(master_factors),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+        }
+    }
+
+
+def _verify(
+    mode: str,
+    rows: List[EmissionBatchRow],
+    exact: List[Decimal],
+    emissions: List[Any],
+    process_index: np.ndarray,
+    process_count: int,
+    totals: List[Any]
+) -> Dict[str, Any]:
+    """계산 결과와 Decimal 기준값 비교"""
+    exact_totals = [Decimal(0)] * process_count
+    for position, value in zip(process_index.tolist(), exact):
+        exact_totals[position] += value
+
+    def to_decimal(value: Any) -> Decimal:
+        if mode == MODE_FIXED:
+            return Decimal(value).scaleb(-EMISSION_SCALE)
+        return value if isinstance(value, Decimal) else Decimal(repr(value))
+
+    def differs(value: Any, reference: Decimal) -> bool:
+        if mode == MODE_FLOAT:
+            return abs(value - float(reference)) > _FLOAT_TOLERANCE
+        return to_decimal(value) != reference
+
+    mismatch_count = 0
+    mismatches = []
+    max_diff = Decimal(0)
+    for row, value, reference in zip(rows, emissions, exact):
+        if not differs(value, reference):
+            continue
+        mismatch_count += 1
+        max_diff = max(max_diff, abs(to_decimal(value) - reference))
+        if len(mismatches) < MAX_REPORTED_MISMATCHES:
+            mismatches.append({"row": row.index, "computed": float(to_decimal(value)), "exact": str(reference)})
+
+    total_mismatch_count = sum(
+        1 for value, reference in zip(totals, exact_totals) if differs(value, reference)
+    )
+
+    return {
+        "item_mismatch_count": mismatch_count,
+        "total_mismatch_count": total_mismatch_count,
+        "max_abs_diff": float(max_diff),
+        "mismatches": mismatches,
+        "exact": mismatch_count == 0 and total_mismatch_count == 0
+    }
+
+
+__all__ = [
+    "MODE_FIXED",
+    "MODE_FLOAT",
+    "MODE_DECIMAL",
+    "CALCULATION_MODES",
+    "EMISSION_SCALE",
+    "EmissionBatchRow",
+    "exact_emission",
+    "names_needing_factor",
+    "calculate_emission_batch"
+]
@@ -0,0 +1,510 @@
+# ============================================================================
+# 🕸️ 그래프 토폴로지 캐시 (엣지 인접 인덱스 + 파생 뷰)
+# ============================================================================
+
+"""
+edge 테이블 인접 인덱스 (프로세스 전역)
+
+순환 참조 검증이 공정마다 나가는 엣지를 한 번씩 조회하던 재귀 DFS(노드 수만큼
+쿼리) 대신, 전체 엣지를 한 번 읽어 정방향/역방향 인접 리스트로 들고 있다가
+메모리에서 O(V+E)로 경로를 찾습니다. EdgeRepository가 엣지를 생성/수정/삭제하면
+apply_* 로 인덱스를 바로 고치므로 엣지 생성 검증에는 추가 쿼리가 없습니다.
+
+인덱스는 이 프로세스의 쓰기만 반영하므로 워커가 여러 개면 다른 워커의 쓰기는
+TTL이 지나 다시 읽을 때 반영됩니다. 그 사이의 오차가 허용되지 않으면
+GRAPH_CYCLE_CHECK_MODE=cte 로 검증을 재귀 CTE 한 번(path_exists_cte)으로 돌릴 수
+있습니다.
+
+같은 인덱스로 이웃 조회(노드별 엣지, 공정의 continue 엣지, 제품의 생산/소비 공정),
+진입/진출 차수, 약한 연결 요소, continue 체인 길이를 메모리에서 읽습니다.
+엣지 쓰기마다 version이 1씩 올라가며, 연결 요소/체인 길이처럼 전체를 훑어야 하는
+파생 뷰는 계산 당시 version과 같을 때만 재사용합니다.
+
+환경변수:
+- GRAPH_TOPOLOGY_CACHE_ENABLED: 인접 인덱스 사용 여부 (기본 true)
+- GRAPH_TOPOLOGY_TTL_SECONDS: 전체 다시 읽기 주기 초 (기본 300, 0이면 다시 읽지 않음)
+- GRAPH_CYCLE_CHECK_MODE: memory | cte (기본 memory)
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 노드 키: ('process', id) 또는 ('product', id)
+NodeKey = Tuple[str, int]
+
+CYCLE_CHECK_MEMORY = "memory"
+CYCLE_CHECK_CTE = "cte"
+
+
+class CircularEdgeError(ValueError):
+    """엣지를 추가하면 그래프에 순환 참조가 생길 때 발생"""
+
+    def __init__(self, source: NodeKey, target: NodeKey, cycle_path: List[NodeKey]):
+        self.source = source
+        self.target = target
+        self.cycle_path = cycle_path
+        path_text = " → ".join(f"{node_type}:{node_id}" for node_type, node_id in cycle_path)
+        super().__init__(f"순환 참조가 감지되었습니다: {path_text}")
+
+
+class TopologyUnavailableError(RuntimeError):
+    """토폴로지 캐시가 꺼져 있거나 적재에 실패해 메모리 그래프를 쓸 수 없을 때 발생"""
+
+    def __init__(self):
+        super().__init__(
+            "그래프 토폴로지 캐시를 사용할 수 없습니다 (GRAPH_TOPOLOGY_CACHE_ENABLED 설정 또는 적재 실패 로그를 확인하세요)."
+        )
+
+
+def node_key(node_type: str, node_id: Any) -> NodeKey:
+    return node_type, int(node_id)
+
+
+class GraphTopologyCache:
+    """엣지 인접 인덱스 (정방향/역방향 인접 리스트)"""
+
+    def __init__(self):
+        self.enabled = os.getenv("GRAPH_TOPOLOGY_CACHE_ENABLED", "true").lower() == "true"
+        self.ttl_seconds = float(os.getenv("GRAPH_TOPOLOGY_TTL_SECONDS", "300"))
+        self.cycle_check_mode = os.getenv("GRAPH_CYCLE_CHECK_MODE", CYCLE_CHECK_MEMORY).lower()
+
+        # edge_id -> 엣지 행 (id, 노드, edge_kind, created_at, updated_at)
+        self._edges: Dict[int, Dict[str, Any]] = {}
+        # node -> {edge_id: (이웃 노드, edge_kind)}
+        self._successors: Dict[NodeKey, Dict[int, Tuple[NodeKey, str]]] = {}
+        self._predecessors: Dict[NodeKey, Dict[int, Tuple[NodeKey, str]]] = {}
+        self._loaded_at: Optional[float] = None
+        self._load_lock = asyncio.Lock()
+        # 파생 뷰 이름 -> (계산 당시 version, 값)
+        self._derived: Dict[str, Tuple[int, Any]] = {}
+
+        self.version = 0
+        self.loads = 0
+
+    # ============================================================================
+    # 📥 적재
+    # ============================================================================
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def _is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return self.ttl_seconds > 0 and time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    async def ensure_loaded(self, pool) -> bool:
+        """인덱스가 없거나 TTL이 지났으면 전체 엣지를 다시 읽음 (사용 불가면 False)"""
+        if not self.enabled or pool is None:
+            return False
+        if not self._is_stale():
+            return True
+
+        async with self._load_lock:
+            if not self._is_stale():
+                return True
+            async with pool.acquire() as conn:
+                rows = await conn.fetch("""
+                    SELECT id, source_node_type, source_id, target_node_type, target_id, edge_kind,
+                           created_at, updated_at
+                    FROM edge
+                """)
+            self._rebuild(dict(row) for row in rows)
+            logger.info(f"✅ 그래프 토폴로지 인덱스 적재: 엣지 {len(self._edges)}개, 노드 {len(self._successors)}개")
+        return True
+
+    def _rebuild(self, edges: Iterable[Dict[str, Any]]):
+        self._edges.clear()
+        self._successors.clear()
+        self._predecessors.clear()
+        for edge in edges:
+            self._add(edge)
+        self._loaded_at = time.monotonic()
+        self.version += 1
+        self.loads += 1
+
+    def invalidate(self):
+        """다음 조회 때 전체를 다시 읽도록 표시"""
+        self._loaded_at = None
+
+    # ============================================================================
+    # ✏️ 엣지 변경 반영 (EdgeRepository 쓰기 직후 호출)
+    # ============================================================================
+
+    def _add(self, edge: Dict[str, Any]):
+        edge_id = int(edge['id'])
+        source = node_key(edge['source_node_type'], edge['source_id'])
+        target = node_key(edge['target_node_type'], edge['target_id'])
+        kind = edge['edge_kind']
+
+        self._edges[edge_id] = dict(edge)
+        self._successors.setdefault(source, {})[edge_id] = (target, kind)
+        self._predecessors.setdefault(target, {})[edge_id] = (source, kind)
+        self._successors.setdefault(target, {})
+        self._predecessors.setdefault(source, {})
+
+    def _remove(self, edge_id: int):
+        existing = self._edges.pop(edge_id, None)
+        if existing is None:
+            return
+        source = node_key(existing['source_node_type'], existing['source_id'])
+        target = node_key(existing['target_node_type'], existing['target_id'])
+        self._successors.get(source, {}).pop(edge_id, None)
+        self._predecessors.get(target, {}).pop(edge_id, None)
+        # 엣지가 모두 사라진 노드는 인덱스에서 제거
+        for node in (source, target):
+            if not self._successors.get(node) and not self._predecessors.get(node):
+                self._successors.pop(node, None)
+                self._predecessors.pop(node, None)
+
+    def apply_edge_created(self, edge: Dict[str, Any]):
+        if self.is_loaded:
+            self._add(edge)
+        self.version += 1
+
+    def apply_edge_updated(self, edge: Dict[str, Any]):
+        if self.is_loaded:
+            self._remove(int(edge['id']))
+            self._add(edge)
+        self.version += 1
+
+    def apply_edge_deleted(self, edge_id: int):
+        if self.is_loaded:
+            self._remove(int(edge_id))
+        self.version += 1
+
+    # ============================================================================
+    # 👀 이웃/차수 조회
+    # ============================================================================
+
+    def _edge_rows(self, edge_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        return [dict(self._edges[edge_id]) for edge_id in sorted(edge_ids)]
+
+    def out_edges(self, node: NodeKey, edge_kinds: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """node에서 나가는 엣지 행 (id 순)"""
+        return self._edge_rows(
+            edge_id for edge_id, (_, kind) in self._successors.get(node, {}).items()
+            if edge_kinds is None or kind in edge_kinds
+        )
+
+    def in_edges(self, node: NodeKey, edge_kinds: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """node로 들어오는 엣지 행 (id 순)"""
+        return self._edge_rows(
+            edge_id for edge_id, (_, kind) in self._predecessors.get(node, {}).items()
+            if edge_kinds is None or kind in edge_kinds
+        )
+
+    def edges_by_node_id(self, node_id: int) -> List[Dict[str, Any]]:
+        """노드 타입과 관계없이 source_id 또는 target_id가 node_id인 엣지 행 (id 순)"""
+        edge_ids: Set[int] = set()
+        for node_type in self.node_types():
+            node = (node_type, int(node_id))
+            edge_ids.update(self._successors.get(node, {}))
+            edge_ids.update(self._predecessors.get(node, {}))
+        return self._edge_rows(edge_ids)
+
+    def edges(
+        self,
+        edge_kinds: Optional[Set[str]] = None,
+        source_type: Optional[str] = None,
+        target_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """조건에 맞는 전체 엣지 행 (id 순)"""
+        return self._edge_rows(
+            edge_id for edge_id, edge in self._edges.items()
+            if (edge_kinds is None or edge['edge_kind'] in edge_kinds)
+            and (source_type is None or edge['source_node_type'] == source_type)
+            and (target_type is None or edge['target_node_type'] == target_type)
+        )
+
+    def in_degree(self, node: NodeKey) -> int:
+        return len(self._predecessors.get(node, {}))
+
+    def out_degree(self, node: NodeKey) -> int:
+        return len(self._successors.get(node, {}))
+
+    def node_types(self) -> List[str]:
+        return sorted({node_type for node_type, _ in self._successors})
+
+    def nodes(self, node_type: Optional[str] = None) -> List[NodeKey]:
+        return sorted(node for node in self._successors if node_type is None or node[0] == node_type)
+
+    def adjacency(self, node_type: Optional[str] = None) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """노드 타입별 정방향/역방향 인접 리스트 뷰 ("타입:id" -> [{node_type, node_id, edge_id, edge_kind}])"""
+        def view(index: Dict[NodeKey, Dict[int, Tuple[NodeKey, str]]]) -> Dict[str, List[Dict[str, Any]]]:
+            return {
+                f"{node[0]}:{node[1]}": [
+                    {"node_type": neighbor[0], "node_id": neighbor[1], "edge_id": edge_id, "edge_kind": kind}
+                    for edge_id, (neighbor, kind) in sorted(index.get(node, {}).items())
+                ]
+                for node in self.nodes(node_type)
+            }
+        return {"forward": view(self._successors), "reverse": view(self._predecessors)}
+
+    def node_summary(self, node: NodeKey) -> Dict[str, Any]:
+        """노드 하나의 차수/이웃/연결 요소"""
+        component_index = self._component_index().get(node)
+        return {
+            "node_type": node[0],
+            "node_id": node[1],
+            "in_degree": self.in_degree(node),
+            "out_degree": self.out_degree(node),
+            "in_edges": self.in_edges(node),
+            "out_edges": self.out_edges(node),
+            "component": component_index,
+            "component_size": len(self.connected_components()[component_index]) if component_index is not None else 0
+        }
+
+    # ============================================================================
+    # 🧩 파생 뷰 (version이 같을 때만 재사용)
+    # ============================================================================
+
+    def _memo(self, name: str, compute):
+        cached = self._derived.get(name)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        value = compute()
+        self._derived[name] = (self.version, value)
+        return value
+
+    def connected_components(self) -> List[List[NodeKey]]:
+        """약한 연결 요소 목록 (엣지 방향 무시, 큰 요소부터)"""
+        def compute() -> List[List[NodeKey]]:
+            seen: Set[NodeKey] = set()
+            components: List[List[NodeKey]] = []
+            for start in self.nodes():
+                if start in seen or not (self._successors.get(start) or self._predecessors.get(start)):
+                    continue
+                component = []
+                queue = deque([start])
+                seen.add(start)
+                while queue:
+                    node = queue.popleft()
+                    component.append(node)
+                    neighbors = list(self._successors.get(node, {}).values()) + list(self._predecessors.get(node, {}).values())
+                    for neighbor, _ in neighbors:
+                        if neighbor not in seen:
+                            seen.add(neighbor)
+                            queue.append(neighbor)
+                components.append(sorted(component))
+            components.sort(key=len, reverse=True)
+            return components
+        return self._memo("components", compute)
+
+    def _component_index(self) -> Dict[NodeKey, int]:
+        def compute() -> Dict[NodeKey, int]:
+            return {
+                node: index
+                for index, component in enumerate(self.connected_components())
+                for node in component
+            }
+        return self._memo("component_index", compute)
+
+    def continue_chain_lengths(self) -> Dict[int, Tuple[int, List[int]]]:
+        """공정별 가장 긴 continue 체인 (공정 수, 경로) - 순환에 걸린 공정은 제외"""
+        def compute() -> Dict[int, Tuple[int, List[int]]]:
+            kinds = {'continue'}
+            processes = [node for node in self.nodes('process')]
+            in_degree = {
+                node: sum(1 for neighbor, kind in self._predecessors.get(node, {}).values()
+                          if kind in kinds and neighbor[0] == 'process')
+                for node in processes
+            }
+            depth = {node: 1 for node in processes}
+            parent: Dict[NodeKey, Optional[NodeKey]] = {node: None for node in processes}
+            queue = deque(node for node, degree in in_degree.items() if degree == 0)
+            ordered: List[NodeKey] = []
+            while queue:
+                node = queue.popleft()
+                ordered.append(node)
+                for neighbor, kind in self._successors.get(node, {}).values():
+                    if kind not in kinds or neighbor[0] != 'process':
+                        continue
+                    if depth[node] + 1 > depth[neighbor]:
+                        depth[neighbor] = depth[node] + 1
+                        parent[neighbor] = node
+                    in_degree[neighbor] -= 1
+                    if in_degree[neighbor] == 0:
+                        queue.append(neighbor)
+
+            chains = {}
+            for node in ordered:
+                path = [node[1]]
+                while parent[node] is not None:
+                    node = parent[node]
+                    path.append(node[1])
+                chains[path[0]] = (len(path), path[::-1])
+            return chains
+        return self._memo("continue_chains", compute)
+
+    def long_continue_chains(self, max_length: int = 20) -> List[Dict[str, Any]]:
+        """continue 체인 길이가 max_length 이상인 공정 (긴 것부터)"""
+        chains = [
+            {"process_id": process_id, "chain_length": length, "path": path}
+            for process_id, (length, path) in self.continue_chain_lengths().items()
+            if length >= max_length
+        ]
+        chains.sort(key=lambda chain: (-chain["chain_length"], chain["process_id"]))
+        return chains
+
+    def isolated_processes(self, process_ids: Iterable[int]) -> List[int]:
+        """엣지가 하나도 없는 공정 ID (process_ids 중)"""
+        return sorted(
+            process_id for process_id in process_ids
+            if not self.in_degree(('process', process_id)) and not self.out_degree(('process', process_id))
+        )
+
+    def get_summary(self) -> Dict[str, Any]:
+        """노드 타입/엣지 종류별 개수와 연결 요소 요약"""
+        edge_kinds: Dict[str, int] = {}
+        for edge in self._edges.values():
+            edge_kinds[edge['edge_kind']] = edge_kinds.get(edge['edge_kind'], 0) + 1
+        components = self.connected_components()
+        return {
+            **self.get_stats(),
+            "nodes_by_type": {node_type: len(self.nodes(node_type)) for node_type in self.node_types()},
+            "edges_by_kind": edge_kinds,
+            "component_count": len(components),
+            "largest_component_size": len(components[0]) if components else 0,
+            "cycle_nodes": [f"{node_type}:{node_id}" for node_type, node_id in self.find_cycle_nodes()]
+        }
+
+    # ============================================================================
+    # 🔎 경로/순환 탐색
+    # ============================================================================
+
+    def find_path(
+        self,
+        start: NodeKey,
+        goal: NodeKey,
+        edge_kinds: Optional[Set[str]] = None,
+        ignore_edge_id: Optional[int] = None
+    ) -> Optional[List[NodeKey]]:
+        """start에서 goal로 가는 경로 (BFS, 없으면 None)"""
+        if start == goal:
+            return [start]
+        parents: Dict[NodeKey, Optional[NodeKey]] = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for edge_id, (neighbor, kind) in self._successors.get(node, {}).items():
+                if edge_id == ignore_edge_id or neighbor in parents:
+                    continue
+                if edge_kinds is not None and kind not in edge_kinds:
+                    continue
+                parents[neighbor] = node
+                if neighbor == goal:
+                    path = [neighbor]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return path[::-1]
+                queue.append(neighbor)
+        return None
+
+    def cycle_path_for_edge(
+        self,
+        source: NodeKey,
+        target: NodeKey,
+        edge_kinds: Optional[Set[str]] = None,
+        ignore_edge_id: Optional[int] = None
+    ) -> Optional[List[NodeKey]]:
+        """source→target 엣지를 추가했을 때 생기는 순환 경로 (target→…→source→target, 없으면 None)"""
+        path = self.find_path(target, source, edge_kinds, ignore_edge_id)
+        if path is None:
+            return None
+        return path + [target]
+
+    async def find_cycle_path(
+        self,
+        pool,
+        source: NodeKey,
+        target: NodeKey,
+        edge_kinds: Optional[Iterable[str]] = None,
+        ignore_edge_id: Optional[int] = None
+    ) -> Optional[List[NodeKey]]:
+        """source→target 엣지를 추가하면 생기는 순환 경로 (없으면 None)
+
+        기본은 메모리 인접 인덱스에서 찾고(추가 쿼리 없음), 인덱스를 쓸 수 없거나
+        GRAPH_CYCLE_CHECK_MODE=cte 이면 재귀 CTE 한 번으로 DB에서 확인합니다.
+        """
+        kinds = set(edge_kinds) if edge_kinds else None
+        if self.cycle_check_mode != CYCLE_CHECK_CTE and await self.ensure_loaded(pool):
+            return self.cycle_path_for_edge(source, target, kinds, ignore_edge_id)
+
+        if source == target:
+            return [source, target]
+        async with pool.acquire() as conn:
+            reachable = await path_exists_cte(conn, target, source, kinds, ignore_edge_id)
+        # CTE는 도달 여부만 확인하므로 경로는 양 끝 노드로 표시
+        return [target, source, target] if reachable else None
+
+    def find_cycle_nodes(self) -> List[NodeKey]:
+        """전체 그래프에서 순환에 걸린 노드 목록 (Kahn 알고리즘으로 정렬되지 않고 남은 노드)"""
+        in_degree = {node: len(edges) for node, edges in self._predecessors.items()}
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
+        while queue:
+            node = queue.popleft()
+            for neighbor, _ in self._successors.get(node, {}).values():
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+        return [node for node, degree in in_degree.items() if degree > 0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "loaded": self.is_loaded,
+            "version": self.version,
+            "loads": self.loads,
+            "edges": len(self._edges),
+            "nodes": len(self._successors),
+            "ttl_seconds": self.ttl_seconds,
+            "cycle_check_mode": self.cycle_check_mode
+        }
+
+
+async def path_exists_cte(
+    conn,
+    start: NodeKey,
+    goal: NodeKey,
+    edge_kinds: Optional[Iterable[str]] = None,
+    ignore_edge_id: Optional[int] = None
+) -> bool:
+    """start에서 goal로 가는 경로가 있는지 재귀 CTE 한 번으로 확인"""
+    # UNION(중복 제거)으로 노드마다 한 번만 확장하므로 순환이 있어도 종료되고 O(V+E)
+    return await conn.fetchval("""
+        WITH RECURSIVE reachable(node_type, node_id) AS (
+            SELECT $1::text, $2::integer
+            UNION
+            SELECT e.target_node_type::text, e.target_id
+            FROM reachable r
+            JOIN edge e ON e.source_node_type = r.node_type AND e.source_id = r.node_id
+            WHERE ($5::text[] IS NULL OR e.edge_kind = ANY($5::text[]))
+            AND ($6::integer IS NULL OR e.id <> $6::integer)
+        )
+        SELECT EXISTS (
+            SELECT 1 FROM reachable WHERE node_type = $3 AND node_id = $4
+        )
+    """, start[0], start[1], goal[0], goal[1], list(edge_kinds) if edge_kinds else None, ignore_edge_id)
+
+
+topology_cache = GraphTopologyCache()
+
+__all__ = [
+    "NodeKey",
+    "CYCLE_CHECK_MEMORY",
+    "CYCLE_CHECK_CTE",
+    "CircularEdgeError",
+    "TopologyUnavailableError",
+    "GraphTopologyCache",
+    "node_key",
+    "path_exists_cte",
+    "topology_cache"
+]
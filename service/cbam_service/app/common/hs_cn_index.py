@@ -0,0 +1,298 @@
+# ============================================================================
+# 🔤 HS-CN 매핑 조회 인덱스 (코드 접두사 트라이 + 품목명 n-gram)
+# ============================================================================
+
+"""
+hs_cn_mapping 테이블 메모리 인덱스 (프로세스 전역)
+
+제품 입력 폼은 키 입력마다 HS/CN 코드 접두사 검색(LIKE 'x%')과 품목명 부분 검색
+(ILIKE '%x%')을 호출해 매번 DB 전체를 훑었습니다. 매핑 테이블은 작고 거의 바뀌지
+않으므로 한 번 읽어 다음 인덱스로 들고 있습니다.
+
+- hscode / cncode_total: 접두사 트라이 (노드마다 정렬된 매핑 ID 목록) -> 접두사 길이만큼만 탐색
+- goods_name / goods_engname: 소문자 1-gram/2-gram 역색인 -> 질의 n-gram 교집합 후 부분 문자열 확인
+- 품목명 결과는 일치 정도(완전 일치 > 접두사 > 단어 시작 > 부분 일치), 일치 위치, 이름 길이 순으로 정렬
+
+MappingRepository 가 매핑을 생성/수정/삭제하면 apply_* 로 행을 바로 반영하고 트라이/역색인은
+다음 조회 때 다시 만듭니다 (5천 건 기준 수백 ms, 이후 조회는 μs~ms). 다른 워커의 쓰기는 TTL이 지나 다시 읽을 때 반영되며,
+인덱스를 쓸 수 없으면 Repository 가 기존 SQL 검색으로 대체합니다.
+
+환경변수:
+- HS_CN_INDEX_ENABLED: 메모리 인덱스 사용 여부 (기본 true)
+- HS_CN_INDEX_TTL_SECONDS: 전체 다시 읽기 주기 초 (기본 600, 0이면 다시 읽지 않음)
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAPPING_COLUMNS = (
+    "id", "hscode", "aggregoods_name", "aggregoods_engname",
+    "cncode_total", "goods_name", "goods_engname"
+)
+
+# 품목명 일치 순위
+MATCH_EXACT = 0
+MATCH_PREFIX = 1
+MATCH_WORD = 2
+MATCH_SUBSTRING = 3
+
+_WORD_SEPARATORS = " \t-_/(),.·"
+
+# 품목명 검색 결과(정렬된 ID 목록)를 기억할 최근 질의 수 (자동완성 재입력/백스페이스 대비)
+_NAME_QUERY_MEMO_SIZE = 256
+
+
+class _PrefixTrie:
+    """코드 접두사 트라이 (노드마다 해당 접두사를 가진 ID 목록을 정렬 순서대로 보관)"""
+
+    __slots__ = ("_root",)
+
+    def __init__(self):
+        # 노드: [자식 dict, ID 목록]
+        self._root: List[Any] = [{}, []]
+
+    def insert(self, key: str, item_id: int):
+        node = self._root
+        node[1].append(item_id)
+        for char in key:
+            child = node[0].get(char)
+            if child is None:
+                child = [{}, []]
+                node[0][char] = child
+            node = child
+            node[1].append(item_id)
+
+    def find(self, prefix: str) -> List[int]:
+        node = self._root
+        for char in prefix:
+            node = node[0].get(char)
+            if node is None:
+                return []
+        return node[1]
+
+
+def _ngrams(text: str) -> Set[str]:
+    """1-gram + 2-gram (한글은 음절 단위, 영문은 문자 단위)"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _query_grams(query: str) -> List[str]:
+    """질의를 덮는 최소 n-gram (2자 이상이면 2-gram, 1자면 1-gram)"""
+    if len(query) == 1:
+        return [query]
+    return list({query[i:i + 2] for i in range(len(query) - 1)})
+
+
+def _name_rank(lowered: Optional[str], query: str) -> Optional[Tuple[int, int, int]]:
+    """소문자 이름 하나의 일치 순위 (불일치면 None)"""
+    if not lowered:
+        return None
+    position = lowered.find(query)
+    if position < 0:
+        return None
+    if lowered == query:
+        return MATCH_EXACT, 0, len(lowered)
+    if position == 0:
+        return MATCH_PREFIX, 0, len(lowered)
+    # 단어 시작 위치에서 일치하는지 (첫 일치가 단어 중간이면 다음 일치도 확인)
+    word_position = position
+    while word_position >= 0:
+        if lowered[word_position - 1] in _WORD_SEPARATORS:
+            return MATCH_WORD, word_position, len(lowered)
+        word_position = lowered.find(query, word_position + 1)
+    return MATCH_SUBSTRING, position, len(lowered)
+
+
+class HSCNLookupIndex:
+    """HS-CN 매핑 메모리 인덱스"""
+
+    def __init__(self):
+        self.enabled = os.getenv("HS_CN_INDEX_ENABLED", "true").lower() == "true"
+        self.ttl_seconds = float(os.getenv("HS_CN_INDEX_TTL_SECONDS", "600"))
+
+        # mapping_id -> 매핑 행
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        self._hs_trie = _PrefixTrie()
+        self._cn_trie = _PrefixTrie()
+        # n-gram -> 매핑 ID 집합, mapping_id -> (소문자 국문명, 소문자 영문명)
+        self._name_grams: Dict[str, Set[int]] = {}
+        self._lower_names: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        # 질의 -> 정렬된 매핑 ID 목록 (재구성 시 비움)
+        self._name_memo: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._dirty = True
+        self._loaded_at: Optional[float] = None
+        self._load_lock = asyncio.Lock()
+
+        self.loads = 0
+        self.rebuilds = 0
+        self.lookups = 0
+
+    # ============================================================================
+    # 📥 적재
+    # ============================================================================
+
+    def _is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return self.ttl_seconds > 0 and time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    async def ensure_loaded(self, pool) -> bool:
+        """인덱스가 없거나 TTL이 지났으면 전체 매핑을 다시 읽음 (사용 불가면 False)"""
+        if not self.enabled or pool is None:
+            return False
+        if not self._is_stale():
+            return True
+
+        async with self._load_lock:
+            if not self._is_stale():
+                return True
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(f"SELECT {', '.join(MAPPING_COLUMNS)} FROM hs_cn_mapping")
+            self._rows = {row['id']: dict(row) for row in rows}
+            self._dirty = True
+            self._loaded_at = time.monotonic()
+            self.loads += 1
+            logger.info(f"✅ HS-CN 매핑 인덱스 적재: {len(self._rows)}건")
+        return True
+
+    def invalidate(self):
+        """다음 조회 때 전체를 다시 읽도록 표시"""
+        self._loaded_at = None
+
+    def _ensure_built(self):
+        """행이 바뀌었으면 트라이/역색인 재구성 (await 없이 한 번에 교체)"""
+        if not self._dirty:
+            return
+        hs_trie = _PrefixTrie()
+        cn_trie = _PrefixTrie()
+        name_grams: Dict[str, Set[int]] = {}
+        lower_names: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+
+        # 트라이 노드의 ID 목록이 기존 ORDER BY 와 같은 순서가 되도록 정렬 후 삽입
+        for row in sorted(self._rows.values(), key=lambda r: (r['hscode'] or "", r['cncode_total'] or "", r['id'])):
+            if row['hscode']:
+                hs_trie.insert(row['hscode'], row['id'])
+        for row in sorted(self._rows.values(), key=lambda r: (r['cncode_total'] or "", r['hscode'] or "", r['id'])):
+            if row['cncode_total']:
+                cn_trie.insert(row['cncode_total'], row['id'])
+        for row in self._rows.values():
+            names = tuple(row[field].lower() if row[field] else None for field in ("goods_name", "goods_engname"))
+            lower_names[row['id']] = names
+            for name in names:
+                if name:
+                    for gram in _ngrams(name):
+                        name_grams.setdefault(gram, set()).add(row['id'])
+
+        self._hs_trie, self._cn_trie = hs_trie, cn_trie
+        self._name_grams, self._lower_names = name_grams, lower_names
+        self._name_memo.clear()
+        self._dirty = False
+        self.rebuilds += 1
+
+    # ============================================================================
+    # ✏️ 매핑 변경 반영 (MappingRepository 쓰기 직후 호출)
+    # ============================================================================
+
+    def apply_upsert(self, row: Optional[Dict[str, Any]]):
+        if not row or self._loaded_at is None:
+            return
+        self._rows[row['id']] = {column: row.get(column) for column in MAPPING_COLUMNS}
+        self._dirty = True
+
+    def apply_delete(self, mapping_id: int):
+        if self._loaded_at is None:
+            return
+        if self._rows.pop(mapping_id, None) is not None:
+            self._dirty = True
+
+    # ============================================================================
+    # 🔍 조회
+    # ============================================================================
+
+    def _collect(self, ids: Iterable[int], limit: Optional[int]) -> List[Dict[str, Any]]:
+        results = []
+        for mapping_id in ids:
+            results.append(dict(self._rows[mapping_id]))
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def search_hs_code(self, prefix: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """hscode 접두사 검색 (hscode, cncode_total 순)"""
+        self._ensure_built()
+        self.lookups += 1
+        return self._collect(self._hs_trie.find(prefix), limit)
+
+    def search_cn_code(self, prefix: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """cncode_total 접두사 검색 (cncode_total, hscode 순)"""
+        self._ensure_built()
+        self.lookups += 1
+        return self._collect(self._cn_trie.find(prefix), limit)
+
+    def search_goods_name(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """품목명(국문/영문) 부분 검색, 일치 정도 순으로 정렬"""
+        self._ensure_built()
+        self.lookups += 1
+        query = query.lower()
+        memo = self._name_memo.get(query)
+        if memo is not None:
+            self._name_memo.move_to_end(query)
+            return self._collect(memo, limit)
+
+        if not query:
+            candidates: Iterable[int] = self._rows.keys()
+        else:
+            postings = [self._name_grams.get(gram) for gram in _query_grams(query)]
+            if not all(postings):
+                return []
+            postings.sort(key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+
+        ranked = []
+        for mapping_id in candidates:
+            ranks = [rank for rank in (_name_rank(name, query) for name in self._lower_names[mapping_id]) if rank]
+            if not ranks:
+                continue
+            row = self._rows[mapping_id]
+            ranked.append((min(ranks), row['goods_name'] or "", row['hscode'] or "", mapping_id))
+        ranked.sort()
+
+        ordered = [entry[-1] for entry in ranked]
+        self._name_memo[query] = ordered
+        if len(self._name_memo) > _NAME_QUERY_MEMO_SIZE:
+            self._name_memo.popitem(last=False)
+        return self._collect(ordered, limit)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "loaded": self._loaded_at is not None,
+            "mappings": len(self._rows),
+            "name_grams": len(self._name_grams),
+            "loads": self.loads,
+            "rebuilds": self.rebuilds,
+            "lookups": self.lookups,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# 애플리케이션 전역 인스턴스
+hs_cn_index = HSCNLookupIndex()
+
+
+__all__ = [
+    "MATCH_EXACT",
+    "MATCH_PREFIX",
+    "MATCH_WORD",
+    "MATCH_SUBSTRING",
+    "HSCNLookupIndex",
+    "hs_cn_index",
+]
@@ -0,0 +1,319 @@
+# ============================================================================
+# 🗃️ 보고서 결과 캐시 (사업장별 버전 카운터 무효화)
+# ============================================================================
+
+"""
+보고서/통계 결과 캐시
+
+키는 (종류, install_id, start_date, end_date)이며 TTL과 LRU로 크기를 제한합니다.
+MatDir/FuelDir/Product/Edge Repository가 데이터를 쓰면 영향을 받는 사업장의
+버전 카운터를 올리고, 캐시 항목은 저장 당시 버전과 현재 버전이 다르면 버려집니다.
+(항목을 직접 찾아 지우지 않으므로 무효화는 카운터 증가 한 번으로 끝납니다.)
+
+보고서가 읽는 테이블(product, product_process, process, install)을 쓰는 모든 경로가 무효화하며,
+영향 사업장은 쓰기 트랜잭션 안에서 installs_for_*()로 찾고 카운터는 커밋 후 올립니다.
+커밋 전에 올리면 동시에 계산 중인 보고서가 커밋 전 스냅샷을 새 버전으로 다시 저장할 수 있습니다.
+(process_input/precursors 등 이 서비스가 쓰지 않는 테이블 변경은 TTL 후 반영)
+
+환경변수:
+- REPORT_CACHE_ENABLED: 캐시 사용 여부 (기본 true)
+- REPORT_CACHE_TTL_SECONDS: 항목 유지 시간 초 (기본 300)
+- REPORT_CACHE_MAX_ENTRIES: 메모리 캐시 최대 항목 수 (기본 256)
+- REPORT_CACHE_BACKEND: memory | redis (기본 memory)
+- REPORT_CACHE_REDIS_URL: Redis 주소 (기본 REDIS_URL)
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis 패키지가 없으면 메모리 백엔드만 사용
+    aioredis = None
+
+REDIS_KEY_PREFIX = "cbam:report"
+
+# (install 버전, 전역 버전)
+VersionToken = Tuple[int, int]
+
+
+class ReportCache:
+    """보고서 결과 캐시 (메모리 LRU 또는 Redis)"""
+
+    def __init__(self):
+        self.enabled = os.getenv("REPORT_CACHE_ENABLED", "true").lower() == "true"
+        self.ttl_seconds = float(os.getenv("REPORT_CACHE_TTL_SECONDS", "300"))
+        self.max_entries = int(os.getenv("REPORT_CACHE_MAX_ENTRIES", "256"))
+        self.backend = os.getenv("REPORT_CACHE_BACKEND", "memory").lower()
+        self.redis_url = os.getenv("REPORT_CACHE_REDIS_URL", os.getenv("REDIS_URL", ""))
+
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[VersionToken, float, Any]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._global_version = 0
+        self._redis = None
+        self._redis_lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    # ============================================================================
+    # 🔌 Redis 연결
+    # ============================================================================
+
+    async def _get_redis(self):
+        """Redis 클라이언트 반환 (설정/패키지가 없거나 연결 실패 시 메모리 백엔드로 전환)"""
+        if self.backend != "redis":
+            return None
+        if self._redis is not None:
+            return self._redis
+
+        async with self._redis_lock:
+            if self._redis is not None:
+                return self._redis
+            if aioredis is None or not self.redis_url:
+                logger.warning("⚠️ redis 패키지 또는 REPORT_CACHE_REDIS_URL이 없어 메모리 보고서 캐시를 사용합니다.")
+                self.backend = "memory"
+                return None
+            try:
+                client = aioredis.from_url(self.redis_url)
+                await client.ping()
+                self._redis = client
+                logger.info("✅ 보고서 캐시 Redis 연결 성공")
+            except Exception as e:
+                logger.warning(f"⚠️ 보고서 캐시 Redis 연결 실패, 메모리 캐시 사용: {e}")
+                self.backend = "memory"
+            return self._redis
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    # ============================================================================
+    # 🔢 버전 카운터
+    # ============================================================================
+
+    async def _version_token(self, install_id: int) -> VersionToken:
+        redis = await self._get_redis()
+        if redis is None:
+            return self._versions.get(install_id, 0), self._global_version
+
+        install_version, global_version = await redis.mget(
+            f"{REDIS_KEY_PREFIX}:version:{install_id}",
+            f"{REDIS_KEY_PREFIX}:version:global"
+        )
+        return int(install_version or 0), int(global_version or 0)
+
+    async def invalidate_installs(self, install_ids: Iterable[int]):
+        """사업장 버전 카운터 증가 (해당 사업장의 캐시 항목 전체 무효화)"""
+        install_ids = {int(install_id) for install_id in install_ids if install_id is not None}
+        if not self.enabled or not install_ids:
+            return
+        self.invalidations += len(install_ids)
+
+        try:
+            redis = await self._get_redis()
+            if redis is None:
+                for install_id in install_ids:
+                    self._versions[install_id] = self._versions.get(install_id, 0) + 1
+                return
+
+            pipe = redis.pipeline()
+            for install_id in install_ids:
+                pipe.incr(f"{REDIS_KEY_PREFIX}:version:{install_id}")
+            await pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"⚠️ 보고서 캐시 무효화 실패: {e}")
+
+    async def invalidate_all(self):
+        """전역 버전 증가 (모든 캐시 항목 무효화)"""
+        if not self.enabled:
+            return
+        self.invalidations += 1
+        try:
+            redis = await self._get_redis()
+            if redis is None:
+                self._global_version += 1
+                return
+            await redis.incr(f"{REDIS_KEY_PREFIX}:version:global")
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"⚠️ 보고서 캐시 전체 무효화 실패: {e}")
+
+    async def installs_for_nodes(
+        self, conn, process_ids: Iterable[int] = (), product_ids: Iterable[int] = ()
+    ) -> Optional[Set[int]]:
+        """
+        공정/제품이 속한 사업장 ID 조회 (조회 실패 시 None = 전체 무효화 대상)
+
+        쓰기 트랜잭션 안에서 호출해 삭제 전 연결 관계로 사업장을 찾고,
+        무효화는 커밋 후 invalidate_resolved()로 합니다.
+        """
+        if not self.enabled:
+            return set()
+        process_ids = [int(process_id) for process_id in process_ids if process_id is not None]
+        product_ids = [int(product_id) for product_id in product_ids if product_id is not None]
+        if not process_ids and not product_ids:
+            return set()
+
+        try:
+            # 실패해도 호출한 쓰기 트랜잭션이 중단되지 않도록 세이브포인트 안에서 조회
+            async with conn.transaction():
+                rows = await conn.fetch("""
+                    SELECT DISTINCT p.install_id
+                    FROM product_process pp
+                    JOIN product p ON p.id = pp.product_id
+                    WHERE pp.process_id = ANY($1::bigint[])
+                    UNION
+                    SELECT p.install_id
+                    FROM product p
+                    WHERE p.id = ANY($2::bigint[])
+                """, process_ids, product_ids)
+            return {row['install_id'] for row in rows if row['install_id'] is not None}
+        except Exception as e:
+            logger.warning(f"⚠️ 보고서 캐시 사업장 조회 실패, 전체 무효화: {e}")
+            return None
+
+    async def installs_for_edges(self, conn, edges: Iterable[Optional[Dict[str, Any]]]) -> Optional[Set[int]]:
+        """엣지 양 끝 노드가 속한 사업장 ID 조회"""
+        process_ids, product_ids = [], []
+        for edge in edges:
+            if not edge:
+                continue
+            for node_type, node_id in (
+                (edge.get('source_node_type'), edge.get('source_id')),
+                (edge.get('target_node_type'), edge.get('target_id'))
+            ):
+                if node_type == 'process':
+                    process_ids.append(node_id)
+                elif node_type == 'product':
+                    product_ids.append(node_id)
+        return await self.installs_for_nodes(conn, process_ids=process_ids, product_ids=product_ids)
+
+    async def invalidate_resolved(self, install_ids: Optional[Iterable[int]]):
+        """installs_for_* 결과로 무효화 (커밋 후 호출, None 이면 전체 무효화)"""
+        if install_ids is None:
+            await self.invalidate_all()
+        else:
+            await self.invalidate_installs(install_ids)
+
+    async def invalidate_for_nodes(self, conn, process_ids: Iterable[int] = (), product_ids: Iterable[int] = ()):
+        """공정/제품이 속한 사업장을 찾아 바로 무효화 (트랜잭션 밖, 커밋된 쓰기 이후에만 사용)"""
+        await self.invalidate_resolved(
+            await self.installs_for_nodes(conn, process_ids=process_ids, product_ids=product_ids)
+        )
+
+    # ============================================================================
+    # 📦 조회/저장
+    # ============================================================================
+
+    async def get_or_compute(
+        self,
+        kind: str,
+        install_id: int,
+        start_date: date,
+        end_date: date,
+        model_cls: Type[Any],
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """캐시 조회 후 없으면 compute()로 계산하여 저장"""
+        if not self.enabled:
+            return await compute()
+
+        try:
+            token = await self._version_token(install_id)
+            cached = await self._get(kind, install_id, start_date, end_date, token, model_cls)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"⚠️ 보고서 캐시 조회 실패: {e}")
+            return await compute()
+
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        # 계산 전에 읽은 버전으로 저장하므로 계산 중 들어온 쓰기는 다음 조회에서 무효화됨
+        value = await compute()
+        try:
+            await self._set(kind, install_id, start_date, end_date, token, value)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"⚠️ 보고서 캐시 저장 실패: {e}")
+        return value
+
+    @staticmethod
+    def _redis_key(kind: str, install_id: int, start_date: date, end_date: date, token: VersionToken) -> str:
+        return f"{REDIS_KEY_PREFIX}:{kind}:{install_id}:{start_date}:{end_date}:{token[0]}:{token[1]}"
+
+    async def _get(self, kind, install_id, start_date, end_date, token: VersionToken, model_cls):
+        redis = await self._get_redis()
+        if redis is not None:
+            payload = await redis.get(self._redis_key(kind, install_id, start_date, end_date, token))
+            return model_cls.model_validate_json(payload) if payload else None
+
+        key = (kind, install_id, start_date, end_date)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry_token, expires_at, value = entry
+        if entry_token != token or expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def _set(self, kind, install_id, start_date, end_date, token: VersionToken, value):
+        redis = await self._get_redis()
+        if redis is not None:
+            await redis.set(
+                self._redis_key(kind, install_id, start_date, end_date, token),
+                value.model_dump_json(),
+                ex=max(1, int(self.ttl_seconds))
+            )
+            return
+
+        key = (kind, install_id, start_date, end_date)
+        self._entries[key] = (token, time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """히트/미스 통계 (/health 노출용)"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": self.backend,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "errors": self.errors
+        }
+
+
+# 서비스 전역 캐시 인스턴스
+report_cache = ReportCache()
+
+
+__all__ = [
+    "ReportCache",
+    "report_cache"
+]
@@ -7,7 +7,8 @@ import logging
 from typing import List
 import time
 
-from app.domain.calculation.calculation_service import CalculationService
+from app.common.dependencies import get_calculation_service
+from app.common.graph_topology import CircularEdgeError
 from app.domain.calculation.calculation_schema import (
     ProcessAttrdirEmissionCreateRequest, ProcessAttrdirEmissionResponse, ProcessAttrdirEmissionUpdateRequest,
     ProcessEmissionCalculationRequest, ProcessEmissionCalculationResponse,
@@ -21,8 +22,8 @@ logger = logging.getLogger(__name__)
 # Gateway를 통해 접근하므로 prefix 제거 (경로 중복 방지)
 router = APIRouter(tags=["Calculation"])
 
-# 서비스 인스턴스 생성
-calculation_service = CalculationService()
+# 서비스 인스턴스 (애플리케이션 수명 싱글톤)
+calculation_service = get_calculation_service()
 
 # ============================================================================
 # 📊 배출량 계산 관련 엔드포인트
@@ -104,6 +105,9 @@ async def propagate_emissions(request: EmissionPropagationRequest):
         result = await calculation_service.propagate_emissions(request)
         logger.info(f"✅ 배출량 전파 성공: {result.propagated_amount} tCO2e 전파됨")
         return result
+    except CircularEdgeError as e:
+        logger.warning(f"⚠️ 배출량 전파 거부: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"❌ 배출량 전파 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"배출량 전파 중 오류가 발생했습니다: {str(e)}")
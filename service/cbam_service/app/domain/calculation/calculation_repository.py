@@ -6,7 +6,9 @@ import logging
 import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import asyncpg
+from app.common.database_pool import get_domain_pool
+from app.common.graph_topology import GraphTopologyCache, NodeKey, topology_cache
+from app.common.attrdir_emission_sync import attrdir_emission_sync, refresh_process_attrdir_emissions
 import os
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -41,18 +43,10 @@ class CalculationRepository:
         self._initialization_attempted = True
         
         try:
-            # asyncpg 연결 풀 생성
-            self.pool = await asyncpg.create_pool(
-                self.database_url,
-                min_size=1,  # 최소 연결 수를 줄임
-                max_size=10,  # 최대 연결 수를 줄임
-                command_timeout=30,  # 타임아웃을 줄임
-                server_settings={
-                    'application_name': 'cbam-service'
-                }
-            )
+            # 공용 연결 풀에서 도메인 핸들 획득
+            self.pool = await get_domain_pool('calculation')
             
-            logger.info("✅ 데이터베이스 연결 풀 생성 성공")
+            logger.info("✅ 공용 연결 풀 연결 성공")
             
             # 테이블 및 트리거 생성은 선택적으로 실행
             try:
@@ -266,7 +260,8 @@ class CalculationRepository:
             
         try:
             async with self.pool.acquire() as conn:
-                # 기본적인 트리거만 생성 (필요시 확장)
+                # matdir/fueldir 쓰기 -> process_attrdir_emission 증분 반영 트리거
+                await attrdir_emission_sync.install(conn)
                 logger.info("✅ 트리거 생성 완료")
                 
         except Exception as e:
@@ -332,14 +327,14 @@ class CalculationRepository:
     # ============================================================================
 
     async def get_process_chains_by_process_ids(self, process_ids: List[int]) -> List[Dict]:
-        """공정 ID들로 통합 그룹 조회"""
+        """공정 ID들로 통합 그룹 조회 (그룹별 공정 목록은 array_agg로 한 번에 조회)"""
         await self._ensure_pool_initialized()
             
         try:
             async with self.pool.acquire() as conn:
-                # process_chain_link 테이블을 통해 공정이 포함된 그룹들 조회
+                # process_chain_link 테이블을 통해 공정이 포함된 그룹과 그룹별 공정 순서 조회
                 chains = await conn.fetch("""
-                    SELECT DISTINCT 
+                    SELECT 
                         pc.id,
                         pc.chain_name,
                         pc.start_process_id,
@@ -347,31 +342,24 @@ class CalculationRepository:
                         pc.chain_length,
                         pc.is_active,
                         pc.created_at,
-                        pc.updated_at
+                        pc.updated_at,
+                        COALESCE((
+                            SELECT array_agg(l.process_id ORDER BY l.sequence_order)
+                            FROM process_chain_link l
+                            WHERE l.chain_id = pc.id
+                        ), '{}'::int[]) AS processes
                     FROM process_chain pc
-                    INNER JOIN process_chain_link pcl ON pc.id = pcl.chain_id
-                    WHERE pcl.process_id = ANY($1)
+                    WHERE EXISTS (
+                        SELECT 1 FROM process_chain_link pcl
+                        WHERE pcl.chain_id = pc.id AND pcl.process_id = ANY($1::int[])
+                    )
                     ORDER BY pc.id
                 """, process_ids)
                 
-                # 각 그룹에 포함된 공정 목록도 함께 조회
-                chain_list = []
-                for chain in chains:
-                    chain_dict = dict(chain)
-                    chain_dict['processes'] = []
-                    
-                    # 해당 그룹에 포함된 공정 목록 조회
-                    process_links = await conn.fetch("""
-                        SELECT process_id, sequence_order
-                        FROM process_chain_link
-                        WHERE chain_id = $1
-                        ORDER BY sequence_order
-                    """, chain_dict['id'])
-                    
-                    chain_dict['processes'] = [link['process_id'] for link in process_links]
-                    chain_list.append(chain_dict)
-                
-                return chain_list
+                return [
+                    {**dict(chain), 'processes': list(chain['processes'])}
+                    for chain in chains
+                ]
         except Exception as e:
             logger.error(f"❌ 공정 ID로 통합 그룹 조회 실패: {str(e)}")
             raise e
@@ -520,7 +508,7 @@ class CalculationRepository:
     # ============================================================================
 
     async def calculate_process_attrdir_emission(self, process_id: int) -> Dict[str, Any]:
-        """공정별 직접귀속배출량 계산 및 저장"""
+        """공정별 직접귀속배출량 계산 및 저장 (집계 트리거가 있으면 유지 중인 합계 반환)"""
         await self._ensure_pool_initialized()
             
         try:
@@ -533,6 +521,20 @@ class CalculationRepository:
                 if not process_result:
                     raise Exception(f"공정 ID {process_id}를 찾을 수 없습니다.")
                 
+                if attrdir_emission_sync.triggers_active:
+                    # 트리거가 matdir/fueldir 쓰기마다 합계를 맞추므로 SUM 재계산 불필요
+                    result = await conn.fetchrow("""
+                        SELECT * FROM process_attrdir_emission WHERE process_id = $1
+                    """, process_id)
+                    if result:
+                        return dict(result)
+                    # 배출량 데이터가 없는 공정은 합계 행이 없으므로 한 번만 집계해 생성
+                    await refresh_process_attrdir_emissions(conn, [process_id])
+                    result = await conn.fetchrow("""
+                        SELECT * FROM process_attrdir_emission WHERE process_id = $1
+                    """, process_id)
+                    return dict(result)
+                
                 # 2. 원료별 직접배출량 계산 (matdir 테이블 기반)
                 matdir_emission = await conn.fetchrow("""
                     SELECT COALESCE(SUM(matdir_em), 0) as total_matdir_emission
@@ -706,6 +708,12 @@ class CalculationRepository:
         """모든 continue 엣지 조회"""
         await self._ensure_pool_initialized()
             
+        if await topology_cache.ensure_loaded(self.pool):
+            return [
+                {key: edge[key] for key in ('id', 'source_id', 'target_id', 'source_node_type', 'target_node_type', 'edge_kind')}
+                for edge in topology_cache.edges({'continue'}, source_type='process', target_type='process')
+            ]
+        
         try:
             async with self.pool.acquire() as conn:
                 results = await conn.fetch("""
@@ -729,38 +737,30 @@ class CalculationRepository:
             logger.error(f"❌ continue 엣지 조회 실패: {str(e)}")
             raise e
     
-    async def get_outgoing_continue_edges(self, process_id: int) -> List[Dict[str, Any]]:
-        """특정 공정에서 나가는 continue 엣지들 조회"""
+    async def get_topology(self) -> Optional[GraphTopologyCache]:
+        """적재된 그래프 토폴로지 캐시 (사용할 수 없으면 None)"""
         await self._ensure_pool_initialized()
-            
-        try:
-            async with self.pool.acquire() as conn:
-                results = await conn.fetch("""
-                    SELECT 
-                        e.id,
-                        e.source_id,
-                        e.target_id,
-                        e.source_node_type,
-                        e.target_node_type,
-                        e.edge_kind
-                    FROM edge e
-                    WHERE e.edge_kind = 'continue'
-                    AND e.source_node_type = 'process'
-                    AND e.target_node_type = 'process'
-                    AND e.source_id = $1
-                    ORDER BY e.id
-                """, process_id)
-                
-                return [dict(row) for row in results]
-                
-        except Exception as e:
-            logger.error(f"❌ 공정 {process_id}의 나가는 continue 엣지 조회 실패: {str(e)}")
-            raise e
+        if await topology_cache.ensure_loaded(self.pool):
+            return topology_cache
+        return None
+    
+    async def find_continue_cycle_path(self, source_id: int, target_id: int) -> Optional[List[NodeKey]]:
+        """공정 source→target continue 엣지를 추가하면 생기는 순환 경로 (없으면 None)"""
+        await self._ensure_pool_initialized()
+        return await topology_cache.find_cycle_path(
+            self.pool, ('process', source_id), ('process', target_id), edge_kinds=['continue']
+        )
     
     async def get_isolated_processes(self) -> List[int]:
         """고립된 공정들 조회 (엣지가 없는 공정)"""
         await self._ensure_pool_initialized()
             
+        if await topology_cache.ensure_loaded(self.pool):
+            # 공정 ID만 읽고 연결 여부는 인접 인덱스의 차수로 판단
+            async with self.pool.acquire() as conn:
+                process_ids = [row['id'] for row in await conn.fetch("SELECT id FROM process")]
+            return topology_cache.isolated_processes(process_ids)
+        
         try:
             async with self.pool.acquire() as conn:
                 results = await conn.fetch("""
@@ -784,6 +784,10 @@ class CalculationRepository:
         """매우 긴 체인들 조회 (무한 루프 가능성 확인)"""
         await self._ensure_pool_initialized()
             
+        if await topology_cache.ensure_loaded(self.pool):
+            # 인접 인덱스에서 공정별 가장 긴 continue 체인 (version이 같으면 재계산하지 않음)
+            return topology_cache.long_continue_chains(max_length)
+        
         try:
             async with self.pool.acquire() as conn:
                 # 재귀 CTE를 사용하여 체인 길이 계산
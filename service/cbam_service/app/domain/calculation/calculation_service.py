@@ -5,14 +5,14 @@
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from app.common.graph_topology import CircularEdgeError, NodeKey
 from app.domain.calculation.calculation_repository import CalculationRepository
 from app.domain.calculation.calculation_schema import (
     ProcessAttrdirEmissionCreateRequest, ProcessAttrdirEmissionResponse, ProcessAttrdirEmissionUpdateRequest,
     ProcessEmissionCalculationRequest, ProcessEmissionCalculationResponse,
     ProductEmissionCalculationRequest, ProductEmissionCalculationResponse,
     EmissionPropagationRequest, EmissionPropagationResponse,
-    GraphRecalculationRequest, GraphRecalculationResponse,
-    CircularReferenceError
+    GraphRecalculationRequest, GraphRecalculationResponse
 )
 
 logger = logging.getLogger(__name__)
@@ -200,15 +200,12 @@ class CalculationService:
             
             # 1. 순환 참조 검증
             if request.edge_kind == "continue":
-                is_circular = await self._check_circular_reference(
+                cycle_path = await self._check_circular_reference(
                     request.source_process_id, request.target_process_id
                 )
-                if is_circular:
-                    raise CircularReferenceError(
-                        error_type="CIRCULAR_REFERENCE",
-                        error_message="순환 참조가 감지되었습니다",
-                        affected_processes=[request.source_process_id, request.target_process_id],
-                        cycle_path=[request.source_process_id, request.target_process_id]
+                if cycle_path:
+                    raise CircularEdgeError(
+                        ('process', request.source_process_id), ('process', request.target_process_id), cycle_path
                     )
             
             # 2. 소스 공정 배출량 조회
@@ -342,36 +339,14 @@ class CalculationService:
         
         return propagated, new_target_em, formula
     
-    async def _check_circular_reference(self, source_id: int, target_id: int) -> bool:
-        """순환 참조 검증 (DFS 기반)"""
+    async def _check_circular_reference(self, source_id: int, target_id: int) -> Optional[List[NodeKey]]:
+        """순환 참조 검증 (인접 인덱스 또는 재귀 CTE) -> 순환 경로, 없으면 None"""
         try:
-            visited = set()
-            path = []
-            
-            async def dfs(current_id: int, target: int) -> bool:
-                if current_id == target:
-                    return True
-                if current_id in visited:
-                    return False
-                
-                visited.add(current_id)
-                path.append(current_id)
-                
-                # 현재 공정에서 나가는 continue 엣지들 찾기
-                outgoing_edges = await self.calc_repository.get_outgoing_continue_edges(current_id)
-                
-                for edge in outgoing_edges:
-                    if await dfs(edge['target_id'], target):
-                        return True
-                
-                path.pop()
-                return False
-            
-            return await dfs(target_id, source_id)
+            return await self.calc_repository.find_continue_cycle_path(source_id, target_id)
             
         except Exception as e:
             logger.warning(f"⚠️ 순환 참조 검증 중 오류: {str(e)}")
-            return False  # 오류 발생 시 안전하게 False 반환
+            return None  # 오류 발생 시 안전하게 None 반환
     
     async def _validate_graph_structure(self) -> List[str]:
         """전체 그래프 구조 검증"""
@@ -387,6 +362,13 @@ class CalculationService:
             if long_chains:
                 errors.append(f"매우 긴 체인 발견: {len(long_chains)}개 (20단계 이상)")
             
+            # 3. 순환 참조 확인 (토폴로지 캐시를 쓸 수 있을 때만)
+            topology = await self.calc_repository.get_topology()
+            if topology is not None:
+                cycle_nodes = topology.find_cycle_nodes()
+                if cycle_nodes:
+                    errors.append(f"순환 참조 발견: {len(cycle_nodes)}개 노드")
+            
         except Exception as e:
             logger.warning(f"⚠️ 그래프 구조 검증 중 오류: {str(e)}")
             errors.append(f"검증 오류: {str(e)}")
@@ -7,7 +7,8 @@ import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-from app.domain.edge.edge_service import EdgeService
+from app.common.dependencies import get_edge_service
+from app.common.graph_topology import CircularEdgeError, TopologyUnavailableError
 from app.domain.edge.edge_schema import (
     EdgeCreateRequest, EdgeUpdateRequest, EdgeResponse
 )
@@ -17,17 +18,6 @@ logger = logging.getLogger(__name__)
 # Gateway를 통해 접근하므로 prefix 제거 (경로 중복 방지)
 router = APIRouter(tags=["Edge"])
 
-# 싱글톤 서비스 인스턴스 (성능 최적화)
-_edge_service_instance = None
-
-def get_edge_service():
-    """엣지 서비스 인스턴스 반환 (싱글톤 패턴)"""
-    global _edge_service_instance
-    if _edge_service_instance is None:
-        _edge_service_instance = EdgeService(None)  # Repository에서 직접 DB 연결 사용
-        logger.info("✅ Edge Service 싱글톤 인스턴스 생성")
-    return _edge_service_instance
-
 # ============================================================================
 # 📊 상태 확인 엔드포인트
 # ============================================================================
@@ -107,6 +97,9 @@ async def create_edge(
         
     except HTTPException:
         raise
+    except CircularEdgeError as e:
+        logger.warning(f"⚠️ 엣지 생성 거부: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"❌ 엣지 생성 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"엣지 생성 중 오류가 발생했습니다: {str(e)}")
@@ -173,6 +166,9 @@ async def update_edge(
         
     except HTTPException:
         raise
+    except CircularEdgeError as e:
+        logger.warning(f"⚠️ 엣지 수정 거부: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"❌ 엣지 수정 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"엣지 수정 중 오류가 발생했습니다: {str(e)}")
@@ -395,34 +391,57 @@ async def get_edges_by_node(
 
 @router.get("/stats/summary")
 async def get_edge_summary():
-    """엣지 통계 요약"""
+    """엣지 통계 요약 (그래프 토폴로지 캐시 기준, 캐시를 쓸 수 없으면 DB 직접 집계)"""
     try:
         logger.info("📊 엣지 통계 요약 요청")
         
         edge_service = get_edge_service()
-        all_edges = await edge_service.get_edges()
-        
-        # 타입별 통계
-        type_stats = {}
-        for edge in all_edges:
-            edge_type = edge['edge_kind']
-            if edge_type not in type_stats:
-                type_stats[edge_type] = 0
-            type_stats[edge_type] += 1
-        
-        summary = {
-            "total_edges": len(all_edges),
-            "edge_types": type_stats,
-            "unique_nodes": len(set([edge['source_id'] for edge in all_edges] + [edge['target_id'] for edge in all_edges]))
-        }
+        summary = await edge_service.get_edge_summary()
         
-        logger.info(f"✅ 엣지 통계 요약 생성 성공: {summary}")
+        logger.info(f"✅ 엣지 통계 요약 생성 성공: 엣지 {summary['total_edges']}개 ({summary['source']})")
         return summary
         
     except Exception as e:
         logger.error(f"❌ 엣지 통계 요약 생성 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"엣지 통계 요약 생성 중 오류가 발생했습니다: {str(e)}")
 
+@router.get("/topology/adjacency")
+async def get_topology_adjacency(
+    node_type: Optional[str] = Query(None, description="노드 타입 (process | product, 없으면 전체)")
+):
+    """노드 타입별 정방향/역방향 인접 리스트"""
+    try:
+        logger.info(f"🕸️ 그래프 인접 리스트 조회 요청: {node_type or '전체'}")
+        
+        edge_service = get_edge_service()
+        return await edge_service.get_topology_adjacency(node_type)
+        
+    except TopologyUnavailableError as e:
+        logger.warning(f"⚠️ 그래프 인접 리스트 조회 불가: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ 그래프 인접 리스트 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"그래프 인접 리스트 조회 중 오류가 발생했습니다: {str(e)}")
+
+@router.get("/topology/{node_type}/{node_id}")
+async def get_node_topology(
+    node_type: str,
+    node_id: int
+):
+    """노드의 진입/진출 차수, 이웃 엣지, 연결 요소"""
+    try:
+        logger.info(f"🕸️ 노드 토폴로지 조회 요청: {node_type}:{node_id}")
+        
+        edge_service = get_edge_service()
+        return await edge_service.get_node_topology(node_type, node_id)
+        
+    except TopologyUnavailableError as e:
+        logger.warning(f"⚠️ 노드 토폴로지 조회 불가: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ 노드 토폴로지 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"노드 토폴로지 조회 중 오류가 발생했습니다: {str(e)}")
+
 # ============================================================================
 # 📦 일괄 처리 엔드포인트
 # ============================================================================
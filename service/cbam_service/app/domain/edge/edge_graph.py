@@ -0,0 +1,238 @@
+# ============================================================================
+# 🧮 Edge Graph - 메모리 기반 배출량 전파 그래프 엔진
+# ============================================================================
+
+"""
+공정/제품 혼합 DAG를 메모리에 구성하고 위상 정렬 순서로 누적 배출량을 계산합니다.
+
+DB 접근은 하지 않으며, EdgeRepository.get_emission_graph_snapshot()이 반환한
+스냅샷으로 그래프를 만들고 계산 결과를 EdgeRepository.save_emission_graph_results()로
+한 번에 저장하는 구조입니다.
+
+전파 규칙 (dataallocation.mdc):
+- continue (공정→공정): target.cumulative += source.cumulative
+- produce  (공정→제품): product.attr_em = Σ(생산 공정 cumulative)
+- consume  (제품→공정): target.cumulative += product.attr_em × (소비량 / 제품 생산량)
+                         소비량 할당 = to_next_process × (소비량 / 전체 소비량)
+"""
+
+import logging
+from collections import deque
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Set
+
+logger = logging.getLogger(__name__)
+
+# 노드 키: ('process', id) 또는 ('product', id)
+NodeKey = Tuple[str, int]
+
+PROCESS = 'process'
+PRODUCT = 'product'
+
+
+class EmissionGraphCycleError(Exception):
+    """그래프에 순환 참조가 있어 위상 정렬이 불가능할 때 발생"""
+
+    def __init__(self, cycle_nodes: List[NodeKey]):
+        self.cycle_nodes = cycle_nodes
+        super().__init__(f"순환 참조가 감지되었습니다: {len(cycle_nodes)}개 노드")
+
+
+class EmissionGraph:
+    """공정/제품 혼합 배출량 그래프 (인접 리스트 + 위상 정렬)"""
+
+    def __init__(self):
+        self.successors: Dict[NodeKey, List[Tuple[NodeKey, str]]] = {}
+        self.predecessors: Dict[NodeKey, List[Tuple[NodeKey, str]]] = {}
+        self.process_attrdir: Dict[int, float] = {}
+        self.products: Dict[int, Dict[str, float]] = {}
+        self.consumption: Dict[Tuple[int, int], float] = {}  # (product_id, process_id) -> 소비량
+        self.edge_count = 0
+        self._total_consumption: Dict[int, float] = {}
+
+    # ============================================================================
+    # 🏗️ 그래프 구성
+    # ============================================================================
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> 'EmissionGraph':
+        """Repository 스냅샷으로 그래프 생성"""
+        graph = cls()
+        for edge in snapshot.get('edges', []):
+            graph.add_edge(edge)
+        graph.process_attrdir = dict(snapshot.get('process_attrdir', {}))
+        graph.products = dict(snapshot.get('products', {}))
+        graph.consumption = dict(snapshot.get('consumption', {}))
+        return graph
+
+    def add_edge(self, edge: Dict[str, Any]):
+        """엣지 1개를 인접 리스트에 추가"""
+        source = (edge['source_node_type'], int(edge['source_id']))
+        target = (edge['target_node_type'], int(edge['target_id']))
+        kind = edge['edge_kind']
+
+        self._total_consumption.clear()
+        self.successors.setdefault(source, []).append((target, kind))
+        self.predecessors.setdefault(target, []).append((source, kind))
+        self.successors.setdefault(target, [])
+        self.predecessors.setdefault(source, [])
+        self.edge_count += 1
+
+    @property
+    def nodes(self) -> List[NodeKey]:
+        return list(self.successors.keys())
+
+    def process_ids(self) -> List[int]:
+        return [node_id for node_type, node_id in self.successors if node_type == PROCESS]
+
+    def product_ids(self) -> List[int]:
+        return [node_id for node_type, node_id in self.successors if node_type == PRODUCT]
+
+    def add_node(self, node: NodeKey):
+        """엣지 없이 노드만 추가 (엣지 삭제로 고립된 노드 재계산용)"""
+        self.successors.setdefault(node, [])
+        self.predecessors.setdefault(node, [])
+
+    def downstream_closure(self, start_nodes: Iterable[NodeKey]) -> Set[NodeKey]:
+        """시작 노드들과 그 하류(successor)에 있는 모든 노드 집합 (BFS)"""
+        closure: Set[NodeKey] = set()
+        queue = deque(node for node in start_nodes if node in self.successors)
+        while queue:
+            node = queue.popleft()
+            if node in closure:
+                continue
+            closure.add(node)
+            for target, _ in self.successors.get(node, []):
+                if target not in closure:
+                    queue.append(target)
+        return closure
+
+    # ============================================================================
+    # 🔀 위상 정렬
+    # ============================================================================
+
+    def topological_order(self, subset: Optional[Set[NodeKey]] = None) -> List[NodeKey]:
+        """Kahn 알고리즘으로 위상 정렬 (subset이 주어지면 해당 노드만 정렬)"""
+        nodes = subset if subset is not None else set(self.successors)
+        in_degree = {node: 0 for node in nodes}
+        for node in nodes:
+            for target, _ in self.successors.get(node, []):
+                if target in in_degree:
+                    in_degree[target] += 1
+
+        # 노드 ID 순으로 시작점을 잡아 결과를 결정적으로 유지
+        queue = deque(sorted(node for node, degree in in_degree.items() if degree == 0))
+        order: List[NodeKey] = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for target, _ in self.successors.get(node, []):
+                if target not in in_degree:
+                    continue
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    queue.append(target)
+
+        if len(order) != len(nodes):
+            cycle_nodes = sorted(node for node, degree in in_degree.items() if degree > 0)
+            raise EmissionGraphCycleError(cycle_nodes)
+        return order
+
+    # ============================================================================
+    # 🧮 배출량 계산
+    # ============================================================================
+
+    def compute(
+        self,
+        order: Optional[List[NodeKey]] = None,
+        known_process_cumulative: Optional[Dict[int, float]] = None,
+        known_product_emission: Optional[Dict[int, float]] = None,
+        reset_products: Optional[Iterable[int]] = None
+    ) -> Dict[str, Any]:
+        """
+        위상 정렬 순서대로 한 번에 누적 배출량을 계산합니다.
+
+        order에 포함되지 않은 선행 노드의 값은 known_* 값(DB 저장값)을 사용합니다.
+        reset_products: produce 엣지가 바뀐 제품 (생산 공정이 더 없으면 배출량을 0으로 초기화)
+        """
+        if order is None:
+            order = self.topological_order()
+
+        process_cumulative: Dict[int, float] = dict(known_process_cumulative or {})
+        product_emission: Dict[int, float] = dict(known_product_emission or {})
+        consumption_updates: Dict[Tuple[int, int], float] = {}
+        produced: Set[int] = set()
+        reset = set(reset_products or ())
+
+        for node_type, node_id in order:
+            if node_type == PROCESS:
+                total = self.process_attrdir.get(node_id, 0.0)
+                for (source_type, source_id), kind in self.predecessors.get((node_type, node_id), []):
+                    if kind == 'continue' and source_type == PROCESS:
+                        total += process_cumulative.get(source_id, 0.0)
+                    elif kind == 'consume' and source_type == PRODUCT:
+                        total += self._consumed_emission(source_id, node_id, product_emission)
+                process_cumulative[node_id] = total
+
+                # consume 엣지의 원료 투입량 할당 (target.mat_amount)
+                for (source_type, source_id), kind in self.predecessors.get((node_type, node_id), []):
+                    if kind == 'consume' and source_type == PRODUCT:
+                        consumption_updates[(source_id, node_id)] = self._allocated_amount(source_id, node_id)
+
+            elif node_type == PRODUCT:
+                producers = [
+                    source_id for (source_type, source_id), kind in self.predecessors.get((node_type, node_id), [])
+                    if kind == 'produce' and source_type == PROCESS
+                ]
+                if not producers:
+                    if node_id in reset:
+                        # 마지막 생산 공정 연결이 끊긴 제품
+                        product_emission[node_id] = 0.0
+                        produced.add(node_id)
+                        continue
+                    # 생산 공정이 연결된 적 없는 제품은 기존 배출량을 유지
+                    product = self.products.get(node_id)
+                    product_emission.setdefault(node_id, product['attr_em'] if product else 0.0)
+                    continue
+                product_emission[node_id] = sum(process_cumulative.get(source_id, 0.0) for source_id in producers)
+                produced.add(node_id)
+
+        computed = set(order)
+        return {
+            'process_cumulative': {
+                node_id: value for node_id, value in process_cumulative.items()
+                if (PROCESS, node_id) in computed
+            },
+            'product_emission': {
+                node_id: value for node_id, value in product_emission.items()
+                if node_id in produced
+            },
+            'consumption_updates': consumption_updates
+        }
+
+    def _consumers_of(self, product_id: int) -> Iterable[int]:
+        for (target_type, target_id), kind in self.successors.get((PRODUCT, product_id), []):
+            if kind == 'consume' and target_type == PROCESS:
+                yield target_id
+
+    def _consumed_emission(self, product_id: int, process_id: int, product_emission: Dict[int, float]) -> float:
+        """제품 배출량 중 해당 공정이 소비한 만큼의 전구물질 배출량"""
+        product = self.products.get(product_id)
+        if not product or product['product_amount'] <= 0:
+            return 0.0
+        consumption_amount = self.consumption.get((product_id, process_id), 0.0)
+        return product_emission.get(product_id, product['attr_em']) * (consumption_amount / product['product_amount'])
+
+    def _allocated_amount(self, product_id: int, process_id: int) -> float:
+        """to_next_process를 소비량 비율로 분배한 값"""
+        product = self.products.get(product_id)
+        if not product:
+            return 0.0
+        to_next_process = product['product_amount'] - product['product_sell'] - product['product_eusell']
+        if product_id not in self._total_consumption:
+            self._total_consumption[product_id] = sum(
+                self.consumption.get((product_id, consumer), 0.0) for consumer in self._consumers_of(product_id)
+            )
+        total_consumption = self._total_consumption[product_id]
+        if total_consumption <= 0:
+            return 0.0
+        return to_next_process * (self.consumption.get((product_id, process_id), 0.0) / total_consumption)
@@ -6,7 +6,9 @@ import os
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import asyncpg
+from app.common.database_pool import get_domain_pool
+from app.common.report_cache import report_cache
+from app.common.graph_topology import GraphTopologyCache, NodeKey, topology_cache
 
 logger = logging.getLogger(__name__)
 
@@ -35,16 +37,8 @@ class EdgeRepository:
         self._initialization_attempted = True
         
         try:
-            self.pool = await asyncpg.create_pool(
-                self.database_url,
-                min_size=1,
-                max_size=10,
-                command_timeout=30,
-                server_settings={
-                    'application_name': 'cbam-service-edge'
-                }
-            )
-            logger.info("✅ Edge 데이터베이스 연결 풀 생성 성공")
+            self.pool = await get_domain_pool('edge')
+            logger.info("✅ Edge 공용 연결 풀 연결 성공")
             
             # 테이블 생성은 선택적으로 실행
             try:
@@ -143,10 +137,15 @@ class EdgeRepository:
                     edge_data['edge_kind']
                 )
                 
-                if row:
-                    logger.info(f"✅ 엣지 생성 성공: ID {row['id']}")
-                    return dict(row)
-                return None
+                if not row:
+                    return None
+                install_ids = await report_cache.installs_for_edges(conn, [dict(row)])
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            topology_cache.apply_edge_created(dict(row))
+            logger.info(f"✅ 엣지 생성 성공: ID {row['id']}")
+            return dict(row)
                 
         except Exception as e:
             logger.error(f"❌ 엣지 생성 실패: {str(e)}")
@@ -212,12 +211,22 @@ class EdgeRepository:
                 """
                 
                 params = [edge_id] + list(update_data.values())
+                previous_row = await conn.fetchrow(
+                    "SELECT source_node_type, source_id, target_node_type, target_id FROM edge WHERE id = $1", edge_id
+                )
                 row = await conn.fetchrow(query, *params)
                 
-                if row:
-                    logger.info(f"✅ 엣지 {edge_id} 수정 성공")
-                    return dict(row)
-                return None
+                if not row:
+                    return None
+                install_ids = await report_cache.installs_for_edges(
+                    conn, [dict(row), dict(previous_row) if previous_row else None]
+                )
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            topology_cache.apply_edge_updated(dict(row))
+            logger.info(f"✅ 엣지 {edge_id} 수정 성공")
+            return dict(row)
                 
         except Exception as e:
             logger.error(f"❌ 엣지 {edge_id} 수정 실패: {str(e)}")
@@ -229,13 +238,21 @@ class EdgeRepository:
             await self._ensure_pool_initialized()
             
             async with self.pool.acquire() as conn:
-                query = "DELETE FROM edge WHERE id = $1"
-                result = await conn.execute(query, edge_id)
+                query = """
+                    DELETE FROM edge WHERE id = $1
+                    RETURNING source_node_type, source_id, target_node_type, target_id
+                """
+                row = await conn.fetchrow(query, edge_id)
                 
-                if result == "DELETE 1":
-                    logger.info(f"✅ 엣지 {edge_id} 삭제 성공")
-                    return True
-                return False
+                if not row:
+                    return False
+                install_ids = await report_cache.installs_for_edges(conn, [dict(row)])
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            topology_cache.apply_edge_deleted(edge_id)
+            logger.info(f"✅ 엣지 {edge_id} 삭제 성공")
+            return True
                 
         except Exception as e:
             logger.error(f"❌ 엣지 {edge_id} 삭제 실패: {str(e)}")
@@ -250,6 +267,9 @@ class EdgeRepository:
         try:
             await self._ensure_pool_initialized()
             
+            if await topology_cache.ensure_loaded(self.pool):
+                return topology_cache.edges({edge_kind})
+            
             async with self.pool.acquire() as conn:
                 query = """
                     SELECT id, source_node_type, source_id, target_node_type, target_id, edge_kind, created_at, updated_at
@@ -270,6 +290,9 @@ class EdgeRepository:
         try:
             await self._ensure_pool_initialized()
             
+            if await topology_cache.ensure_loaded(self.pool):
+                return topology_cache.edges_by_node_id(node_id)
+            
             async with self.pool.acquire() as conn:
                 query = """
                     SELECT id, source_node_type, source_id, target_node_type, target_id, edge_kind, created_at, updated_at
@@ -285,6 +308,55 @@ class EdgeRepository:
             logger.error(f"❌ 노드별 엣지 조회 실패: {str(e)}")
             return []
     
+    async def get_topology(self) -> Optional[GraphTopologyCache]:
+        """적재된 그래프 토폴로지 캐시 (사용할 수 없으면 None)"""
+        await self._ensure_pool_initialized()
+        if await topology_cache.ensure_loaded(self.pool):
+            return topology_cache
+        return None
+    
+    async def get_edge_summary_from_db(self) -> Dict[str, Any]:
+        """엣지 종류별 개수와 연결된 노드 수를 DB에서 직접 집계 (토폴로지 캐시를 쓸 수 없을 때)"""
+        await self._ensure_pool_initialized()
+        
+        async with self.pool.acquire() as conn:
+            kind_rows = await conn.fetch("""
+                SELECT edge_kind, COUNT(*) AS edge_count
+                FROM edge
+                GROUP BY edge_kind
+            """)
+            node_rows = await conn.fetch("""
+                SELECT node_type, COUNT(*) AS node_count
+                FROM (
+                    SELECT source_node_type AS node_type, source_id AS node_id FROM edge
+                    UNION
+                    SELECT target_node_type, target_id FROM edge
+                ) nodes
+                GROUP BY node_type
+            """)
+        
+        edges_by_kind = {row['edge_kind']: row['edge_count'] for row in kind_rows}
+        return {
+            "edges": sum(edges_by_kind.values()),
+            "edges_by_kind": edges_by_kind,
+            "nodes_by_type": {row['node_type']: row['node_count'] for row in node_rows}
+        }
+    
+    # ============================================================================
+    # 🔄 순환 참조 검증
+    # ============================================================================
+    
+    async def find_cycle_path(
+        self,
+        source: NodeKey,
+        target: NodeKey,
+        edge_kinds: Optional[List[str]] = None,
+        ignore_edge_id: Optional[int] = None
+    ) -> Optional[List[NodeKey]]:
+        """source→target 엣지를 추가하면 생기는 순환 경로 (없으면 None)"""
+        await self._ensure_pool_initialized()
+        return await topology_cache.find_cycle_path(self.pool, source, target, edge_kinds, ignore_edge_id)
+    
     # ============================================================================
     # 🔗 배출량 전파 관련 메서드들
     # ============================================================================
@@ -323,6 +395,12 @@ class EdgeRepository:
         try:
             await self._ensure_pool_initialized()
             
+            if await topology_cache.ensure_loaded(self.pool):
+                return [
+                    {key: edge[key] for key in ('id', 'source_node_type', 'source_id', 'target_node_type', 'target_id', 'edge_kind')}
+                    for edge in topology_cache.out_edges(('process', source_process_id), {'continue'})
+                ]
+            
             async with self.pool.acquire() as conn:
                 query = """
                     SELECT id, source_node_type, source_id, target_node_type, target_id, edge_kind
@@ -375,6 +453,13 @@ class EdgeRepository:
         try:
             await self._ensure_pool_initialized()
             
+            if await topology_cache.ensure_loaded(self.pool):
+                producers = topology_cache.in_edges(('product', product_id), {'produce'})
+                return [
+                    {'process_id': edge['source_id'], 'edge_kind': edge['edge_kind']}
+                    for edge in sorted(producers, key=lambda edge: edge['source_id'])
+                ]
+            
             async with self.pool.acquire() as conn:
                 query = """
                     SELECT e.source_id as process_id, e.edge_kind
@@ -447,6 +532,10 @@ class EdgeRepository:
         try:
             await self._ensure_pool_initialized()
             
+            # 소비 엣지가 없으면 제품/소비량 조회 없이 바로 반환
+            if await topology_cache.ensure_loaded(self.pool) and not topology_cache.out_edges(('product', product_id), {'consume'}):
+                return []
+            
             async with self.pool.acquire() as conn:
                 # 제품의 to_next_process 계산
                 product_query = """
@@ -498,7 +587,6 @@ class EdgeRepository:
                 
                 if result == "UPDATE 1":
                     logger.info(f"공정 {process_id}의 제품 {product_id} 투입량 업데이트 성공: {amount}")
-                    return True
                 else:
                     logger.warning(f"공정 {process_id}의 제품 {product_id} 관계가 없어 새로 생성합니다")
                     # 관계가 없으면 새로 생성
@@ -508,8 +596,191 @@ class EdgeRepository:
                     """
                     
                     await conn.execute(insert_query, process_id, product_id, amount)
-                    return True
+                
+                # 보고서 캐시 무효화 대상 (소비량은 보고서에 포함됨)
+                install_ids = await report_cache.installs_for_nodes(conn, product_ids=[product_id])
+            
+            await report_cache.invalidate_resolved(install_ids)
+            return True
                     
         except Exception as e:
             logger.error(f"공정 {process_id}의 제품 {product_id} 투입량 업데이트 실패: {str(e)}")
             return False
+    
+    # ============================================================================
+    # 🧮 그래프 엔진용 일괄 조회/저장
+    # ============================================================================
+    
+    async def get_emission_graph_snapshot(
+        self,
+        extra_process_ids: Optional[List[int]] = None,
+        extra_product_ids: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """
+        배출량 그래프 계산에 필요한 엣지/공정/제품/소비량 데이터를 일괄 조회합니다.
+        
+        extra_*_ids: 엣지가 없어도 데이터를 함께 조회할 노드 (엣지 삭제로 고립된 노드 등)
+        """
+        await self._ensure_pool_initialized()
+        
+        async with self.pool.acquire() as conn:
+            edge_rows = await conn.fetch("""
+                SELECT id, source_node_type, source_id, target_node_type, target_id, edge_kind
+                FROM edge
+                ORDER BY id
+            """)
+            return await self._load_graph_snapshot(
+                conn, [dict(row) for row in edge_rows], extra_process_ids, extra_product_ids
+            )
+    
+    async def get_downstream_graph_snapshot(self, start_nodes: List[NodeKey]) -> Dict[str, Any]:
+        """
+        시작 노드들의 하류 부분 그래프만 조회합니다 (증분 전파용).
+        
+        재귀 CTE로 하류 노드 집합을 구하고, 다음 엣지만 읽습니다.
+        - 하류 노드로 들어오는 엣지 (하류 밖 선행 노드는 DB 저장값을 사용)
+        - 그 엣지의 원천 제품이 가진 consume 엣지 (소비량 비율 분배용)
+        """
+        await self._ensure_pool_initialized()
+        
+        async with self.pool.acquire() as conn:
+            edge_rows = await conn.fetch("""
+                WITH RECURSIVE downstream(node_type, node_id) AS (
+                    SELECT * FROM unnest($1::text[], $2::bigint[])
+                    UNION
+                    SELECT e.target_node_type::text, e.target_id::bigint
+                    FROM edge e
+                    JOIN downstream d ON e.source_node_type = d.node_type AND e.source_id = d.node_id
+                ),
+                incoming AS (
+                    SELECT e.id, e.source_node_type, e.source_id, e.target_node_type, e.target_id, e.edge_kind
+                    FROM edge e
+                    JOIN downstream d ON e.target_node_type = d.node_type AND e.target_id = d.node_id
+                )
+                SELECT * FROM incoming
+                UNION
+                SELECT e.id, e.source_node_type, e.source_id, e.target_node_type, e.target_id, e.edge_kind
+                FROM edge e
+                WHERE e.edge_kind = 'consume'
+                  AND e.source_node_type = 'product'
+                  AND e.source_id IN (SELECT source_id FROM incoming WHERE source_node_type = 'product')
+                ORDER BY id
+            """, [node_type for node_type, _ in start_nodes], [node_id for _, node_id in start_nodes])
+            return await self._load_graph_snapshot(
+                conn,
+                [dict(row) for row in edge_rows],
+                [node_id for node_type, node_id in start_nodes if node_type == 'process'],
+                [node_id for node_type, node_id in start_nodes if node_type == 'product']
+            )
+    
+    async def _load_graph_snapshot(
+        self,
+        conn,
+        edges: List[Dict[str, Any]],
+        extra_process_ids: Optional[List[int]] = None,
+        extra_product_ids: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """엣지 목록에 등장하는 노드의 배출량/제품/소비량 데이터 조회"""
+        process_ids = sorted({
+            row[f'{side}_id'] for row in edges for side in ('source', 'target')
+            if row[f'{side}_node_type'] == 'process'
+        } | set(extra_process_ids or []))
+        product_ids = sorted({
+            row[f'{side}_id'] for row in edges for side in ('source', 'target')
+            if row[f'{side}_node_type'] == 'product'
+        } | set(extra_product_ids or []))
+        
+        emission_rows = await conn.fetch("""
+            SELECT process_id, attrdir_em, cumulative_emission
+            FROM process_attrdir_emission
+            WHERE process_id = ANY($1::bigint[])
+        """, process_ids)
+        
+        product_rows = await conn.fetch("""
+            SELECT id, product_amount, product_sell, product_eusell, attr_em
+            FROM product
+            WHERE id = ANY($1::bigint[])
+        """, product_ids)
+        
+        consumption_rows = await conn.fetch("""
+            SELECT product_id, process_id, COALESCE(consumption_amount, 0) AS consumption_amount
+            FROM product_process
+            WHERE product_id = ANY($1::bigint[])
+        """, product_ids)
+        
+        return {
+            'edges': edges,
+            'process_attrdir': {
+                row['process_id']: float(row['attrdir_em']) if row['attrdir_em'] else 0.0
+                for row in emission_rows
+            },
+            'process_cumulative': {
+                row['process_id']: float(row['cumulative_emission']) if row['cumulative_emission'] else 0.0
+                for row in emission_rows
+            },
+            'products': {
+                row['id']: {
+                    'product_amount': float(row['product_amount']) if row['product_amount'] else 0.0,
+                    'product_sell': float(row['product_sell']) if row['product_sell'] else 0.0,
+                    'product_eusell': float(row['product_eusell']) if row['product_eusell'] else 0.0,
+                    'attr_em': float(row['attr_em']) if row['attr_em'] else 0.0
+                }
+                for row in product_rows
+            },
+            'consumption': {
+                (row['product_id'], row['process_id']): float(row['consumption_amount'])
+                for row in consumption_rows
+            }
+        }
+    
+    async def save_emission_graph_results(
+        self,
+        process_cumulative: Dict[int, float],
+        product_emission: Dict[int, float],
+        consumption_updates: Dict[Any, float]
+    ) -> None:
+        """그래프 엔진 계산 결과를 한 트랜잭션에서 일괄 저장합니다."""
+        await self._ensure_pool_initialized()
+        
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                if process_cumulative:
+                    await conn.execute("""
+                        INSERT INTO process_attrdir_emission (process_id, cumulative_emission, calculation_date)
+                        SELECT v.process_id, v.cumulative_emission, NOW()
+                        FROM unnest($1::bigint[], $2::numeric[]) AS v(process_id, cumulative_emission)
+                        ON CONFLICT (process_id) DO UPDATE SET
+                            cumulative_emission = EXCLUDED.cumulative_emission,
+                            calculation_date = NOW(),
+                            updated_at = NOW()
+                    """, list(process_cumulative.keys()), list(process_cumulative.values()))
+                
+                if product_emission:
+                    await conn.execute("""
+                        UPDATE product p
+                        SET attr_em = v.attr_em, updated_at = NOW()
+                        FROM unnest($1::bigint[], $2::numeric[]) AS v(id, attr_em)
+                        WHERE p.id = v.id
+                    """, list(product_emission.keys()), list(product_emission.values()))
+                
+                if consumption_updates:
+                    keys = list(consumption_updates.keys())
+                    await conn.execute("""
+                        INSERT INTO product_process (product_id, process_id, consumption_amount)
+                        SELECT v.product_id, v.process_id, v.consumption_amount
+                        FROM unnest($1::bigint[], $2::bigint[], $3::numeric[]) AS v(product_id, process_id, consumption_amount)
+                        ON CONFLICT (product_id, process_id) DO UPDATE SET
+                            consumption_amount = EXCLUDED.consumption_amount,
+                            updated_at = NOW()
+                    """, [key[0] for key in keys], [key[1] for key in keys], list(consumption_updates.values()))
+                
+                # 보고서가 읽는 제품/소비량이 바뀐 사업장
+                install_ids = await report_cache.installs_for_nodes(
+                    conn, product_ids=set(product_emission) | {key[0] for key in consumption_updates}
+                )
+        
+        await report_cache.invalidate_resolved(install_ids)
+        logger.info(
+            f"✅ 그래프 배출량 일괄 저장 완료: 공정 {len(process_cumulative)}개, "
+            f"제품 {len(product_emission)}개, 소비량 {len(consumption_updates)}개"
+        )
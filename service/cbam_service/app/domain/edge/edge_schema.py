@@ -3,7 +3,7 @@
 # ============================================================================
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Dict, Any
 from datetime import datetime
 
 class EdgeCreateRequest(BaseModel):
@@ -36,6 +36,7 @@ class EdgeResponse(BaseModel):
     edge_kind: str = Field(..., description="엣지 종류")
     created_at: Optional[datetime] = Field(None, description="생성일")
     updated_at: Optional[datetime] = Field(None, description="수정일")
+    propagation_result: Optional[Dict[str, Any]] = Field(None, description="엣지 변경 후 배출량 전파 결과")
     
     class Config:
         from_attributes = True
@@ -3,13 +3,17 @@
 # ============================================================================
 
 import logging
+import os
+import time
 from typing import Dict, List, Any, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 
 from app.domain.edge.edge_repository import EdgeRepository
+from app.domain.edge.edge_graph import EmissionGraph, EmissionGraphCycleError
 from app.domain.edge.edge_schema import EdgeResponse
+from app.common.graph_topology import CircularEdgeError, TopologyUnavailableError, node_key, topology_cache
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +22,8 @@ class EdgeService:
     
     def __init__(self, db: Session):
         self.repository = EdgeRepository(db)
+        # 엣지 변경 시 배출량 전파 방식: incremental(하류 그래프만) | full(전체 그래프)
+        self.propagation_mode = os.getenv("EDGE_PROPAGATION_MODE", "incremental").lower()
         logger.info("✅ Edge Service 초기화 완료")
     
     async def initialize(self):
@@ -239,52 +245,65 @@ class EdgeService:
             logger.error(f"제품 {source_product_id} → 공정 {target_process_id} 배출량 전달 실패: {e}")
             return False
     
-    async def propagate_emissions_full_graph(self) -> Dict[str, Any]:
-        """전체 그래프에 대해 배출량 전파를 실행합니다."""
+    async def propagate_emissions_full_graph(self, touched_nodes: Optional[List[Tuple[str, int]]] = None) -> Dict[str, Any]:
+        """
+        전체 그래프에 대해 배출량 전파를 실행합니다.
+        
+        엣지/배출량/제품/소비량을 일괄 조회해 메모리 그래프를 만들고,
+        위상 정렬 순서로 한 번에 계산한 뒤 결과를 일괄 저장합니다.
+        touched_nodes: 변경된 엣지의 타겟 노드 (생산 공정이 모두 끊긴 제품은 0으로 초기화)
+        """
         try:
             logger.info("🔄 전체 그래프 배출량 전파 시작")
+            started_at = time.perf_counter()
             
-            # 모든 엣지를 조회
-            all_edges = await self.repository.get_edges()
+            touched = [(node_type, int(node_id)) for node_type, node_id in (touched_nodes or [])]
+            touched_products = [node_id for node_type, node_id in touched if node_type == 'product']
+            snapshot = await self.repository.get_emission_graph_snapshot(extra_product_ids=touched_products)
+            graph = EmissionGraph.from_snapshot(snapshot)
+            for node in touched:
+                graph.add_node(node)
             
-            if not all_edges:
+            if graph.edge_count == 0 and not touched_products:
                 logger.info("전체 그래프에 엣지가 없습니다.")
                 return {'success': True, 'message': '전체 그래프에 엣지가 없습니다.'}
             
-            # 엣지 종류별로 분류
-            continue_edges = [edge for edge in all_edges if edge['edge_kind'] == 'continue']
-            produce_edges = [edge for edge in all_edges if edge['edge_kind'] == 'produce']
-            consume_edges = [edge for edge in all_edges if edge['edge_kind'] == 'consume']
+            edge_counts = {'continue': 0, 'produce': 0, 'consume': 0}
+            for edge in snapshot['edges']:
+                if edge['edge_kind'] in edge_counts:
+                    edge_counts[edge['edge_kind']] += 1
             
-            logger.info(f"전체 그래프 엣지 분류: continue={len(continue_edges)}, produce={len(produce_edges)}, consume={len(consume_edges)}")
+            logger.info(f"전체 그래프 엣지 분류: continue={edge_counts['continue']}, produce={edge_counts['produce']}, consume={edge_counts['consume']}")
             
-            # 1. continue 엣지들 처리 (공정→공정)
-            for edge in continue_edges:
-                success = await self.propagate_emissions_continue(edge['source_id'], edge['target_id'])
-                if not success:
-                    logger.warning(f"continue 엣지 {edge['id']} 처리 실패")
-            
-            # 2. produce 엣지들 처리 (공정→제품)
-            for edge in produce_edges:
-                success = await self.propagate_emissions_produce(edge['source_id'], edge['target_id'])
-                if not success:
-                    logger.warning(f"produce 엣지 {edge['id']} 처리 실패")
-            
-            # 3. consume 엣지들 처리 (제품→공정)
-            for edge in consume_edges:
-                success = await self.propagate_emissions_consume(edge['source_id'], edge['target_id'])
-                if not success:
-                    logger.warning(f"consume 엣지 {edge['id']} 처리 실패")
-            
-            logger.info("✅ 전체 그래프 배출량 전파 완료")
+            try:
+                order = graph.topological_order()
+            except EmissionGraphCycleError as cycle_error:
+                logger.error(f"❌ 전체 그래프 배출량 전파 중단: {cycle_error}")
+                return {
+                    'success': False,
+                    'error': str(cycle_error),
+                    'message': '순환 참조로 인해 전체 그래프 배출량 전파를 중단했습니다',
+                    'cycle_nodes': [f"{node_type}_{node_id}" for node_type, node_id in cycle_error.cycle_nodes]
+                }
+            
+            results = graph.compute(order, reset_products=touched_products)
+            await self.repository.save_emission_graph_results(
+                results['process_cumulative'],
+                results['product_emission'],
+                results['consumption_updates']
+            )
+            
+            elapsed = time.perf_counter() - started_at
+            logger.info(f"✅ 전체 그래프 배출량 전파 완료: 노드 {len(order)}개 ({elapsed:.3f}s)")
             return {
                 'success': True,
                 'message': '전체 그래프 배출량 전파 완료',
-                'processed_edges': {
-                    'continue': len(continue_edges),
-                    'produce': len(produce_edges),
-                    'consume': len(consume_edges)
-                }
+                'processed_edges': edge_counts,
+                'processed_nodes': {
+                    'process': len(results['process_cumulative']),
+                    'product': len(results['product_emission'])
+                },
+                'elapsed_seconds': round(elapsed, 3)
             }
             
         except Exception as e:
@@ -295,48 +314,104 @@ class EdgeService:
                 'message': '전체 그래프 배출량 전파 실패'
             }
     
-    async def _detect_cycles(self, edges: List[Dict[str, Any]]) -> bool:
-        """순환 참조(사이클)를 감지합니다."""
+    async def propagate_emissions_incremental(self, touched_nodes: List[Tuple[str, int]]) -> Dict[str, Any]:
+        """
+        변경된 노드의 하류 노드들만 위상 정렬 순서로 재계산합니다.
+        
+        하류 부분 그래프(재귀 CTE)만 조회하며, 하류 집합 밖의 선행 노드 값은
+        DB에 저장된 누적 배출량을 그대로 사용합니다.
+        """
         try:
-            # 그래프 구성
-            graph = {}
-            for edge in edges:
-                source_key = f"{edge['source_node_type']}_{edge['source_id']}"
-                target_key = f"{edge['target_node_type']}_{edge['target_id']}"
-                
-                if source_key not in graph:
-                    graph[source_key] = []
-                graph[source_key].append(target_key)
-            
-            # DFS로 사이클 감지
-            visited = set()
-            rec_stack = set()
-            
-            def has_cycle_util(node):
-                visited.add(node)
-                rec_stack.add(node)
-                
-                for neighbor in graph.get(node, []):
-                    if neighbor not in visited:
-                        if has_cycle_util(neighbor):
-                            return True
-                    elif neighbor in rec_stack:
-                        return True
-                
-                rec_stack.remove(node)
-                return False
-            
-            for node in graph:
-                if node not in visited:
-                    if has_cycle_util(node):
-                        logger.error(f"순환 참조 발견: 노드 {node}")
-                        return True
+            started_at = time.perf_counter()
+            touched = [(node_type, int(node_id)) for node_type, node_id in touched_nodes]
+            logger.info(f"🔄 증분 배출량 전파 시작: 변경 노드 {touched}")
+            
+            snapshot = await self.repository.get_downstream_graph_snapshot(touched)
+            graph = EmissionGraph.from_snapshot(snapshot)
+            for node in touched:
+                graph.add_node(node)
+            
+            dirty = graph.downstream_closure(touched)
+            try:
+                order = graph.topological_order(dirty)
+            except EmissionGraphCycleError as cycle_error:
+                logger.error(f"❌ 증분 배출량 전파 중단: {cycle_error}")
+                return {
+                    'success': False,
+                    'error': str(cycle_error),
+                    'message': '순환 참조로 인해 증분 배출량 전파를 중단했습니다',
+                    'cycle_nodes': [f"{node_type}_{node_id}" for node_type, node_id in cycle_error.cycle_nodes]
+                }
             
-            return False
+            results = graph.compute(
+                order,
+                known_process_cumulative=snapshot['process_cumulative'],
+                known_product_emission={
+                    product_id: product['attr_em'] for product_id, product in snapshot['products'].items()
+                },
+                reset_products=[node_id for node_type, node_id in touched if node_type == 'product']
+            )
+            await self.repository.save_emission_graph_results(
+                results['process_cumulative'],
+                results['product_emission'],
+                results['consumption_updates']
+            )
+            
+            elapsed = time.perf_counter() - started_at
+            logger.info(f"✅ 증분 배출량 전파 완료: 노드 {len(order)}/{len(graph.nodes)}개 재계산 ({elapsed:.3f}s)")
+            return {
+                'success': True,
+                'message': '증분 배출량 전파 완료',
+                'mode': 'incremental',
+                'recomputed_nodes': len(order),
+                'total_nodes': len(graph.nodes),
+                'processed_nodes': {
+                    'process': len(results['process_cumulative']),
+                    'product': len(results['product_emission'])
+                },
+                'elapsed_seconds': round(elapsed, 3)
+            }
             
         except Exception as e:
-            logger.error(f"순환 참조 감지 실패: {e}")
-            return False
+            logger.error(f"증분 배출량 전파 실패: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'message': '증분 배출량 전파 실패'
+            }
+    
+    async def _propagate_after_edge_change(self, edges: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """엣지 변경 후 배출량 전파 (EDGE_PROPAGATION_MODE=full 이면 전체 그래프 재계산)"""
+        # 엣지의 타겟 노드가 영향을 받는 하류 그래프의 시작점
+        touched_nodes = list(dict.fromkeys(
+            (edge['target_node_type'], edge['target_id']) for edge in edges if edge
+        ))
+        if self.propagation_mode == 'full':
+            logger.info("🔄 엣지 변경으로 인한 전체 그래프 배출량 전파 시작")
+            return await self.propagate_emissions_full_graph(touched_nodes)
+        
+        logger.info("🔄 엣지 변경으로 인한 증분 배출량 전파 시작")
+        return await self.propagate_emissions_incremental(touched_nodes)
+    
+    async def _validate_no_cycle(self, edge: Dict[str, Any], ignore_edge_id: Optional[int] = None):
+        """엣지를 추가/수정해도 순환 참조가 생기지 않는지 검증 (생기면 CircularEdgeError)"""
+        source = node_key(edge['source_node_type'], edge['source_id'])
+        target = node_key(edge['target_node_type'], edge['target_id'])
+        
+        # 배출량 그래프는 엣지 종류와 무관하게 위상 정렬하므로 모든 엣지 종류를 따라감
+        cycle_path = await self.repository.find_cycle_path(source, target, ignore_edge_id=ignore_edge_id)
+        if cycle_path:
+            raise CircularEdgeError(source, target, cycle_path)
+    
+    async def detect_cycles(self) -> List[Dict[str, Any]]:
+        """현재 그래프에서 순환에 걸린 노드 목록 (인접 인덱스 기준)"""
+        await self.repository._ensure_pool_initialized()
+        if not await topology_cache.ensure_loaded(self.repository.pool):
+            return []
+        cycle_nodes = topology_cache.find_cycle_nodes()
+        if cycle_nodes:
+            logger.error(f"순환 참조 발견: {len(cycle_nodes)}개 노드")
+        return [{'node_type': node_type, 'node_id': node_id} for node_type, node_id in cycle_nodes]
     
     async def create_edge(self, edge_data) -> Optional[EdgeResponse]:
         """엣지 생성 (Repository 패턴) - 엣지 생성 후 전체 그래프 재계산"""
@@ -352,6 +427,9 @@ class EdgeService:
                 'edge_kind': edge_data.edge_kind
             }
             
+            # 순환 참조 검증 (메모리 인접 인덱스, 추가 쿼리 없음)
+            await self._validate_no_cycle(edge_dict)
+            
             # Repository를 통해 엣지 생성
             result = await self.repository.create_edge(edge_dict)
             
@@ -359,15 +437,14 @@ class EdgeService:
                 logger.info(f"✅ 엣지 생성 완료: ID {result['id']}")
                 
                 try:
-                    # 엣지 생성 후 전체 그래프 배출량 전파 실행
-                    logger.info("🔄 엣지 변경으로 인한 전체 그래프 배출량 전파 시작")
-                    propagation_result = await self.propagate_emissions_full_graph()
+                    # 엣지 생성 후 배출량 전파 실행
+                    propagation_result = await self._propagate_after_edge_change([result])
                     
                     if propagation_result['success']:
-                        logger.info("✅ 전체 그래프 배출량 전파 완료")
+                        logger.info("✅ 배출량 전파 완료")
                         result['propagation_result'] = propagation_result
                     else:
-                        logger.warning(f"⚠️ 전체 그래프 배출량 전파 실패: {propagation_result.get('error', 'Unknown error')}")
+                        logger.warning(f"⚠️ 배출량 전파 실패: {propagation_result.get('error', 'Unknown error')}")
                         result['propagation_result'] = propagation_result
                         # 배출량 전파 실패는 엣지 생성을 실패시키지 않음 (경고만)
                         
@@ -429,21 +506,27 @@ class EdgeService:
             if edge_data.edge_kind is not None:
                 update_data['edge_kind'] = edge_data.edge_kind
             
+            # 수정 전 엣지 (기존 타겟 노드도 재계산 대상)
+            previous_edge = await self.repository.get_edge(edge_id)
+            
+            # 노드가 바뀌면 수정 후 엣지 기준으로 순환 참조 검증 (자기 자신은 제외)
+            if previous_edge and any(key in update_data for key in ('source_node_type', 'source_id', 'target_node_type', 'target_id')):
+                await self._validate_no_cycle({**previous_edge, **update_data}, ignore_edge_id=edge_id)
+            
             # Repository를 통해 엣지 수정
             result = await self.repository.update_edge(edge_id, update_data)
             
             if result:
                 logger.info(f"✅ 엣지 {edge_id} 수정 완료")
                 
-                # 엣지 수정 후 전체 그래프 배출량 전파 실행
-                logger.info("🔄 엣지 변경으로 인한 전체 그래프 배출량 전파 시작")
-                propagation_result = await self.propagate_emissions_full_graph()
+                # 엣지 수정 후 배출량 전파 실행
+                propagation_result = await self._propagate_after_edge_change([previous_edge, result])
                 
                 if propagation_result['success']:
-                    logger.info("✅ 전체 그래프 배출량 전파 완료")
+                    logger.info("✅ 배출량 전파 완료")
                     result['propagation_result'] = propagation_result
                 else:
-                    logger.warning(f"⚠️ 전체 그래프 배출량 전파 실패: {propagation_result.get('error', 'Unknown error')}")
+                    logger.warning(f"⚠️ 배출량 전파 실패: {propagation_result.get('error', 'Unknown error')}")
                     result['propagation_result'] = propagation_result
                 
                 return EdgeResponse(**result)
@@ -462,20 +545,22 @@ class EdgeService:
         try:
             logger.info(f"엣지 {edge_id} 삭제 시작")
             
+            # 삭제 전 엣지 (타겟 노드가 재계산 대상)
+            deleted_edge = await self.repository.get_edge(edge_id)
+            
             # Repository를 통해 엣지 삭제
             success = await self.repository.delete_edge(edge_id)
             
             if success:
                 logger.info(f"✅ 엣지 {edge_id} 삭제 완료")
                 
-                # 엣지 삭제 후 전체 그래프 배출량 전파 실행
-                logger.info("🔄 엣지 변경으로 인한 전체 그래프 배출량 전파 시작")
-                propagation_result = await self.propagate_emissions_full_graph()
+                # 엣지 삭제 후 배출량 전파 실행
+                propagation_result = await self._propagate_after_edge_change([deleted_edge])
                 
                 if propagation_result['success']:
-                    logger.info("✅ 전체 그래프 배출량 전파 완료")
+                    logger.info("✅ 배출량 전파 완료")
                 else:
-                    logger.warning(f"⚠️ 전체 그래프 배출량 전파 실패: {propagation_result.get('error', 'Unknown error')}")
+                    logger.warning(f"⚠️ 배출량 전파 실패: {propagation_result.get('error', 'Unknown error')}")
                 
                 return True
             else:
@@ -510,6 +595,41 @@ class EdgeService:
             logger.error(f"노드별 엣지 조회 실패: {e}")
             return []
     
+    # ============================================================================
+    # 🕸️ 그래프 토폴로지 조회 (메모리 캐시)
+    # ============================================================================
+    
+    async def get_edge_summary(self) -> Dict[str, Any]:
+        """엣지 통계 요약 (토폴로지 캐시를 쓸 수 없으면 DB에서 직접 집계, topology는 None)"""
+        topology = await self.repository.get_topology()
+        if topology is not None:
+            counts = topology.get_summary()
+            source = "topology_cache"
+        else:
+            counts = await self.repository.get_edge_summary_from_db()
+            source = "database"
+        return {
+            "total_edges": counts["edges"],
+            "edge_types": counts["edges_by_kind"],
+            "unique_nodes": sum(counts["nodes_by_type"].values()),
+            "source": source,
+            "topology": counts if topology is not None else None
+        }
+    
+    async def get_topology_adjacency(self, node_type: Optional[str] = None) -> Dict[str, Any]:
+        """노드 타입별 정방향/역방향 인접 리스트"""
+        topology = await self.repository.get_topology()
+        if topology is None:
+            raise TopologyUnavailableError()
+        return {"version": topology.version, "node_type": node_type, **topology.adjacency(node_type)}
+    
+    async def get_node_topology(self, node_type: str, node_id: int) -> Dict[str, Any]:
+        """노드 하나의 진입/진출 차수, 이웃 엣지, 연결 요소"""
+        topology = await self.repository.get_topology()
+        if topology is None:
+            raise TopologyUnavailableError()
+        return {"version": topology.version, **topology.node_summary(node_key(node_type, node_id))}
+    
     # ============================================================================
     # 🔄 전체 그래프 배출량 전파 메서드들
     # ============================================================================
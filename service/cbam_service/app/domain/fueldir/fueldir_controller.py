@@ -4,16 +4,17 @@
 
 from fastapi import APIRouter, HTTPException
 import logging
-from typing import List
+from typing import List, Dict, Any
 import time
 
-from app.domain.fueldir.fueldir_service import FuelDirService
+from app.common.dependencies import get_fueldir_service
 from app.domain.fueldir.fueldir_schema import (
     FuelDirCreateRequest, 
     FuelDirUpdateRequest, 
     FuelDirResponse,
     FuelDirCalculationRequest,
     FuelDirCalculationResponse,
+    FuelDirBatchCalculationRequest,
     FuelMasterSearchRequest,
     FuelMasterResponse,
     FuelMasterListResponse,
@@ -25,8 +26,8 @@ logger = logging.getLogger(__name__)
 # Gateway를 통해 접근하므로 prefix 제거 (경로 중복 방지)
 router = APIRouter(tags=["Fuel Directory"])
 
-# 서비스 인스턴스 생성
-fueldir_service = FuelDirService()
+# 서비스 인스턴스 (애플리케이션 수명 싱글톤)
+fueldir_service = get_fueldir_service()
 
 # ============================================================================
 # 📦 기존 FuelDir 관련 엔드포인트
@@ -120,6 +121,19 @@ async def calculate_fueldir_emission(calculation_data: FuelDirCalculationRequest
         logger.error(f"❌ 연료직접배출량 계산 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"연료직접배출량 계산 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/calculate/batch", response_model=Dict[str, Any])
+async def calculate_fueldir_emission_batch(request: FuelDirBatchCalculationRequest):
+    """연료직접배출량 일괄 계산 (배출계수 자동 조회, 공정별 합계 포함)"""
+    try:
+        logger.info(f"🧮 연료직접배출량 일괄 계산 요청: {len(request.items)}건 (mode={request.mode}, verify={request.verify})")
+        result = await fueldir_service.calculate_fueldir_emission_batch(request)
+        summary = result["summary"]
+        logger.info(f"✅ 연료직접배출량 일괄 계산 성공: {summary['calculated_count']}/{summary['total_items']}건, 공정 {summary['process_count']}개")
+        return result
+    except Exception as e:
+        logger.error(f"❌ 연료직접배출량 일괄 계산 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"연료직접배출량 일괄 계산 중 오류가 발생했습니다: {str(e)}")
+
 @router.get("/process/{process_id}/total")
 async def get_total_fueldir_emission_by_process(process_id: int):
     """특정 공정의 총 연료직접배출량 계산"""
@@ -224,26 +238,15 @@ async def search_fueldirs_by_fuel_name(fuel_name: str, skip: int = 0, limit: int
 # ============================================================================
 
 @router.post("/bulk")
-async def create_fueldirs_bulk(fueldirs_data: List[FuelDirCreateRequest]):
-    """여러 연료직접배출량 데이터 일괄 생성"""
+async def create_fueldirs_bulk(fueldirs_data: List[FuelDirCreateRequest], include_results: bool = True):
+    """여러 연료직접배출량 데이터 일괄 생성/수정 (한 문장 업서트, 행별 오류 보고)"""
     try:
         logger.info(f"📦 연료직접배출량 일괄 생성 요청: {len(fueldirs_data)}개")
-        results = []
-        
-        for fueldir_data in fueldirs_data:
-            try:
-                result = await fueldir_service.create_fueldir(fueldir_data)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"❌ 개별 연료직접배출량 생성 실패: {str(e)}")
-                # 개별 실패는 전체 실패로 처리하지 않음
-        
-        logger.info(f"✅ 연료직접배출량 일괄 생성 완료: {len(results)}/{len(fueldirs_data)}개 성공")
+        result = await fueldir_service.create_fueldirs_bulk(fueldirs_data, include_results)
+        logger.info(f"✅ 연료직접배출량 일괄 생성 완료: {result['success_count']}/{result['total_count']}개 성공")
         return {
-            "message": f"일괄 생성 완료: {len(results)}/{len(fueldirs_data)}개 성공",
-            "success_count": len(results),
-            "total_count": len(fueldirs_data),
-            "results": results
+            "message": f"일괄 생성 완료: {result['success_count']}/{result['total_count']}개 성공",
+            **result
         }
         
     except Exception as e:
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from typing import Optional, List, Literal
 from decimal import Decimal
 from datetime import datetime
 
@@ -46,6 +46,21 @@ class FuelDirCalculationRequest(BaseModel):
             return Decimal(v)
         return v
 
+class FuelDirBatchCalculationItem(BaseModel):
+    """연료직접배출량 일괄 계산 항목"""
+    process_id: int = Field(..., description="공정 ID")
+    fuel_name: str = Field(..., min_length=1, max_length=255, description="투입된 연료명")
+    fuel_amount: Decimal = Field(..., ge=0, description="투입된 연료량")
+    fuel_factor: Optional[Decimal] = Field(None, ge=0, description="배출계수 (없으면 fuel_master에서 조회)")
+    fuel_oxyfactor: Optional[Decimal] = Field(default=Decimal('1.0000'), ge=0, description="산화계수 (기본값: 1.0000)")
+
+class FuelDirBatchCalculationRequest(BaseModel):
+    """연료직접배출량 일괄 계산 요청"""
+    items: List[FuelDirBatchCalculationItem] = Field(..., min_length=1, max_length=100000, description="계산할 연료 투입 목록")
+    mode: Literal["fixed", "float", "decimal"] = Field("fixed", description="계산 모드 (fixed: int64 고정소수점, float: float64, decimal: Decimal 정확 계산)")
+    verify: bool = Field(False, description="Decimal 정확 계산과 비교한 검증 결과 포함")
+    include_items: bool = Field(True, description="행별 계산 결과 포함 (false면 공정별 합계만)")
+
 # ============================================================================
 # 📤 기존 응답 스키마
 # ============================================================================
@@ -9,10 +9,12 @@ from decimal import Decimal
 from app.domain.fueldir.fueldir_repository import FuelDirRepository
 from app.domain.fueldir.fueldir_schema import (
     FuelDirCreateRequest, FuelDirResponse, FuelDirUpdateRequest, 
-    FuelDirCalculationRequest, FuelDirCalculationResponse,
+    FuelDirCalculationRequest, FuelDirCalculationResponse, FuelDirBatchCalculationRequest,
     FuelMasterSearchRequest, FuelMasterResponse, 
     FuelMasterListResponse, FuelMasterFactorResponse
 )
+from app.common.emission_batch import EmissionBatchRow, calculate_emission_batch, names_needing_factor
+from app.common.direct_emission_bulk import DirectEmissionBulkRow
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,15 @@ class FuelDirService:
         self.fueldir_repository = FuelDirRepository()
         logger.info("✅ FuelDir 서비스 초기화 완료")
     
+    async def initialize(self):
+        """데이터베이스 연결 초기화"""
+        try:
+            await self.fueldir_repository.initialize()
+            logger.info("✅ FuelDir 서비스 데이터베이스 연결 초기화 완료")
+        except Exception as e:
+            logger.warning(f"⚠️ FuelDir 서비스 데이터베이스 초기화 실패 (서비스는 계속 실행): {e}")
+            logger.info("ℹ️ 데이터베이스 연결은 필요할 때 자동으로 초기화됩니다.")
+    
     # ============================================================================
     # 📦 기존 FuelDir 관련 메서드들
     # ============================================================================
@@ -181,6 +192,45 @@ class FuelDirService:
             logger.error(f"Error calculating fueldir emission with formula: {e}")
             raise e
 
+    async def calculate_fueldir_emission_batch(self, request: FuelDirBatchCalculationRequest) -> Dict[str, Any]:
+        """연료직접배출량 일괄 계산 (배출계수는 fuel_master에서 한 번에 조회, 공정별 합계 포함)"""
+        try:
+            rows = [
+                EmissionBatchRow(
+                    index=index,
+                    process_id=item.process_id,
+                    name=item.fuel_name,
+                    amount=item.fuel_amount,
+                    factor=item.fuel_factor,
+                    oxyfactor=item.fuel_oxyfactor if item.fuel_oxyfactor is not None else Decimal('1.0000')
+                )
+                for index, item in enumerate(request.items)
+            ]
+            master_factors = await self.fueldir_repository.get_fuel_factors_by_names(names_needing_factor(rows))
+            return calculate_emission_batch(rows, master_factors, request.mode, request.verify, request.include_items)
+        except Exception as e:
+            logger.error(f"Error calculating fueldir emission batch: {e}")
+            raise e
+
+    async def create_fueldirs_bulk(self, requests: List[FuelDirCreateRequest], include_results: bool = True) -> Dict[str, Any]:
+        """연료직접배출량 일괄 생성/수정 (같은 공정+연료명은 마지막 행 적용)"""
+        try:
+            rows = [
+                DirectEmissionBulkRow(
+                    index=index,
+                    process_id=request.process_id,
+                    name=request.fuel_name,
+                    factor=request.fuel_factor,
+                    amount=request.fuel_amount,
+                    oxyfactor=request.fuel_oxyfactor
+                )
+                for index, request in enumerate(requests)
+            ]
+            return await self.fueldir_repository.upsert_fueldirs_bulk(rows, include_results)
+        except Exception as e:
+            logger.error(f"Error bulk upserting fueldirs: {e}")
+            raise e
+
     # ============================================================================
     # 🏗️ Fuel Master 관련 메서드들 (새로 추가)
     # ============================================================================
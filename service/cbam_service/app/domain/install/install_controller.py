@@ -2,11 +2,12 @@
 # 🏭 Install Controller - 사업장 API 엔드포인트
 # ============================================================================
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 import logging
 from typing import List
 
 from app.domain.install.install_service import InstallService
+from app.common.dependencies import get_install_service
 from app.domain.install.install_schema import (
     InstallCreateRequest, InstallResponse, InstallUpdateRequest, InstallNameResponse
 )
@@ -17,22 +18,16 @@ logger = logging.getLogger(__name__)
 # 실제 경로: /install/ (사업장 목록 조회), /install/names (사업장명 목록) 등
 router = APIRouter(tags=["Install"])
 
-# 서비스 인스턴스는 요청 시마다 생성 (모듈 레벨 초기화 방지)
-def get_install_service():
-    """Install 서비스 인스턴스 반환"""
-    return InstallService()
-
 # ============================================================================
 # 🏭 Install 관련 엔드포인트
 # ============================================================================
 
 # 실제 경로: /install/ (사업장 목록 조회)
 @router.get("/", response_model=List[InstallResponse])
-async def get_installs():
+async def get_installs(install_service: InstallService = Depends(get_install_service)):
     """사업장 목록 조회"""
     try:
         logger.info("📋 사업장 목록 조회 요청")
-        install_service = get_install_service()
         installs = await install_service.get_installs()
         logger.info(f"✅ 사업장 목록 조회 성공: {len(installs)}개")
         return installs
@@ -42,11 +37,10 @@ async def get_installs():
 
 # 실제 경로: /install/names (사업장명 목록 조회)
 @router.get("/names", response_model=List[InstallNameResponse])
-async def get_install_names():
+async def get_install_names(install_service: InstallService = Depends(get_install_service)):
     """사업장명 목록 조회 (드롭다운용)"""
     try:
         logger.info("📋 사업장명 목록 조회 요청")
-        install_service = get_install_service()
         install_names = await install_service.get_install_names()
         logger.info(f"✅ 사업장명 목록 조회 성공: {len(install_names)}개")
         return install_names
@@ -56,13 +50,12 @@ async def get_install_names():
 
 # 실제 경로: /install/ (사업장 생성)
 @router.post("/", response_model=InstallResponse)
-async def create_install(request: InstallCreateRequest):
+async def create_install(request: InstallCreateRequest, install_service: InstallService = Depends(get_install_service)):
     """사업장 생성"""
     try:
         logger.info(f"📝 사업장 생성 요청 시작: {request.name}, 보고기간: {request.reporting_year}")
         logger.info(f"📝 요청 데이터: {request.dict()}")
         
-        install_service = get_install_service()
         logger.info("🔧 Install 서비스 인스턴스 생성 완료")
         
         install = await install_service.create_install(request)
@@ -83,11 +76,10 @@ async def create_install(request: InstallCreateRequest):
 
 # 실제 경로: /install/{install_id} (특정 사업장 조회)
 @router.get("/{install_id}", response_model=InstallResponse)
-async def get_install(install_id: int):
+async def get_install(install_id: int, install_service: InstallService = Depends(get_install_service)):
     """특정 사업장 조회"""
     try:
         logger.info(f"📋 사업장 조회 요청: ID {install_id}")
-        install_service = get_install_service()
         install = await install_service.get_install(install_id)
         if not install:
             raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
@@ -102,11 +94,10 @@ async def get_install(install_id: int):
 
 # 실제 경로: /install/{install_id} (사업장 수정)
 @router.put("/{install_id}", response_model=InstallResponse)
-async def update_install(install_id: int, request: InstallUpdateRequest):
+async def update_install(install_id: int, request: InstallUpdateRequest, install_service: InstallService = Depends(get_install_service)):
     """사업장 수정"""
     try:
         logger.info(f"📝 사업장 수정 요청: ID {install_id}")
-        install_service = get_install_service()
         install = await install_service.update_install(install_id, request)
         if not install:
             raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
@@ -121,11 +112,10 @@ async def update_install(install_id: int, request: InstallUpdateRequest):
 
 # 실제 경로: /install/{install_id} (사업장 삭제)
 @router.delete("/{install_id}")
-async def delete_install(install_id: int):
+async def delete_install(install_id: int, install_service: InstallService = Depends(get_install_service)):
     """사업장 삭제"""
     try:
         logger.info(f"🗑️ 사업장 삭제 요청: ID {install_id}")
-        install_service = get_install_service()
         success = await install_service.delete_install(install_id)
         if not success:
             raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
@@ -140,11 +130,10 @@ async def delete_install(install_id: int):
 
 # 실제 경로: /install/debug/structure (데이터베이스 구조 분석)
 @router.get("/debug/structure")
-async def debug_database_structure():
+async def debug_database_structure(install_service: InstallService = Depends(get_install_service)):
     """데이터베이스 구조 분석 (디버그용)"""
     try:
         logger.info("🔍 데이터베이스 구조 분석 요청")
-        install_service = get_install_service()
         
         # Repository에서 직접 구조 분석 실행
         repository = install_service.install_repository
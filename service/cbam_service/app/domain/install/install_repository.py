@@ -6,7 +6,9 @@ import logging
 import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import asyncpg
+from app.common.database_pool import get_domain_pool
+from app.common.graph_topology import topology_cache
+from app.common.report_cache import report_cache
 
 from app.domain.install.install_schema import InstallCreateRequest, InstallUpdateRequest
 
@@ -38,18 +40,10 @@ class InstallRepository:
         self._initialization_attempted = True
         
         try:
-            # asyncpg 연결 풀 생성
-            self.pool = await asyncpg.create_pool(
-                self.database_url,
-                min_size=1,
-                max_size=10,
-                command_timeout=30,
-                server_settings={
-                    'application_name': 'cbam-service-install'
-                }
-            )
+            # 공용 연결 풀에서 도메인 핸들 획득
+            self.pool = await get_domain_pool('install')
             
-            logger.info("✅ Install 데이터베이스 연결 풀 생성 성공")
+            logger.info("✅ Install 공용 연결 풀 연결 성공")
             
             # 테이블 생성은 선택적으로 실행
             try:
@@ -314,15 +308,17 @@ class InstallRepository:
                     WHERE id = ${len(update_data) + 1} RETURNING *
                 """, *values)
                 
-                if result:
-                    install_dict = dict(result)
-                    # datetime 객체를 문자열로 변환
-                    if 'created_at' in install_dict and install_dict['created_at']:
-                        install_dict['created_at'] = install_dict['created_at'].isoformat()
-                    if 'updated_at' in install_dict and install_dict['updated_at']:
-                        install_dict['updated_at'] = install_dict['updated_at'].isoformat()
-                    return install_dict
+            if not result:
                 return None
+            # 보고서에 사업장명이 포함되므로 쓰기가 커밋된 뒤 무효화
+            await report_cache.invalidate_installs([install_id])
+            install_dict = dict(result)
+            # datetime 객체를 문자열로 변환
+            if 'created_at' in install_dict and install_dict['created_at']:
+                install_dict['created_at'] = install_dict['created_at'].isoformat()
+            if 'updated_at' in install_dict and install_dict['updated_at']:
+                install_dict['updated_at'] = install_dict['updated_at'].isoformat()
+            return install_dict
         except Exception as e:
             logger.error(f"❌ 사업장 수정 실패: {str(e)}")
             raise
@@ -332,6 +328,7 @@ class InstallRepository:
         if not self.pool:
             raise Exception("데이터베이스 연결 풀이 초기화되지 않았습니다.")
             
+        edges_deleted = False
         try:
             async with self.pool.acquire() as conn:
                 logger.info(f"🗑️ 사업장 ID {install_id} 삭제 시작 - 데이터베이스 구조 분석 중...")
@@ -363,6 +360,8 @@ class InstallRepository:
                         async with conn.transaction():
                             result = await conn.execute(query, *params)
                             logger.info(f"✅ {table_name} 정리 완료: {result}")
+                        if table_name == 'edge' and result != "DELETE 0":
+                            edges_deleted = True
                     except Exception as e:
                         logger.warning(f"⚠️ {table_name} 정리 실패 (건너뜀): {e}")
                         continue
@@ -374,20 +373,27 @@ class InstallRepository:
                         result = await conn.execute("""
                             DELETE FROM install WHERE id = $1
                         """, install_id)
-                        
-                        if result == "DELETE 0":
-                            logger.warning(f"⚠️ 삭제할 사업장 ID {install_id}를 찾을 수 없습니다")
-                            return False
-                        
-                        logger.info(f"✅ 사업장 ID {install_id} 삭제 완료")
-                        return True
+                    
+                    if result == "DELETE 0":
+                        logger.warning(f"⚠️ 삭제할 사업장 ID {install_id}를 찾을 수 없습니다")
+                        return False
+                    
+                    logger.info(f"✅ 사업장 ID {install_id} 삭제 완료")
                 except Exception as e:
                     logger.error(f"❌ install 테이블 삭제 실패: {str(e)}")
                     raise
+            
+            # 보고서 캐시 무효화는 트랜잭션이 커밋된 뒤에
+            await report_cache.invalidate_installs([install_id])
+            return True
                     
         except Exception as e:
             logger.error(f"❌ 사업장 삭제 실패: {str(e)}")
             raise
+        finally:
+            # 단계별 트랜잭션이라 이후 단계가 실패해도 엣지 삭제는 커밋되어 있음
+            if edges_deleted:
+                topology_cache.invalidate()
 
     def _determine_delete_order(self, db_analysis: Dict[str, Any], install_id: int) -> List[tuple]:
         """데이터베이스 구조 분석 결과에 따른 삭제 순서 결정"""
@@ -396,20 +402,40 @@ class InstallRepository:
         # 외래키 제약조건을 기반으로 삭제 순서 결정
         fk_constraints = db_analysis.get('foreign_key_constraints', {})
         
-        # 1단계: product_process 관계 삭제 (가장 먼저)
-        if 'product_process' in db_analysis['table_names']:
+        # 1단계: edge 삭제 (이 사업장의 제품과, 다른 사업장과 공유하지 않는 공정을 참조하는 것들)
+        # 공정 연결을 product_process로 찾으므로 관계를 지우기 전에 실행
+        if 'edge' in db_analysis['table_names']:
             delete_order.append((
-                'product_process',
-                "DELETE FROM product_process WHERE product_id IN (SELECT id FROM product WHERE install_id = $1)",
+                'edge',
+                """
+                WITH install_products AS (
+                    SELECT id FROM product WHERE install_id = $1
+                ),
+                install_processes AS (
+                    SELECT DISTINCT pp.process_id AS id
+                    FROM product_process pp
+                    WHERE pp.product_id IN (SELECT id FROM install_products)
+                      AND NOT EXISTS (
+                          SELECT 1 FROM product_process other
+                          JOIN product op ON op.id = other.product_id
+                          WHERE other.process_id = pp.process_id AND op.install_id <> $1
+                      )
+                )
+                DELETE FROM edge e
+                WHERE (e.source_node_type = 'product' AND e.source_id IN (SELECT id FROM install_products))
+                   OR (e.target_node_type = 'product' AND e.target_id IN (SELECT id FROM install_products))
+                   OR (e.source_node_type = 'process' AND e.source_id IN (SELECT id FROM install_processes))
+                   OR (e.target_node_type = 'process' AND e.target_id IN (SELECT id FROM install_processes))
+                """,
                 (install_id,)
             ))
         
-        # 2단계: edge 삭제 (product/process를 참조하는 것들)
-        if 'edge' in db_analysis['table_names']:
+        # 2단계: product_process 관계 삭제
+        if 'product_process' in db_analysis['table_names']:
             delete_order.append((
-                'edge',
-                "DELETE FROM edge e WHERE e.source_node_id IN (SELECT p.id FROM product p WHERE p.install_id = $1 UNION SELECT proc.id FROM process proc JOIN product_process pp ON proc.id = pp.process_id JOIN product pr ON pp.product_id = pr.id WHERE pr.install_id = $1) OR e.target_node_id IN (SELECT p.id FROM product p WHERE p.install_id = $1 UNION SELECT proc.id FROM process proc JOIN product_process pp ON proc.id = pp.process_id JOIN product pr ON pp.product_id = pr.id WHERE pr.install_id = $1)",
-                (install_id, install_id, install_id, install_id)
+                'product_process',
+                "DELETE FROM product_process WHERE product_id IN (SELECT id FROM product WHERE install_id = $1)",
+                (install_id,)
             ))
         
         # 3단계: process 삭제 (product와 연결되지 않은 것들)
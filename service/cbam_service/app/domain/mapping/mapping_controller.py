@@ -4,9 +4,9 @@
 
 from fastapi import APIRouter, HTTPException, Query
 import logging
-from typing import List
+from typing import List, Optional
 
-from app.domain.mapping.mapping_service import HSCNMappingService
+from app.common.dependencies import get_mapping_service
 from app.domain.mapping.mapping_schema import (
     HSCNMappingCreateRequest, HSCNMappingResponse, HSCNMappingUpdateRequest,
     HSCNMappingFullResponse, HSCodeLookupResponse, MappingStatsResponse,
@@ -18,17 +18,15 @@ logger = logging.getLogger(__name__)
 # Gateway를 통해 접근하므로 prefix 제거 (경로 중복 방지)
 router = APIRouter(tags=["Mapping"])
 
-# 서비스 인스턴스는 요청 시마다 생성 (모듈 레벨 초기화 방지)
-def get_mapping_service():
-    """매핑 서비스 인스턴스 반환"""
-    return HSCNMappingService(None)  # Repository에서 직접 DB 연결 사용
-
 # ============================================================================
 # 🔍 HS 코드 조회 엔드포인트 (메인 기능)
 # ============================================================================
 
 @router.get("/cncode/lookup/{hs_code}", response_model=List[HSCNMappingResponse])
-async def lookup_cn_code_by_hs_code(hs_code: str):
+async def lookup_cn_code_by_hs_code(
+    hs_code: str,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="최대 결과 수 (자동완성용)")
+):
     """
     HS 코드로 CN 코드 조회 (부분 검색 허용)
     
@@ -39,7 +37,7 @@ async def lookup_cn_code_by_hs_code(hs_code: str):
         logger.info(f"🔍 HS 코드 조회 요청: {hs_code}")
         
         mapping_service = get_mapping_service()
-        result = await mapping_service.lookup_by_hs_code(hs_code)
+        result = await mapping_service.lookup_by_hs_code(hs_code, limit)
         
         if not result.success:
             raise HTTPException(status_code=400, detail=result.message)
@@ -150,12 +148,15 @@ async def delete_mapping(mapping_id: int):
 # ============================================================================
 
 @router.get("/mapping/search/hs/{hs_code}", response_model=List[HSCNMappingFullResponse])
-async def search_by_hs_code(hs_code: str):
+async def search_by_hs_code(
+    hs_code: str,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="최대 결과 수 (자동완성용)")
+):
     """HS 코드로 검색"""
     try:
         logger.info(f"🔍 HS 코드 검색 요청: {hs_code}")
         mapping_service = get_mapping_service()
-        mappings = await mapping_service.search_by_hs_code(hs_code)
+        mappings = await mapping_service.search_by_hs_code(hs_code, limit)
         logger.info(f"✅ HS 코드 검색 성공: {len(mappings)}개 결과")
         return mappings
     except Exception as e:
@@ -163,12 +164,15 @@ async def search_by_hs_code(hs_code: str):
         raise HTTPException(status_code=500, detail=f"HS 코드 검색 중 오류가 발생했습니다: {str(e)}")
 
 @router.get("/mapping/search/cn/{cn_code}", response_model=List[HSCNMappingFullResponse])
-async def search_by_cn_code(cn_code: str):
+async def search_by_cn_code(
+    cn_code: str,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="최대 결과 수 (자동완성용)")
+):
     """CN 코드로 검색"""
     try:
         logger.info(f"🔍 CN 코드 검색 요청: {cn_code}")
         mapping_service = get_mapping_service()
-        mappings = await mapping_service.search_by_cn_code(cn_code)
+        mappings = await mapping_service.search_by_cn_code(cn_code, limit)
         logger.info(f"✅ CN 코드 검색 성공: {len(mappings)}개 결과")
         return mappings
     except Exception as e:
@@ -176,12 +180,15 @@ async def search_by_cn_code(cn_code: str):
         raise HTTPException(status_code=500, detail=f"CN 코드 검색 중 오류가 발생했습니다: {str(e)}")
 
 @router.get("/mapping/search/goods/{goods_name}", response_model=List[HSCNMappingFullResponse])
-async def search_by_goods_name(goods_name: str):
-    """품목명으로 검색"""
+async def search_by_goods_name(
+    goods_name: str,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="최대 결과 수 (자동완성용)")
+):
+    """품목명으로 검색 (일치 정도 순)"""
     try:
         logger.info(f"🔍 품목명 검색 요청: {goods_name}")
         mapping_service = get_mapping_service()
-        mappings = await mapping_service.search_by_goods_name(goods_name)
+        mappings = await mapping_service.search_by_goods_name(goods_name, limit)
         logger.info(f"✅ 품목명 검색 성공: {len(mappings)}개 결과")
         return mappings
     except Exception as e:
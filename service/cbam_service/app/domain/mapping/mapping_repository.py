@@ -4,8 +4,9 @@
 
 import os
 import logging
-from typing import List, Optional, Dict, Any
-import asyncpg
+from typing import List, Optional, Dict, Any, Set, Tuple
+from app.common.database_pool import get_domain_pool
+from app.common.hs_cn_index import HSCNLookupIndex, hs_cn_index
 
 from app.domain.mapping.mapping_schema import HSCNMappingCreateRequest, HSCNMappingUpdateRequest
 
@@ -36,16 +37,8 @@ class HSCNMappingRepository:
         self._initialization_attempted = True
         
         try:
-            self.pool = await asyncpg.create_pool(
-                self.database_url,
-                min_size=1,
-                max_size=10,
-                command_timeout=30,
-                server_settings={
-                    'application_name': 'cbam-service-mapping'
-                }
-            )
-            logger.info("✅ Mapping 데이터베이스 연결 풀 생성 성공")
+            self.pool = await get_domain_pool('mapping')
+            logger.info("✅ Mapping 공용 연결 풀 연결 성공")
             
         except Exception as e:
             logger.error(f"❌ Mapping 데이터베이스 연결 실패: {str(e)}")
@@ -60,6 +53,15 @@ class HSCNMappingRepository:
         if not self.pool:
             raise Exception("데이터베이스 연결 풀이 초기화되지 않았습니다.")
     
+    async def _lookup_index(self) -> Optional[HSCNLookupIndex]:
+        """메모리 조회 인덱스 (비활성/적재 실패 시 None -> SQL 검색)"""
+        try:
+            if await hs_cn_index.ensure_loaded(self.pool):
+                return hs_cn_index
+        except Exception as e:
+            logger.warning(f"⚠️ HS-CN 매핑 인덱스 적재 실패, DB 검색으로 대체: {e}")
+        return None
+    
     # ============================================================================
     # 📋 기본 CRUD 작업
     # ============================================================================
@@ -76,17 +78,18 @@ class HSCNMappingRepository:
                 VALUES ($1, $2, $3, $4, $5, $6)
                 RETURNING id, hscode, aggregoods_name, aggregoods_engname, 
                           cncode_total, goods_name, goods_engname
-                """, (
+                """,
                     mapping_data.hscode,
                     mapping_data.aggregoods_name,
                     mapping_data.aggregoods_engname,
                     mapping_data.cncode_total,
                     mapping_data.goods_name,
                     mapping_data.goods_engname
-                ))
+                )
                 
                 if result:
                     logger.info(f"✅ HS-CN 매핑 생성 성공: ID {result['id']}")
+                    hs_cn_index.apply_upsert(dict(result))
                     return dict(result)
                 return None
                 
@@ -159,6 +162,7 @@ class HSCNMappingRepository:
                 
                 if result:
                     logger.info(f"✅ HS-CN 매핑 수정 성공: ID {mapping_id}")
+                    hs_cn_index.apply_upsert(dict(result))
                     return dict(result)
                 return None
                 
@@ -179,6 +183,7 @@ class HSCNMappingRepository:
                 success = result != "DELETE 0"
                 if success:
                     logger.info(f"✅ HS-CN 매핑 삭제 성공: ID {mapping_id}")
+                    hs_cn_index.apply_delete(mapping_id)
                 else:
                     logger.warning(f"⚠️ HS-CN 매핑 삭제 실패: ID {mapping_id} (존재하지 않음)")
                 
@@ -192,11 +197,18 @@ class HSCNMappingRepository:
     # 🔍 HS 코드 조회 기능
     # ============================================================================
     
-    async def lookup_by_hs_code(self, hs_code: str) -> List[Dict[str, Any]]:
+    async def lookup_by_hs_code(self, hs_code: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """HS 코드로 CN 코드 조회 (부분 검색 허용)"""
         await self._ensure_pool_initialized()
         
         try:
+            index = await self._lookup_index()
+            if index is not None:
+                results = index.search_hs_code(hs_code, limit)
+                for row in results:
+                    row.pop('id', None)
+                return results
+            
             async with self.pool.acquire() as conn:
                 # 부분 검색을 위해 LIKE 연산자 사용
                 results = await conn.fetch("""
@@ -205,7 +217,8 @@ class HSCNMappingRepository:
                     FROM hs_cn_mapping 
                     WHERE hscode LIKE $1
                     ORDER BY hscode, cncode_total
-                """, f"{hs_code}%")
+                    LIMIT $2
+                """, f"{hs_code}%", limit)
                 
                 logger.info(f"🔍 HS 코드 조회: {hs_code}, 결과: {len(results)}개")
                 return [dict(row) for row in results]
@@ -214,11 +227,15 @@ class HSCNMappingRepository:
             logger.error(f"❌ HS 코드 조회 실패: {str(e)}")
             return []
     
-    async def search_by_hs_code(self, hs_code: str) -> List[Dict[str, Any]]:
+    async def search_by_hs_code(self, hs_code: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """HS 코드로 검색 (부분 일치)"""
         await self._ensure_pool_initialized()
         
         try:
+            index = await self._lookup_index()
+            if index is not None:
+                return index.search_hs_code(hs_code, limit)
+            
             async with self.pool.acquire() as conn:
                 results = await conn.fetch("""
                 SELECT id, hscode, aggregoods_name, aggregoods_engname, 
@@ -226,7 +243,8 @@ class HSCNMappingRepository:
                 FROM hs_cn_mapping 
                 WHERE hscode LIKE $1
                 ORDER BY hscode, cncode_total
-                """, f"{hs_code}%")
+                LIMIT $2
+                """, f"{hs_code}%", limit)
                 
                 return [dict(row) for row in results]
                 
@@ -234,11 +252,15 @@ class HSCNMappingRepository:
             logger.error(f"❌ HS 코드 검색 실패: {str(e)}")
             return []
     
-    async def search_by_cn_code(self, cn_code: str) -> List[Dict[str, Any]]:
+    async def search_by_cn_code(self, cn_code: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """CN 코드로 검색 (부분 일치)"""
         await self._ensure_pool_initialized()
         
         try:
+            index = await self._lookup_index()
+            if index is not None:
+                return index.search_cn_code(cn_code, limit)
+            
             async with self.pool.acquire() as conn:
                 results = await conn.fetch("""
                 SELECT id, hscode, aggregoods_name, aggregoods_engname, 
@@ -246,7 +268,8 @@ class HSCNMappingRepository:
                 FROM hs_cn_mapping 
                 WHERE cncode_total LIKE $1
                 ORDER BY cncode_total, hscode
-                """, f"{cn_code}%")
+                LIMIT $2
+                """, f"{cn_code}%", limit)
                 
                 return [dict(row) for row in results]
                 
@@ -254,11 +277,15 @@ class HSCNMappingRepository:
             logger.error(f"❌ CN 코드 검색 실패: {str(e)}")
             return []
     
-    async def search_by_goods_name(self, goods_name: str) -> List[Dict[str, Any]]:
-        """품목명으로 검색 (부분 일치)"""
+    async def search_by_goods_name(self, goods_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """품목명으로 검색 (부분 일치, 일치 정도 순)"""
         await self._ensure_pool_initialized()
         
         try:
+            index = await self._lookup_index()
+            if index is not None:
+                return index.search_goods_name(goods_name, limit)
+            
             async with self.pool.acquire() as conn:
                 results = await conn.fetch("""
                 SELECT id, hscode, aggregoods_name, aggregoods_engname, 
@@ -266,7 +293,8 @@ class HSCNMappingRepository:
                 FROM hs_cn_mapping 
                 WHERE goods_name ILIKE $1 OR goods_engname ILIKE $1
                 ORDER BY goods_name, hscode
-                """, f"%{goods_name}%")
+                LIMIT $2
+                """, f"%{goods_name}%", limit)
                 
                 return [dict(row) for row in results]
                 
@@ -307,49 +335,213 @@ class HSCNMappingRepository:
     # 📦 일괄 처리
     # ============================================================================
     
-    async def create_mappings_batch(self, mappings_data: List[HSCNMappingCreateRequest]) -> Dict[str, Any]:
-        """HS-CN 매핑 일괄 생성"""
+    async def create_mappings_batch(
+        self,
+        mappings_data: List[HSCNMappingCreateRequest],
+        on_duplicate: str = "insert",
+        mode: str = "best_effort",
+        row_numbers: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """HS-CN 매핑 일괄 생성 (COPY로 임시 테이블 적재 후 한 문장으로 반영)
+        
+        on_duplicate:
+        - insert: 기존처럼 모든 행을 그대로 추가 (중복 검사 없음)
+        - skip / update: (hscode, cncode_total)이 같은 기존 매핑은 건너뛰거나 품목명을 갱신하고,
+          요청 안에서 키가 같은 행은 마지막 행만 반영 (앞선 행은 skipped에 행 번호와 함께 보고)
+        
+        한 문장 반영이 실패하면 best_effort 모드는 행마다 SAVEPOINT로 다시 시도해 실패한 행만
+        errors에 행 번호와 함께 남기고, atomic 모드는 아무것도 반영하지 않습니다.
+        row_numbers는 오류/건너뜀 보고에 쓸 요청 내 행 번호입니다 (기본 0부터 순서대로).
+        """
         await self._ensure_pool_initialized()
         
+        result = {'created_count': 0, 'updated_count': 0, 'skipped_count': 0, 'failed_count': 0,
+                  'errors': [], 'skipped': []}
+        if not mappings_data:
+            return result
+        
+        if row_numbers is None:
+            row_numbers = list(range(len(mappings_data)))
+        records = [
+            (
+                row_no,
+                mapping_data.hscode,
+                mapping_data.aggregoods_name,
+                mapping_data.aggregoods_engname,
+                mapping_data.cncode_total,
+                mapping_data.goods_name,
+                mapping_data.goods_engname
+            )
+            for row_no, mapping_data in zip(row_numbers, mappings_data)
+        ]
+        
+        if on_duplicate != "insert":
+            # 요청 안에서 키가 같은 행은 마지막 행만 반영
+            last_rows: Dict[tuple, tuple] = {}
+            for record in records:
+                last_rows[(record[1], record[4])] = record
+            for record in records:
+                kept = last_rows[(record[1], record[4])]
+                if kept is not record:
+                    result['skipped'].append(
+                        f"[{record[0]}] 요청 내 중복 (hscode {record[1]}, cncode {record[4]}) - 행 {kept[0]} 반영"
+                    )
+            records = sorted(last_rows.values(), key=lambda record: record[0])
+        
         try:
             async with self.pool.acquire() as conn:
-                created_count = 0
-                failed_count = 0
-                errors = []
-                
-                for mapping_data in mappings_data:
+                async with conn.transaction():
+                    if on_duplicate != "insert":
+                        # 같은 키를 동시에 적재하는 배치끼리 중복 행을 만들지 않도록 직렬화
+                        await conn.execute("SELECT pg_advisory_xact_lock(hashtext('hs_cn_mapping_batch'))")
+                    await conn.execute("""
+                        CREATE TEMP TABLE hs_cn_mapping_staging (
+                            row_no INTEGER,
+                            hscode TEXT,
+                            aggregoods_name TEXT,
+                            aggregoods_engname TEXT,
+                            cncode_total TEXT,
+                            goods_name TEXT,
+                            goods_engname TEXT
+                        ) ON COMMIT DROP
+                    """)
+                    await conn.copy_records_to_table(
+                        'hs_cn_mapping_staging',
+                        records=records,
+                        columns=['row_no', 'hscode', 'aggregoods_name', 'aggregoods_engname',
+                                 'cncode_total', 'goods_name', 'goods_engname']
+                    )
+                    
                     try:
-                        await conn.execute("""
-                        INSERT INTO hs_cn_mapping (hscode, aggregoods_name, aggregoods_engname, 
-                                                 cncode_total, goods_name, goods_engname)
-                        VALUES ($1, $2, $3, $4, $5, $6)
-                        """, (
-                            mapping_data.hscode,
-                            mapping_data.aggregoods_name,
-                            mapping_data.aggregoods_engname,
-                            mapping_data.cncode_total,
-                            mapping_data.goods_name,
-                            mapping_data.goods_engname
-                        ))
-                        
-                        created_count += 1
-                        
+                        # 실패해도 임시 테이블은 남도록 SAVEPOINT 안에서 한 문장 반영
+                        async with conn.transaction():
+                            existing_rows = await self._apply_staged_mappings(conn, on_duplicate)
+                        outcomes = {
+                            record[0]: ("existing" if record[0] in existing_rows else "created", None)
+                            for record in records
+                        }
                     except Exception as e:
-                        failed_count += 1
-                        errors.append(f"매핑 생성 실패: {str(e)}")
-                
-                logger.info(f"✅ 일괄 매핑 생성 완료: 성공 {created_count}개, 실패 {failed_count}개")
-                
-                return {
-                    'created_count': created_count,
-                    'failed_count': failed_count,
-                    'errors': errors
-                }
+                        if mode == "atomic":
+                            raise
+                        logger.warning(f"⚠️ 일괄 매핑 한 문장 반영 실패, 행 단위로 다시 시도: {e}")
+                        outcomes = await self._apply_mappings_row_by_row(conn, records, on_duplicate)
+            
+            for record in records:
+                row_no = record[0]
+                outcome, error = outcomes[row_no]
+                if outcome == "created":
+                    result['created_count'] += 1
+                elif outcome == "existing" and on_duplicate == "update":
+                    result['updated_count'] += 1
+                elif outcome == "existing":
+                    result['skipped'].append(
+                        f"[{row_no}] 이미 있는 매핑 (hscode {record[1]}, cncode {record[4]})"
+                    )
+                else:
+                    result['failed_count'] += 1
+                    result['errors'].append(f"[{row_no}] 매핑 생성 실패: {error}")
+            result['skipped_count'] = len(result['skipped'])
+            
+            if result['created_count'] or result['updated_count']:
+                # 여러 건이 바뀌었으므로 다음 조회 때 전체를 다시 읽음
+                hs_cn_index.invalidate()
+            
+            logger.info(
+                f"✅ 일괄 매핑 생성 완료: 생성 {result['created_count']}개, 갱신 {result['updated_count']}개, "
+                f"건너뜀 {result['skipped_count']}개, 실패 {result['failed_count']}개"
+            )
+            return result
                 
         except Exception as e:
             logger.error(f"❌ 일괄 매핑 생성 실패: {str(e)}")
             return {
                 'created_count': 0,
+                'updated_count': 0,
+                'skipped_count': 0,
                 'failed_count': len(mappings_data),
-                'errors': [f"일괄 처리 실패: {str(e)}"]
+                'errors': [f"일괄 처리 실패 (전체 미반영): {str(e)}"],
+                'skipped': []
             }
+    
+    async def _apply_staged_mappings(self, conn, on_duplicate: str) -> Set[int]:
+        """임시 테이블의 행을 한 문장으로 반영 -> 기존 매핑과 키가 같았던 행 번호"""
+        if on_duplicate == "insert":
+            await conn.execute("""
+                INSERT INTO hs_cn_mapping (hscode, aggregoods_name, aggregoods_engname, 
+                                         cncode_total, goods_name, goods_engname)
+                SELECT hscode, aggregoods_name, aggregoods_engname, cncode_total, goods_name, goods_engname
+                FROM hs_cn_mapping_staging
+                ORDER BY row_no
+            """)
+            return set()
+        
+        # 데이터 변경 CTE는 모두 같은 스냅샷을 보므로 existing은 이번 INSERT 이전 기준
+        rows = await conn.fetch("""
+            WITH existing AS (
+                SELECT s.row_no
+                FROM hs_cn_mapping_staging s
+                WHERE EXISTS (
+                    SELECT 1 FROM hs_cn_mapping m
+                    WHERE m.hscode = s.hscode AND m.cncode_total IS NOT DISTINCT FROM s.cncode_total
+                )
+            ),
+            updated AS (
+                UPDATE hs_cn_mapping m
+                SET aggregoods_name = s.aggregoods_name,
+                    aggregoods_engname = s.aggregoods_engname,
+                    goods_name = s.goods_name,
+                    goods_engname = s.goods_engname
+                FROM hs_cn_mapping_staging s
+                WHERE $1::bool AND m.hscode = s.hscode AND m.cncode_total IS NOT DISTINCT FROM s.cncode_total
+                RETURNING s.row_no
+            ),
+            inserted AS (
+                INSERT INTO hs_cn_mapping (hscode, aggregoods_name, aggregoods_engname, 
+                                         cncode_total, goods_name, goods_engname)
+                SELECT s.hscode, s.aggregoods_name, s.aggregoods_engname,
+                       s.cncode_total, s.goods_name, s.goods_engname
+                FROM hs_cn_mapping_staging s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM hs_cn_mapping m
+                    WHERE m.hscode = s.hscode AND m.cncode_total IS NOT DISTINCT FROM s.cncode_total
+                )
+                ORDER BY s.row_no
+                RETURNING id
+            )
+            SELECT row_no FROM existing
+        """, on_duplicate == "update")
+        return {row['row_no'] for row in rows}
+    
+    async def _apply_mappings_row_by_row(self, conn, records: List[tuple], on_duplicate: str) -> Dict[int, Tuple[str, Optional[str]]]:
+        """행마다 SAVEPOINT로 반영 -> {행 번호: (created | existing | failed, 오류)}"""
+        outcomes: Dict[int, Tuple[str, Optional[str]]] = {}
+        for row_no, hscode, aggregoods_name, aggregoods_engname, cncode_total, goods_name, goods_engname in records:
+            try:
+                async with conn.transaction():
+                    if on_duplicate != "insert":
+                        exists = await conn.fetchval("""
+                            SELECT EXISTS (
+                                SELECT 1 FROM hs_cn_mapping
+                                WHERE hscode = $1 AND cncode_total IS NOT DISTINCT FROM $2
+                            )
+                        """, hscode, cncode_total)
+                        if exists:
+                            if on_duplicate == "update":
+                                await conn.execute("""
+                                    UPDATE hs_cn_mapping
+                                    SET aggregoods_name = $3, aggregoods_engname = $4,
+                                        goods_name = $5, goods_engname = $6
+                                    WHERE hscode = $1 AND cncode_total IS NOT DISTINCT FROM $2
+                                """, hscode, cncode_total, aggregoods_name, aggregoods_engname,
+                                    goods_name, goods_engname)
+                            outcomes[row_no] = ("existing", None)
+                            continue
+                    await conn.execute("""
+                        INSERT INTO hs_cn_mapping (hscode, aggregoods_name, aggregoods_engname, 
+                                                 cncode_total, goods_name, goods_engname)
+                        VALUES ($1, $2, $3, $4, $5, $6)
+                    """, hscode, aggregoods_name, aggregoods_engname, cncode_total, goods_name, goods_engname)
+                    outcomes[row_no] = ("created", None)
+            except Exception as e:
+                outcomes[row_no] = ("failed", str(e))
+        return outcomes
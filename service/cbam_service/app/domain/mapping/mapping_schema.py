@@ -3,7 +3,7 @@
 # ============================================================================
 
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Literal
 
 # ============================================================================
 # 🏭 HS-CN 매핑 관련 스키마
@@ -77,10 +77,24 @@ class MappingStatsResponse(BaseModel):
 class HSCNMappingBatchCreateRequest(BaseModel):
     """HS-CN 매핑 일괄 생성 요청"""
     mappings: List[HSCNMappingCreateRequest] = Field(..., description="매핑 목록")
+    mode: Literal["atomic", "best_effort"] = Field(
+        "best_effort", description="atomic: 한 건이라도 검증 실패 시 전체 거부, best_effort: 유효한 행만 저장"
+    )
+    on_duplicate: Literal["insert", "skip", "update"] = Field(
+        "insert",
+        description=(
+            "insert: 중복 검사 없이 모든 행 추가 (기본), "
+            "skip/update: 같은 (hscode, cncode_total) 매핑이 이미 있으면 건너뛰기 또는 품목명 갱신 "
+            "(요청 안에서 키가 같은 행은 마지막 행만 반영하고 나머지는 skipped로 보고)"
+        )
+    )
 
 class HSCNMappingBatchResponse(BaseModel):
     """HS-CN 매핑 일괄 처리 응답"""
     success: bool = Field(..., description="처리 성공 여부")
     created_count: int = Field(..., description="생성된 매핑 수")
     failed_count: int = Field(..., description="실패한 매핑 수")
-    errors: List[str] = Field(default=[], description="오류 메시지 목록")
+    updated_count: int = Field(0, description="갱신된 기존 매핑 수")
+    skipped_count: int = Field(0, description="이미 있거나 요청 내 중복이라 건너뛴 매핑 수")
+    errors: List[str] = Field(default=[], description="오류 메시지 목록 ([행 번호] 사유)")
+    skipped: List[str] = Field(default=[], description="건너뛴 행 목록 ([행 번호] 사유)")
@@ -21,6 +21,15 @@ class HSCNMappingService:
     def __init__(self, db: Session):
         self.repository = HSCNMappingRepository(db)
     
+    async def initialize(self):
+        """데이터베이스 연결 초기화"""
+        try:
+            await self.repository.initialize()
+            logger.info("✅ Mapping 서비스 데이터베이스 연결 초기화 완료")
+        except Exception as e:
+            logger.warning(f"⚠️ Mapping 서비스 데이터베이스 초기화 실패 (서비스는 계속 실행): {e}")
+            logger.info("ℹ️ 데이터베이스 연결은 필요할 때 자동으로 초기화됩니다.")
+    
     # ============================================================================
     # 📋 기본 CRUD 작업
     # ============================================================================
@@ -103,7 +112,7 @@ class HSCNMappingService:
     # 🔍 HS 코드 조회 기능
     # ============================================================================
     
-    async def lookup_by_hs_code(self, hs_code: str) -> HSCodeLookupResponse:
+    async def lookup_by_hs_code(self, hs_code: str, limit: Optional[int] = None) -> HSCodeLookupResponse:
         """HS 코드로 CN 코드 조회 (부분 검색 허용)"""
         try:
             # HS 코드 유효성 검증 (부분 검색 허용)
@@ -115,7 +124,7 @@ class HSCNMappingService:
                     message=f"유효하지 않은 HS 코드: {hs_code}"
                 )
             
-            mappings = await self.repository.lookup_by_hs_code(hs_code)
+            mappings = await self.repository.lookup_by_hs_code(hs_code, limit)
             
             # 응답 데이터 변환 (딕셔너리에서 키로 접근)
             response_data = []
@@ -144,28 +153,28 @@ class HSCNMappingService:
                 message=f"HS 코드 조회 중 오류가 발생했습니다: {str(e)}"
             )
     
-    async def search_by_hs_code(self, hs_code: str) -> List[HSCNMappingFullResponse]:
+    async def search_by_hs_code(self, hs_code: str, limit: Optional[int] = None) -> List[HSCNMappingFullResponse]:
         """HS 코드로 검색"""
         try:
-            mappings = await self.repository.search_by_hs_code(hs_code)
+            mappings = await self.repository.search_by_hs_code(hs_code, limit)
             return [HSCNMappingFullResponse(**mapping) for mapping in mappings]
         except Exception as e:
             logger.error(f"❌ HS 코드 검색 실패: {str(e)}")
             return []
     
-    async def search_by_cn_code(self, cn_code: str) -> List[HSCNMappingFullResponse]:
+    async def search_by_cn_code(self, cn_code: str, limit: Optional[int] = None) -> List[HSCNMappingFullResponse]:
         """CN 코드로 검색"""
         try:
-            mappings = await self.repository.search_by_cn_code(cn_code)
+            mappings = await self.repository.search_by_cn_code(cn_code, limit)
             return [HSCNMappingFullResponse(**mapping) for mapping in mappings]
         except Exception as e:
             logger.error(f"❌ CN 코드 검색 실패: {str(e)}")
             return []
     
-    async def search_by_goods_name(self, goods_name: str) -> List[HSCNMappingFullResponse]:
+    async def search_by_goods_name(self, goods_name: str, limit: Optional[int] = None) -> List[HSCNMappingFullResponse]:
         """품목명으로 검색"""
         try:
-            mappings = await self.repository.search_by_goods_name(goods_name)
+            mappings = await self.repository.search_by_goods_name(goods_name, limit)
             return [HSCNMappingFullResponse(**mapping) for mapping in mappings]
         except Exception as e:
             logger.error(f"❌ 품목명 검색 실패: {str(e)}")
@@ -193,24 +202,26 @@ class HSCNMappingService:
     # ============================================================================
     
     async def create_mappings_batch(self, batch_data: HSCNMappingBatchCreateRequest) -> HSCNMappingBatchResponse:
-        """HS-CN 매핑 일괄 생성"""
+        """HS-CN 매핑 일괄 생성 (atomic 모드는 검증 오류가 하나라도 있으면 저장하지 않음)"""
         try:
-            # 데이터 유효성 검증
+            # 데이터 유효성 검증 (오류에는 요청 내 행 번호 포함)
             valid_mappings = []
+            valid_row_numbers = []
             errors = []
             
-            for mapping_data in batch_data.mappings:
+            for index, mapping_data in enumerate(batch_data.mappings):
                 if not self._validate_hs_code(mapping_data.hscode):
-                    errors.append(f"유효하지 않은 HS 코드: {mapping_data.hscode}")
+                    errors.append(f"[{index}] 유효하지 않은 HS 코드: {mapping_data.hscode}")
                     continue
                 
                 if not self._validate_cn_code(mapping_data.cncode_total):
-                    errors.append(f"유효하지 않은 CN 코드: {mapping_data.cncode_total}")
+                    errors.append(f"[{index}] 유효하지 않은 CN 코드: {mapping_data.cncode_total}")
                     continue
                 
                 valid_mappings.append(mapping_data)
+                valid_row_numbers.append(index)
             
-            if not valid_mappings:
+            if not valid_mappings or (errors and batch_data.mode == "atomic"):
                 return HSCNMappingBatchResponse(
                     success=False,
                     created_count=0,
@@ -219,13 +230,18 @@ class HSCNMappingService:
                 )
             
             # 일괄 생성 실행
-            result = await self.repository.create_mappings_batch(valid_mappings)
+            result = await self.repository.create_mappings_batch(
+                valid_mappings, batch_data.on_duplicate, batch_data.mode, row_numbers=valid_row_numbers
+            )
             
             return HSCNMappingBatchResponse(
-                success=result['created_count'] > 0,
+                success=result['failed_count'] == 0,
                 created_count=result['created_count'],
                 failed_count=result['failed_count'] + len(errors),
-                errors=result['errors'] + errors
+                updated_count=result['updated_count'],
+                skipped_count=result['skipped_count'],
+                errors=result['errors'] + errors,
+                skipped=result['skipped']
             )
             
         except Exception as e:
@@ -7,13 +7,14 @@ import logging
 from typing import List, Dict, Any
 import time
 
-from app.domain.matdir.matdir_service import MatDirService
+from app.common.dependencies import get_matdir_service
 from app.domain.matdir.matdir_schema import (
     MatDirCreateRequest, 
     MatDirUpdateRequest, 
     MatDirResponse,
     MatDirCalculationRequest,
-    MatDirCalculationResponse
+    MatDirCalculationResponse,
+    MatDirBatchCalculationRequest
 )
 
 logger = logging.getLogger(__name__)
@@ -21,8 +22,8 @@ logger = logging.getLogger(__name__)
 # Gateway를 통해 접근하므로 prefix 제거 (경로 중복 방지)
 router = APIRouter(tags=["Material Directory"])
 
-# 서비스 인스턴스 생성
-matdir_service = MatDirService()
+# 서비스 인스턴스 (애플리케이션 수명 싱글톤)
+matdir_service = get_matdir_service()
 
 # ============================================================================
 # 📦 1. 기존 MatDir 관련 엔드포인트 (원료직접배출량 데이터 관리)
@@ -66,6 +67,21 @@ async def get_matdirs_by_process(process_id: int):
 
 # 이 엔드포인트는 material-master 엔드포인트들 뒤로 이동됨
 
+@router.post("/bulk")
+async def create_matdirs_bulk(matdirs_data: List[MatDirCreateRequest], include_results: bool = True):
+    """여러 원료직접배출량 데이터 일괄 생성/수정 (한 문장 업서트, 행별 오류 보고)"""
+    try:
+        logger.info(f"📦 원료직접배출량 일괄 생성 요청: {len(matdirs_data)}개")
+        result = await matdir_service.create_matdirs_bulk(matdirs_data, include_results)
+        logger.info(f"✅ 원료직접배출량 일괄 생성 완료: {result['success_count']}/{result['total_count']}개 성공")
+        return {
+            "message": f"일괄 생성 완료: {result['success_count']}/{result['total_count']}개 성공",
+            **result
+        }
+    except Exception as e:
+        logger.error(f"❌ 원료직접배출량 일괄 생성 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"원료직접배출량 일괄 생성 중 오류가 발생했습니다: {str(e)}")
+
 @router.put("/{matdir_id}", response_model=MatDirResponse)
 async def update_matdir(matdir_id: int, matdir_data: MatDirUpdateRequest):
     """원료직접배출량 데이터 수정"""
@@ -116,6 +132,19 @@ async def calculate_matdir_emission(calculation_data: MatDirCalculationRequest):
         logger.error(f"❌ 원료직접배출량 계산 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"원료직접배출량 계산 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/calculate/batch", response_model=Dict[str, Any])
+async def calculate_matdir_emission_batch(request: MatDirBatchCalculationRequest):
+    """원료직접배출량 일괄 계산 (배출계수 자동 조회, 공정별 합계 포함)"""
+    try:
+        logger.info(f"🧮 원료직접배출량 일괄 계산 요청: {len(request.items)}건 (mode={request.mode}, verify={request.verify})")
+        result = await matdir_service.calculate_matdir_emission_batch(request)
+        summary = result["summary"]
+        logger.info(f"✅ 원료직접배출량 일괄 계산 성공: {summary['calculated_count']}/{summary['total_items']}건, 공정 {summary['process_count']}개")
+        return result
+    except Exception as e:
+        logger.error(f"❌ 원료직접배출량 일괄 계산 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"원료직접배출량 일괄 계산 중 오류가 발생했습니다: {str(e)}")
+
 @router.get("/process/{process_id}/total")
 async def get_total_matdir_emission_by_process(process_id: int):
     """특정 공정의 총 원료직접배출량 계산"""
@@ -6,7 +6,10 @@ import os
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import asyncpg
+from app.common.database_pool import get_domain_pool
+from app.common.report_cache import report_cache
+from app.common.attrdir_emission_sync import attrdir_emission_sync
+from app.common.direct_emission_bulk import MATDIR_TABLE, DirectEmissionBulkRow, bulk_upsert_direct_emissions
 from decimal import Decimal
 
 logger = logging.getLogger(__name__)
@@ -36,16 +39,8 @@ class MatDirRepository:
         self._initialization_attempted = True
         
         try:
-            self.pool = await asyncpg.create_pool(
-                self.database_url,
-                min_size=1,
-                max_size=10,
-                command_timeout=30,
-                server_settings={
-                    'application_name': 'cbam-service-matdir'
-                }
-            )
-            logger.info("✅ MatDir 데이터베이스 연결 풀 생성 성공")
+            self.pool = await get_domain_pool('matdir')
+            logger.info("✅ MatDir 공용 연결 풀 연결 성공")
             
             # 테이블 생성은 선택적으로 실행
             try:
@@ -54,6 +49,12 @@ class MatDirRepository:
             except Exception as e:
                 logger.warning(f"⚠️ 테이블 생성 실패 (기본 기능은 정상): {e}")
             
+            # 공정 직접귀속배출량 집계 트리거 (도메인 초기화 순서와 무관하게 마지막 테이블 생성 후 설치)
+            try:
+                await attrdir_emission_sync.ensure_installed(self.pool)
+            except Exception as e:
+                logger.warning(f"⚠️ 공정 직접귀속배출량 집계 트리거 설치 실패 (재계산 방식으로 동작): {e}")
+            
         except Exception as e:
             logger.error(f"❌ MatDir 데이터베이스 연결 실패: {str(e)}")
             logger.warning("데이터베이스 연결 실패로 인해 일부 기능이 제한됩니다.")
@@ -303,9 +304,14 @@ class MatDirRepository:
                     """, *params)
                     logger.info(f"🔍 INSERT 쿼리 실행 완료: {result}")
                 
-                action = "업데이트" if existing_record else "생성"
-                logger.info(f"✅ MatDir {action} 성공: ID {result['id']}")
-                return dict(result)
+                # 보고서 캐시 무효화 대상 (공정이 속한 사업장)
+                install_ids = await report_cache.installs_for_nodes(conn, process_ids=[result['process_id']])
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            action = "업데이트" if existing_record else "생성"
+            logger.info(f"✅ MatDir {action} 성공: ID {result['id']}")
+            return dict(result)
                 
         except Exception as e:
             logger.error(f"❌ MatDir 생성/업데이트 실패: {str(e)}")
@@ -313,6 +319,11 @@ class MatDirRepository:
             logger.error(f"❌ 에러 상세: {e}")
             raise
 
+    async def upsert_matdirs_bulk(self, rows: List[DirectEmissionBulkRow], include_results: bool = True) -> Dict[str, Any]:
+        """원료직접배출량 일괄 업서트 (unnest 배열 ON CONFLICT 한 문장 + 영향 공정만 재집계)"""
+        await self._ensure_pool_initialized()
+        return await bulk_upsert_direct_emissions(self.pool, MATDIR_TABLE, rows, include_results)
+
     async def get_matdirs(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
         """모든 원료직접배출량 데이터 조회"""
         await self._ensure_pool_initialized()
@@ -398,6 +409,20 @@ class MatDirRepository:
             logger.error(f"❌ 원료 마스터 조회 실패: {str(e)}")
             return None
 
+    async def get_material_factors_by_names(self, mat_names: List[str]) -> Dict[str, Decimal]:
+        """원료명 목록의 배출계수를 한 번에 조회 -> {원료명: 배출계수}"""
+        if not mat_names:
+            return {}
+        await self._ensure_pool_initialized()
+        
+        async with self.pool.acquire() as conn:
+            results = await conn.fetch("""
+                SELECT mat_name, mat_factor
+                FROM material_master
+                WHERE mat_name = ANY($1::text[])
+            """, mat_names)
+        return {row['mat_name']: row['mat_factor'] for row in results}
+
     async def search_materials(self, search_term: str) -> List[Dict[str, Any]]:
         """원료명으로 검색 (부분 검색)"""
         await self._ensure_pool_initialized()
@@ -561,7 +586,13 @@ class MatDirRepository:
                 
                 result = await conn.fetchrow(query, *final_values)
                 
-                return dict(result) if result else None
+                if not result:
+                    return None
+                install_ids = await report_cache.installs_for_nodes(conn, process_ids=[result['process_id']])
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            return dict(result)
                 
         except Exception as e:
             logger.error(f"❌ MatDir 수정 실패: {str(e)}")
@@ -576,11 +607,18 @@ class MatDirRepository:
             async with self.pool.acquire() as conn:
                 # ID를 문자열로 변환하여 BIGINT 범위 지원
                 matdir_id_str = str(matdir_id)
-                result = await conn.execute("""
+                deleted_process_id = await conn.fetchval("""
                     DELETE FROM matdir WHERE id = $1
+                    RETURNING process_id
                 """, matdir_id_str)
                 
-                return result != "DELETE 0"
+                if deleted_process_id is None:
+                    return False
+                install_ids = await report_cache.installs_for_nodes(conn, process_ids=[deleted_process_id])
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            return True
                 
         except Exception as e:
             logger.error(f"❌ MatDir 삭제 실패: {str(e)}")
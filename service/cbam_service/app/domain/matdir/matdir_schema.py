@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Literal
 from decimal import Decimal
 from datetime import datetime
 
@@ -43,6 +43,19 @@ class MatDirCalculationResponse(BaseModel):
     matdir_em: float = Field(..., description="원료직접배출량")
     calculation_formula: str = Field(..., description="계산 공식")
 
+# ============================================================================
+# 🧮 일괄 계산 스키마
+# ============================================================================
 
+class MatDirBatchCalculationItem(BaseModel):
+    process_id: int = Field(..., description="공정 ID")
+    mat_name: str = Field(..., description="투입된 원료명")
+    mat_amount: Decimal = Field(..., description="투입된 원료량")
+    mat_factor: Optional[Decimal] = Field(None, description="배출계수 (없으면 material_master에서 조회)")
+    oxyfactor: Optional[Decimal] = Field(default=Decimal('1.0000'), description="산화계수 (기본값: 1)")
 
-
+class MatDirBatchCalculationRequest(BaseModel):
+    items: List[MatDirBatchCalculationItem] = Field(..., min_length=1, max_length=100000, description="계산할 원료 투입 목록")
+    mode: Literal["fixed", "float", "decimal"] = Field("fixed", description="계산 모드 (fixed: int64 고정소수점, float: float64, decimal: Decimal 정확 계산)")
+    verify: bool = Field(False, description="Decimal 정확 계산과 비교한 검증 결과 포함")
+    include_items: bool = Field(True, description="행별 계산 결과 포함 (false면 공정별 합계만)")
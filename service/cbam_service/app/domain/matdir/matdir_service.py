@@ -9,8 +9,11 @@ from decimal import Decimal
 from app.domain.matdir.matdir_repository import MatDirRepository
 from app.domain.matdir.matdir_schema import (
     MatDirCreateRequest, MatDirResponse, MatDirUpdateRequest, 
-    MatDirCalculationRequest, MatDirCalculationResponse
+    MatDirCalculationRequest, MatDirCalculationResponse,
+    MatDirBatchCalculationRequest
 )
+from app.common.emission_batch import EmissionBatchRow, calculate_emission_batch, names_needing_factor
+from app.common.direct_emission_bulk import DirectEmissionBulkRow
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,15 @@ class MatDirService:
         self.matdir_repository = MatDirRepository()
         logger.info("✅ MatDir 서비스 초기화 완료")
     
+    async def initialize(self):
+        """데이터베이스 연결 초기화"""
+        try:
+            await self.matdir_repository.initialize()
+            logger.info("✅ MatDir 서비스 데이터베이스 연결 초기화 완료")
+        except Exception as e:
+            logger.warning(f"⚠️ MatDir 서비스 데이터베이스 초기화 실패 (서비스는 계속 실행): {e}")
+            logger.info("ℹ️ 데이터베이스 연결은 필요할 때 자동으로 초기화됩니다.")
+    
     # ============================================================================
     # 📦 기존 MatDir 관련 메서드들
     # ============================================================================
@@ -179,6 +191,45 @@ class MatDirService:
             calculation_formula=formula
         )
 
+    async def calculate_matdir_emission_batch(self, request: MatDirBatchCalculationRequest) -> Dict[str, Any]:
+        """원료직접배출량 일괄 계산 (배출계수는 material_master에서 한 번에 조회, 공정별 합계 포함)"""
+        try:
+            rows = [
+                EmissionBatchRow(
+                    index=index,
+                    process_id=item.process_id,
+                    name=item.mat_name,
+                    amount=item.mat_amount,
+                    factor=item.mat_factor,
+                    oxyfactor=item.oxyfactor if item.oxyfactor is not None else Decimal('1.0000')
+                )
+                for index, item in enumerate(request.items)
+            ]
+            master_factors = await self.matdir_repository.get_material_factors_by_names(names_needing_factor(rows))
+            return calculate_emission_batch(rows, master_factors, request.mode, request.verify, request.include_items)
+        except Exception as e:
+            logger.error(f"Error calculating matdir emission batch: {e}")
+            raise e
+
+    async def create_matdirs_bulk(self, requests: List[MatDirCreateRequest], include_results: bool = True) -> Dict[str, Any]:
+        """원료직접배출량 일괄 생성/수정 (같은 공정+원료명은 마지막 행 적용)"""
+        try:
+            rows = [
+                DirectEmissionBulkRow(
+                    index=index,
+                    process_id=request.process_id,
+                    name=request.mat_name,
+                    factor=request.mat_factor,
+                    amount=request.mat_amount,
+                    oxyfactor=request.oxyfactor
+                )
+                for index, request in enumerate(requests)
+            ]
+            return await self.matdir_repository.upsert_matdirs_bulk(rows, include_results)
+        except Exception as e:
+            logger.error(f"Error bulk upserting matdirs: {e}")
+            raise e
+
     async def get_total_matdir_emission_by_process(self, process_id: int) -> Decimal:
         """특정 공정의 총 원료직접배출량 계산"""
         try:
@@ -2,11 +2,12 @@
 # 🏭 Process Controller - 공정 API 엔드포인트
 # ============================================================================
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends, Query
 import logging
 from typing import List, Optional
 
 from app.domain.process.process_service import ProcessService
+from app.common.dependencies import get_process_service
 from app.domain.process.process_schema import (
     ProcessCreateRequest, ProcessResponse, ProcessUpdateRequest
 )
@@ -16,26 +17,22 @@ logger = logging.getLogger(__name__)
 # Gateway를 통해 접근하므로 /process 경로로 설정 (prefix 없음)
 router = APIRouter(tags=["Process"])
 
-def get_process_service():
-    """Process 서비스 인스턴스 반환"""
-    return ProcessService()
-
 @router.get("/", response_model=List[ProcessResponse])
 async def get_processes(
     process_name: Optional[str] = None,
-    product_id: Optional[int] = None
+    product_id: Optional[int] = None,
+    install_id: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=10000),
+    process_service: ProcessService = Depends(get_process_service)
 ):
-    """프로세스 목록 조회 (선택적 필터링)"""
+    """프로세스 목록 조회 (선택적 필터링/페이지네이션, DB에서 필터 적용)"""
     try:
-        logger.info(f"📋 프로세스 목록 조회 요청 - process_name: {process_name}, product_id: {product_id}")
-        process_service = get_process_service()
-        processes = await process_service.get_processes()
-        
-        # 필터링 적용
-        if process_name:
-            processes = [p for p in processes if process_name.lower() in p.process_name.lower()]
-        if product_id is not None:
-            processes = [p for p in processes if p.products and any(prod.get('id') == product_id for prod in p.products)]
+        logger.info(
+            f"📋 프로세스 목록 조회 요청 - process_name: {process_name}, product_id: {product_id}, "
+            f"install_id: {install_id}, skip: {skip}, limit: {limit}"
+        )
+        processes = await process_service.get_processes(process_name, product_id, install_id, skip, limit)
         
         logger.info(f"✅ 프로세스 목록 조회 성공: {len(processes)}개")
         return processes
@@ -44,11 +41,10 @@ async def get_processes(
         raise HTTPException(status_code=500, detail=f"프로세스 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
 @router.get("/{process_id}", response_model=ProcessResponse)
-async def get_process(process_id: int):
+async def get_process(process_id: int, process_service: ProcessService = Depends(get_process_service)):
     """특정 프로세스 조회"""
     try:
         logger.info(f"📋 프로세스 조회 요청: ID {process_id}")
-        process_service = get_process_service()
         process = await process_service.get_process(process_id)
         
         if not process:
@@ -64,11 +60,10 @@ async def get_process(process_id: int):
         raise HTTPException(status_code=500, detail=f"프로세스 조회 중 오류가 발생했습니다: {str(e)}")
 
 @router.post("/", response_model=ProcessResponse)
-async def create_process(request: ProcessCreateRequest):
+async def create_process(request: ProcessCreateRequest, process_service: ProcessService = Depends(get_process_service)):
     """프로세스 생성"""
     try:
         logger.info(f"🔄 프로세스 생성 요청: {request.process_name}")
-        process_service = get_process_service()
         process = await process_service.create_process(request)
         logger.info(f"✅ 프로세스 생성 성공: ID {process.id}")
         return process
@@ -77,11 +72,10 @@ async def create_process(request: ProcessCreateRequest):
         raise HTTPException(status_code=500, detail=f"프로세스 생성 중 오류가 발생했습니다: {str(e)}")
 
 @router.put("/{process_id}", response_model=ProcessResponse)
-async def update_process(process_id: int, request: ProcessUpdateRequest):
+async def update_process(process_id: int, request: ProcessUpdateRequest, process_service: ProcessService = Depends(get_process_service)):
     """프로세스 수정"""
     try:
         logger.info(f"📝 프로세스 수정 요청: ID {process_id}")
-        process_service = get_process_service()
         process = await process_service.update_process(process_id, request)
         
         if not process:
@@ -97,11 +91,10 @@ async def update_process(process_id: int, request: ProcessUpdateRequest):
         raise HTTPException(status_code=500, detail=f"프로세스 수정 중 오류가 발생했습니다: {str(e)}")
 
 @router.delete("/{process_id}")
-async def delete_process(process_id: int):
+async def delete_process(process_id: int, process_service: ProcessService = Depends(get_process_service)):
     """프로세스 삭제"""
     try:
         logger.info(f"🗑️ 프로세스 삭제 요청: ID {process_id}")
-        process_service = get_process_service()
         success = await process_service.delete_process(process_id)
         
         if not success:
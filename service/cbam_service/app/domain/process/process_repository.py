@@ -3,7 +3,8 @@ import os
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import asyncpg
+from app.common.database_pool import get_domain_pool
+from app.common.report_cache import report_cache
 from app.domain.process.process_schema import ProcessCreateRequest, ProcessUpdateRequest
 
 logger = logging.getLogger(__name__)
@@ -32,12 +33,8 @@ class ProcessRepository:
         self._initialization_attempted = True
         
         try:
-            self.pool = await asyncpg.create_pool(
-                self.database_url,
-                min_size=1, max_size=10, command_timeout=30,
-                server_settings={'application_name': 'cbam-service-process'}
-            )
-            logger.info("✅ Process 데이터베이스 연결 풀 생성 성공")
+            self.pool = await get_domain_pool('process')
+            logger.info("✅ Process 공용 연결 풀 연결 성공")
             
             try:
                 await self._create_process_table_async()
@@ -113,11 +110,18 @@ class ProcessRepository:
             logger.error(f"❌ 공정 생성 실패: {str(e)}")
             raise
     
-    async def get_processes(self) -> List[Dict[str, Any]]:
-        """공정 목록 조회"""
+    async def get_processes(
+        self,
+        process_name: Optional[str] = None,
+        product_id: Optional[int] = None,
+        install_id: Optional[int] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """공정 목록 조회 (공정명/제품/사업장 필터, 페이지네이션)"""
         await self._ensure_pool_initialized()
         try:
-            return await self._get_processes_db()
+            return await self._get_processes_db(process_name, product_id, install_id, skip, limit)
         except Exception as e:
             logger.error(f"❌ 공정 목록 조회 실패: {str(e)}")
             raise
@@ -190,48 +194,77 @@ class ProcessRepository:
                             ON CONFLICT (product_id, process_id) DO NOTHING
                         """, product_id, process_id)
                 
-                # 3. 생성된 공정 정보 반환 (제품 정보 포함)
-                return await self._get_process_with_products_db(process_id)
+                # 보고서 캐시 무효화 대상 (연결된 제품의 사업장)
+                install_ids = await report_cache.installs_for_nodes(conn, product_ids=process_data.get('product_ids') or [])
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            
+            # 3. 생성된 공정 정보 반환 (제품 정보 포함)
+            return await self._get_process_with_products_db(process_id)
                 
         except Exception as e:
             logger.error(f"❌ 공정 생성 실패: {str(e)}")
             raise
     
-    async def _get_processes_db(self) -> List[Dict[str, Any]]:
-        """데이터베이스에서 프로세스 목록 조회 (다대다 관계)"""
+    async def _get_processes_db(
+        self,
+        process_name: Optional[str] = None,
+        product_id: Optional[int] = None,
+        install_id: Optional[int] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """데이터베이스에서 프로세스 목록 조회 (다대다 관계, 공정 1회 + 연결 제품 1회 조회)"""
         if not self.pool:
             raise Exception("데이터베이스 연결 풀이 초기화되지 않았습니다.")
             
         try:
             async with self.pool.acquire() as conn:
-                # 모든 공정 조회
+                # 1. 필터/페이지가 적용된 공정 조회
                 results = await conn.fetch("""
-                    SELECT id, process_name, start_period, end_period, created_at, updated_at
-                    FROM process
-                    ORDER BY id
-                """)
+                    SELECT pr.id, pr.process_name, pr.start_period, pr.end_period, pr.created_at, pr.updated_at
+                    FROM process pr
+                    WHERE ($1::text IS NULL OR strpos(lower(pr.process_name), lower($1::text)) > 0)
+                      AND ($2::int IS NULL OR EXISTS (
+                            SELECT 1 FROM product_process pp
+                            WHERE pp.process_id = pr.id AND pp.product_id = $2::int
+                      ))
+                      AND ($3::int IS NULL OR EXISTS (
+                            SELECT 1 FROM product_process pp
+                            JOIN product p ON p.id = pp.product_id
+                            WHERE pp.process_id = pr.id AND p.install_id = $3::int
+                      ))
+                    ORDER BY pr.id
+                    OFFSET $4::int
+                    LIMIT $5::int
+                """, process_name or None, product_id, install_id, skip, limit)
                 
-                processes = []
-                for row in results:
-                    process_dict = dict(row)
-                    
-                    # 해당 공정과 연결된 제품들 조회
-                    product_results = await conn.fetch("""
-                        SELECT p.id, p.install_id, p.product_name, p.product_category, 
-                               p.prostart_period, p.proend_period, p.product_amount,
-                               p.cncode_total, p.goods_name, p.aggrgoods_name,
-                               p.product_sell, p.product_eusell, p.created_at, p.updated_at
-                        FROM product p
-                        JOIN product_process pp ON p.id = pp.product_id
-                        WHERE pp.process_id = $1
-                    """, process_dict['id'])
-                    
-                    products = [dict(product) for product in product_results]
-                    process_dict['products'] = products
-                    
-                    # datetime.date 객체는 그대로 유지 (스키마에서 date 타입으로 정의됨)
-                    
-                    processes.append(process_dict)
+                processes = [dict(row) for row in results]
+                if not processes:
+                    return processes
+                
+                # 2. 조회된 공정들의 연결 제품을 한 번에 조회해 메모리에서 연결
+                product_results = await conn.fetch("""
+                    SELECT pp.process_id AS linked_process_id,
+                           p.id, p.install_id, p.product_name, p.product_category, 
+                           p.prostart_period, p.proend_period, p.product_amount,
+                           p.cncode_total, p.goods_name, p.aggrgoods_name,
+                           p.product_sell, p.product_eusell, p.created_at, p.updated_at
+                    FROM product p
+                    JOIN product_process pp ON p.id = pp.product_id
+                    WHERE pp.process_id = ANY($1::int[])
+                    ORDER BY pp.process_id, p.id
+                """, [process['id'] for process in processes])
+                
+                products_by_process: Dict[int, List[Dict[str, Any]]] = {}
+                for product in product_results:
+                    product_dict = dict(product)
+                    products_by_process.setdefault(product_dict.pop('linked_process_id'), []).append(product_dict)
+                
+                # datetime.date 객체는 그대로 유지 (스키마에서 date 타입으로 정의됨)
+                for process in processes:
+                    process['products'] = products_by_process.get(process['id'], [])
                 
                 return processes
                 
@@ -278,11 +311,15 @@ class ProcessRepository:
                 
                 result = await conn.fetchrow(query, *values)
                 
-                if result:
-                    process_dict = dict(result)
-                    # datetime.date 객체는 그대로 유지 (스키마에서 date 타입으로 정의됨)
-                    return process_dict
-                return None
+                if not result:
+                    return None
+                # 보고서 캐시 무효화 대상 (공정명/기간은 보고서에 포함됨)
+                install_ids = await report_cache.installs_for_nodes(conn, process_ids=[process_id])
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            # datetime.date 객체는 그대로 유지 (스키마에서 date 타입으로 정의됨)
+            return dict(result)
                 
         except Exception as e:
             logger.error(f"❌ 공정 수정 실패: {str(e)}")
@@ -306,6 +343,9 @@ class ProcessRepository:
                 
                 logger.info(f"🗑️ 공정 삭제 시작: ID {process_id}, 이름: {result['process_name']}")
                 
+                # 보고서 캐시 무효화 대상 (제품-공정 관계를 지우기 전에 사업장 조회)
+                install_ids = await report_cache.installs_for_nodes(conn, process_ids=[process_id])
+                
                 # 먼저 해당 공정과 연결된 제품-공정 관계들을 삭제
                 await conn.execute("""
                     DELETE FROM product_process WHERE process_id = $1
@@ -319,8 +359,10 @@ class ProcessRepository:
                 """, process_id)
                 
                 logger.info(f"🗑️ 공정 삭제 완료")
-                
-                return True
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            return True
                 
         except Exception as e:
             logger.error(f"❌ 공정 삭제 실패: {str(e)}")
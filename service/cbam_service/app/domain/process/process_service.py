@@ -44,10 +44,17 @@ class ProcessService:
             logger.error(f"Error creating process: {e}")
             raise e
     
-    async def get_processes(self) -> List[ProcessResponse]:
+    async def get_processes(
+        self,
+        process_name: Optional[str] = None,
+        product_id: Optional[int] = None,
+        install_id: Optional[int] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[ProcessResponse]:
         """프로세스 목록 조회"""
         try:
-            processes = await self.process_repository.get_processes()
+            processes = await self.process_repository.get_processes(process_name, product_id, install_id, skip, limit)
             return [ProcessResponse(**process) for process in processes]
         except Exception as e:
             logger.error(f"Error getting processes: {e}")
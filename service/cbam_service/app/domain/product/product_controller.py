@@ -2,11 +2,12 @@
 # 🏭 Product Controller - 제품 API 엔드포인트
 # ============================================================================
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 import logging
 from typing import List, Optional
 
 from app.domain.product.product_service import ProductService
+from app.common.dependencies import get_product_service
 from app.domain.product.product_schema import (
     ProductCreateRequest, ProductResponse, ProductUpdateRequest, ProductNameResponse
 )
@@ -16,11 +17,6 @@ logger = logging.getLogger(__name__)
 # Gateway를 통해 접근하므로 /product 경로로 설정 (prefix 없음)
 router = APIRouter(tags=["Product"])
 
-# 서비스 인스턴스는 요청 시마다 생성 (모듈 레벨 초기화 방지)
-def get_product_service():
-    """Product 서비스 인스턴스 반환"""
-    return ProductService()
-
 # ============================================================================
 # 🏭 Product 관련 엔드포인트
 # ============================================================================
@@ -29,12 +25,12 @@ def get_product_service():
 async def get_products(
     install_id: Optional[int] = None,
     product_name: Optional[str] = None,
-    product_category: Optional[str] = None
+    product_category: Optional[str] = None,
+    product_service: ProductService = Depends(get_product_service)
 ):
     """제품 목록 조회 (선택적 필터링)"""
     try:
         logger.info(f"📋 제품 목록 조회 요청 - install_id: {install_id}, product_name: {product_name}, category: {product_category}")
-        product_service = get_product_service()
         products = await product_service.get_products()
         
         # 필터링 적용
@@ -52,11 +48,10 @@ async def get_products(
         raise HTTPException(status_code=500, detail=f"제품 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
 @router.get("/names", response_model=List[ProductNameResponse])
-async def get_product_names():
+async def get_product_names(product_service: ProductService = Depends(get_product_service)):
     """제품명 목록 조회 (드롭다운용)"""
     try:
         logger.info("📋 제품명 목록 조회 요청")
-        product_service = get_product_service()
         product_names = await product_service.get_product_names()
         logger.info(f"✅ 제품명 목록 조회 성공: {len(product_names)}개")
         return product_names
@@ -65,11 +60,10 @@ async def get_product_names():
         raise HTTPException(status_code=500, detail=f"제품명 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
 @router.get("/{product_id}", response_model=ProductResponse)
-async def get_product(product_id: int):
+async def get_product(product_id: int, product_service: ProductService = Depends(get_product_service)):
     """특정 제품 조회"""
     try:
         logger.info(f"📋 제품 조회 요청: ID {product_id}")
-        product_service = get_product_service()
         product = await product_service.get_product(product_id)
         if not product:
             raise HTTPException(status_code=404, detail="제품을 찾을 수 없습니다")
@@ -83,11 +77,10 @@ async def get_product(product_id: int):
         raise HTTPException(status_code=500, detail=f"제품 조회 중 오류가 발생했습니다: {str(e)}")
 
 @router.post("/", response_model=ProductResponse)
-async def create_product(request: ProductCreateRequest):
+async def create_product(request: ProductCreateRequest, product_service: ProductService = Depends(get_product_service)):
     """제품 생성"""
     try:
         logger.info(f"📝 제품 생성 요청: {request.product_name}")
-        product_service = get_product_service()
         product = await product_service.create_product(request)
         if not product:
             raise HTTPException(status_code=400, detail="제품 생성에 실패했습니다")
@@ -101,11 +94,10 @@ async def create_product(request: ProductCreateRequest):
         raise HTTPException(status_code=500, detail=f"제품 생성 중 오류가 발생했습니다: {str(e)}")
 
 @router.put("/{product_id}", response_model=ProductResponse)
-async def update_product(product_id: int, request: ProductUpdateRequest):
+async def update_product(product_id: int, request: ProductUpdateRequest, product_service: ProductService = Depends(get_product_service)):
     """제품 수정"""
     try:
         logger.info(f"📝 제품 수정 요청: ID {product_id}")
-        product_service = get_product_service()
         product = await product_service.update_product(product_id, request)
         if not product:
             raise HTTPException(status_code=404, detail="제품을 찾을 수 없습니다")
@@ -119,11 +111,10 @@ async def update_product(product_id: int, request: ProductUpdateRequest):
         raise HTTPException(status_code=500, detail=f"제품 수정 중 오류가 발생했습니다: {str(e)}")
 
 @router.delete("/{product_id}")
-async def delete_product(product_id: int):
+async def delete_product(product_id: int, product_service: ProductService = Depends(get_product_service)):
     """제품 삭제"""
     try:
         logger.info(f"🗑️ 제품 삭제 요청: ID {product_id}")
-        product_service = get_product_service()
         success = await product_service.delete_product(product_id)
         if not success:
             raise HTTPException(status_code=404, detail="제품을 찾을 수 없습니다")
@@ -141,11 +132,10 @@ async def delete_product(product_id: int):
 # ============================================================================
 
 @router.get("/install/{install_id}", response_model=List[ProductResponse])
-async def get_products_by_install(install_id: int):
+async def get_products_by_install(install_id: int, product_service: ProductService = Depends(get_product_service)):
     """사업장별 제품 목록 조회"""
     try:
         logger.info(f"🔍 사업장별 제품 조회 요청: 사업장 ID {install_id}")
-        product_service = get_product_service()
         products = await product_service.get_products_by_install(install_id)
         logger.info(f"✅ 사업장별 제품 조회 성공: 사업장 ID {install_id} → {len(products)}개")
         return products
@@ -154,11 +144,10 @@ async def get_products_by_install(install_id: int):
         raise HTTPException(status_code=500, detail=f"사업장별 제품 조회 중 오류가 발생했습니다: {str(e)}")
 
 @router.get("/search/{search_term}", response_model=List[ProductResponse])
-async def search_products(search_term: str):
+async def search_products(search_term: str, product_service: ProductService = Depends(get_product_service)):
     """제품 검색"""
     try:
         logger.info(f"🔍 제품 검색 요청: 검색어 '{search_term}'")
-        product_service = get_product_service()
         products = await product_service.search_products(search_term)
         logger.info(f"✅ 제품 검색 성공: 검색어 '{search_term}' → {len(products)}개")
         return products
@@ -171,11 +160,10 @@ async def search_products(search_term: str):
 # ============================================================================
 
 @router.get("/stats/summary")
-async def get_product_summary():
+async def get_product_summary(product_service: ProductService = Depends(get_product_service)):
     """제품 통계 요약"""
     try:
         logger.info("📊 제품 통계 요약 요청")
-        product_service = get_product_service()
         all_products = await product_service.get_products()
         
         # 카테고리별 통계
@@ -6,7 +6,8 @@ import logging
 import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import asyncpg
+from app.common.database_pool import get_domain_pool
+from app.common.report_cache import report_cache
 
 from app.domain.product.product_schema import ProductCreateRequest, ProductUpdateRequest
 
@@ -38,18 +39,10 @@ class ProductRepository:
         self._initialization_attempted = True
         
         try:
-            # asyncpg 연결 풀 생성
-            self.pool = await asyncpg.create_pool(
-                self.database_url,
-                min_size=1,
-                max_size=10,
-                command_timeout=30,
-                server_settings={
-                    'application_name': 'cbam-service-product'
-                }
-            )
+            # 공용 연결 풀에서 도메인 핸들 획득
+            self.pool = await get_domain_pool('product')
             
-            logger.info("✅ Product 데이터베이스 연결 풀 생성 성공")
+            logger.info("✅ Product 공용 연결 풀 연결 성공")
             
             # 테이블 생성은 선택적으로 실행
             try:
@@ -299,9 +292,11 @@ class ProductRepository:
                     VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
                     RETURNING *
                 """, *params)
-                
-                logger.info(f"✅ 제품 생성 성공: {result}")
-                return dict(result)
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_installs([result['install_id']])
+            logger.info(f"✅ 제품 생성 성공: {result}")
+            return dict(result)
                 
         except Exception as e:
             logger.error(f"❌ 제품 생성 실패: {str(e)}")
@@ -387,18 +382,24 @@ class ProductRepository:
                 """
                 values.append(product_id)
                 
+                # 사업장이 바뀌는 경우 이전 사업장 보고서도 무효화
+                previous_install_id = None
+                if update_data.get('install_id') is not None:
+                    previous_install_id = await conn.fetchval("SELECT install_id FROM product WHERE id = $1", product_id)
+                
                 result = await conn.fetchrow(query, *values)
                 
-                if result:
-                    product_dict = dict(result)
-                    # datetime.date 객체를 문자열로 변환
-                    if 'prostart_period' in product_dict and product_dict['prostart_period']:
-                        product_dict['prostart_period'] = product_dict['prostart_period'].isoformat()
-                    if 'proend_period' in product_dict and product_dict['proend_period']:
-                        product_dict['proend_period'] = product_dict['proend_period'].isoformat()
-                    return product_dict
-                else:
-                    return None
+            if not result:
+                return None
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_installs([result['install_id'], previous_install_id])
+            product_dict = dict(result)
+            # datetime.date 객체를 문자열로 변환
+            if 'prostart_period' in product_dict and product_dict['prostart_period']:
+                product_dict['prostart_period'] = product_dict['prostart_period'].isoformat()
+            if 'proend_period' in product_dict and product_dict['proend_period']:
+                product_dict['proend_period'] = product_dict['proend_period'].isoformat()
+            return product_dict
                 
         except Exception as e:
             logger.error(f"❌ 제품 업데이트 실패: {str(e)}")
@@ -417,11 +418,17 @@ class ProductRepository:
                     """, product_id)
                     
                     # 2단계: 제품 삭제
-                    result = await conn.execute("""
+                    deleted_install_id = await conn.fetchval("""
                         DELETE FROM product WHERE id = $1
+                        RETURNING install_id
                     """, product_id)
                     
-                    return result != "DELETE 0"
+                    if deleted_install_id is None:
+                        return False
+            
+            # 보고서 캐시 무효화는 트랜잭션이 커밋된 뒤에
+            await report_cache.invalidate_installs([deleted_install_id])
+            return True
                 
         except Exception as e:
             logger.error(f"❌ 제품 삭제 실패: {str(e)}")
@@ -7,12 +7,13 @@ from typing import List
 from fastapi import APIRouter, HTTPException, Query, Depends
 from fastapi.responses import JSONResponse
 
-from app.domain.productprocess.productprocess_service import ProductProcessService
+from app.common.dependencies import get_product_process_service
 from app.domain.productprocess.productprocess_schema import (
     ProductProcessCreateRequest, ProductProcessResponse,
     ProductProcessUpdateRequest, ProductProcessSearchRequest,
     ProductProcessFullResponse, ProductProcessByProductResponse,
-    ProductProcessByProcessResponse, ProductProcessStatsResponse
+    ProductProcessByProcessResponse, ProductProcessStatsResponse,
+    ProductProcessBatchCreateRequest, ProductProcessBatchResponse
 )
 
 logger = logging.getLogger(__name__)
@@ -20,8 +21,8 @@ logger = logging.getLogger(__name__)
 # Gateway를 통해 접근하므로 prefix 제거 (경로 중복 방지)
 router = APIRouter(tags=["Product Process"])
 
-# 서비스 인스턴스 생성
-product_process_service = ProductProcessService()
+# 서비스 인스턴스 (애플리케이션 수명 싱글톤)
+product_process_service = get_product_process_service()
 
 # ============================================================================
 # 🔗 ProductProcess 관련 엔드포인트 (다대다 관계)
@@ -43,6 +44,20 @@ async def create_product_process(request: ProductProcessCreateRequest):
         logger.error(f"❌ 제품-공정 관계 생성 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"제품-공정 관계 생성 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/batch", response_model=ProductProcessBatchResponse)
+async def create_product_processes_batch(request: ProductProcessBatchCreateRequest):
+    """제품-공정 관계 일괄 생성 (한 문장으로 저장, 행 번호별 오류 반환)"""
+    try:
+        logger.info(f"📦 제품-공정 관계 일괄 생성 요청: {len(request.relations)}개")
+        
+        # 서비스 초기화 확인
+        await product_process_service.initialize()
+        
+        return await product_process_service.create_product_processes_batch(request.relations, request.mode)
+    except Exception as e:
+        logger.error(f"❌ 제품-공정 관계 일괄 생성 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"제품-공정 관계 일괄 생성 중 오류가 발생했습니다: {str(e)}")
+
 @router.get("/{relation_id}", response_model=ProductProcessFullResponse)
 async def get_product_process_by_id(relation_id: int):
     """ID로 제품-공정 관계 조회"""
@@ -6,7 +6,8 @@ import logging
 import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import asyncpg
+from app.common.database_pool import get_domain_pool
+from app.common.report_cache import report_cache
 import os
 
 logger = logging.getLogger(__name__)
@@ -38,18 +39,10 @@ class ProductProcessRepository:
         logger.info(f"🔄 ProductProcess Repository 초기화 시작 - DATABASE_URL: {self.database_url[:20]}...")
         
         try:
-            # asyncpg 연결 풀 생성
-            self.pool = await asyncpg.create_pool(
-                self.database_url,
-                min_size=1,
-                max_size=10,
-                command_timeout=30,
-                server_settings={
-                    'application_name': 'cbam-service'
-                }
-            )
+            # 공용 연결 풀에서 도메인 핸들 획득
+            self.pool = await get_domain_pool('productprocess')
             
-            logger.info("✅ ProductProcess 데이터베이스 연결 풀 생성 성공")
+            logger.info("✅ ProductProcess 공용 연결 풀 연결 성공")
             
         except Exception as e:
             logger.error(f"❌ 데이터베이스 연결 실패: {str(e)}")
@@ -92,11 +85,15 @@ class ProductProcessRepository:
                     RETURNING *
                 """, product_process_data['product_id'], product_process_data['process_id'])
                 
-                if result:
-                    logger.info(f"✅ 제품-공정 관계 생성 성공: 제품 ID {product_process_data['product_id']}, 공정 ID {product_process_data['process_id']}")
-                    return dict(result)
-                else:
+                if not result:
                     raise Exception("제품-공정 관계 생성에 실패했습니다.")
+                # 보고서 캐시 무효화 대상 (제품의 사업장)
+                install_ids = await report_cache.installs_for_nodes(conn, product_ids=[result['product_id']])
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            logger.info(f"✅ 제품-공정 관계 생성 성공: 제품 ID {product_process_data['product_id']}, 공정 ID {product_process_data['process_id']}")
+            return dict(result)
                     
         except Exception as e:
             logger.error(f"❌ 제품-공정 관계 생성 실패: {str(e)}")
@@ -110,15 +107,19 @@ class ProductProcessRepository:
             async with self.pool.acquire() as conn:
                 result = await conn.execute("""
                     DELETE FROM product_process WHERE product_id = $1 AND process_id = $2
-                """, (product_id, process_id))
+                """, product_id, process_id)
                 
                 success = result != "DELETE 0"
-                if success:
-                    logger.info(f"✅ 제품-공정 관계 삭제 성공: 제품 ID {product_id}, 공정 ID {process_id}")
-                else:
+                if not success:
                     logger.warning(f"⚠️ 제품-공정 관계를 찾을 수 없음: 제품 ID {product_id}, 공정 ID {process_id}")
-                
-                return success
+                    return False
+                # 보고서 캐시 무효화 대상 (제품의 사업장)
+                install_ids = await report_cache.installs_for_nodes(conn, product_ids=[product_id])
+            
+            # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+            await report_cache.invalidate_resolved(install_ids)
+            logger.info(f"✅ 제품-공정 관계 삭제 성공: 제품 ID {product_id}, 공정 ID {process_id}")
+            return True
                 
         except Exception as e:
             logger.error(f"❌ 제품-공정 관계 삭제 실패: {str(e)}")
@@ -273,35 +274,84 @@ class ProductProcessRepository:
             logger.error(f"❌ 제품-공정 관계 통계 조회 실패: {str(e)}")
             raise
 
-    async def create_product_processes_batch(self, relations: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """제품-공정 관계 일괄 생성"""
+    async def create_product_processes_batch(self, relations: List[Dict[str, Any]], mode: str = "best_effort") -> Dict[str, Any]:
+        """제품-공정 관계 일괄 생성 (unnest 배열 한 문장)
+        
+        행마다 제품/공정 존재 여부와 생성 여부를 함께 돌려받아 행 번호별 오류를 만듭니다.
+        atomic 모드는 존재하지 않는 제품/공정이 하나라도 있으면 아무 관계도 만들지 않습니다.
+        """
         await self._ensure_pool_initialized()
         
+        if not relations:
+            return {"created_count": 0, "existing_count": 0, "failed_count": 0, "errors": []}
+        
         try:
             async with self.pool.acquire() as conn:
-                created_count = 0
-                failed_count = 0
-                errors = []
-                
-                for relation in relations:
-                    try:
-                        await conn.execute("""
+                async with conn.transaction():
+                    rows = await conn.fetch("""
+                        WITH input AS (
+                            SELECT t.row_no, t.product_id, t.process_id,
+                                   EXISTS (SELECT 1 FROM product p WHERE p.id = t.product_id) AS product_exists,
+                                   EXISTS (SELECT 1 FROM process pr WHERE pr.id = t.process_id) AS process_exists
+                            FROM unnest($1::int[], $2::int[], $3::int[]) AS t(row_no, product_id, process_id)
+                        ),
+                        inserted AS (
                             INSERT INTO product_process (product_id, process_id)
-                            VALUES ($1, $2)
+                            SELECT DISTINCT i.product_id, i.process_id
+                            FROM input i
+                            WHERE i.product_exists AND i.process_exists
+                              AND ($4::bool OR NOT EXISTS (
+                                  SELECT 1 FROM input bad WHERE NOT (bad.product_exists AND bad.process_exists)
+                              ))
                             ON CONFLICT (product_id, process_id) DO NOTHING
-                        """, relation['product_id'], relation['process_id'])
-                        
-                        created_count += 1
-                        
-                    except Exception as e:
-                        failed_count += 1
-                        errors.append(f"Relation {relation}: {str(e)}")
+                            RETURNING product_id, process_id
+                        )
+                        SELECT i.row_no, i.product_id, i.process_id, i.product_exists, i.process_exists,
+                               (ins.product_id IS NOT NULL) AS created
+                        FROM input i
+                        LEFT JOIN inserted ins
+                          ON ins.product_id = i.product_id AND ins.process_id = i.process_id
+                        ORDER BY i.row_no
+                    """,
+                        list(range(len(relations))),
+                        [relation['product_id'] for relation in relations],
+                        [relation['process_id'] for relation in relations],
+                        mode != "atomic"
+                    )
+                    
+                    errors = []
+                    created_pairs = set()
+                    for row in rows:
+                        if not row['product_exists']:
+                            errors.append(f"[{row['row_no']}] 제품 ID {row['product_id']}를 찾을 수 없습니다.")
+                        elif not row['process_exists']:
+                            errors.append(f"[{row['row_no']}] 공정 ID {row['process_id']}를 찾을 수 없습니다.")
+                        elif row['created']:
+                            created_pairs.add((row['product_id'], row['process_id']))
+                    
+                    created_count = len(created_pairs)
+                    failed_count = len(errors)
+                    # atomic 모드에서 거부되면 유효한 행도 만들어지지 않으므로 기존 관계로 세지 않음
+                    rejected = mode == "atomic" and failed_count > 0
+                    existing_count = 0 if rejected else len(relations) - failed_count - created_count
+                    
+                    install_ids = await report_cache.installs_for_nodes(
+                        conn, product_ids={product_id for product_id, _ in created_pairs}
+                    ) if created_pairs else set()
+                
+                # 보고서 캐시 무효화는 쓰기가 커밋된 뒤에
+                await report_cache.invalidate_resolved(install_ids)
                 
-                logger.info(f"✅ 제품-공정 관계 일괄 생성 완료: {created_count}개 성공, {failed_count}개 실패")
+                logger.info(
+                    f"✅ 제품-공정 관계 일괄 생성 완료: {created_count}개 생성, {existing_count}개 기존/중복, "
+                    f"{failed_count}개 실패{' (전체 거부)' if rejected else ''}"
+                )
                 
                 return {
                     "created_count": created_count,
+                    "existing_count": existing_count,
                     "failed_count": failed_count,
+                    "rejected": rejected,
                     "errors": errors
                 }
                 
@@ -3,7 +3,7 @@
 # ============================================================================
 
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Literal
 from datetime import datetime
 
 # ============================================================================
@@ -64,3 +64,22 @@ class ProductProcessStatsResponse(BaseModel):
     total_relations: int = Field(..., description="전체 관계 수")
     total_products: int = Field(..., description="관련 제품 수")
     total_processes: int = Field(..., description="관련 공정 수")
+
+# ============================================================================
+# 📦 일괄 처리 관련 스키마
+# ============================================================================
+
+class ProductProcessBatchCreateRequest(BaseModel):
+    """제품-공정 관계 일괄 생성 요청"""
+    relations: List[ProductProcessCreateRequest] = Field(..., max_length=10000, description="관계 목록 (최대 10000개)")
+    mode: Literal["atomic", "best_effort"] = Field(
+        "best_effort", description="atomic: 존재하지 않는 제품/공정이 하나라도 있으면 전체 거부, best_effort: 유효한 행만 저장"
+    )
+
+class ProductProcessBatchResponse(BaseModel):
+    """제품-공정 관계 일괄 생성 응답"""
+    success: bool = Field(..., description="처리 성공 여부")
+    created_count: int = Field(..., description="새로 생성된 관계 수")
+    existing_count: int = Field(0, description="이미 있거나 요청 내 중복인 관계 수")
+    failed_count: int = Field(..., description="실패한 행 수")
+    errors: List[str] = Field(default=[], description="오류 메시지 목록 ([행 번호] 메시지)")
@@ -3,7 +3,7 @@
 # ============================================================================
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Optional
 from datetime import datetime
 
 from app.domain.productprocess.productprocess_repository import ProductProcessRepository
@@ -11,7 +11,8 @@ from app.domain.productprocess.productprocess_schema import (
     ProductProcessCreateRequest, ProductProcessResponse,
     ProductProcessUpdateRequest, ProductProcessSearchRequest,
     ProductProcessFullResponse, ProductProcessByProductResponse,
-    ProductProcessByProcessResponse, ProductProcessStatsResponse
+    ProductProcessByProcessResponse, ProductProcessStatsResponse,
+    ProductProcessBatchResponse
 )
 
 logger = logging.getLogger(__name__)
@@ -163,9 +164,8 @@ class ProductProcessService:
             else:
                 # 제품 정보를 직접 조회
                 try:
-                    from app.domain.product.product_service import ProductService
-                    product_service = ProductService()
-                    await product_service.initialize()
+                    from app.common.dependencies import get_product_service
+                    product_service = get_product_service()
                     product = await product_service.get_product(product_id)
                     if product:
                         product_name = product.product_name
@@ -244,24 +244,31 @@ class ProductProcessService:
             logger.error(f"❌ 제품-공정 관계 통계 조회 실패: {str(e)}")
             raise
 
-    async def create_product_processes_batch(self, relations: List[ProductProcessCreateRequest]) -> Dict[str, Any]:
+    async def create_product_processes_batch(
+        self,
+        relations: List[ProductProcessCreateRequest],
+        mode: str = "best_effort"
+    ) -> ProductProcessBatchResponse:
         """제품-공정 관계 일괄 생성"""
         try:
-            logger.info(f"🔄 제품-공정 관계 일괄 생성 요청: {len(relations)}개")
+            logger.info(f"🔄 제품-공정 관계 일괄 생성 요청: {len(relations)}개 ({mode})")
             
             # 스키마를 딕셔너리로 변환
-            relations_data = []
-            for relation in relations:
-                relation_dict = {
-                    'product_id': relation.product_id,
-                    'process_id': relation.process_id
-                }
-                relations_data.append(relation_dict)
+            relations_data = [
+                {'product_id': relation.product_id, 'process_id': relation.process_id}
+                for relation in relations
+            ]
             
-            result = await self.product_process_repository.create_product_processes_batch(relations_data)
+            result = await self.product_process_repository.create_product_processes_batch(relations_data, mode)
             
             logger.info(f"✅ 제품-공정 관계 일괄 생성 완료: {result['created_count']}개 성공, {result['failed_count']}개 실패")
-            return result
+            return ProductProcessBatchResponse(
+                success=not result['rejected'] and result['failed_count'] == 0,
+                created_count=result['created_count'],
+                existing_count=result['existing_count'],
+                failed_count=result['failed_count'],
+                errors=result['errors']
+            )
             
         except Exception as e:
             logger.error(f"❌ 제품-공정 관계 일괄 생성 실패: {str(e)}")
@@ -8,7 +8,7 @@ from fastapi import APIRouter, HTTPException, Query, Depends
 from fastapi.responses import JSONResponse
 from datetime import date
 
-from app.domain.report.report_service import ReportService
+from app.common.dependencies import get_report_service
 from app.domain.report.report_schema import (
     GasEmissionReportRequest, GasEmissionReportResponse,
     ReportStatsResponse
@@ -19,8 +19,8 @@ logger = logging.getLogger(__name__)
 # Gateway를 통해 접근하므로 prefix 제거 (경로 중복 방지)
 router = APIRouter(tags=["Report"])
 
-# 서비스 인스턴스 생성
-report_service = ReportService()
+# 서비스 인스턴스 (애플리케이션 수명 싱글톤)
+report_service = get_report_service()
 
 # ============================================================================
 # 📊 Report 관련 엔드포인트
@@ -6,7 +6,7 @@ import logging
 import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date
-import asyncpg
+from app.common.database_pool import get_domain_pool
 import os
 
 logger = logging.getLogger(__name__)
@@ -38,18 +38,10 @@ class ReportRepository:
         logger.info(f"🔄 Report Repository 초기화 시작 - DATABASE_URL: {self.database_url[:20]}...")
         
         try:
-            # asyncpg 연결 풀 생성
-            self.pool = await asyncpg.create_pool(
-                self.database_url,
-                min_size=1,
-                max_size=10,
-                command_timeout=30,
-                server_settings={
-                    'application_name': 'cbam-service'
-                }
-            )
+            # 공용 연결 풀에서 도메인 핸들 획득
+            self.pool = await get_domain_pool('report')
             
-            logger.info("✅ Report 데이터베이스 연결 풀 생성 성공")
+            logger.info("✅ Report 공용 연결 풀 연결 성공")
             
         except Exception as e:
             logger.error(f"❌ 데이터베이스 연결 실패: {str(e)}")
@@ -214,6 +206,118 @@ class ReportRepository:
             logger.error(f"❌ 공정별 연료 조회 실패: {str(e)}")
             raise
 
+    async def get_report_tree_data(self, install_id: int, start_date: date, end_date: date) -> Dict[str, Any]:
+        """
+        보고서 제품/공정/원료/연료 트리 데이터 일괄 조회
+
+        제품 → 공정 → 원료/연료를 단계별로 한 번씩만 조회(= ANY($1))하여
+        제품·공정 수와 관계없이 한 연결에서 4개의 쿼리로 끝냅니다.
+        """
+        await self._ensure_pool_initialized()
+
+        try:
+            async with self.pool.acquire() as conn:
+                products = await conn.fetch("""
+                    SELECT
+                        p.id,
+                        p.product_name,
+                        p.product_category,
+                        p.product_cncode,
+                        p.goods_name,
+                        p.aggrgoods_name,
+                        p.product_amount,
+                        p.prostart_period,
+                        p.proend_period,
+                        p.product_sell,
+                        p.product_eusell
+                    FROM product p
+                    WHERE p.install_id = $1
+                    AND p.prostart_period <= $3
+                    AND p.proend_period >= $2
+                    ORDER BY p.product_name
+                """, install_id, start_date, end_date)
+
+                product_ids = [row['id'] for row in products]
+                processes = []
+                if product_ids:
+                    processes = await conn.fetch("""
+                        SELECT
+                            pp.product_id,
+                            pr.id,
+                            pr.process_name,
+                            pr.start_period,
+                            pr.end_period,
+                            pp.consumption_amount
+                        FROM product_process pp
+                        JOIN process pr ON pp.process_id = pr.id
+                        WHERE pp.product_id = ANY($1::bigint[])
+                        ORDER BY pp.product_id, pr.process_name
+                    """, product_ids)
+
+                process_ids = list({row['id'] for row in processes})
+                materials = []
+                fuels = []
+                if process_ids:
+                    materials = await conn.fetch("""
+                        SELECT
+                            pi.process_id,
+                            m.id,
+                            m.item_name,
+                            m.item_eng,
+                            m.carbon_factor,
+                            m.em_factor,
+                            m.cn_code,
+                            pi.quantity,
+                            pi.input_type
+                        FROM process_input pi
+                        JOIN materials m ON pi.material_id = m.id
+                        WHERE pi.process_id = ANY($1::bigint[]) AND pi.input_type = 'material'
+                        ORDER BY pi.process_id, m.item_name
+                    """, process_ids)
+
+                    fuels = await conn.fetch("""
+                        SELECT
+                            pi.process_id,
+                            f.id,
+                            f.fuel_name,
+                            f.fuel_eng,
+                            f.fuel_emfactor,
+                            f.net_calory,
+                            pi.quantity,
+                            pi.input_type
+                        FROM process_input pi
+                        JOIN fuels f ON pi.fuel_id = f.id
+                        WHERE pi.process_id = ANY($1::bigint[]) AND pi.input_type = 'fuel'
+                        ORDER BY pi.process_id, f.fuel_name
+                    """, process_ids)
+
+                # 공정/원료/연료를 부모 ID별로 묶어서 반환 (부모 ID 컬럼은 기존 응답 형태에 맞게 제거)
+                processes_by_product: Dict[int, List[Dict[str, Any]]] = {}
+                for row in processes:
+                    process = dict(row)
+                    processes_by_product.setdefault(process.pop('product_id'), []).append(process)
+
+                materials_by_process: Dict[int, List[Dict[str, Any]]] = {}
+                for row in materials:
+                    material = dict(row)
+                    materials_by_process.setdefault(material.pop('process_id'), []).append(material)
+
+                fuels_by_process: Dict[int, List[Dict[str, Any]]] = {}
+                for row in fuels:
+                    fuel = dict(row)
+                    fuels_by_process.setdefault(fuel.pop('process_id'), []).append(fuel)
+
+                return {
+                    'products': [dict(row) for row in products],
+                    'processes_by_product': processes_by_product,
+                    'materials_by_process': materials_by_process,
+                    'fuels_by_process': fuels_by_process
+                }
+
+        except Exception as e:
+            logger.error(f"❌ 보고서 트리 데이터 일괄 조회 실패: {str(e)}")
+            raise
+
     async def get_precursors_by_install(self, install_id: int) -> List[Dict[str, Any]]:
         """사업장별 전구체 조회"""
         await self._ensure_pool_initialized()
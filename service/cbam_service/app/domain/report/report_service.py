@@ -6,6 +6,7 @@ import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 
+from app.common.report_cache import report_cache
 from app.domain.report.report_repository import ReportRepository
 from app.domain.report.report_schema import (
     GasEmissionReportRequest, GasEmissionReportResponse,
@@ -36,8 +37,66 @@ class ReportService:
     # 📊 Report 관련 메서드
     # ============================================================================
 
+    def _build_product_tree(self, tree_data: Dict[str, Any]) -> List[ProductInfo]:
+        """일괄 조회한 데이터로 ProductInfo/ProcessInfo 트리 구성 (추가 쿼리 없음)"""
+        processes_by_product = tree_data['processes_by_product']
+        materials_by_process = tree_data['materials_by_process']
+        fuels_by_process = tree_data['fuels_by_process']
+        
+        products = []
+        for product_data in tree_data['products']:
+            processes = []
+            for process_data in processes_by_product.get(product_data['id'], []):
+                materials_data = materials_by_process.get(process_data['id'], [])
+                fuels_data = fuels_by_process.get(process_data['id'], [])
+                
+                # 배출량 계산
+                emission_amount = sum(m.get('em_factor', 0) * m.get('quantity', 0) for m in materials_data)
+                emission_amount += sum(f.get('fuel_emfactor', 0) * f.get('quantity', 0) for f in fuels_data)
+                
+                process = ProcessInfo(
+                    id=process_data['id'],
+                    process_name=process_data['process_name'],
+                    start_period=process_data.get('start_period'),
+                    end_period=process_data.get('end_period'),
+                    materials=materials_data,
+                    fuels=fuels_data,
+                    emission_amount=emission_amount,
+                    aggregated_emission=emission_amount * product_data.get('product_amount', 0)
+                )
+                processes.append(process)
+            
+            product = ProductInfo(
+                id=product_data['id'],
+                product_name=product_data['product_name'],
+                product_category=product_data['product_category'],
+                cn_code=product_data.get('product_cncode'),
+                goods_name=product_data.get('goods_name'),
+                aggrgoods_name=product_data.get('aggrgoods_name'),
+                product_amount=product_data['product_amount'],
+                prostart_period=product_data['prostart_period'],
+                proend_period=product_data['proend_period'],
+                processes=processes
+            )
+            products.append(product)
+        
+        return products
+
     async def generate_gas_emission_report(self, request: GasEmissionReportRequest) -> GasEmissionReportResponse:
-        """가스 배출 보고서 생성"""
+        """가스 배출 보고서 생성 (사업장/기간별 캐시 사용)"""
+        report = await report_cache.get_or_compute(
+            f"gas_emission:{request.company_name or ''}",
+            request.install_id,
+            request.start_date,
+            request.end_date,
+            GasEmissionReportResponse,
+            lambda: self._build_gas_emission_report(request)
+        )
+        # 발행일자는 요청마다 다르므로 캐시된 보고서에 덮어씀
+        return report.model_copy(update={"issue_date": request.issue_date or date.today()})
+
+    async def _build_gas_emission_report(self, request: GasEmissionReportRequest) -> GasEmissionReportResponse:
+        """가스 배출 보고서 생성 (DB 조회 및 조립)"""
         try:
             logger.info(f"📊 가스 배출 보고서 생성 요청: 사업장 ID {request.install_id}, 기간 {request.start_date} ~ {request.end_date}")
             
@@ -60,53 +119,11 @@ class ReportService:
                 currency_code=installation_data.get('currency_code')
             )
             
-            # 2. 제품 정보 조회
-            products_data = await self.report_repository.get_products_by_install_and_period(
+            # 2. 제품/공정/원료/연료 일괄 조회 후 메모리에서 트리 구성
+            tree_data = await self.report_repository.get_report_tree_data(
                 request.install_id, request.start_date, request.end_date
             )
-            
-            products = []
-            for product_data in products_data:
-                # 제품별 공정 조회
-                processes_data = await self.report_repository.get_processes_by_product(product_data['id'])
-                
-                processes = []
-                for process_data in processes_data:
-                    # 공정별 원료 조회
-                    materials_data = await self.report_repository.get_materials_by_process(process_data['id'])
-                    
-                    # 공정별 연료 조회
-                    fuels_data = await self.report_repository.get_fuels_by_process(process_data['id'])
-                    
-                    # 배출량 계산
-                    emission_amount = sum(m.get('em_factor', 0) * m.get('quantity', 0) for m in materials_data)
-                    emission_amount += sum(f.get('fuel_emfactor', 0) * f.get('quantity', 0) for f in fuels_data)
-                    
-                    process = ProcessInfo(
-                        id=process_data['id'],
-                        process_name=process_data['process_name'],
-                        start_period=process_data.get('start_period'),
-                        end_period=process_data.get('end_period'),
-                        materials=materials_data,
-                        fuels=fuels_data,
-                        emission_amount=emission_amount,
-                        aggregated_emission=emission_amount * product_data.get('product_amount', 0)
-                    )
-                    processes.append(process)
-                
-                product = ProductInfo(
-                    id=product_data['id'],
-                    product_name=product_data['product_name'],
-                    product_category=product_data['product_category'],
-                    cn_code=product_data.get('product_cncode'),
-                    goods_name=product_data.get('goods_name'),
-                    aggrgoods_name=product_data.get('aggrgoods_name'),
-                    product_amount=product_data['product_amount'],
-                    prostart_period=product_data['prostart_period'],
-                    proend_period=product_data['proend_period'],
-                    processes=processes
-                )
-                products.append(product)
+            products = self._build_product_tree(tree_data)
             
             # 3. 전구체 정보 조회
             precursors_data = await self.report_repository.get_precursors_by_install(request.install_id)
@@ -157,29 +174,41 @@ class ReportService:
             raise
 
     async def get_report_stats(self, install_id: int, start_date: date, end_date: date) -> ReportStatsResponse:
-        """보고서 통계 조회"""
+        """보고서 통계 조회 (사업장/기간별 캐시 사용)"""
+        return await report_cache.get_or_compute(
+            "stats",
+            install_id,
+            start_date,
+            end_date,
+            ReportStatsResponse,
+            lambda: self._build_report_stats(install_id, start_date, end_date)
+        )
+
+    async def _build_report_stats(self, install_id: int, start_date: date, end_date: date) -> ReportStatsResponse:
+        """보고서 통계 계산 (DB 조회 및 집계)"""
         try:
             logger.info(f"📊 보고서 통계 조회 요청: 사업장 ID {install_id}")
             
             # 서비스 초기화 확인
             await self.initialize()
             
-            # 제품 수 조회
-            products_data = await self.report_repository.get_products_by_install_and_period(
+            # 제품/공정/원료/연료 일괄 조회 후 메모리에서 집계
+            tree_data = await self.report_repository.get_report_tree_data(
                 install_id, start_date, end_date
             )
+            products_data = tree_data['products']
             
             total_products = len(products_data)
             total_processes = 0
             total_emissions = 0.0
             
             for product_data in products_data:
-                processes_data = await self.report_repository.get_processes_by_product(product_data['id'])
+                processes_data = tree_data['processes_by_product'].get(product_data['id'], [])
                 total_processes += len(processes_data)
                 
                 for process_data in processes_data:
-                    materials_data = await self.report_repository.get_materials_by_process(process_data['id'])
-                    fuels_data = await self.report_repository.get_fuels_by_process(process_data['id'])
+                    materials_data = tree_data['materials_by_process'].get(process_data['id'], [])
+                    fuels_data = tree_data['fuels_by_process'].get(process_data['id'], [])
                     
                     emission_amount = sum(m.get('em_factor', 0) * m.get('quantity', 0) for m in materials_data)
                     emission_amount += sum(f.get('fuel_emfactor', 0) * f.get('quantity', 0) for f in fuels_data)
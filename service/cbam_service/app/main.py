@@ -5,14 +5,17 @@
 import time
 import logging
 import os
-import re
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import text
+
+from app.common.database_pool import pool_registry
+from app.common.report_cache import report_cache
+from app.common.graph_topology import topology_cache
+from app.common.attrdir_emission_sync import attrdir_emission_sync
+from app.common.hs_cn_index import hs_cn_index
+from app.common.dependencies import container
 
 # 로깅 설정
 logging.basicConfig(
@@ -55,11 +58,7 @@ APP_VERSION = os.getenv("APP_VERSION", "1.0.0")
 APP_DESCRIPTION = os.getenv("APP_DESCRIPTION", "ReactFlow 기반 서비스")
 DEBUG_MODE = os.getenv("DEBUG_MODE", "false").lower() == "true"
 
-# 전역 데이터베이스 엔진 및 세션 팩토리
-async_engine = None
-async_session_factory = None
-
-# get_async_db 함수는 database_base.py에서 관리 (순환 참조 방지)
+# 데이터베이스 연결은 app.common.database_pool의 공용 풀(pool_registry)이 관리
 
 # ============================================================================
 # 🔄 애플리케이션 생명주기 관리
@@ -73,37 +72,8 @@ def get_database_url():
         return None
     return database_url
 
-def clean_database_url(url: str) -> str:
-    """데이터베이스 URL 정리 및 asyncpg 형식으로 변환"""
-    # Railway PostgreSQL에서 발생할 수 있는 잘못된 파라미터들 제거
-    invalid_params = [
-        'db_type', 'db_type=postgresql', 'db_type=postgres',
-        'db_type=mysql', 'db_type=sqlite'
-    ]
-    
-    for param in invalid_params:
-        if param in url:
-            url = url.replace(param, '')
-            logger.warning(f"잘못된 데이터베이스 파라미터 제거: {param}")
-    
-    # 연속된 & 제거
-    url = re.sub(r'&&+', '&', url)
-    url = re.sub(r'&+$', '', url)
-    
-    if '?' in url and url.split('?')[1].startswith('&'):
-        url = url.replace('?&', '?')
-    
-    # postgresql:// -> postgresql+asyncpg:// 변환 (SQLAlchemy async 지원)
-    if url.startswith('postgresql://'):
-        url = url.replace('postgresql://', 'postgresql+asyncpg://', 1)
-        logger.info("✅ PostgreSQL URL을 asyncpg 형식으로 변환")
-    
-    return url
-
 async def initialize_database():
-    """비동기 데이터베이스 초기화 및 SQLAlchemy 엔진 설정"""
-    global async_engine, async_session_factory
-    
+    """공용 asyncpg 연결 풀 초기화 (모든 Repository가 이 풀을 공유)"""
     try:
         database_url = get_database_url()
         if not database_url:
@@ -112,50 +82,21 @@ async def initialize_database():
             return
         
         logger.info(f"🗄️ 데이터베이스 초기화 시작...")
-        clean_url = clean_database_url(database_url)
-        logger.info(f"🗄️ 정리된 데이터베이스 URL: {clean_url.split('@')[1] if '@' in clean_url else 'localhost'}")
-        
-        # 비동기 SQLAlchemy 엔진 생성
-        async_engine = create_async_engine(
-            clean_url,
-            echo=DEBUG_MODE,  # 디버그 모드에서만 SQL 로깅
-            pool_pre_ping=True,
-            pool_recycle=300,
-            pool_size=5,
-            max_overflow=10,
-            connect_args={
-                'server_settings': {
-                    'application_name': 'cbam-service-async',
-                    'timezone': 'utc',
-                    'client_encoding': 'utf8'
-                }
-            }
-        )
+        pool = await pool_registry.open()
         
-        # 비동기 세션 팩토리 생성
-        async_session_factory = sessionmaker(
-            async_engine, 
-            class_=AsyncSession, 
-            expire_on_commit=False
-        )
-        
-        logger.info("✅ 비동기 SQLAlchemy 엔진 및 세션 팩토리 생성 완료")
-        
-        # 연결 테스트 (타임아웃 설정)
+        # 연결 테스트
         try:
-            async with async_engine.begin() as conn:
-                result = await conn.execute(text("SELECT 1"))
+            async with pool.acquire() as conn:
+                await conn.fetchval("SELECT 1")
                 logger.info("✅ 데이터베이스 연결 테스트 성공")
         except Exception as conn_error:
             logger.warning(f"⚠️ 데이터베이스 연결 테스트 실패: {str(conn_error)}")
             logger.info("✅ 서비스는 계속 실행되지만 데이터베이스 기능이 제한될 수 있습니다.")
         
     except Exception as e:
-        logger.error(f"❌ 비동기 데이터베이스 초기화 실패: {str(e)}")
+        logger.error(f"❌ 공용 연결 풀 초기화 실패: {str(e)}")
         logger.warning("⚠️ 데이터베이스 연결 실패로 인해 일부 기능이 제한될 수 있습니다.")
         logger.info("✅ 서비스는 데이터베이스 없이도 계속 실행됩니다.")
-        async_engine = None
-        async_session_factory = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -165,21 +106,20 @@ async def lifespan(app: FastAPI):
     # 비동기 데이터베이스 초기화
     await initialize_database()
     
-    # ReactFlow 기반 서비스 초기화
+    # ReactFlow 기반 서비스 초기화 (싱글톤 생성 + 테이블 확인 워밍업)
+    await container.warm_up()
     logger.info("✅ ReactFlow 기반 서비스 초기화")
     
-    # SQLAlchemy 엔진 상태 확인
-    if async_engine:
-        logger.info("✅ SQLAlchemy 비동기 엔진 초기화 완료")
+    # 공용 연결 풀 상태 확인
+    if pool_registry.pool:
+        logger.info("✅ 공용 데이터베이스 연결 풀 초기화 완료")
     else:
-        logger.warning("⚠️ SQLAlchemy 엔진 초기화 실패 - Repository 자동 초기화에 의존")
+        logger.warning("⚠️ 공용 연결 풀 초기화 실패 - Repository 최초 사용 시 재시도")
     
     yield
     
-    # 서비스 종료 시 정리 작업
-    if async_engine:
-        await async_engine.dispose()
-        logger.info("✅ SQLAlchemy 엔진 정리 완료")
+    # 서비스 종료 시 정리 작업 (싱글톤 해제 + 공용 연결 풀 종료)
+    await container.shutdown()
     
     logger.info("✅ ReactFlow 기반 서비스 정리 완료")
     logger.info("🛑 Cal_boundary 서비스 종료 중...")
@@ -278,13 +218,17 @@ async def root():
 @app.get("/health", tags=["health"])
 async def health_check():
     """서비스 상태 확인"""
-    # 🔴 데이터베이스 연결 상태 확인 제거 - 메인 라우터 역할에 맞지 않음
-    # 각 Repository가 자체적으로 연결 상태를 관리함
+    # 🔴 데이터베이스 연결 확인 쿼리는 실행하지 않고 공용 풀 통계만 노출
     return {
         "status": "healthy",
         "service": APP_NAME,
         "version": APP_VERSION,
-        "timestamp": time.time()
+        "timestamp": time.time(),
+        "database_pool": pool_registry.get_stats(),
+        "report_cache": report_cache.get_stats(),
+        "graph_topology": topology_cache.get_stats(),
+        "attrdir_emission_sync": attrdir_emission_sync.get_stats(),
+        "hs_cn_index": hs_cn_index.get_stats()
     }
 
 @app.get("/debug/routes", tags=["debug"])
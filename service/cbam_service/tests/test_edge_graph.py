@@ -0,0 +1,70 @@
+# ============================================================================
+# 🧪 EmissionGraph 배출량 전파 테스트
+# ============================================================================
+
+from app.domain.edge.edge_graph import EmissionGraph, PROCESS, PRODUCT
+
+
+def _edge(source, target, kind):
+    return {
+        'source_node_type': source[0], 'source_id': source[1],
+        'target_node_type': target[0], 'target_id': target[1],
+        'edge_kind': kind
+    }
+
+
+def _snapshot(edges, product_attr_em=0.0):
+    return {
+        'edges': edges,
+        'process_attrdir': {1: 10.0, 2: 5.0, 3: 2.0},
+        'products': {
+            100: {'product_amount': 10.0, 'product_sell': 0.0, 'product_eusell': 0.0, 'attr_em': product_attr_em}
+        },
+        'consumption': {(100, 3): 10.0}
+    }
+
+
+def test_produce_and_consume_propagation():
+    graph = EmissionGraph.from_snapshot(_snapshot([
+        _edge((PROCESS, 1), (PROCESS, 2), 'continue'),
+        _edge((PROCESS, 2), (PRODUCT, 100), 'produce'),
+        _edge((PRODUCT, 100), (PROCESS, 3), 'consume'),
+    ]))
+
+    results = graph.compute()
+
+    assert results['process_cumulative'] == {1: 10.0, 2: 15.0, 3: 17.0}
+    assert results['product_emission'] == {100: 15.0}
+    assert results['consumption_updates'] == {(100, 3): 10.0}
+
+
+def test_deleting_last_produce_edge_resets_product():
+    # 공정 2 → 제품 100 produce 엣지 삭제 후 증분 재계산 (제품 100이 변경 노드)
+    graph = EmissionGraph.from_snapshot(_snapshot([
+        _edge((PRODUCT, 100), (PROCESS, 3), 'consume'),
+    ], product_attr_em=15.0))
+    touched = [(PRODUCT, 100)]
+    for node in touched:
+        graph.add_node(node)
+    order = graph.topological_order(graph.downstream_closure(touched))
+
+    results = graph.compute(
+        order,
+        known_process_cumulative={1: 10.0, 2: 15.0, 3: 17.0},
+        known_product_emission={100: 15.0},
+        reset_products=[100]
+    )
+
+    assert results['product_emission'] == {100: 0.0}
+    assert results['process_cumulative'] == {3: 2.0}
+
+
+def test_product_without_producers_keeps_emission_when_untouched():
+    graph = EmissionGraph.from_snapshot(_snapshot([
+        _edge((PRODUCT, 100), (PROCESS, 3), 'consume'),
+    ], product_attr_em=15.0))
+
+    results = graph.compute()
+
+    assert results['product_emission'] == {}
+    assert results['process_cumulative'] == {3: 17.0}
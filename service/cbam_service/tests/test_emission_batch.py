@@ -0,0 +1,111 @@
+# ============================================================================
+# 🧮 배출량 일괄 계산 테스트
+# ============================================================================
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from app.common.emission_batch import (
+    MODE_DECIMAL, MODE_FIXED, MODE_FLOAT, EmissionBatchRow,
+    calculate_emission_batch, exact_emission, names_needing_factor
+)
+
+
+def _random_rows(count, seed=15):
+    rng = random.Random(seed)
+    return [
+        EmissionBatchRow(
+            index=index,
+            process_id=rng.randint(1, 5),
+            name=f"원료{rng.randint(1, 3)}",
+            amount=Decimal(rng.randint(0, 10_000_000)).scaleb(-3),
+            factor=Decimal(rng.randint(1, 5_000_000)).scaleb(-6),
+            oxyfactor=Decimal(rng.randint(9000, 10000)).scaleb(-4)
+        )
+        for index in range(count)
+    ]
+
+
+def _exact_totals(rows):
+    totals = {}
+    for row in rows:
+        emission = exact_emission(row.amount, row.factor, row.oxyfactor)
+        totals[row.process_id] = totals.get(row.process_id, Decimal(0)) + emission
+    return totals
+
+
+def test_exact_emission_rounds_half_up():
+    assert exact_emission(Decimal("1"), Decimal("0.0000005"), Decimal("1")) == Decimal("0.000001")
+    assert exact_emission(Decimal("-1"), Decimal("0.0000005"), Decimal("1")) == Decimal("-0.000001")
+    assert exact_emission(Decimal("2.5"), Decimal("1.2"), Decimal("0.99")) == Decimal("2.970000")
+
+
+def test_names_needing_factor_keeps_order_and_dedupes():
+    rows = [
+        EmissionBatchRow(0, 1, "코크스", Decimal("1")),
+        EmissionBatchRow(1, 1, "석회석", Decimal("1"), factor=Decimal("0.4")),
+        EmissionBatchRow(2, 2, "무연탄", Decimal("1")),
+        EmissionBatchRow(3, 2, "코크스", Decimal("1")),
+    ]
+    assert names_needing_factor(rows) == ["코크스", "무연탄"]
+
+
+def test_master_factor_fallback_and_missing_factor_error():
+    rows = [
+        EmissionBatchRow(0, 1, "코크스", Decimal("10")),
+        EmissionBatchRow(1, 1, "석회석", Decimal("2"), factor=Decimal("0.5")),
+        EmissionBatchRow(2, 2, "미등록", Decimal("3")),
+    ]
+    result = calculate_emission_batch(rows, {"코크스": Decimal("3.1")}, mode=MODE_FIXED)
+
+    assert [item["factor_source"] for item in result["items"]] == ["master", "request"]
+    assert [item["emission"] for item in result["items"]] == [31.0, 1.0]
+    assert [error["row"] for error in result["errors"]] == [2]
+    assert result["process_totals"] == [{"process_id": 1, "total_emission": 32.0, "item_count": 2}]
+    assert result["summary"]["calculated_count"] == 2
+    assert result["summary"]["failed_count"] == 1
+
+
+def test_fixed_mode_matches_decimal_exactly():
+    rows = _random_rows(2000)
+    result = calculate_emission_batch(rows, {}, mode=MODE_FIXED, verify=True)
+
+    assert result["verification"]["exact"]
+    exact_totals = _exact_totals(rows)
+    for total in result["process_totals"]:
+        assert Decimal(repr(total["total_emission"])) == exact_totals[total["process_id"]]
+
+
+def test_decimal_mode_is_reference():
+    rows = _random_rows(300)
+    result = calculate_emission_batch(rows, {}, mode=MODE_DECIMAL, verify=True)
+
+    assert result["verification"]["exact"]
+    for item, row in zip(result["items"], rows):
+        assert item["emission"] == float(exact_emission(row.amount, row.factor, row.oxyfactor))
+
+
+def test_float_mode_within_rounding_tolerance():
+    rows = _random_rows(2000)
+    result = calculate_emission_batch(rows, {}, mode=MODE_FLOAT, verify=True)
+
+    verification = result["verification"]
+    assert verification["item_mismatch_count"] == 0
+    assert verification["max_abs_diff"] <= 0.5e-6
+    exact_totals = _exact_totals(rows)
+    for total in result["process_totals"]:
+        # 합계는 행 반올림을 하지 않으므로 행 수만큼의 반올림 오차까지 허용
+        reference = float(exact_totals[total["process_id"]])
+        assert total["total_emission"] == pytest.approx(reference, abs=0.5e-6 * total["item_count"])
+
+
+def test_empty_input_and_invalid_mode():
+    result = calculate_emission_batch([], {})
+    assert result["items"] == []
+    assert result["process_totals"] == []
+    assert result["summary"]["total_emission"] == 0
+
+    with pytest.raises(ValueError):
+        calculate_emission_batch([], {}, mode="approx")
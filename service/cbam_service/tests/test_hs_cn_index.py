@@ -0,0 +1,135 @@
+# ============================================================================
+# 🔤 HS-CN 매핑 조회 인덱스 테스트
+# ============================================================================
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from app.common.hs_cn_index import HSCNLookupIndex
+
+ROWS = [
+    {"id": 1, "hscode": "720110", "aggregoods_name": "선철", "aggregoods_engname": "Pig iron",
+     "cncode_total": "72011011", "goods_name": "비합금 선철", "goods_engname": "Non-alloy pig iron"},
+    {"id": 2, "hscode": "720110", "aggregoods_name": "선철", "aggregoods_engname": "Pig iron",
+     "cncode_total": "72011019", "goods_name": "선철", "goods_engname": "Pig iron"},
+    {"id": 3, "hscode": "720120", "aggregoods_name": "선철", "aggregoods_engname": "Pig iron",
+     "cncode_total": "72012000", "goods_name": "선철 (인 함유)", "goods_engname": "Pig iron, phosphoric"},
+    {"id": 4, "hscode": "760110", "aggregoods_name": "알루미늄", "aggregoods_engname": "Aluminium",
+     "cncode_total": "76011000", "goods_name": "알루미늄 괴", "goods_engname": "Aluminium, not alloyed"},
+    {"id": 5, "hscode": "720110", "aggregoods_name": "선철", "aggregoods_engname": "Pig iron",
+     "cncode_total": "72011000", "goods_name": "고순도선철", "goods_engname": None},
+]
+
+
+class _FakeConn:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def fetch(self, query):
+        return [dict(row) for row in self._rows]
+
+
+class _FakePool:
+    def __init__(self, rows):
+        self.rows = rows
+        self.acquires = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquires += 1
+        yield _FakeConn(self.rows)
+
+
+def _loaded_index(rows=ROWS):
+    index = HSCNLookupIndex()
+    index.enabled = True
+    index.ttl_seconds = 0
+    pool = _FakePool(rows)
+    assert asyncio.run(index.ensure_loaded(pool))
+    return index, pool
+
+
+def _ids(results):
+    return [row["id"] for row in results]
+
+
+def test_code_prefix_search_order_and_limit():
+    index, _ = _loaded_index()
+
+    # hscode, cncode_total 순 (기존 ORDER BY 와 동일)
+    assert _ids(index.search_hs_code("7201")) == [5, 1, 2, 3]
+    assert _ids(index.search_hs_code("720110", limit=2)) == [5, 1]
+    assert _ids(index.search_cn_code("720110")) == [5, 1, 2]
+    assert _ids(index.search_cn_code("76")) == [4]
+    assert index.search_hs_code("99") == []
+    assert _ids(index.search_hs_code("")) == [5, 1, 2, 3, 4]
+
+
+def test_goods_name_ranking():
+    index, _ = _loaded_index()
+
+    # 완전 일치 > 접두사 > 단어 시작 > 부분 일치
+    assert _ids(index.search_goods_name("선철")) == [2, 3, 1, 5]
+    # 영문명도 검색, 대소문자 무시
+    assert _ids(index.search_goods_name("ALUMINIUM")) == [4]
+    # 같은 단어 시작 일치면 앞쪽 위치, 짧은 이름 순
+    assert _ids(index.search_goods_name("iron")) == [2, 3, 1]
+    assert index.search_goods_name("구리") == []
+
+
+def test_goods_name_results_match_substring_scan():
+    index, _ = _loaded_index()
+
+    for query in ["선", "철", "pig", "n", "알루", "인 함", "oy"]:
+        expected = {
+            row["id"] for row in ROWS
+            if any(name and query.lower() in name.lower() for name in (row["goods_name"], row["goods_engname"]))
+        }
+        assert set(_ids(index.search_goods_name(query))) == expected, query
+
+
+def test_apply_upsert_and_delete_rebuild_on_next_lookup():
+    index, pool = _loaded_index()
+    assert _ids(index.search_goods_name("선철")) == [2, 3, 1, 5]
+
+    index.apply_upsert({**ROWS[1], "goods_name": "주물용 선철"})
+    index.apply_upsert({"id": 6, "hscode": "720150", "cncode_total": "72015010",
+                        "goods_name": "선철", "goods_engname": None})
+    index.apply_delete(3)
+
+    # 메모된 질의 결과도 재구성과 함께 버려짐
+    assert _ids(index.search_goods_name("선철")) == [6, 1, 2, 5]
+    assert _ids(index.search_hs_code("7201")) == [5, 1, 2, 6]
+    assert _ids(index.search_cn_code("72012")) == []
+    # 변경 반영은 DB를 다시 읽지 않음
+    assert pool.acquires == 1
+
+
+def test_apply_before_load_is_ignored_and_invalidate_reloads():
+    index = HSCNLookupIndex()
+    index.enabled = True
+    index.ttl_seconds = 0
+    index.apply_upsert(ROWS[0])
+    index.apply_delete(1)
+    assert index.get_stats()["mappings"] == 0
+
+    pool = _FakePool(ROWS)
+    asyncio.run(index.ensure_loaded(pool))
+    asyncio.run(index.ensure_loaded(pool))
+    assert pool.acquires == 1
+
+    index.invalidate()
+    pool.rows = ROWS[:2]
+    asyncio.run(index.ensure_loaded(pool))
+    assert pool.acquires == 2
+    assert _ids(index.search_hs_code("72")) == [1, 2]
+
+
+def test_disabled_index_is_not_used():
+    index = HSCNLookupIndex()
+    index.enabled = False
+    pool = _FakePool(ROWS)
+
+    assert asyncio.run(index.ensure_loaded(pool)) is False
+    assert asyncio.run(HSCNLookupIndex().ensure_loaded(None)) is False
+    assert pool.acquires == 0
@@ -0,0 +1,244 @@
+# ============================================================================
+# 🔎 투입물명 맵핑 매처 (학습 데이터셋 인덱스)
+# ============================================================================
+
+"""
+학습 데이터셋 맵핑 딕셔너리를 한 번만 인덱싱해 두고 조회하는 매처
+
+기존 predict_material_with_mapping은 정확 매치에 실패하면 딕셔너리 전체를
+두 번 선형 탐색했습니다 (행당 O(N), 업로드 M행이면 O(N·M)).
+load_training_dataset 시점에 아래 인덱스를 만들어 두고 조회합니다.
+
+- 정확 매치: 딕셔너리 조회
+- 키가 입력에 포함: Aho-Corasick 오토마톤으로 입력을 한 번만 훑어 포함된 모든 키 탐색
+- 입력이 키에 포함: 키의 n-gram 역색인에서 가장 드문 n-gram의 후보만 실제 포함 여부 확인
+  (n보다 짧은 입력은 모든 짧은 부분 문자열을 미리 색인해 두고 바로 조회)
+- 입력이 라벨과 같음: 소문자 라벨 집합
+
+부분 매치가 여러 키에 걸리면 기존 선형 탐색과 같은 결과가 나오도록
+딕셔너리 삽입 순서가 가장 빠른 키를 고릅니다. 신뢰도는 기존과 같이
+정확 매치/라벨 일치 1.0, 부분 매치 0.8, 매치 없음 0.0 입니다.
+
+같은 투입물명이 수천 행 반복되는 업로드를 위해 predict_cached는 결과를
+LRU로 메모이제이션합니다. 매처는 데이터셋을 다시 읽을 때 통째로 새로
+만들어지므로 캐시도 함께 버려집니다.
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 입력이 키에 포함되는지 찾을 때 사용하는 n-gram 길이
+NGRAM_SIZE = 3
+
+# predict_cached 메모이제이션 최대 항목 수
+DEFAULT_CACHE_SIZE = 50000
+
+# 매치 종류
+MATCH_EXACT = "exact"
+MATCH_PARTIAL = "partial"
+MATCH_LABEL = "label"
+MATCH_NONE = "none"
+
+
+class _AhoCorasick:
+    """키 집합에 대한 Aho-Corasick 오토마톤 (입력에 포함된 키 중 순위가 가장 빠른 키 탐색)"""
+
+    def __init__(self, keys: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 상태에서 끝나는(실패 링크로 이어지는 것 포함) 키 중 가장 빠른 순위, 없으면 -1
+        self._best: List[int] = [-1]
+
+        for rank, key in enumerate(keys):
+            self._add(key, rank)
+        self._build_fail_links()
+
+    def _add(self, key: str, rank: int):
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(-1)
+            state = next_state
+        if self._best[state] == -1 or rank < self._best[state]:
+            self._best[state] = rank
+
+    def _build_fail_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                inherited = self._best[self._fail[next_state]]
+                if inherited != -1 and (self._best[next_state] == -1 or inherited < self._best[next_state]):
+                    self._best[next_state] = inherited
+
+    def best_match(self, text: str) -> int:
+        """text에 포함된 키 중 가장 빠른 순위 반환 (없으면 -1)"""
+        best = -1
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found = self._best[state]
+            if found != -1 and (best == -1 or found < best):
+                best = found
+                if best == 0:
+                    break
+        return best
+
+
+class _NGramIndex:
+    """키의 n-gram 역색인 (입력을 포함하는 키 중 순위가 가장 빠른 키 탐색)"""
+
+    def __init__(self, keys: List[str], n: int = NGRAM_SIZE):
+        self.n = n
+        self._keys = keys
+        # 길이 n 미만 부분 문자열 -> 그것을 포함하는 가장 빠른 키 순위
+        self._short: Dict[str, int] = {}
+        # n-gram -> 그것을 포함하는 키 순위 목록 (오름차순)
+        self._postings: Dict[str, List[int]] = {}
+
+        for rank, key in enumerate(keys):
+            seen: Set[str] = set()
+            for start in range(len(key)):
+                for length in range(1, n + 1):
+                    if start + length > len(key):
+                        break
+                    piece = key[start:start + length]
+                    if piece in seen:
+                        continue
+                    seen.add(piece)
+                    if length < n:
+                        self._short.setdefault(piece, rank)
+                    else:
+                        self._postings.setdefault(piece, []).append(rank)
+
+    def best_match(self, text: str, before: int = -1) -> int:
+        """text를 포함하는 키 중 가장 빠른 순위 반환 (before가 주어지면 그보다 빠른 키만, 없으면 -1)"""
+        if not self._keys:
+            return -1
+        if not text:
+            return 0  # 빈 문자열은 모든 키에 포함
+
+        if len(text) < self.n:
+            rank = self._short.get(text, -1)
+        else:
+            rank = self._search_long(text, before)
+
+        if before != -1 and rank != -1 and rank >= before:
+            return -1
+        return rank
+
+    def _search_long(self, text: str, before: int) -> int:
+        # 입력의 n-gram 중 가장 드문 것의 색인 목록만 후보로 삼고 실제 포함 여부 확인
+        candidates = None
+        for i in range(len(text) - self.n + 1):
+            posting = self._postings.get(text[i:i + self.n])
+            if posting is None:
+                return -1
+            if candidates is None or len(posting) < len(candidates):
+                candidates = posting
+
+        for rank in candidates:
+            if before != -1 and rank >= before:
+                break
+            if text in self._keys[rank]:
+                return rank
+        return -1
+
+
+class MaterialMatcher:
+    """학습 데이터셋 맵핑 매처 (정규화된 입력 -> 라벨)"""
+
+    def __init__(self, mapping: Optional[Dict[str, str]] = None, cache_size: int = DEFAULT_CACHE_SIZE):
+        mapping = mapping or {}
+        self._mapping: Dict[str, str] = dict(mapping)
+        # 딕셔너리 삽입 순서가 곧 부분 매치 우선순위
+        self._keys: List[str] = list(self._mapping.keys())
+        self._labels: Set[str] = {label.lower() for label in self._mapping.values()}
+        self._contained_keys = _AhoCorasick(self._keys)
+        self._containing_keys = _NGramIndex(self._keys)
+        # 인스턴스별 메모이제이션 (lru_cache는 스레드 풀에서 동시에 호출해도 안전)
+        self.predict_cached = lru_cache(maxsize=cache_size)(self.predict)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def find_partial(self, normalized_input: str) -> Optional[Tuple[str, str]]:
+        """키가 입력에 포함되거나 입력이 키에 포함되는 첫 번째 (키, 라벨)"""
+        rank = self._contained_keys.best_match(normalized_input)
+        if rank != 0:
+            containing = self._containing_keys.best_match(normalized_input, before=rank)
+            if containing != -1:
+                rank = containing
+        if rank == -1:
+            return None
+        key = self._keys[rank]
+        return key, self._mapping[key]
+
+    def match(self, normalized_input: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """정규화된 입력 매칭 -> (매치 종류, 라벨, 매치된 키)"""
+        label = self._mapping.get(normalized_input)
+        if label is not None:
+            return MATCH_EXACT, label, normalized_input
+
+        partial = self.find_partial(normalized_input)
+        if partial is not None:
+            key, label = partial
+            return MATCH_PARTIAL, label, key
+
+        if normalized_input in self._labels:
+            return MATCH_LABEL, None, None
+
+        return MATCH_NONE, None, None
+
+    def predict(self, input_text: str) -> Tuple[str, float]:
+        """입력 텍스트 분류 -> (추천 라벨, 신뢰도)"""
+        if not self._keys:
+            return input_text, 0.0
+
+        kind, label, _ = self.match(input_text.strip().lower())
+        if kind == MATCH_EXACT:
+            return label, 1.0
+        if kind == MATCH_PARTIAL:
+            return label, 0.8
+        if kind == MATCH_LABEL:
+            return input_text, 1.0
+        return input_text, 0.0
+
+    def predict_many(self, input_texts: Iterable[str]) -> Dict[str, Tuple[str, float]]:
+        """서로 다른 입력 텍스트 일괄 분류 -> {입력 텍스트: (추천 라벨, 신뢰도)}"""
+        return {input_text: self.predict_cached(input_text) for input_text in input_texts}
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        info = self.predict_cached.cache_info()
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "entries": info.currsize,
+            "max_entries": info.maxsize
+        }
+
+
+__all__ = [
+    "DEFAULT_CACHE_SIZE",
+    "MATCH_EXACT",
+    "MATCH_PARTIAL",
+    "MATCH_LABEL",
+    "MATCH_NONE",
+    "MaterialMatcher"
+]
@@ -0,0 +1,230 @@
+# ============================================================================
+# 📥 Bulk Ingest - 대량 행 저장 (asyncpg COPY)
+# ============================================================================
+
+"""
+업로드 데이터를 한 트랜잭션 안에서 대량으로 저장하는 계층
+
+서비스 엔진(database.engine)의 연결을 빌려 asyncpg copy_records_to_table로
+행을 한 번에 흘려 넣습니다. 행마다 INSERT를 보내고 실패하면 세션 전체를
+rollback하던 방식과 달리, 테이블별 저장은 SAVEPOINT 안에서 실행되므로
+잘못된 행이 있어도 앞서 저장한 행은 유지됩니다.
+
+1. 행 -> 컬럼 값 변환 (날짜/숫자 변환 실패 행은 DB에 보내기 전에 제외)
+2. SAVEPOINT 안에서 COPY 한 번으로 전체 저장
+3. COPY가 실패하면(제약 조건 위반 등) 청크 단위 executemany로 재시도하고,
+   실패한 청크만 행 단위 SAVEPOINT로 나눠 문제 행을 찾아 제외
+"""
+
+import logging
+import re
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..utils import excel_date_to_postgres_date
+
+logger = logging.getLogger(__name__)
+
+# executemany 재시도 시 청크 크기
+FALLBACK_CHUNK_SIZE = 500
+
+# 실패 행 응답에 포함할 최대 개수
+MAX_REPORTED_ERRORS = 100
+
+# 컬럼 타입 (엔티티 정의 기준, 지정되지 않은 컬럼은 text)
+_INTEGER_COLUMNS = {"source_id"}
+_NUMERIC_COLUMNS = {"생산수량", "수량", "운송수량"}
+_DATE_COLUMNS = {"투입일", "종료일", "운송일자"}
+# 날짜 문자열: YYYY-M-D (구분자 - / ., 월/일 0 채움 선택, 뒤의 시간 부분은 무시)
+_DATE_PATTERN = re.compile(r"^\s*(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})(?:$|[\sT])")
+# 분류 테이블(연료/유틸리티/폐기물/공정 생산품)은 로트번호가 integer
+_INTEGER_LOT_TABLES = {"utility_data", "waste_data", "fuel_data", "process_product_data"}
+
+
+@dataclass
+class BulkIngestResult:
+    """테이블 하나의 대량 저장 결과"""
+    table: str
+    total_rows: int = 0
+    saved_count: int = 0
+    method: str = "copy"
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def failed_count(self) -> int:
+        return len(self.errors)
+
+    def add_error(self, row_index: int, error: Exception):
+        self.errors.append({"row": row_index, "error": str(error)})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "table": self.table,
+            "total_rows": self.total_rows,
+            "saved_count": self.saved_count,
+            "failed_count": self.failed_count,
+            "method": self.method,
+            "errors": self.errors[:MAX_REPORTED_ERRORS]
+        }
+
+
+# ============================================================================
+# 🔄 값 변환
+# ============================================================================
+
+def _to_date(value: Any) -> Optional[date]:
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    converted = excel_date_to_postgres_date(value)
+    # PostgreSQL date 캐스트처럼 '2024-1-5'와 같은 0 없는 월/일도 허용
+    match = _DATE_PATTERN.match(str(converted))
+    if not match:
+        raise ValueError(f"날짜 형식이 올바르지 않습니다: {value}")
+    try:
+        return date(*(int(part) for part in match.groups()))
+    except ValueError:
+        raise ValueError(f"날짜 형식이 올바르지 않습니다: {value}")
+
+
+def _to_numeric(value: Any) -> Optional[Decimal]:
+    if value is None:
+        return None
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(f"숫자 형식이 올바르지 않습니다: {value}")
+
+
+def _to_text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def _column_converter(table: str, column: str) -> Callable[[Any], Any]:
+    if column in _DATE_COLUMNS:
+        return _to_date
+    if column in _NUMERIC_COLUMNS:
+        return _to_numeric
+    if column in _INTEGER_COLUMNS or (column == "로트번호" and table in _INTEGER_LOT_TABLES):
+        return lambda value: None if value is None else int(value)
+    return _to_text
+
+
+def build_records(
+    indexed_rows: Iterable[Tuple[int, Dict[str, Any]]],
+    mapper: Callable[[Dict[str, Any]], Dict[str, Any]],
+    result: BulkIngestResult
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """(원본 행 번호, 업로드 행)을 컬럼 값 딕셔너리로 변환 (변환 실패 행은 result.errors에 기록 후 제외)"""
+    records = []
+    for row_index, row in indexed_rows:
+        result.total_rows += 1
+        try:
+            records.append((row_index, mapper(row)))
+        except Exception as e:
+            result.add_error(row_index, e)
+    return records
+
+
+# ============================================================================
+# 🗄️ 연결/트랜잭션
+# ============================================================================
+
+@asynccontextmanager
+async def ingest_transaction(engine) -> AsyncIterator[Any]:
+    """서비스 엔진의 연결에서 asyncpg 연결을 꺼내 트랜잭션 하나로 감싸서 제공"""
+    if engine is None:
+        raise RuntimeError("데이터베이스가 초기화되지 않았습니다.")
+
+    async with engine.connect() as sa_connection:
+        raw_connection = await sa_connection.get_raw_connection()
+        connection = raw_connection.driver_connection
+        async with connection.transaction():
+            yield connection
+
+
+# ============================================================================
+# 📥 대량 저장
+# ============================================================================
+
+async def bulk_insert(
+    connection,
+    table: str,
+    records: List[Tuple[int, Dict[str, Any]]],
+    result: BulkIngestResult
+) -> BulkIngestResult:
+    """(원본 행 번호, 컬럼 값) 목록을 table에 저장 (ingest_transaction 안에서 호출)"""
+    if not records:
+        return result
+
+    columns = list(records[0][1].keys())
+    converters = [_column_converter(table, column) for column in columns]
+
+    # 1. 타입 변환 (실패 행은 DB에 보내지 않음)
+    prepared: List[Tuple[int, Tuple[Any, ...]]] = []
+    for row_index, record in records:
+        try:
+            prepared.append((
+                row_index,
+                tuple(convert(record.get(column)) for column, convert in zip(columns, converters))
+            ))
+        except Exception as e:
+            result.add_error(row_index, e)
+    if not prepared:
+        return result
+
+    # 2. COPY 한 번으로 저장
+    try:
+        async with connection.transaction():
+            await connection.copy_records_to_table(
+                table,
+                records=[values for _, values in prepared],
+                columns=columns
+            )
+        result.saved_count += len(prepared)
+        result.method = "copy"
+        return result
+    except Exception as e:
+        logger.warning(f"⚠️ {table} COPY 실패, 청크 단위로 재시도합니다: {e}")
+
+    # 3. 청크 단위 executemany, 실패한 청크는 행 단위로 문제 행 제외
+    result.method = "executemany"
+    placeholders = ", ".join(f"${position}" for position in range(1, len(columns) + 1))
+    column_list = ", ".join(columns)
+    insert_sql = f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})"
+
+    for start in range(0, len(prepared), FALLBACK_CHUNK_SIZE):
+        chunk = prepared[start:start + FALLBACK_CHUNK_SIZE]
+        try:
+            async with connection.transaction():
+                await connection.executemany(insert_sql, [values for _, values in chunk])
+            result.saved_count += len(chunk)
+            continue
+        except Exception:
+            pass
+
+        for row_index, values in chunk:
+            try:
+                async with connection.transaction():
+                    await connection.execute(insert_sql, *values)
+                result.saved_count += 1
+            except Exception as e:
+                result.add_error(row_index, e)
+
+    return result
+
+
+__all__ = [
+    "BulkIngestResult",
+    "build_records",
+    "bulk_insert",
+    "ingest_transaction"
+]
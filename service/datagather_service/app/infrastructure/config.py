@@ -23,6 +23,8 @@ class Settings(BaseSettings):
     db_echo: bool = False
     db_pool_size: int = 10
     db_max_overflow: int = 20
+    db_pool_timeout: int = 30  # 연결 대기 최대 시간 (초)
+    db_pool_recycle: int = 1800  # 연결 재생성 주기 (초)
     
     # 로깅 설정
     log_level: str = "INFO"
@@ -50,6 +52,18 @@ class Settings(BaseSettings):
     retry_attempts: int = 3
     retry_delay: int = 5  # 5초
     
+    # 목록 조회 설정
+    list_default_limit: int = 1000  # 페이지 크기 기본값 (limit 생략 시)
+    list_max_limit: int = 5000  # 페이지 크기 최대값
+    list_stream_batch_size: int = 1000  # NDJSON 스트리밍 시 서버 측 커서에서 한 번에 읽는 행 수
+    list_ensure_indexes: bool = False  # 시작 시 백그라운드로 키셋 인덱스 확인/생성 (기본은 migrations/add_list_keyset_indexes.sql 로 생성)
+    
+    # AI 맵핑 분류 설정
+    ai_process_chunk_size: int = 2000  # 한 번에 분류할 고유 투입물명 수
+    ai_process_thread_pool: bool = True  # 청크 분류를 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+    ai_process_thread_min_items: int = 500  # 고유 투입물명이 이 수 이상일 때만 스레드 풀 사용
+    ai_match_cache_size: int = 50000  # 투입물명 분류 결과 메모이제이션 크기
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -75,7 +89,9 @@ class Settings(BaseSettings):
             "url": self.database_url,
             "echo": self.db_echo,
             "pool_size": self.db_pool_size,
-            "max_overflow": self.db_max_overflow
+            "max_overflow": self.db_max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle
         }
     
     def get_server_config(self) -> dict:
@@ -117,7 +133,14 @@ class Settings(BaseSettings):
             "max_batch_size": self.max_batch_size,
             "processing_timeout": self.processing_timeout,
             "retry_attempts": self.retry_attempts,
-            "retry_delay": self.retry_delay
+            "retry_delay": self.retry_delay,
+            "list_default_limit": self.list_default_limit,
+            "list_max_limit": self.list_max_limit,
+            "list_stream_batch_size": self.list_stream_batch_size,
+            "ai_process_chunk_size": self.ai_process_chunk_size,
+            "ai_process_thread_pool": self.ai_process_thread_pool,
+            "ai_process_thread_min_items": self.ai_process_thread_min_items,
+            "ai_match_cache_size": self.ai_match_cache_size
         }
     
     def validate(self) -> bool:
@@ -0,0 +1,309 @@
+# ============================================================================
+# 📄 Data Listing - 키셋 페이지네이션 / NDJSON 스트리밍 조회
+# ============================================================================
+
+"""
+데이터 테이블(input/output/transport/process_data) 목록 조회
+
+전체 행을 한 번에 읽어 JSON 하나로 만들던 조회를 두 가지로 나눕니다.
+
+- 페이지 조회: (created_at, id) 키셋 페이지네이션. 다음 페이지 위치는 마지막 행의
+  (created_at, id)를 담은 불투명한 cursor 문자열로 전달하므로 OFFSET 없이 인덱스를 탑니다.
+- 스트리밍 조회: 서버 측 커서로 배치 단위로 읽으면서 한 행씩 NDJSON으로 직렬화해
+  바로 흘려보냅니다 (메모리에는 배치 하나만 유지).
+
+정렬은 created_at DESC NULLS LAST, id DESC 이며 필터는 source_file, 공정,
+created_at 날짜 범위를 지원합니다 (테이블에 없는 필터 컬럼은 무시).
+"""
+
+import base64
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# 테이블별 필터 컬럼 (None이면 해당 필터 미지원)
+LIST_TABLES: Dict[str, Dict[str, Optional[str]]] = {
+    "input_data": {"source_file": "source_file", "공정": "공정"},
+    "output_data": {"source_file": "source_file", "공정": "공정"},
+    "transport_data": {"source_file": None, "공정": "도착공정"},
+    "process_data": {"source_file": None, "공정": "공정명"},
+}
+
+
+class InvalidCursorError(ValueError):
+    """cursor 문자열을 해석할 수 없음"""
+
+
+@dataclass
+class DataListFilters:
+    """목록 조회 필터"""
+    source_file: Optional[str] = None
+    process: Optional[str] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source_file": self.source_file,
+            "공정": self.process,
+            "date_from": self.date_from.isoformat() if self.date_from else None,
+            "date_to": self.date_to.isoformat() if self.date_to else None
+        }
+
+
+# ============================================================================
+# 🔖 cursor 인코딩
+# ============================================================================
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    payload = {"c": created_at.isoformat() if created_at else None, "i": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        created_at = datetime.fromisoformat(payload["c"]) if payload.get("c") else None
+        return created_at, int(payload["i"])
+    except Exception as e:
+        raise InvalidCursorError(f"잘못된 cursor 입니다: {cursor}") from e
+
+
+# ============================================================================
+# 🔎 쿼리 구성
+# ============================================================================
+
+def _build_query(
+    table: str,
+    filters: DataListFilters,
+    after: Optional[Tuple[Optional[datetime], int]] = None,
+    null_tail: bool = False,
+    limit: Optional[int] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """목록 조회 쿼리 구성
+
+    after: 이 (created_at, id) 위치 다음 행부터 조회 (키셋)
+    null_tail: created_at이 NULL인 구간(정렬 맨 뒤)만 조회
+    """
+    columns = LIST_TABLES[table]
+    conditions: List[str] = []
+    params: Dict[str, Any] = {}
+
+    if filters.source_file and columns["source_file"]:
+        conditions.append(f"{columns['source_file']} = :source_file")
+        params["source_file"] = filters.source_file
+    if filters.process and columns["공정"]:
+        conditions.append(f"{columns['공정']} = :process")
+        params["process"] = filters.process
+    if filters.date_from:
+        conditions.append("created_at >= :date_from")
+        params["date_from"] = datetime.combine(filters.date_from, datetime.min.time())
+    if filters.date_to:
+        # date_to 당일 포함
+        conditions.append("created_at < :date_to")
+        params["date_to"] = datetime.combine(filters.date_to + timedelta(days=1), datetime.min.time())
+
+    if null_tail:
+        conditions.append("created_at IS NULL")
+    if after is not None:
+        after_created_at, after_id = after
+        params["cursor_id"] = after_id
+        if after_created_at is None:
+            # NULL created_at 구간에서는 id로만 이어감
+            conditions.append("created_at IS NULL AND id < :cursor_id")
+        else:
+            # 행 비교로 써야 (created_at DESC NULLS LAST, id DESC) 인덱스 범위 스캔을 탐
+            # (NULL created_at 구간은 행 비교에 걸리지 않으므로 fetch_page에서 따로 이어 조회)
+            conditions.append("(created_at, id) < (:cursor_created_at, :cursor_id)")
+            params["cursor_created_at"] = after_created_at
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"SELECT * FROM {table} {where} ORDER BY created_at DESC NULLS LAST, id DESC"
+    if limit is not None:
+        query += " LIMIT :limit"
+        params["limit"] = limit
+    return query, params
+
+
+async def _fetch_rows(session: AsyncSession, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    result = await session.execute(text(query), params)
+    return [dict(row._mapping) for row in result.fetchall()]
+
+
+def serialize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """행 값을 JSON 직렬화 가능한 값으로 변환 (날짜는 ISO 문자열, Decimal은 float)"""
+    for key, value in row.items():
+        if hasattr(value, 'isoformat'):
+            row[key] = value.isoformat()
+        elif isinstance(value, Decimal):
+            row[key] = float(value)
+    return row
+
+
+# ============================================================================
+# 📄 페이지 조회
+# ============================================================================
+
+async def fetch_page(
+    session: AsyncSession,
+    table: str,
+    filters: DataListFilters,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """키셋 페이지 하나 조회 -> {data, count, next_cursor, has_more}"""
+    after = decode_cursor(cursor) if cursor else None
+    # 다음 페이지 존재 여부 확인용으로 한 행 더 조회
+    fetch_limit = limit + 1
+    query, params = _build_query(table, filters, after=after, limit=fetch_limit)
+    rows = await _fetch_rows(session, query, params)
+
+    # created_at이 있는 cursor 뒤로 행이 모자라면 NULL created_at 구간에서 이어 조회
+    # (날짜 범위 필터가 있으면 NULL 구간은 결과에 포함되지 않음)
+    cursor_has_created_at = after is not None and after[0] is not None
+    has_date_filter = filters.date_from is not None or filters.date_to is not None
+    if cursor_has_created_at and not has_date_filter and len(rows) < fetch_limit:
+        query, params = _build_query(table, filters, null_tail=True, limit=fetch_limit - len(rows))
+        rows.extend(await _fetch_rows(session, query, params))
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1].get("created_at"), rows[-1]["id"]) if has_more and rows else None
+
+    return {
+        "data": [serialize_row(row) for row in rows],
+        "count": len(rows),
+        "limit": limit,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+        "filters": filters.to_dict()
+    }
+
+
+# ============================================================================
+# 🌊 NDJSON 스트리밍
+# ============================================================================
+
+def _json_default(value: Any):
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+async def stream_ndjson(
+    session_maker,
+    table: str,
+    filters: DataListFilters,
+    batch_size: int
+) -> AsyncIterator[bytes]:
+    """서버 측 커서로 배치 단위로 읽으면서 한 행씩 NDJSON으로 내보냄"""
+    query, params = _build_query(table, filters)
+    streamed = 0
+    # 응답을 다 보낼 때까지 세션을 유지해야 하므로 의존성 주입 대신 직접 세션을 엶
+    async with session_maker() as session:
+        result = await session.stream(
+            text(query).execution_options(yield_per=batch_size),
+            params
+        )
+        async for partition in result.mappings().partitions(batch_size):
+            yield "".join(
+                json.dumps(dict(row), ensure_ascii=False, default=_json_default) + "\n"
+                for row in partition
+            ).encode("utf-8")
+            streamed += len(partition)
+    logger.info(f"{table} NDJSON 스트리밍 완료: {streamed}행")
+
+
+# ============================================================================
+# 🗂️ 키셋 인덱스
+# ============================================================================
+
+# 워커 여러 개가 동시에 인덱스를 만들지 않도록 잡는 세션 advisory lock 키
+_LIST_INDEX_LOCK_KEY = 0x6C697374  # 'list'
+
+
+def list_index_name(table: str) -> str:
+    return f"ix_{table}_created_at_id"
+
+
+async def _ensure_list_index(conn, table: str) -> str:
+    """테이블 하나의 키셋 인덱스 확인 -> created | rebuilt | exists"""
+    index_name = list_index_name(table)
+    result = await conn.execute(text("""
+        SELECT i.indisvalid
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = :index_name
+    """), {"index_name": index_name})
+    valid = result.scalar()
+    if valid:
+        return "exists"
+
+    status = "created"
+    if valid is False:
+        # 이전 CONCURRENTLY 생성이 실패해 INVALID로 남은 인덱스 (IF NOT EXISTS가 건너뛰므로 지우고 다시 생성)
+        logger.warning(f"⚠️ {index_name} 인덱스가 INVALID 상태라 다시 생성합니다")
+        await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+        status = "rebuilt"
+    await conn.execute(text(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+        f"ON {table} (created_at DESC NULLS LAST, id DESC)"
+    ))
+    return status
+
+
+async def ensure_list_indexes(engine):
+    """(created_at, id) 키셋 인덱스 확인/생성 (테이블별로 처리, 실패해도 서비스는 계속)
+
+    큰 테이블에서는 오래 걸리므로 시작 경로에서 기다리지 말고 백그라운드 태스크로 실행합니다.
+    운영 DB에는 migrations/add_list_keyset_indexes.sql 로 미리 만들어 두는 것을 권장합니다.
+    """
+    if engine is None:
+        return
+    try:
+        # CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 실행해야 함
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            locked = (await conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": _LIST_INDEX_LOCK_KEY}
+            )).scalar()
+            if not locked:
+                logger.info("다른 워커가 목록 조회 키셋 인덱스를 확인 중이라 건너뜁니다")
+                return
+            try:
+                for table in LIST_TABLES:
+                    try:
+                        status = await _ensure_list_index(conn, table)
+                        logger.info(f"✅ {list_index_name(table)} 키셋 인덱스: {status}")
+                    except Exception as e:
+                        logger.warning(f"⚠️ {list_index_name(table)} 키셋 인덱스 생성 실패: {e}")
+            finally:
+                await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _LIST_INDEX_LOCK_KEY})
+    except Exception as e:
+        logger.warning(f"⚠️ 목록 조회 키셋 인덱스 확인 실패: {e}")
+
+
+__all__ = [
+    "LIST_TABLES",
+    "DataListFilters",
+    "InvalidCursorError",
+    "encode_cursor",
+    "decode_cursor",
+    "serialize_row",
+    "fetch_page",
+    "stream_ndjson",
+    "list_index_name",
+    "ensure_list_indexes"
+]
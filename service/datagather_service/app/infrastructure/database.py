@@ -2,10 +2,10 @@
 # 🗄️ Database - 데이터베이스 연결 및 설정
 # ============================================================================
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 import os
 
 from .config import Settings
@@ -14,7 +14,7 @@ from .config import Settings
 Base = declarative_base()
 
 class Database:
-    """데이터베이스 연결 관리 클래스"""
+    """데이터베이스 연결 관리 클래스 (서비스 전체가 공유하는 비동기 엔진과 연결 풀)"""
     
     def __init__(self):
         self.settings = Settings()
@@ -24,11 +24,14 @@ class Database:
     async def init_db(self):
         """데이터베이스 초기화"""
         try:
-            # 비동기 엔진 생성
+            # 비동기 엔진 생성 (크기가 제한된 연결 풀을 모든 요청이 공유)
             self.engine = create_async_engine(
                 self.settings.database_url,
                 echo=self.settings.db_echo,
-                poolclass=NullPool,
+                pool_size=self.settings.db_pool_size,
+                max_overflow=self.settings.db_max_overflow,
+                pool_timeout=self.settings.db_pool_timeout,
+                pool_recycle=self.settings.db_pool_recycle,
                 pool_pre_ping=True
             )
             
@@ -39,7 +42,10 @@ class Database:
                 expire_on_commit=False
             )
             
-            print("✅ 데이터베이스 연결이 성공적으로 초기화되었습니다.")
+            print(
+                f"✅ 데이터베이스 연결이 성공적으로 초기화되었습니다. "
+                f"(pool_size={self.settings.db_pool_size}, max_overflow={self.settings.db_max_overflow})"
+            )
             
         except Exception as e:
             print(f"❌ 데이터베이스 연결 초기화 실패: {e}")
@@ -49,6 +55,8 @@ class Database:
         """데이터베이스 연결 종료"""
         if self.engine:
             await self.engine.dispose()
+            self.engine = None
+            self.async_session_maker = None
             print("✅ 데이터베이스 연결이 종료되었습니다.")
     
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -106,11 +114,27 @@ class Database:
             return False
         
         try:
-            async with self.engine.begin() as conn:
-                await conn.execute("SELECT 1")
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
             return True
         except Exception:
             return False
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """연결 풀 상태 (/health 노출용)"""
+        if not self.engine:
+            return {"initialized": False}
+        
+        pool = self.engine.pool
+        return {
+            "initialized": True,
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "max_overflow": self.settings.db_max_overflow,
+            "timeout": self.settings.db_pool_timeout
+        }
 
 # 전역 데이터베이스 인스턴스
 database = Database()
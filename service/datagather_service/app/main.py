@@ -7,10 +7,13 @@ import logging
 import os
 import json
 import re
-from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form
+import time
+from datetime import date
+from contextlib import asynccontextmanager, suppress
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, Dict, Any
 import uvicorn
@@ -19,6 +22,11 @@ import pandas as pd
 
 from .infrastructure.database import database
 from .infrastructure.config import settings
+from .infrastructure.bulk_ingest import BulkIngestResult, build_records, bulk_insert, ingest_transaction
+from .infrastructure.data_listing import (
+    DataListFilters, InvalidCursorError, fetch_page, stream_ndjson, ensure_list_indexes
+)
+from .common.material_matcher import MaterialMatcher, MATCH_EXACT, MATCH_PARTIAL, MATCH_LABEL
 
 # 로깅 설정
 logging.basicConfig(
@@ -29,10 +37,12 @@ logger = logging.getLogger(__name__)
 
 # 학습 데이터셋 기반 맵핑 시스템
 mapping_dictionary = {}
+# 맵핑 딕셔너리 인덱스 (load_training_dataset에서 재생성)
+material_matcher = MaterialMatcher(cache_size=settings.ai_match_cache_size)
 
 def load_training_dataset():
     """학습 데이터셋을 로드하여 맵핑 딕셔너리 생성"""
-    global mapping_dictionary
+    global mapping_dictionary, material_matcher
     try:
         # 학습 데이터셋 파일 경로 (여러 경로 시도)
         possible_paths = [
@@ -71,6 +81,8 @@ def load_training_dataset():
                     # 입력 텍스트를 키로, 라벨을 값으로 저장
                     mapping_dictionary[input_text.strip().lower()] = label.strip()
         
+        material_matcher = MaterialMatcher(mapping_dictionary, cache_size=settings.ai_match_cache_size)
+        
         logger.info(f"✅ 맵핑 딕셔너리 생성 완료: {len(mapping_dictionary)}개 항목")
         logger.info(f"📝 샘플 맵핑: {dict(list(mapping_dictionary.items())[:5])}")
         return True
@@ -90,24 +102,22 @@ def predict_material_with_mapping(input_text: str) -> tuple[str, float]:
         
         # 입력 텍스트 정규화
         normalized_input = input_text.strip().lower()
+        match_kind, predicted_label, matched_key = material_matcher.match(normalized_input)
         
         # 1. 정확한 매치 확인
-        if normalized_input in mapping_dictionary:
-            predicted_label = mapping_dictionary[normalized_input]
+        if match_kind == MATCH_EXACT:
             logger.info(f"✅ 정확한 매치 발견: '{input_text}' -> '{predicted_label}'")
             return predicted_label, 1.0
         
         # 2. 부분 매치 확인 (포함 관계)
-        for key, value in mapping_dictionary.items():
-            if key in normalized_input or normalized_input in key:
-                logger.info(f"✅ 부분 매치 발견: '{input_text}' -> '{value}' (키: '{key}')")
-                return value, 0.8
+        if match_kind == MATCH_PARTIAL:
+            logger.info(f"✅ 부분 매치 발견: '{input_text}' -> '{predicted_label}' (키: '{matched_key}')")
+            return predicted_label, 0.8
         
         # 3. 입력값이 이미 라벨과 같은지 확인
-        for key, value in mapping_dictionary.items():
-            if value.lower() == normalized_input:
-                logger.info(f"✅ 입력값이 라벨과 일치: '{input_text}'")
-                return input_text, 1.0
+        if match_kind == MATCH_LABEL:
+            logger.info(f"✅ 입력값이 라벨과 일치: '{input_text}'")
+            return input_text, 1.0
         
         # 4. 매치되지 않으면 원본 텍스트 반환
         logger.info(f"⚠️ 매치되는 라벨이 없습니다. 원본 텍스트 반환: '{input_text}'")
@@ -139,6 +149,8 @@ async def lifespan(app: FastAPI):
     
     # 데이터베이스 초기화
     await database.init_db()
+    # 키셋 인덱스 생성은 큰 테이블에서 오래 걸리므로 시작을 막지 않도록 백그라운드에서 실행
+    index_task = asyncio.create_task(ensure_list_indexes(database.engine)) if settings.list_ensure_indexes else None
     
     # 학습 데이터셋 로드
     load_training_dataset()
@@ -149,6 +161,11 @@ async def lifespan(app: FastAPI):
     
     # 종료 시
     logger.info("🛑 DataGather Service를 종료합니다...")
+    if index_task and not index_task.done():
+        index_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await index_task
+    await database.close_db()
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -169,12 +186,10 @@ app.add_middleware(
 
 # 의존성 주입 함수
 async def get_session() -> AsyncSession:
-    """데이터베이스 세션 의존성"""
+    """데이터베이스 세션 의존성 (공용 연결 풀에서 요청마다 세션 하나)"""
     async for session in database.get_session():
         yield session
 
-# 의존성 주입 함수 제거 - 직접 데이터베이스 세션 사용
-
 # 루트 엔드포인트
 @app.get("/")
 async def root():
@@ -202,6 +217,10 @@ async def root():
             "get_output_data": "/api/datagather/output-data",
             "get_transport_data": "/api/datagather/transport-data",
             "get_process_data": "/api/datagather/process-data",
+            "stream_input_data": "/api/datagather/input-data/stream",
+            "stream_output_data": "/api/datagather/output-data/stream",
+            "stream_transport_data": "/api/datagather/transport-data/stream",
+            "stream_process_data": "/api/datagather/process-data/stream",
             "delete_input_data": "/api/datagather/input-data/{id}",
             "delete_output_data": "/api/datagather/output-data/{id}",
             "delete_transport_data": "/api/datagather/transport-data/{id}",
@@ -222,7 +241,8 @@ async def health_check():
             "status": "healthy" if db_healthy else "unhealthy",
             "service": settings.app_name,
             "version": settings.app_version,
-            "database": "connected" if db_healthy else "disconnected"
+            "database": "connected" if db_healthy else "disconnected",
+            "database_pool": database.get_pool_stats()
         }
     except Exception as e:
         logger.error(f"헬스체크 실패: {e}")
@@ -235,82 +255,96 @@ async def health_check():
 @app.get("/favicon.ico")
 async def favicon():
     """Favicon 요청 처리"""
-    from fastapi.responses import Response
     return Response(status_code=204)
 
+def classify_material_names(material_names: list) -> Dict[str, tuple[str, float]]:
+    """서로 다른 투입물명 일괄 분류 (스레드 풀에서도 호출)"""
+    return material_matcher.predict_many(material_names)
+
+async def classify_material_names_in_chunks(material_names: list) -> Dict[str, tuple[str, float]]:
+    """고유 투입물명을 청크로 나눠 분류 (대량이면 스레드 풀에서 실행하여 이벤트 루프 블로킹 방지)"""
+    chunk_size = max(1, settings.ai_process_chunk_size)
+    use_thread_pool = (
+        settings.ai_process_thread_pool
+        and len(material_names) >= settings.ai_process_thread_min_items
+    )
+    
+    results: Dict[str, tuple[str, float]] = {}
+    for start in range(0, len(material_names), chunk_size):
+        chunk = material_names[start:start + chunk_size]
+        if use_thread_pool:
+            results.update(await asyncio.to_thread(classify_material_names, chunk))
+        else:
+            results.update(classify_material_names(chunk))
+            # 청크 사이에 다른 요청이 처리될 수 있도록 양보
+            await asyncio.sleep(0)
+    return results
+
 # AI 처리 관련 엔드포인트
 @app.post("/ai-process")
 async def ai_process_data(data: Dict[str, Any]):
-    """AI 데이터 처리"""
+    """AI 데이터 처리 (고유 투입물명만 분류 후 행으로 결과 전개)"""
     try:
-        logger.info(f"🤖 AI 데이터 처리 요청: {data.get('data_type', 'unknown')}")
-        logger.info(f"📊 전체 요청 데이터: {data}")
+        started_at = time.perf_counter()
         
         # 입력 데이터에서 처리할 데이터 추출
         input_data = data.get('data', [])
-        logger.info(f"📥 입력 데이터 개수: {len(input_data)}")
-        logger.info(f"📥 입력 데이터 샘플: {input_data[:2] if input_data else '빈 데이터'}")
-        
-        # Hugging Face AI 처리
-        processed_data = []
-        
-        for i, item in enumerate(input_data):
-            logger.info(f"🔄 처리 중인 항목 {i+1}: {item}")
-            투입물명 = item.get('투입물명', '')
-            공정 = item.get('공정', '')
-            logger.info(f"   - 투입물명: '{투입물명}', 공정: '{공정}'")
-            
-            # 학습 데이터셋 기반 맵핑을 사용하여 AI 추천 답변 생성
-            try:
-                ai_추천답변, actual_confidence = generate_ai_recommendation(투입물명)
-                logger.info(f"   - 맵핑 기반 AI 분류 결과: '{ai_추천답변}', 신뢰도: {actual_confidence:.3f}")
-                
-            except Exception as e:
-                logger.error(f"   - AI 분류 실패, 기본값 사용: {e}")
-                ai_추천답변 = 투입물명  # 기본값으로 원본 텍스트 사용
-                actual_confidence = 0.0
-            
-            # 각 항목에 AI 처리 결과 추가
-            processed_item = {
-                **item,
-                "AI추천답변": ai_추천답변,
-                "ai_processed": True,
-                "ai_model": "학습 데이터셋 기반 맵핑",
-                "ai_task": "mapping-classification",
-                "classification": "processed",
-                "confidence": actual_confidence,
-                "processed_at": "2024-01-01T00:00:00Z"
-            }
-            processed_data.append(processed_item)
-            logger.info(f"   ✅ 항목 {i+1} 처리 완료")
-        
-        logger.info(f"📊 최종 처리된 데이터 개수: {len(processed_data)}")
-        
-        # AI 분류 결과만 반환
+        logger.info(f"🤖 AI 데이터 처리 요청: {data.get('data_type', 'unknown')}, {len(input_data)}행")
+        logger.debug(f"📥 입력 데이터 샘플: {input_data[:2] if input_data else '빈 데이터'}")
+        
+        # 1. 고유 투입물명 추출 (문자열이 아닌 값은 기존과 같이 원본 그대로 신뢰도 0.0)
+        unique_names = list(dict.fromkeys(
+            item.get('투입물명', '') for item in input_data
+            if isinstance(item.get('투입물명', ''), str)
+        ))
+        
+        # 2. 고유 투입물명만 분류
+        classified_at = time.perf_counter()
+        try:
+            classified = await classify_material_names_in_chunks(unique_names)
+        except Exception as e:
+            logger.error(f"❌ AI 분류 실패, 기본값 사용: {e}")
+            classified = {name: (name, 0.0) for name in unique_names}
+        classification_ms = (time.perf_counter() - classified_at) * 1000
+        
+        # 3. 분류 결과를 행으로 전개 (AI 분류 결과만 반환)
+        ai_model = "학습 데이터셋 기반 맵핑"
+        processed_at = "2024-01-01T00:00:00Z"
         ai_classification_results = []
-        for item in processed_data:
-            ai_result = {
-                "투입물명": item.get('투입물명', ''),
+        for item in input_data:
+            투입물명 = item.get('투입물명', '')
+            ai_추천답변, actual_confidence = classified.get(투입물명, (투입물명, 0.0)) if isinstance(투입물명, str) else (투입물명, 0.0)
+            ai_classification_results.append({
+                "투입물명": 투입물명,
                 "공정": item.get('공정', ''),
-                "AI분류결과": item.get('AI추천답변', ''),
-                "분류신뢰도": item.get('confidence', 0.0),
-                "AI모델": item.get('ai_model', ''),
-                "처리시간": item.get('processed_at', '')
-            }
-            ai_classification_results.append(ai_result)
+                "AI분류결과": ai_추천답변,
+                "분류신뢰도": actual_confidence,
+                "AI모델": ai_model,
+                "처리시간": processed_at
+            })
         
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
         response_data = {
             "success": True,
             "message": f"학습 데이터셋 기반 맵핑 AI 분류가 완료되었습니다.",
-            "ai_model": "학습 데이터셋 기반 맵핑",
+            "ai_model": ai_model,
             "mapping_entries": len(mapping_dictionary),
             "ai_task": "mapping-classification",
             "total_classified": len(ai_classification_results),
+            "processing_stats": {
+                "total_rows": len(input_data),
+                "unique_materials": len(unique_names),
+                "classification_ms": round(classification_ms, 2),
+                "elapsed_ms": round(elapsed_ms, 2),
+                "match_cache": material_matcher.get_cache_stats()
+            },
             "ai_results": ai_classification_results  # AI 분류 결과만
         }
         
-        logger.info("✅ AI 데이터 처리 성공")
-        logger.info(f"📤 응답 데이터: {response_data}")
+        logger.info(
+            f"✅ AI 데이터 처리 성공: {len(input_data)}행 (고유 투입물명 {len(unique_names)}개), "
+            f"분류 {classification_ms:.1f}ms / 전체 {elapsed_ms:.1f}ms"
+        )
         return JSONResponse(
             status_code=200,
             content=response_data
@@ -340,56 +374,40 @@ async def ai_process_data_gateway(data: Dict[str, Any]):
     return await ai_process_data(data)
 
 # 투입물 데이터 저장 (기존 엔드포인트)
+def _input_data_record(row: Dict[str, Any], source_file: str) -> Dict[str, Any]:
+    """업로드 행 -> input_data 컬럼 값"""
+    return {
+        '로트번호': row.get('로트번호', ''),
+        '생산품명': row.get('생산품명', ''),
+        '생산수량': float(row.get('생산수량', 0)) if row.get('생산수량') else 0,
+        '생산수량_단위': row.get('생산수량_단위', 't'),
+        '투입일': row.get('투입일'),
+        '종료일': row.get('종료일'),
+        '공정': row.get('공정', ''),
+        '투입물명': row.get('투입물명', ''),
+        '수량': float(row.get('수량', 0)) if row.get('수량') else 0,
+        '투입물_단위': row.get('투입물_단위', 't'),
+        'source_file': source_file,
+        '주문처명': row.get('주문처명', ''),
+        '오더번호': row.get('오더번호', '')
+    }
+
 @app.post("/save-input-data")
 async def save_input_data(data: Dict[str, Any]):
     """투입물 데이터를 데이터베이스에 저장"""
     try:
         logger.info(f"투입물 데이터 저장 요청: {data.get('filename', 'unknown')}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
+        input_data_rows = data.get('data', [])
+        source_file = data.get('filename', 'input_data')
+        result = BulkIngestResult(table='input_data')
+        records = build_records(enumerate(input_data_rows), lambda row: _input_data_record(row, source_file), result)
         
-        saved_count = 0
-        with Session() as session:
-            input_data_rows = data.get('data', [])
-            
-            for row in input_data_rows:
-                try:
-                    session.execute(text("""
-                        INSERT INTO input_data 
-                        (로트번호, 생산품명, 생산수량, 생산수량_단위, 투입일, 종료일, 
-                         공정, 투입물명, 수량, 투입물_단위, source_file, 주문처명, 오더번호)
-                        VALUES (:로트번호, :생산품명, :생산수량, :생산수량_단위, :투입일, :종료일,
-                                :공정, :투입물명, :수량, :투입물_단위, :source_file, :주문처명, :오더번호)
-                    """), {
-                        '로트번호': row.get('로트번호', ''),
-                        '생산품명': row.get('생산품명', ''),
-                        '생산수량': float(row.get('생산수량', 0)) if row.get('생산수량') else 0,
-                        '생산수량_단위': row.get('생산수량_단위', 't'),
-                        '투입일': row.get('투입일'),
-                        '종료일': row.get('종료일'),
-                        '공정': row.get('공정', ''),
-                        '투입물명': row.get('투입물명', ''),
-                        '수량': float(row.get('수량', 0)) if row.get('수량') else 0,
-                        '투입물_단위': row.get('투입물_단위', 't'),
-                        'source_file': data.get('filename', 'input_data'),
-                        '주문처명': row.get('주문처명', ''),
-                        '오더번호': row.get('오더번호', '')
-                    })
-                    saved_count += 1
-                except Exception as row_error:
-                    logger.error(f"행 저장 실패: {row_error}, 데이터: {row}")
-                    # 트랜잭션 롤백 후 계속 진행
-                    session.rollback()
-                    continue
-            
-            session.commit()
+        async with ingest_transaction(database.engine) as connection:
+            await bulk_insert(connection, 'input_data', records, result)
+        saved_count = result.saved_count
         
-        logger.info(f"투입물 데이터 저장 완료: {saved_count}행 저장됨")
+        logger.info(f"투입물 데이터 저장 완료: {saved_count}행 저장됨 (실패 {result.failed_count}행, {result.method})")
         
         return JSONResponse(
             status_code=200,
@@ -397,6 +415,8 @@ async def save_input_data(data: Dict[str, Any]):
                 "success": True,
                 "message": f"투입물 데이터가 성공적으로 저장되었습니다. ({saved_count}행)",
                 "saved_count": saved_count,
+                "failed_count": result.failed_count,
+                "errors": result.to_dict()["errors"],
                 "filename": data.get('filename', ''),
                 "total_rows": len(input_data_rows)
             }
@@ -413,171 +433,149 @@ async def save_input_data(data: Dict[str, Any]):
             }
         )
 
-# 투입물 데이터 조회
-@app.get("/api/datagather/input-data")
-async def get_input_data():
-    """투입물 데이터 조회"""
+# 목록 조회 공통 파라미터
+def get_list_filters(
+    source_file: Optional[str] = Query(None, description="업로드 파일명"),
+    process: Optional[str] = Query(None, alias="공정", description="공정 (운송: 도착공정, 공정 데이터: 공정명)"),
+    date_from: Optional[date] = Query(None, description="created_at 시작일 (포함)"),
+    date_to: Optional[date] = Query(None, description="created_at 종료일 (포함)")
+) -> DataListFilters:
+    """목록 조회 필터 의존성"""
+    return DataListFilters(source_file=source_file, process=process, date_from=date_from, date_to=date_to)
+
+async def list_table_page(
+    session: AsyncSession,
+    table: str,
+    label: str,
+    filters: DataListFilters,
+    limit: Optional[int],
+    cursor: Optional[str]
+):
+    """데이터 테이블 키셋 페이지 조회 공통 처리"""
     try:
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
+        # limit을 생략해도 기본 페이지 크기를 적용 (전체 조회는 next_cursor를 따라가거나 /stream 사용)
+        page_limit = min(limit or settings.list_default_limit, settings.list_max_limit)
+        page = await fetch_page(session, table, filters, limit=page_limit, cursor=cursor)
+        return {
+            "success": True,
+            "message": f"{label} 데이터 조회 완료",
+            **page
+        }
         
-        with Session() as session:
-            result = session.execute(text("SELECT * FROM input_data ORDER BY created_at DESC"))
-            rows = result.fetchall()
-            
-            data = []
-            for row in rows:
-                row_dict = dict(row._mapping)
-                for key, value in row_dict.items():
-                    if hasattr(value, 'isoformat'):
-                        row_dict[key] = value.isoformat()
-                data.append(row_dict)
-            
-            return {
-                "success": True,
-                "message": "투입물 데이터 조회 완료",
-                "data": data,
-                "count": len(data)
-            }
-            
-    except Exception as e:
-        logger.error(f"투입물 데이터 조회 실패: {e}")
+    except InvalidCursorError as e:
         return JSONResponse(
-            status_code=500,
+            status_code=400,
             content={
                 "success": False,
                 "error": str(e),
-                "message": "투입물 데이터 조회 중 오류가 발생했습니다."
+                "message": f"{label} 데이터 조회 cursor가 올바르지 않습니다."
             }
         )
-
-# 산출물 데이터 조회
-@app.get("/api/datagather/output-data")
-async def get_output_data():
-    """산출물 데이터 조회"""
-    try:
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        with Session() as session:
-            result = session.execute(text("SELECT * FROM output_data ORDER BY created_at DESC"))
-            rows = result.fetchall()
-            
-            data = []
-            for row in rows:
-                row_dict = dict(row._mapping)
-                for key, value in row_dict.items():
-                    if hasattr(value, 'isoformat'):
-                        row_dict[key] = value.isoformat()
-                data.append(row_dict)
-            
-            return {
-                "success": True,
-                "message": "산출물 데이터 조회 완료",
-                "data": data,
-                "count": len(data)
-            }
-            
     except Exception as e:
-        logger.error(f"산출물 데이터 조회 실패: {e}")
+        logger.error(f"{label} 데이터 조회 실패: {e}")
         return JSONResponse(
             status_code=500,
             content={
                 "success": False,
                 "error": str(e),
-                "message": "산출물 데이터 조회 중 오류가 발생했습니다."
+                "message": f"{label} 데이터 조회 중 오류가 발생했습니다."
             }
         )
 
+def stream_table_rows(table: str, filters: DataListFilters) -> StreamingResponse:
+    """데이터 테이블 NDJSON 스트리밍 공통 처리"""
+    if not database.async_session_maker:
+        raise HTTPException(status_code=503, detail="데이터베이스가 초기화되지 않았습니다.")
+    return StreamingResponse(
+        stream_ndjson(database.async_session_maker, table, filters, batch_size=settings.list_stream_batch_size),
+        media_type="application/x-ndjson"
+    )
+
+# 투입물 데이터 조회
+@app.get("/api/datagather/input-data")
+async def get_input_data(
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    filters: DataListFilters = Depends(get_list_filters),
+    session: AsyncSession = Depends(get_session)
+):
+    """투입물 데이터 조회 (키셋 페이지네이션)"""
+    return await list_table_page(session, "input_data", "투입물", filters, limit, cursor)
+
+@app.get("/api/datagather/input-data/stream")
+async def stream_input_data(filters: DataListFilters = Depends(get_list_filters)):
+    """투입물 데이터 전체 조회 (NDJSON 스트리밍)"""
+    return stream_table_rows("input_data", filters)
+
+# 산출물 데이터 조회
+@app.get("/api/datagather/output-data")
+async def get_output_data(
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    filters: DataListFilters = Depends(get_list_filters),
+    session: AsyncSession = Depends(get_session)
+):
+    """산출물 데이터 조회 (키셋 페이지네이션)"""
+    return await list_table_page(session, "output_data", "산출물", filters, limit, cursor)
+
+@app.get("/api/datagather/output-data/stream")
+async def stream_output_data(filters: DataListFilters = Depends(get_list_filters)):
+    """산출물 데이터 전체 조회 (NDJSON 스트리밍)"""
+    return stream_table_rows("output_data", filters)
+
 # 운송 데이터 조회
 @app.get("/api/datagather/transport-data")
-async def get_transport_data():
-    """운송 데이터 조회"""
-    try:
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        with Session() as session:
-            result = session.execute(text("SELECT * FROM transport_data ORDER BY created_at DESC"))
-            rows = result.fetchall()
-            
-            data = []
-            for row in rows:
-                row_dict = dict(row._mapping)
-                for key, value in row_dict.items():
-                    if hasattr(value, 'isoformat'):
-                        row_dict[key] = value.isoformat()
-                data.append(row_dict)
-            
-            return {
-                "success": True,
-                "message": "운송 데이터 조회 완료",
-                "data": data,
-                "count": len(data)
-            }
-            
-    except Exception as e:
-        logger.error(f"운송 데이터 조회 실패: {e}")
-        return JSONResponse(
-            status_code=500,
-            content={
-                "success": False,
-                "error": str(e),
-                "message": "운송 데이터 조회 중 오류가 발생했습니다."
-            }
-        )
+async def get_transport_data(
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    filters: DataListFilters = Depends(get_list_filters),
+    session: AsyncSession = Depends(get_session)
+):
+    """운송 데이터 조회 (키셋 페이지네이션)"""
+    return await list_table_page(session, "transport_data", "운송", filters, limit, cursor)
+
+@app.get("/api/datagather/transport-data/stream")
+async def stream_transport_data(filters: DataListFilters = Depends(get_list_filters)):
+    """운송 데이터 전체 조회 (NDJSON 스트리밍)"""
+    return stream_table_rows("transport_data", filters)
 
 # 공정 데이터 조회
 @app.get("/api/datagather/process-data")
-async def get_process_data():
-    """공정 데이터 조회"""
-    try:
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        with Session() as session:
-            result = session.execute(text("SELECT * FROM process_data ORDER BY created_at DESC"))
-            rows = result.fetchall()
-            
-            data = []
-            for row in rows:
-                row_dict = dict(row._mapping)
-                for key, value in row_dict.items():
-                    if hasattr(value, 'isoformat'):
-                        row_dict[key] = value.isoformat()
-                data.append(row_dict)
-            
-            return {
-                "success": True,
-                "message": "공정 데이터 조회 완료",
-                "data": data,
-                "count": len(data)
-            }
-            
-    except Exception as e:
-        logger.error(f"공정 데이터 조회 실패: {e}")
-        return JSONResponse(
-            status_code=500,
-            content={
-                "success": False,
-                "error": str(e),
-                "message": "공정 데이터 조회 중 오류가 발생했습니다."
-            }
-        )
+async def get_process_data(
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    filters: DataListFilters = Depends(get_list_filters),
+    session: AsyncSession = Depends(get_session)
+):
+    """공정 데이터 조회 (키셋 페이지네이션)"""
+    return await list_table_page(session, "process_data", "공정", filters, limit, cursor)
+
+@app.get("/api/datagather/process-data/stream")
+async def stream_process_data(filters: DataListFilters = Depends(get_list_filters)):
+    """공정 데이터 전체 조회 (NDJSON 스트리밍)"""
+    return stream_table_rows("process_data", filters)
 
 # 산출물 데이터 저장
+def _output_data_record(row: Dict[str, Any], source_file: str) -> Dict[str, Any]:
+    """업로드 행 -> output_data 컬럼 값"""
+    # 산출물명 필드 매핑 수정
+    output_name = row.get('산출물명', '') or row.get('투입물명', '')
+    return {
+        '로트번호': row.get('로트번호', ''),
+        '생산품명': row.get('생산품명', ''),
+        '생산수량': float(row.get('생산수량', 0)) if row.get('생산수량') else 0,
+        '생산수량_단위': row.get('생산수량_단위', 't'),
+        '투입일': row.get('투입일'),
+        '종료일': row.get('종료일'),
+        '공정': row.get('공정', ''),
+        '산출물명': output_name,
+        '수량': float(row.get('수량', 0)) if row.get('수량') else 0,
+        '산출물_단위': row.get('산출물_단위', 't'),
+        'source_file': source_file,
+        '주문처명': row.get('주문처명', ''),
+        '오더번호': row.get('오더번호', '')
+    }
+
 @app.post("/save-output-data")
 async def save_output_data(
     data: Dict[str, Any],
@@ -587,53 +585,16 @@ async def save_output_data(
     try:
         logger.info(f"산출물 데이터 저장 요청: {data.get('filename', 'unknown')}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
+        output_data_rows = data.get('data', [])
+        source_file = data.get('filename', 'output_data')
+        result = BulkIngestResult(table='output_data')
+        records = build_records(enumerate(output_data_rows), lambda row: _output_data_record(row, source_file), result)
         
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        saved_count = 0
-        with Session() as session:
-            output_data_rows = data.get('data', [])
-            
-            for row in output_data_rows:
-                try:
-                    # 산출물명 필드 매핑 수정
-                    output_name = row.get('산출물명', '') or row.get('투입물명', '')
-                    
-                    session.execute(text("""
-                        INSERT INTO output_data 
-                        (로트번호, 생산품명, 생산수량, 생산수량_단위, 투입일, 종료일, 
-                         공정, 산출물명, 수량, 산출물_단위, source_file, 주문처명, 오더번호)
-                        VALUES (:로트번호, :생산품명, :생산수량, :생산수량_단위, :투입일, :종료일,
-                                :공정, :산출물명, :수량, :산출물_단위, :source_file, :주문처명, :오더번호)
-                    """), {
-                        '로트번호': row.get('로트번호', ''),
-                        '생산품명': row.get('생산품명', ''),
-                        '생산수량': float(row.get('생산수량', 0)) if row.get('생산수량') else 0,
-                        '생산수량_단위': row.get('생산수량_단위', 't'),
-                        '투입일': row.get('투입일'),
-                        '종료일': row.get('종료일'),
-                        '공정': row.get('공정', ''),
-                        '산출물명': output_name,
-                        '수량': float(row.get('수량', 0)) if row.get('수량') else 0,
-                        '산출물_단위': row.get('산출물_단위', 't'),
-                        'source_file': data.get('filename', 'output_data'),
-                        '주문처명': row.get('주문처명', ''),
-                        '오더번호': row.get('오더번호', '')
-                    })
-                    saved_count += 1
-                except Exception as row_error:
-                    logger.error(f"행 저장 실패: {row_error}, 데이터: {row}")
-                    # 트랜잭션 롤백 후 계속 진행
-                    session.rollback()
-                    continue
-            
-            session.commit()
+        async with ingest_transaction(database.engine) as connection:
+            await bulk_insert(connection, 'output_data', records, result)
+        saved_count = result.saved_count
         
-        logger.info(f"산출물 데이터 저장 완료: {saved_count}행 저장됨")
+        logger.info(f"산출물 데이터 저장 완료: {saved_count}행 저장됨 (실패 {result.failed_count}행, {result.method})")
         
         return JSONResponse(
             status_code=200,
@@ -641,6 +602,8 @@ async def save_output_data(
                 "success": True,
                 "message": f"산출물 데이터가 성공적으로 저장되었습니다. ({saved_count}행)",
                 "saved_count": saved_count,
+                "failed_count": result.failed_count,
+                "errors": result.to_dict()["errors"],
                 "filename": data.get('filename', ''),
                 "total_rows": len(output_data_rows)
             }
@@ -658,6 +621,32 @@ async def save_output_data(
         )
 
 # 운송 데이터 저장
+def _transport_data_record(row: Dict[str, Any]) -> Dict[str, Any]:
+    """업로드 행 -> transport_data 컬럼 값"""
+    # Excel 필드명 매핑 (공백 포함 필드명 사용)
+    transport_material = row.get('운송 물질', '') or row.get('운송물질', '')
+    transport_quantity = row.get('운송 수량', 0) or row.get('운송수량', 0)
+    transport_date = row.get('운송 일자') or row.get('운송일자')
+    destination_process = row.get('도착 공정', '') or row.get('도착공정', '')
+    transport_method = row.get('이동 수단', '') or row.get('이동수단', '')
+    
+    # 운송수량이 0이면 기본값 1로 설정 (체크 제약조건 위반 방지)
+    if not transport_quantity or float(transport_quantity) <= 0:
+        transport_quantity = 1
+    
+    return {
+        '생산품명': row.get('생산품명', ''),
+        '로트번호': row.get('로트번호', ''),
+        '운송물질': transport_material,
+        '운송수량': float(transport_quantity),
+        '운송일자': transport_date,
+        '도착공정': destination_process,
+        '출발지': row.get('출발지', ''),
+        '이동수단': transport_method,
+        '주문처명': row.get('주문처명', ''),
+        '오더번호': row.get('오더번호', '')
+    }
+
 @app.post("/save-transport-data")
 async def save_transport_data(
     data: Dict[str, Any],
@@ -667,58 +656,15 @@ async def save_transport_data(
     try:
         logger.info(f"운송 데이터 저장 요청: {data.get('filename', 'unknown')}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
+        transport_data_rows = data.get('data', [])
+        result = BulkIngestResult(table='transport_data')
+        records = build_records(enumerate(transport_data_rows), _transport_data_record, result)
         
-        saved_count = 0
-        with Session() as session:
-            transport_data_rows = data.get('data', [])
-            
-            for row in transport_data_rows:
-                try:
-                    # Excel 필드명 매핑 (공백 포함 필드명 사용)
-                    transport_material = row.get('운송 물질', '') or row.get('운송물질', '')
-                    transport_quantity = row.get('운송 수량', 0) or row.get('운송수량', 0)
-                    transport_date = row.get('운송 일자') or row.get('운송일자')
-                    destination_process = row.get('도착 공정', '') or row.get('도착공정', '')
-                    transport_method = row.get('이동 수단', '') or row.get('이동수단', '')
-                    
-                    # 운송수량이 0이면 기본값 1로 설정 (체크 제약조건 위반 방지)
-                    if not transport_quantity or float(transport_quantity) <= 0:
-                        transport_quantity = 1
-                    
-                    session.execute(text("""
-                        INSERT INTO transport_data 
-                        (생산품명, 로트번호, 운송물질, 운송수량, 운송일자, 
-                         도착공정, 출발지, 이동수단, 주문처명, 오더번호)
-                        VALUES (:생산품명, :로트번호, :운송물질, :운송수량, :운송일자,
-                                :도착공정, :출발지, :이동수단, :주문처명, :오더번호)
-                    """), {
-                        '생산품명': row.get('생산품명', ''),
-                        '로트번호': row.get('로트번호', ''),
-                        '운송물질': transport_material,
-                        '운송수량': float(transport_quantity),
-                        '운송일자': transport_date,
-                        '도착공정': destination_process,
-                        '출발지': row.get('출발지', ''),
-                        '이동수단': transport_method,
-                        '주문처명': row.get('주문처명', ''),
-                        '오더번호': row.get('오더번호', '')
-                    })
-                    saved_count += 1
-                except Exception as row_error:
-                    logger.error(f"행 저장 실패: {row_error}, 데이터: {row}")
-                    # 트랜잭션 롤백 후 계속 진행
-                    session.rollback()
-                    continue
-            
-            session.commit()
+        async with ingest_transaction(database.engine) as connection:
+            await bulk_insert(connection, 'transport_data', records, result)
+        saved_count = result.saved_count
         
-        logger.info(f"운송 데이터 저장 완료: {saved_count}행 저장됨")
+        logger.info(f"운송 데이터 저장 완료: {saved_count}행 저장됨 (실패 {result.failed_count}행, {result.method})")
         
         return JSONResponse(
             status_code=200,
@@ -726,6 +672,8 @@ async def save_transport_data(
                 "success": True,
                 "message": f"운송 데이터가 성공적으로 저장되었습니다. ({saved_count}행)",
                 "saved_count": saved_count,
+                "failed_count": result.failed_count,
+                "errors": result.to_dict()["errors"],
                 "filename": data.get('filename', ''),
                 "total_rows": len(transport_data_rows)
             }
@@ -743,6 +691,35 @@ async def save_transport_data(
         )
 
 # 공정 데이터 저장
+def _process_data_record(row: Dict[str, Any]) -> Dict[str, Any]:
+    """업로드 행 -> process_data 컬럼 값"""
+    # 공정설명 필드 매핑 (다양한 필드명 지원)
+    process_description = (
+        row.get('공정 설명', '') or 
+        row.get('공정설명', '') or 
+        row.get('설명', '') or 
+        row.get('공정내용', '') or
+        row.get('세부설명', '') or
+        row.get('공정_설명', '') or
+        row.get('공정 내용', '') or
+        row.get('세부 설명', '') or
+        row.get('process_description', '') or
+        row.get('description', '') or
+        # 강제로 상세한 설명 생성
+        f"{row.get('공정명', '')} 공정: {row.get('생산제품', '')} 생산을 위한 {row.get('세부공정', '')} 공정입니다."
+    )
+    
+    # 텍스트가 너무 짧으면 더 상세하게 만들기
+    if len(process_description) < 10:
+        process_description = f"{row.get('공정명', '')} 공정 - {row.get('생산제품', '')} 생산을 위한 {row.get('세부공정', '')} 공정으로, 원료를 가공하여 최종 제품을 생산하는 과정입니다."
+    
+    return {
+        '공정명': row.get('공정명', ''),
+        '생산제품': row.get('생산제품', ''),
+        '세부공정': row.get('세부공정', ''),
+        '공정설명': process_description
+    }
+
 @app.post("/save-process-data")
 async def save_process_data(
     data: Dict[str, Any],
@@ -752,73 +729,17 @@ async def save_process_data(
     try:
         logger.info(f"공정 데이터 저장 요청: {data.get('filename', 'unknown')}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
+        process_data_rows = data.get('data', [])
+        if process_data_rows:
+            logger.debug(f"Excel 데이터 필드들: {list(process_data_rows[0].keys())}")
+        result = BulkIngestResult(table='process_data')
+        records = build_records(enumerate(process_data_rows), _process_data_record, result)
         
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        saved_count = 0
-        with Session() as session:
-            process_data_rows = data.get('data', [])
-            
-            for row in process_data_rows:
-                try:
-                    # 디버깅: Excel 데이터의 모든 필드명과 값 확인
-                    logger.info(f"Excel 데이터 필드들: {list(row.keys())}")
-                    logger.info(f"전체 데이터: {row}")
-                    logger.info(f"공정설명 값: '{row.get('공정설명', '')}'")
-                    logger.info(f"공정 설명 값: '{row.get('공정 설명', '')}'")
-                    
-                    # 모든 필드의 값 확인 (디버깅용)
-                    logger.info("=== Excel 데이터 모든 필드 ===")
-                    for key, value in row.items():
-                        logger.info(f"필드 '{key}': '{value}' (타입: {type(value)})")
-                    logger.info("=== 필드 확인 완료 ===")
-                    
-                    # 공정설명 필드 매핑 (다양한 필드명 지원)
-                    process_description = (
-                        row.get('공정 설명', '') or 
-                        row.get('공정설명', '') or 
-                        row.get('설명', '') or 
-                        row.get('공정내용', '') or
-                        row.get('세부설명', '') or
-                        row.get('공정_설명', '') or
-                        row.get('공정 내용', '') or
-                        row.get('세부 설명', '') or
-                        row.get('process_description', '') or
-                        row.get('description', '') or
-                        # 강제로 상세한 설명 생성
-                        f"{row.get('공정명', '')} 공정: {row.get('생산제품', '')} 생산을 위한 {row.get('세부공정', '')} 공정입니다."
-                    )
-                    
-                    # 텍스트가 너무 짧으면 더 상세하게 만들기
-                    if len(process_description) < 10:
-                        process_description = f"{row.get('공정명', '')} 공정 - {row.get('생산제품', '')} 생산을 위한 {row.get('세부공정', '')} 공정으로, 원료를 가공하여 최종 제품을 생산하는 과정입니다."
-                    
-                    logger.info(f"최종 공정설명 값: '{process_description}'")
-                    
-                    session.execute(text("""
-                        INSERT INTO process_data 
-                        (공정명, 생산제품, 세부공정, 공정설명)
-                        VALUES (:공정명, :생산제품, :세부공정, :공정설명)
-                    """), {
-                        '공정명': row.get('공정명', ''),
-                        '생산제품': row.get('생산제품', ''),
-                        '세부공정': row.get('세부공정', ''),
-                        '공정설명': process_description
-                    })
-                    saved_count += 1
-                except Exception as row_error:
-                    logger.error(f"행 저장 실패: {row_error}, 데이터: {row}")
-                    # 트랜잭션 롤백 후 계속 진행
-                    session.rollback()
-                    continue
-            
-            session.commit()
+        async with ingest_transaction(database.engine) as connection:
+            await bulk_insert(connection, 'process_data', records, result)
+        saved_count = result.saved_count
         
-        logger.info(f"공정 데이터 저장 완료: {saved_count}행 저장됨")
+        logger.info(f"공정 데이터 저장 완료: {saved_count}행 저장됨 (실패 {result.failed_count}행, {result.method})")
         
         return JSONResponse(
             status_code=200,
@@ -826,6 +747,8 @@ async def save_process_data(
                 "success": True,
                 "message": f"공정 데이터가 성공적으로 저장되었습니다. ({saved_count}행)",
                 "saved_count": saved_count,
+                "failed_count": result.failed_count,
+                "errors": result.to_dict()["errors"],
                 "filename": data.get('filename', ''),
                 "total_rows": len(process_data_rows)
             }
@@ -843,185 +766,146 @@ async def save_process_data(
         )
 
 # 처리된 데이터 분류 및 저장
+def _classify_processed_row(row: Dict[str, Any]) -> str:
+    """처리된 행을 저장할 테이블 이름 결정"""
+    분류 = row.get('분류', '').lower()
+    투입물명 = row.get('투입물명', '').lower()
+    공정 = row.get('공정', '').lower()
+    
+    if '연료' in 분류 or any(fuel in 투입물명 for fuel in ['석탄', '가스', '오일', '연료', 'fuel']):
+        return 'fuel_data'
+    elif '폐기물' in 분류 or any(waste in 투입물명 for waste in ['폐기물', 'waste', '슬래그', '재']):
+        return 'waste_data'
+    elif '유틸리티' in 분류 or any(util in 투입물명 for util in ['전기', '증기', '냉각수', 'utility']):
+        return 'utility_data'
+    elif '산출물' in 분류 or '생산품' in 분류 or any(output in 투입물명 for output in ['제품', '생산품', '산출물']):
+        return 'output_data'
+    elif '운송' in 분류 or any(transport in 투입물명 for transport in ['운송', 'transport', '이동']):
+        return 'transport_data'
+    elif '공정' in 분류 or any(process in 공정 for process in ['제련', '압연', '가공', '공정']):
+        return 'process_product_data'
+    else:
+        # 기본적으로 투입물로 분류
+        return 'input_data'
+
+def _processed_row_record(table_name: str, row: Dict[str, Any], source_file: str) -> Dict[str, Any]:
+    """처리된 행 -> 분류된 테이블 컬럼 값"""
+    if table_name == 'input_data':
+        return _input_data_record(row, source_file)
+    elif table_name == 'output_data':
+        return {
+            '로트번호': row.get('로트번호', ''),
+            '생산품명': row.get('생산품명', ''),
+            '생산수량': float(row.get('생산수량', 0)) if row.get('생산수량') else 0,
+            '생산수량_단위': row.get('생산수량_단위', 't'),
+            '투입일': row.get('투입일'),
+            '종료일': row.get('종료일'),
+            '공정': row.get('공정', ''),
+            '산출물명': row.get('투입물명', ''),  # 산출물명으로 매핑
+            '수량': float(row.get('수량', 0)) if row.get('수량') else 0,
+            '산출물_단위': row.get('산출물_단위', 't'),
+            '주문처명': row.get('주문처명', ''),
+            '오더번호': row.get('오더번호', '')
+        }
+    elif table_name == 'transport_data':
+        return {
+            '생산품명': row.get('생산품명', ''),
+            '로트번호': row.get('로트번호', ''),
+            '운송물질': row.get('투입물명', ''),
+            '운송수량': float(row.get('수량', 0)) if row.get('수량') else 0,
+            '운송일자': row.get('투입일'),
+            '도착공정': row.get('공정', ''),
+            '출발지': row.get('주문처명', ''),
+            '이동수단': row.get('분류', ''),
+            '주문처명': row.get('주문처명', ''),
+            '오더번호': row.get('오더번호', '')
+        }
+    elif table_name == 'process_data':
+        return {
+            '공정명': row.get('공정', ''),
+            '생산제품': row.get('생산품명', ''),
+            '세부공정': row.get('투입물명', ''),
+            '공정설명': row.get('분류', '')
+        }
+    else:
+        # utility_data, waste_data, fuel_data, process_product_data
+        return {
+            '로트번호': int(row.get('로트번호', 0)) if row.get('로트번호') else 0,
+            '생산수량': float(row.get('생산수량', 0)) if row.get('생산수량') else 0,
+            '투입일': row.get('투입일'),
+            '종료일': row.get('종료일'),
+            '공정': row.get('공정', ''),
+            '투입물명': row.get('투입물명', ''),
+            '수량': float(row.get('수량', 0)) if row.get('수량') else 0,
+            '단위': row.get('단위', 't'),
+            '분류': row.get('분류', table_name.replace('_data', '')),
+            '주문처명': row.get('주문처명', ''),
+            '오더번호': row.get('오더번호', '')
+        }
+
 @app.post("/save-processed-data")
 async def save_processed_data(data: Dict[str, Any]):
     """처리된 데이터를 분류하여 적절한 테이블에 저장"""
     try:
         logger.info(f"처리된 데이터 분류 요청: {data.get('filename', 'unknown')}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        with Session() as session:
-            input_data_rows = data.get('data', [])
-            classified_data = {
-                'input_data': [],
-                'output_data': [],
-                'transport_data': [],
-                'process_data': [],
-                'utility_data': [],
-                'waste_data': [],
-                'fuel_data': [],
-                'process_product_data': []
-            }
-            
-            # 데이터 분류
-            for row in input_data_rows:
-                try:
-                    # 분류 로직
-                    분류 = row.get('분류', '').lower()
-                    투입물명 = row.get('투입물명', '').lower()
-                    공정 = row.get('공정', '').lower()
-                    
-                    if '연료' in 분류 or any(fuel in 투입물명 for fuel in ['석탄', '가스', '오일', '연료', 'fuel']):
-                        classified_data['fuel_data'].append(row)
-                    elif '폐기물' in 분류 or any(waste in 투입물명 for waste in ['폐기물', 'waste', '슬래그', '재']):
-                        classified_data['waste_data'].append(row)
-                    elif '유틸리티' in 분류 or any(util in 투입물명 for util in ['전기', '증기', '냉각수', 'utility']):
-                        classified_data['utility_data'].append(row)
-                    elif '산출물' in 분류 or '생산품' in 분류 or any(output in 투입물명 for output in ['제품', '생산품', '산출물']):
-                        classified_data['output_data'].append(row)
-                    elif '운송' in 분류 or any(transport in 투입물명 for transport in ['운송', 'transport', '이동']):
-                        classified_data['transport_data'].append(row)
-                    elif '공정' in 분류 or any(process in 공정 for process in ['제련', '압연', '가공', '공정']):
-                        classified_data['process_product_data'].append(row)
-                    else:
-                        # 기본적으로 투입물로 분류
-                        classified_data['input_data'].append(row)
-                
-                except Exception as row_error:
-                    logger.error(f"행 분류 실패: {row_error}")
+        input_data_rows = data.get('data', [])
+        source_file = data.get('filename', 'processed')
+        classified_data = {
+            'input_data': [],
+            'output_data': [],
+            'transport_data': [],
+            'process_data': [],
+            'utility_data': [],
+            'waste_data': [],
+            'fuel_data': [],
+            'process_product_data': []
+        }
+        
+        # 데이터 분류 (원본 행 번호 유지)
+        for row_index, row in enumerate(input_data_rows):
+            try:
+                classified_data[_classify_processed_row(row)].append((row_index, row))
+            except Exception as row_error:
+                logger.error(f"행 분류 실패: {row_error}")
+                continue
+        
+        # 분류된 데이터를 각 테이블에 저장 (한 트랜잭션, 테이블별 SAVEPOINT)
+        total_saved = 0
+        save_results = {}
+        failed_rows = {}
+        
+        async with ingest_transaction(database.engine) as connection:
+            for table_name, indexed_rows in classified_data.items():
+                if not indexed_rows:
                     continue
-            
-            # 분류된 데이터를 각 테이블에 저장
-            total_saved = 0
-            save_results = {}
-            
-            for table_name, rows in classified_data.items():
-                if rows:
-                    saved_count = 0
-                    for row in rows:
-                        try:
-                            if table_name == 'input_data':
-                                session.execute(text("""
-                                    INSERT INTO input_data 
-                                    (로트번호, 생산품명, 생산수량, 생산수량_단위, 투입일, 종료일, 
-                                     공정, 투입물명, 수량, 투입물_단위, source_file, 주문처명, 오더번호)
-                                    VALUES (:로트번호, :생산품명, :생산수량, :생산수량_단위, :투입일, :종료일,
-                                            :공정, :투입물명, :수량, :투입물_단위, :source_file, :주문처명, :오더번호)
-                                """), {
-                                    '로트번호': row.get('로트번호', ''),
-                                    '생산품명': row.get('생산품명', ''),
-                                    '생산수량': float(row.get('생산수량', 0)) if row.get('생산수량') else 0,
-                                    '생산수량_단위': row.get('생산수량_단위', 't'),
-                                    '투입일': row.get('투입일'),
-                                    '종료일': row.get('종료일'),
-                                    '공정': row.get('공정', ''),
-                                    '투입물명': row.get('투입물명', ''),
-                                    '수량': float(row.get('수량', 0)) if row.get('수량') else 0,
-                                    '투입물_단위': row.get('투입물_단위', 't'),
-                                    'source_file': data.get('filename', 'processed'),
-                                    '주문처명': row.get('주문처명', ''),
-                                    '오더번호': row.get('오더번호', '')
-                                })
-                            elif table_name == 'output_data':
-                                session.execute(text("""
-                                    INSERT INTO output_data 
-                                    (로트번호, 생산품명, 생산수량, 생산수량_단위, 투입일, 종료일, 
-                                     공정, 산출물명, 수량, 산출물_단위, 주문처명, 오더번호)
-                                    VALUES (:로트번호, :생산품명, :생산수량, :생산수량_단위, :투입일, :종료일,
-                                            :공정, :산출물명, :수량, :산출물_단위, :주문처명, :오더번호)
-                                """), {
-                                    '로트번호': row.get('로트번호', ''),
-                                    '생산품명': row.get('생산품명', ''),
-                                    '생산수량': float(row.get('생산수량', 0)) if row.get('생산수량') else 0,
-                                    '생산수량_단위': row.get('생산수량_단위', 't'),
-                                    '투입일': row.get('투입일'),
-                                    '종료일': row.get('종료일'),
-                                    '공정': row.get('공정', ''),
-                                    '산출물명': row.get('투입물명', ''),  # 산출물명으로 매핑
-                                    '수량': float(row.get('수량', 0)) if row.get('수량') else 0,
-                                    '산출물_단위': row.get('산출물_단위', 't'),
-                                    '주문처명': row.get('주문처명', ''),
-                                    '오더번호': row.get('오더번호', '')
-                                })
-                            elif table_name == 'transport_data':
-                                session.execute(text("""
-                                    INSERT INTO transport_data 
-                                    (생산품명, 로트번호, 운송물질, 운송수량, 운송일자, 
-                                     도착공정, 출발지, 이동수단, 주문처명, 오더번호)
-                                    VALUES (:생산품명, :로트번호, :운송물질, :운송수량, :운송일자,
-                                            :도착공정, :출발지, :이동수단, :주문처명, :오더번호)
-                                """), {
-                                    '생산품명': row.get('생산품명', ''),
-                                    '로트번호': row.get('로트번호', ''),
-                                    '운송물질': row.get('투입물명', ''),
-                                    '운송수량': float(row.get('수량', 0)) if row.get('수량') else 0,
-                                    '운송일자': row.get('투입일'),
-                                    '도착공정': row.get('공정', ''),
-                                    '출발지': row.get('주문처명', ''),
-                                    '이동수단': row.get('분류', ''),
-                                    '주문처명': row.get('주문처명', ''),
-                                    '오더번호': row.get('오더번호', '')
-                                })
-                            elif table_name == 'process_data':
-                                session.execute(text("""
-                                    INSERT INTO process_data 
-                                    (공정명, 생산제품, 세부공정, 공정설명)
-                                    VALUES (:공정명, :생산제품, :세부공정, :공정설명)
-                                """), {
-                                    '공정명': row.get('공정', ''),
-                                    '생산제품': row.get('생산품명', ''),
-                                    '세부공정': row.get('투입물명', ''),
-                                    '공정설명': row.get('분류', '')
-                                })
-                            else:
-                                # utility_data, waste_data, fuel_data, process_product_data
-                                session.execute(text(f"""
-                                    INSERT INTO {table_name} 
-                                    (로트번호, 생산수량, 투입일, 종료일, 공정, 투입물명, 수량, 단위, 분류, 주문처명, 오더번호)
-                                    VALUES (:로트번호, :생산수량, :투입일, :종료일, :공정, :투입물명, :수량, :단위, :분류, :주문처명, :오더번호)
-                                """), {
-                                    '로트번호': int(row.get('로트번호', 0)) if row.get('로트번호') else 0,
-                                    '생산수량': float(row.get('생산수량', 0)) if row.get('생산수량') else 0,
-                                    '투입일': row.get('투입일'),
-                                    '종료일': row.get('종료일'),
-                                    '공정': row.get('공정', ''),
-                                    '투입물명': row.get('투입물명', ''),
-                                    '수량': float(row.get('수량', 0)) if row.get('수량') else 0,
-                                    '단위': row.get('단위', 't'),
-                                    '분류': row.get('분류', table_name.replace('_data', '')),
-                                    '주문처명': row.get('주문처명', ''),
-                                    '오더번호': row.get('오더번호', '')
-                                })
-                            
-                            saved_count += 1
-                            total_saved += 1
-                        
-                        except Exception as row_error:
-                            logger.error(f"행 저장 실패 ({table_name}): {row_error}")
-                            continue
-                    
-                    save_results[table_name] = saved_count
-                    logger.info(f"{table_name} 테이블에 {saved_count}행 저장")
-            
-            session.commit()
-            logger.info(f"분류 및 저장 완료: 총 {total_saved}행 저장됨")
-            
-            return JSONResponse(
-                status_code=200,
-                content={
-                    "success": True,
-                    "message": f"데이터가 성공적으로 분류되어 저장되었습니다. (총 {total_saved}행)",
-                    "total_saved": total_saved,
-                    "classification_results": save_results,
-                    "filename": data.get('filename', '')
-                }
-            )
+                result = BulkIngestResult(table=table_name)
+                records = build_records(
+                    indexed_rows,
+                    lambda row, table_name=table_name: _processed_row_record(table_name, row, source_file),
+                    result
+                )
+                await bulk_insert(connection, table_name, records, result)
+                
+                total_saved += result.saved_count
+                save_results[table_name] = result.saved_count
+                if result.errors:
+                    failed_rows[table_name] = result.to_dict()["errors"]
+                logger.info(f"{table_name} 테이블에 {result.saved_count}행 저장 (실패 {result.failed_count}행)")
+        
+        logger.info(f"분류 및 저장 완료: 총 {total_saved}행 저장됨")
+        
+        return JSONResponse(
+            status_code=200,
+            content={
+                "success": True,
+                "message": f"데이터가 성공적으로 분류되어 저장되었습니다. (총 {total_saved}행)",
+                "total_saved": total_saved,
+                "classification_results": save_results,
+                "errors": failed_rows,
+                "filename": data.get('filename', '')
+            }
+        )
             
     except Exception as e:
         logger.error(f"처리된 데이터 분류 실패: {e}")
@@ -1036,52 +920,46 @@ async def save_processed_data(data: Dict[str, Any]):
 
 # 데이터 분류 저장
 @app.post("/api/datagather/classify-data")
-async def classify_data(data: Dict[str, Any]):
+async def classify_data(data: Dict[str, Any], session: AsyncSession = Depends(get_session)):
     """데이터 분류 정보를 분류별 테이블에 저장"""
     try:
         logger.info(f"데이터 분류 저장 요청: {data}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
         saved_count = 0
-        with Session() as session:
-            classification_data = data.get('data', [])
-            
-            for row in classification_data:
-                try:
-                    분류 = row.get('분류', '').strip()
-                    source_table = row.get('source_table', '')
-                    source_id = row.get('source_id', 0)
-                    
-                    # 분류에 따라 적절한 테이블에 저장
-                    if 분류 == '연료':
-                        target_table = 'fuel_data'
-                    elif 분류 == '유틸리티':
-                        target_table = 'utility_data'
-                    elif 분류 == '폐기물':
-                        target_table = 'waste_data'
-                    elif 분류 == '공정 생산품':
-                        target_table = 'process_product_data'
-                    else:
-                        continue
-                    
+        classification_data = data.get('data', [])
+        
+        for row in classification_data:
+            try:
+                분류 = row.get('분류', '').strip()
+                source_table = row.get('source_table', '')
+                source_id = int(row.get('source_id', 0) or 0)
+                
+                # 분류에 따라 적절한 테이블에 저장
+                if 분류 == '연료':
+                    target_table = 'fuel_data'
+                elif 분류 == '유틸리티':
+                    target_table = 'utility_data'
+                elif 분류 == '폐기물':
+                    target_table = 'waste_data'
+                elif 분류 == '공정 생산품':
+                    target_table = 'process_product_data'
+                else:
+                    continue
+                
+                # 행마다 SAVEPOINT (실패한 행만 되돌리고 앞서 저장한 행은 유지)
+                async with session.begin_nested():
                     # 기존 데이터가 있는지 확인
-                    existing_check = session.execute(text(f"""
+                    existing_check = (await session.execute(text(f"""
                         SELECT id FROM {target_table} 
                         WHERE source_table = :source_table AND source_id = :source_id
                     """), {
                         'source_table': source_table,
                         'source_id': source_id
-                    }).fetchone()
+                    })).fetchone()
                     
                     if existing_check:
                         # 기존 데이터가 있으면 업데이트
-                        session.execute(text(f"""
+                        await session.execute(text(f"""
                             UPDATE {target_table} 
                             SET 분류 = :분류, updated_at = NOW()
                             WHERE source_table = :source_table AND source_id = :source_id
@@ -1093,7 +971,7 @@ async def classify_data(data: Dict[str, Any]):
                     else:
                         # 기존 데이터가 없으면 새로 삽입
                         if source_table == 'input_data':
-                            session.execute(text(f"""
+                            await session.execute(text(f"""
                                 INSERT INTO {target_table} 
                                 (로트번호, 생산수량, 투입일, 종료일, 공정, 투입물명, 수량, 단위, 
                                  분류, source_table, source_id, 주문처명, 오더번호, created_at)
@@ -1107,7 +985,7 @@ async def classify_data(data: Dict[str, Any]):
                                 'source_id': source_id
                             })
                         elif source_table == 'output_data':
-                            session.execute(text(f"""
+                            await session.execute(text(f"""
                                 INSERT INTO {target_table} 
                                 (로트번호, 생산수량, 투입일, 종료일, 공정, 투입물명, 수량, 단위, 
                                  분류, source_table, source_id, 주문처명, 오더번호, created_at)
@@ -1120,15 +998,14 @@ async def classify_data(data: Dict[str, Any]):
                                 'source_table': source_table,
                                 'source_id': source_id
                             })
-                    
-                    saved_count += 1
-                    
-                except Exception as row_error:
-                    logger.error(f"분류 데이터 저장 실패: {row_error}, 데이터: {row}")
-                    session.rollback()
-                    continue
-            
-            session.commit()
+                
+                saved_count += 1
+                
+            except Exception as row_error:
+                logger.error(f"분류 데이터 저장 실패: {row_error}, 데이터: {row}")
+                continue
+        
+        await session.commit()
         
         logger.info(f"분류 데이터 저장 완료: {saved_count}행 저장됨")
         
@@ -1155,85 +1032,77 @@ async def classify_data(data: Dict[str, Any]):
 
 # 분류된 데이터 조회
 @app.get("/api/datagather/classified-data/{classification}")
-async def get_classified_data(classification: str):
+async def get_classified_data(classification: str, session: AsyncSession = Depends(get_session)):
     """분류된 데이터 조회 (연료, 유틸리티, 폐기물, 공정 생산품)"""
     try:
         logger.info(f"분류된 데이터 조회 요청: {classification}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        with Session() as session:
-            # 분류에 따라 적절한 테이블에서 조회
-            if classification == '연료':
-                table_name = 'fuel_data'
-            elif classification == '유틸리티':
-                table_name = 'utility_data'
-            elif classification == '폐기물':
-                table_name = 'waste_data'
-            elif classification == '공정 생산품':
-                table_name = 'process_product_data'
-            else:
-                return JSONResponse(
-                    status_code=400,
-                    content={
-                        "success": False,
-                        "error": "Invalid classification",
-                        "message": f"지원하지 않는 분류입니다: {classification}"
-                    }
-                )
-            
-            # 해당 분류 테이블에서 데이터 조회
-            query = f"""
-                SELECT 
-                    id,
-                    로트번호,
-                    생산수량,
-                    투입일,
-                    종료일,
-                    공정,
-                    투입물명,
-                    수량,
-                    단위,
-                    분류,
-                    source_table,
-                    source_id,
-                    주문처명,
-                    오더번호,
-                    created_at,
-                    updated_at
-                FROM {table_name}
-                ORDER BY created_at DESC
-            """
-            
-            result = session.execute(text(query))
-            rows = result.fetchall()
-            
-            data = []
-            for row in rows:
-                row_dict = dict(row._mapping)
-                
-                # 날짜 필드 처리
-                for key, value in row_dict.items():
-                    if hasattr(value, 'isoformat'):
-                        row_dict[key] = value.isoformat()
-                
-                data.append(row_dict)
-            
-            logger.info(f"분류된 데이터 조회 완료: {len(data)}행 ({classification})")
+        # 분류에 따라 적절한 테이블에서 조회
+        if classification == '연료':
+            table_name = 'fuel_data'
+        elif classification == '유틸리티':
+            table_name = 'utility_data'
+        elif classification == '폐기물':
+            table_name = 'waste_data'
+        elif classification == '공정 생산품':
+            table_name = 'process_product_data'
+        else:
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "success": False,
+                    "error": "Invalid classification",
+                    "message": f"지원하지 않는 분류입니다: {classification}"
+                }
+            )
+        
+        # 해당 분류 테이블에서 데이터 조회
+        query = f"""
+            SELECT 
+                id,
+                로트번호,
+                생산수량,
+                투입일,
+                종료일,
+                공정,
+                투입물명,
+                수량,
+                단위,
+                분류,
+                source_table,
+                source_id,
+                주문처명,
+                오더번호,
+                created_at,
+                updated_at
+            FROM {table_name}
+            ORDER BY created_at DESC
+        """
+        
+        result = await session.execute(text(query))
+        rows = result.fetchall()
+        
+        data = []
+        for row in rows:
+            row_dict = dict(row._mapping)
             
-            return {
-                "success": True,
-                "message": f"{classification} 분류 데이터 조회 완료",
-                "data": data,
-                "count": len(data),
-                "classification": classification
-            }
+            # 날짜 필드 처리
+            for key, value in row_dict.items():
+                if hasattr(value, 'isoformat'):
+                    row_dict[key] = value.isoformat()
             
+            data.append(row_dict)
+        
+        logger.info(f"분류된 데이터 조회 완료: {len(data)}행 ({classification})")
+        
+        return {
+            "success": True,
+            "message": f"{classification} 분류 데이터 조회 완료",
+            "data": data,
+            "count": len(data),
+            "classification": classification
+        }
+        
     except Exception as e:
         logger.error(f"분류된 데이터 조회 실패: {e}")
         return JSONResponse(
@@ -1247,45 +1116,37 @@ async def get_classified_data(classification: str):
 
 # 데이터 삭제 API 엔드포인트들
 @app.delete("/api/datagather/input-data/{data_id}")
-async def delete_input_data(data_id: int):
+async def delete_input_data(data_id: int, session: AsyncSession = Depends(get_session)):
     """투입물 데이터 삭제"""
     try:
         logger.info(f"투입물 데이터 삭제 요청: ID {data_id}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        with Session() as session:
-            # 데이터 존재 여부 확인
-            check_query = "SELECT id FROM input_data WHERE id = :data_id"
-            result = session.execute(text(check_query), {"data_id": data_id})
-            if not result.fetchone():
-                return JSONResponse(
-                    status_code=404,
-                    content={
-                        "success": False,
-                        "error": "Data not found",
-                        "message": f"ID {data_id}에 해당하는 투입물 데이터를 찾을 수 없습니다."
-                    }
-                )
-            
-            # 데이터 삭제
-            delete_query = "DELETE FROM input_data WHERE id = :data_id"
-            session.execute(text(delete_query), {"data_id": data_id})
-            session.commit()
-            
-            logger.info(f"투입물 데이터 삭제 완료: ID {data_id}")
-            
-            return {
-                "success": True,
-                "message": f"투입물 데이터 (ID: {data_id})가 성공적으로 삭제되었습니다.",
-                "deleted_id": data_id
-            }
-            
+        # 데이터 존재 여부 확인
+        check_query = "SELECT id FROM input_data WHERE id = :data_id"
+        result = await session.execute(text(check_query), {"data_id": data_id})
+        if not result.fetchone():
+            return JSONResponse(
+                status_code=404,
+                content={
+                    "success": False,
+                    "error": "Data not found",
+                    "message": f"ID {data_id}에 해당하는 투입물 데이터를 찾을 수 없습니다."
+                }
+            )
+        
+        # 데이터 삭제
+        delete_query = "DELETE FROM input_data WHERE id = :data_id"
+        await session.execute(text(delete_query), {"data_id": data_id})
+        await session.commit()
+        
+        logger.info(f"투입물 데이터 삭제 완료: ID {data_id}")
+        
+        return {
+            "success": True,
+            "message": f"투입물 데이터 (ID: {data_id})가 성공적으로 삭제되었습니다.",
+            "deleted_id": data_id
+        }
+        
     except Exception as e:
         logger.error(f"투입물 데이터 삭제 실패: {e}")
         return JSONResponse(
@@ -1298,45 +1159,37 @@ async def delete_input_data(data_id: int):
         )
 
 @app.delete("/api/datagather/output-data/{data_id}")
-async def delete_output_data(data_id: int):
+async def delete_output_data(data_id: int, session: AsyncSession = Depends(get_session)):
     """산출물 데이터 삭제"""
     try:
         logger.info(f"산출물 데이터 삭제 요청: ID {data_id}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        with Session() as session:
-            # 데이터 존재 여부 확인
-            check_query = "SELECT id FROM output_data WHERE id = :data_id"
-            result = session.execute(text(check_query), {"data_id": data_id})
-            if not result.fetchone():
-                return JSONResponse(
-                    status_code=404,
-                    content={
-                        "success": False,
-                        "error": "Data not found",
-                        "message": f"ID {data_id}에 해당하는 산출물 데이터를 찾을 수 없습니다."
-                    }
-                )
-            
-            # 데이터 삭제
-            delete_query = "DELETE FROM output_data WHERE id = :data_id"
-            session.execute(text(delete_query), {"data_id": data_id})
-            session.commit()
-            
-            logger.info(f"산출물 데이터 삭제 완료: ID {data_id}")
-            
-            return {
-                "success": True,
-                "message": f"산출물 데이터 (ID: {data_id})가 성공적으로 삭제되었습니다.",
-                "deleted_id": data_id
-            }
-            
+        # 데이터 존재 여부 확인
+        check_query = "SELECT id FROM output_data WHERE id = :data_id"
+        result = await session.execute(text(check_query), {"data_id": data_id})
+        if not result.fetchone():
+            return JSONResponse(
+                status_code=404,
+                content={
+                    "success": False,
+                    "error": "Data not found",
+                    "message": f"ID {data_id}에 해당하는 산출물 데이터를 찾을 수 없습니다."
+                }
+            )
+        
+        # 데이터 삭제
+        delete_query = "DELETE FROM output_data WHERE id = :data_id"
+        await session.execute(text(delete_query), {"data_id": data_id})
+        await session.commit()
+        
+        logger.info(f"산출물 데이터 삭제 완료: ID {data_id}")
+        
+        return {
+            "success": True,
+            "message": f"산출물 데이터 (ID: {data_id})가 성공적으로 삭제되었습니다.",
+            "deleted_id": data_id
+        }
+        
     except Exception as e:
         logger.error(f"산출물 데이터 삭제 실패: {e}")
         return JSONResponse(
@@ -1349,45 +1202,37 @@ async def delete_output_data(data_id: int):
         )
 
 @app.delete("/api/datagather/transport-data/{data_id}")
-async def delete_transport_data(data_id: int):
+async def delete_transport_data(data_id: int, session: AsyncSession = Depends(get_session)):
     """운송 데이터 삭제"""
     try:
         logger.info(f"운송 데이터 삭제 요청: ID {data_id}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        with Session() as session:
-            # 데이터 존재 여부 확인
-            check_query = "SELECT id FROM transport_data WHERE id = :data_id"
-            result = session.execute(text(check_query), {"data_id": data_id})
-            if not result.fetchone():
-                return JSONResponse(
-                    status_code=404,
-                    content={
-                        "success": False,
-                        "error": "Data not found",
-                        "message": f"ID {data_id}에 해당하는 운송 데이터를 찾을 수 없습니다."
-                    }
-                )
-            
-            # 데이터 삭제
-            delete_query = "DELETE FROM transport_data WHERE id = :data_id"
-            session.execute(text(delete_query), {"data_id": data_id})
-            session.commit()
-            
-            logger.info(f"운송 데이터 삭제 완료: ID {data_id}")
-            
-            return {
-                "success": True,
-                "message": f"운송 데이터 (ID: {data_id})가 성공적으로 삭제되었습니다.",
-                "deleted_id": data_id
-            }
-            
+        # 데이터 존재 여부 확인
+        check_query = "SELECT id FROM transport_data WHERE id = :data_id"
+        result = await session.execute(text(check_query), {"data_id": data_id})
+        if not result.fetchone():
+            return JSONResponse(
+                status_code=404,
+                content={
+                    "success": False,
+                    "error": "Data not found",
+                    "message": f"ID {data_id}에 해당하는 운송 데이터를 찾을 수 없습니다."
+                }
+            )
+        
+        # 데이터 삭제
+        delete_query = "DELETE FROM transport_data WHERE id = :data_id"
+        await session.execute(text(delete_query), {"data_id": data_id})
+        await session.commit()
+        
+        logger.info(f"운송 데이터 삭제 완료: ID {data_id}")
+        
+        return {
+            "success": True,
+            "message": f"운송 데이터 (ID: {data_id})가 성공적으로 삭제되었습니다.",
+            "deleted_id": data_id
+        }
+        
     except Exception as e:
         logger.error(f"운송 데이터 삭제 실패: {e}")
         return JSONResponse(
@@ -1400,45 +1245,37 @@ async def delete_transport_data(data_id: int):
         )
 
 @app.delete("/api/datagather/process-data/{data_id}")
-async def delete_process_data(data_id: int):
+async def delete_process_data(data_id: int, session: AsyncSession = Depends(get_session)):
     """공정 데이터 삭제"""
     try:
         logger.info(f"공정 데이터 삭제 요청: ID {data_id}")
         
-        # 데이터베이스 연결
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
-        Session = sessionmaker(bind=engine)
-        
-        with Session() as session:
-            # 데이터 존재 여부 확인
-            check_query = "SELECT id FROM process_data WHERE id = :data_id"
-            result = session.execute(text(check_query), {"data_id": data_id})
-            if not result.fetchone():
-                return JSONResponse(
-                    status_code=404,
-                    content={
-                        "success": False,
-                        "error": "Data not found",
-                        "message": f"ID {data_id}에 해당하는 공정 데이터를 찾을 수 없습니다."
-                    }
-                )
-            
-            # 데이터 삭제
-            delete_query = "DELETE FROM process_data WHERE id = :data_id"
-            session.execute(text(delete_query), {"data_id": data_id})
-            session.commit()
-            
-            logger.info(f"공정 데이터 삭제 완료: ID {data_id}")
-            
-            return {
-                "success": True,
-                "message": f"공정 데이터 (ID: {data_id})가 성공적으로 삭제되었습니다.",
-                "deleted_id": data_id
-            }
-            
+        # 데이터 존재 여부 확인
+        check_query = "SELECT id FROM process_data WHERE id = :data_id"
+        result = await session.execute(text(check_query), {"data_id": data_id})
+        if not result.fetchone():
+            return JSONResponse(
+                status_code=404,
+                content={
+                    "success": False,
+                    "error": "Data not found",
+                    "message": f"ID {data_id}에 해당하는 공정 데이터를 찾을 수 없습니다."
+                }
+            )
+        
+        # 데이터 삭제
+        delete_query = "DELETE FROM process_data WHERE id = :data_id"
+        await session.execute(text(delete_query), {"data_id": data_id})
+        await session.commit()
+        
+        logger.info(f"공정 데이터 삭제 완료: ID {data_id}")
+        
+        return {
+            "success": True,
+            "message": f"공정 데이터 (ID: {data_id})가 성공적으로 삭제되었습니다.",
+            "deleted_id": data_id
+        }
+        
     except Exception as e:
         logger.error(f"공정 데이터 삭제 실패: {e}")
         return JSONResponse(
@@ -0,0 +1,36 @@
+-- ============================================================================
+-- 🗂️ 목록 조회 키셋 인덱스 추가 마이그레이션 스크립트
+-- ============================================================================
+-- input/output/transport/process_data 목록 조회의 (created_at, id) 키셋 페이지네이션용 인덱스
+-- CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 psql로 문장 단위로 실행
+-- (psql -f 기본 동작, --single-transaction 옵션은 사용하지 않음)
+
+-- 0. 이전에 동시 생성이 실패해 INVALID로 남은 인덱스 확인
+--    결과가 있으면 해당 인덱스를 DROP INDEX CONCURRENTLY 로 지운 뒤 아래 생성을 다시 실행
+--    (IF NOT EXISTS는 INVALID 인덱스도 있는 것으로 보고 건너뜀)
+SELECT c.relname AS invalid_index
+FROM pg_index i
+JOIN pg_class c ON c.oid = i.indexrelid
+WHERE NOT i.indisvalid
+  AND c.relname IN (
+      'ix_input_data_created_at_id',
+      'ix_output_data_created_at_id',
+      'ix_transport_data_created_at_id',
+      'ix_process_data_created_at_id'
+  );
+
+-- 1. input_data
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_input_data_created_at_id
+    ON input_data (created_at DESC NULLS LAST, id DESC);
+
+-- 2. output_data
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_output_data_created_at_id
+    ON output_data (created_at DESC NULLS LAST, id DESC);
+
+-- 3. transport_data
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transport_data_created_at_id
+    ON transport_data (created_at DESC NULLS LAST, id DESC);
+
+-- 4. process_data
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_process_data_created_at_id
+    ON process_data (created_at DESC NULLS LAST, id DESC);
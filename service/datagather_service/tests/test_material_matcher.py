@@ -0,0 +1,94 @@
+# ============================================================================
+# 🧪 MaterialMatcher 투입물명 맵핑 테스트
+# ============================================================================
+
+import random
+
+from app.common.material_matcher import (
+    MATCH_EXACT, MATCH_LABEL, MATCH_NONE, MATCH_PARTIAL, MaterialMatcher
+)
+
+
+def _linear_predict(mapping, input_text):
+    """인덱스 도입 전 predict_material_with_mapping의 선형 탐색"""
+    if not mapping:
+        return input_text, 0.0
+    normalized_input = input_text.strip().lower()
+    if normalized_input in mapping:
+        return mapping[normalized_input], 1.0
+    for key, value in mapping.items():
+        if key in normalized_input or normalized_input in key:
+            return value, 0.8
+    for value in mapping.values():
+        if value.lower() == normalized_input:
+            return input_text, 1.0
+    return input_text, 0.0
+
+
+MAPPING = {
+    "철광석": "원료",
+    "석회석": "부원료",
+    "코크스": "연료",
+    "무연탄": "연료",
+    "전기": "유틸리티",
+    "슬래그": "폐기물",
+}
+
+
+def test_match_kinds():
+    matcher = MaterialMatcher(MAPPING)
+
+    assert matcher.match("코크스") == (MATCH_EXACT, "연료", "코크스")
+    assert matcher.match("분말 코크스 10t") == (MATCH_PARTIAL, "연료", "코크스")
+    assert matcher.match("석회") == (MATCH_PARTIAL, "부원료", "석회석")
+    assert matcher.match("유틸리티") == (MATCH_LABEL, None, None)
+    assert matcher.match("알루미늄") == (MATCH_NONE, None, None)
+
+
+def test_predict_confidence_and_normalization():
+    matcher = MaterialMatcher(MAPPING)
+
+    assert matcher.predict("  코크스 ") == ("연료", 1.0)
+    assert matcher.predict("고로 슬래그") == ("폐기물", 0.8)
+    assert matcher.predict("유틸리티") == ("유틸리티", 1.0)
+    assert matcher.predict("알루미늄") == ("알루미늄", 0.0)
+    assert MaterialMatcher({}).predict("코크스") == ("코크스", 0.0)
+
+
+def test_partial_match_prefers_earliest_key():
+    # 여러 키가 걸리면 선형 탐색처럼 딕셔너리 삽입 순서가 빠른 키
+    mapping = {"bc": "second", "abcd": "first-containing", "b": "third"}
+    matcher = MaterialMatcher(mapping)
+
+    assert matcher.predict("xbcx") == ("second", 0.8)
+    assert matcher.predict("abc") == ("second", 0.8)
+    assert matcher.predict("ab") == ("first-containing", 0.8)
+
+
+def test_parity_with_linear_scan():
+    rng = random.Random(20240105)
+    alphabet = "abcde"
+
+    for _ in range(30):
+        mapping = {}
+        for _ in range(rng.randint(1, 25)):
+            key = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+            mapping.setdefault(key, rng.choice(["lbl-a", "lbl-b", "ab", "c"]))
+        matcher = MaterialMatcher(mapping)
+
+        for _ in range(100):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            assert matcher.predict(text) == _linear_predict(mapping, text), (mapping, text)
+
+
+def test_predict_many_uses_cache():
+    matcher = MaterialMatcher(MAPPING, cache_size=8)
+
+    results = matcher.predict_many(["코크스", "알루미늄", "코크스"])
+    matcher.predict_many(["코크스"])
+
+    assert results == {"코크스": ("연료", 1.0), "알루미늄": ("알루미늄", 0.0)}
+    stats = matcher.get_cache_stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 2
+    assert stats["max_entries"] == 8